@@ -0,0 +1,373 @@
+"""Answer-equivalence grading against A0 final answers (see DESIGN.md).
+
+grade(answer, reference) compares a model's answer with an example's
+final_answer and returns one of:
+
+- EXACT: the same string (surrounding whitespace aside).
+- EQUIVALENT: a different spelling of the same value: "17/2" or "8.5" for
+  "8 1/2", "x=2 or x=-3" for "x = -3 or x = 2", "2√8" for "4√2",
+  "$20.060" for "$20.06", "x = 7" for "7".
+- WRONG: anything else.
+
+canonical() parses an answer into a hashable value, cached per process.
+Composites are split at the top level (outside brackets), in this order:
+
+- "; " parts (e.g. `step <k>; <answer>`) stay in order.
+- " or " alternatives (`x = -3 or x = 2`) and "∪" intervals compare in
+  any order, but a repeated part still counts (`2 or 2 or 3` is not
+  `2 or 3`).
+- "," lists stay in order, unless every item is a `name = value`
+  assignment (`x=-2, y=-3`), in which case they compare in any order.
+- "=" splits a name from its value; a chain `a = b = c` keeps every side.
+
+Bracketed groups parse their items. `{...}` groups are sets (`{2, 1}` is
+`{1, 2}`); `(...)` and `[...]` groups, which cover intervals and points,
+keep their order, with ∞ taken as is. Commas that only group digits
+(`1,000`, `$1,234.50`) are dropped, unless the answer also uses commas
+as separators or has brackets. Quantities become exact rationals. These are
+integers, decimals, fractions, mixed numbers, scientific `4.8 × 10^4`,
+and `$` money. A `%` or `°` suffix, a π or √n factor (reduced, `6√2`)
+and a trailing unit (`cubic units`, `R4`) are kept alongside the value
+and must match. Anything else, including `Θ(...)` labels and
+expressions, compares as text with its whitespace around symbols
+removed and standalone numbers reduced (`0.50` → `0.5`, `4/8` → `1/2`).
+Text made only of words is compared case-insensitively.
+
+grade_batch() grades many pairs, optionally across a process pool. A
+Grader keeps that pool (and its workers' warm caches) across batches.
+"""
+import multiprocessing
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+EXACT = "exact"
+EQUIVALENT = "equivalent"
+WRONG = "wrong"
+
+# Parsed answers kept by canonical()'s cache, per process.
+CACHE_SIZE = 1 << 16
+# Pairs per task handed to a pool worker by grade_batch().
+GRADE_CHUNK = 2048
+
+_OPEN = "([{"
+_CLOSE = ")]}"
+
+_SPELLINGS = [
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"[−–]"), "-"),
+    (re.compile(r"(?<![A-Za-z])pi(?![A-Za-z])"), "π"),
+    (re.compile(r"(?<![A-Za-z])sqrt(?=\()"), "√"),
+    (re.compile(r"(?<![A-Za-z])(?:Theta|theta)(?=\()"), "Θ"),
+]
+
+_QUANTITY = re.compile(r"""
+    (?P<sign>-)?(?P<money>\$)?
+    (?:
+        (?P<whole>\d+)\ (?P<mixed_num>\d+)/(?P<mixed_den>\d+)
+      | (?P<num>\d+(?:\.\d+)?|\.\d+)(?:/(?P<den>\d+(?:\.\d+)?))?
+        (?:\ ?[×x*]\ ?10\^(?P<exp>-?\d+))?
+    )?
+    \ ?(?P<factor>\*?π|\*?√(?:\((?P<paren_radicand>\d+)\)|(?P<radicand>\d+)))?
+    (?:/(?P<factor_den>\d+))?
+    (?P<suffix>[%°])?
+    (?:\ (?P<unit>[^\d\s=;,].*))?
+""", re.X)
+
+# A number standing alone inside text: not part of a word, a power, a
+# radical, a longer decimal or a fraction's other side.
+_TEXT_NUMBER = re.compile(r"(?<![\w.^/√π])(\d+\.\d+|\d+/\d+|\d+)(?![\w.^/(√π])")
+# Digit groups "1,000": a run of whole three-digit groups after a comma.
+_GROUPED_NUMBER = re.compile(r"(?<![\d.,])\d{1,3}(?:,\d{3})+(?![\d,])")
+_SYMBOL_SPACE = re.compile(r" ?([^\w\s]) ?")
+_WORDS = re.compile(r"[A-Za-z]+(?: [A-Za-z]+)*")
+
+
+def _normalize(text):
+    text = str(text).strip()
+    for pattern, replacement in _SPELLINGS:
+        text = pattern.sub(replacement, text)
+    # <= and >= are relations unless the text also has angle brackets
+    # (`<5>={1, 5}`); then only spaced ones are.
+    if text.count("<") + text.count(">") == 1:
+        text = text.replace("<=", "≤").replace(">=", "≥")
+    else:
+        text = text.replace(" <= ", " ≤ ").replace(" >= ", " ≥ ")
+    # Digit-group commas, unless commas also separate items.
+    if "," in text and not any(char in text for char in _OPEN):
+        ungrouped = _GROUPED_NUMBER.sub(lambda m: m.group().replace(",", ""), text)
+        if "," not in ungrouped:
+            text = ungrouped
+    return text
+
+
+def _split_top(text, separator):
+    """`text` split at `separator` where no bracket is open, or None when
+    it does not occur there."""
+    parts = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char in _OPEN:
+            depth += 1
+        elif char in _CLOSE:
+            depth = max(0, depth - 1)
+        elif depth == 0 and text.startswith(separator, i):
+            parts.append(text[start:i].strip())
+            i += len(separator)
+            start = i
+            continue
+        i += 1
+    if not parts:
+        return None
+    parts.append(text[start:].strip())
+    return parts
+
+
+def _enclosed(text):
+    """True if text[0] opens a bracket that text[-1] closes."""
+    if len(text) < 2 or text[0] not in _OPEN or text[-1] not in _CLOSE:
+        return False
+    depth = 0
+    for i, char in enumerate(text):
+        if char in _OPEN:
+            depth += 1
+        elif char in _CLOSE:
+            depth -= 1
+            if depth == 0 and i != len(text) - 1:
+                return False
+    return depth == 0
+
+
+def _square_free(radicand):
+    """(outside, inside) with outside**2 * inside == radicand, inside
+    square-free."""
+    outside = 1
+    factor = 2
+    while factor * factor <= radicand:
+        while radicand % (factor * factor) == 0:
+            radicand //= factor * factor
+            outside *= factor
+        factor += 1
+    return outside, radicand
+
+
+def _quantity(text):
+    """("q", value, factor, suffix, money, unit) for a single quantity,
+    else None."""
+    match = _QUANTITY.fullmatch(text)
+    if match is None:
+        return None
+    parts = match.groupdict()
+    if parts["whole"] is None and parts["num"] is None and parts["factor"] is None:
+        return None
+    if parts["whole"] is not None:
+        value = int(parts["whole"]) + Fraction(int(parts["mixed_num"]),
+                                               int(parts["mixed_den"]))
+    elif parts["num"] is not None:
+        value = Fraction(parts["num"])
+        if parts["den"] is not None:
+            den = Fraction(parts["den"])
+            if not den:
+                return None
+            value /= den
+        if parts["exp"] is not None:
+            value *= Fraction(10) ** int(parts["exp"])
+    else:
+        value = Fraction(1)
+    factor = ""
+    if parts["factor"] is not None:
+        if parts["factor"].endswith("π"):
+            factor = "π"
+        else:
+            outside, inside = _square_free(int(parts["paren_radicand"]
+                                               or parts["radicand"]))
+            value *= outside
+            factor = f"√{inside}" if inside not in (0, 1) else ""
+            if inside == 0:
+                value = Fraction(0)
+    if parts["factor_den"] is not None:
+        if not int(parts["factor_den"]):
+            return None
+        value /= int(parts["factor_den"])
+    if parts["sign"]:
+        value = -value
+    if value == 0:
+        factor = ""
+    return ("q", value, factor, parts["suffix"] or "", bool(parts["money"]),
+            _text(parts["unit"]) if parts["unit"] else "")
+
+
+def _reduce_number(match):
+    token = match.group(1)
+    if "/" in token:
+        num, den = token.split("/")
+        if int(den) == 0:
+            return token
+        value = Fraction(int(num), int(den))
+    else:
+        value = Fraction(token)
+    if value.denominator == 1:
+        return str(value.numerator)
+    if "." in token:
+        return token.rstrip("0")
+    return f"{value.numerator}/{value.denominator}"
+
+
+def _text(text):
+    text = _SYMBOL_SPACE.sub(r"\1", text)
+    text = _TEXT_NUMBER.sub(_reduce_number, text)
+    if _WORDS.fullmatch(text) and len(text) >= 3:
+        text = text.casefold()
+    return text
+
+
+def _multiset(items):
+    """Items in a canonical order, repeats kept (canonical values are
+    tuples of mixed types, so they are ordered by repr)."""
+    return tuple(sorted(items, key=repr))
+
+
+def _parse(text):
+    text = text.strip()
+    parts = _split_top(text, ";")
+    if parts is not None:
+        return ("seq", tuple(_parse(part) for part in parts))
+    for separator, kind in ((" or ", "or"), ("∪", "union")):
+        parts = _split_top(text, separator)
+        if parts is not None:
+            return (kind, _multiset(_parse(part) for part in parts))
+    parts = _split_top(text, ",")
+    if parts is not None:
+        items = tuple(_parse(part) for part in parts)
+        if all(item[0] == "assign" for item in items):
+            return ("assigns", _multiset(items))
+        return ("list", items)
+    parts = _split_top(text, "=")
+    if parts is not None:
+        if len(parts) == 2 and parts[0]:
+            return ("assign", _text(parts[0]), _parse(parts[1]))
+        return ("chain", tuple(_parse(part) for part in parts))
+    if _enclosed(text):
+        inner = text[1:-1].strip()
+        items = [_parse(item) for item in _split_top(inner, ",") or [inner]]
+        if text[0] == "{":
+            return ("set", _multiset(set(items)))
+        return ("group", text[0], text[-1], tuple(items))
+    quantity = _quantity(text)
+    if quantity is not None:
+        return quantity
+    return ("text", _text(text))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical(answer):
+    """The canonical, hashable value of an answer string (never raises)."""
+    text = _normalize(answer)
+    try:
+        return _parse(text)
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return ("text", _text(text))
+
+
+def _bare(value):
+    """The value of a single `name = value` assignment, else None."""
+    if value[0] == "assign":
+        return value[2]
+    if value[0] == "or" and len(value[1]) == 1:
+        return _bare(next(iter(value[1])))
+    return None
+
+
+def grade(answer, reference) -> str:
+    """EXACT, EQUIVALENT or WRONG for a model answer against a
+    final_answer."""
+    if answer is None:
+        return WRONG
+    answer = str(answer).strip()
+    reference = str(reference).strip()
+    if answer == reference:
+        return EXACT
+    got = canonical(answer)
+    want = canonical(reference)
+    if got == want:
+        return EQUIVALENT
+    # A bare value for a labelled single answer ("7" for "x = 7"), or the
+    # other way round.
+    if _bare(want) is not None and _bare(want) == got:
+        return EQUIVALENT
+    if _bare(got) is not None and _bare(got) == want:
+        return EQUIVALENT
+    return WRONG
+
+
+def _grade_pairs(pairs):
+    return [grade(answer, reference) for answer, reference in pairs]
+
+
+def _pairs(answers, references):
+    answers = list(answers)
+    references = list(references)
+    if len(answers) != len(references):
+        raise ValueError(f"{len(answers)} answers for {len(references)} references")
+    return list(zip(answers, references))
+
+
+class Grader:
+    """grade_batch() over a process pool that outlives one batch.
+
+    The pool starts on the first batch that needs it and stays up until
+    close(), so its workers keep their canonical() caches between
+    batches. Use it as a context manager, or call close().
+    """
+
+    def __init__(self, workers=1, chunk_size=GRADE_CHUNK):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._closed = False
+
+    def grade_batch(self, answers, references) -> list:
+        """Verdicts for answers[i] against references[i], in order."""
+        if self._closed:
+            raise ValueError("grade_batch() on a closed Grader")
+        pairs = _pairs(answers, references)
+        if self.workers == 1 or len(pairs) <= self.chunk_size:
+            return _grade_pairs(pairs)
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        chunks = [pairs[i:i + self.chunk_size]
+                  for i in range(0, len(pairs), self.chunk_size)]
+        return [verdict for verdicts in self._pool.imap(_grade_pairs, chunks)
+                for verdict in verdicts]
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def grade_batch(answers, references, workers=1, chunk_size=GRADE_CHUNK):
+    """Verdicts for answers[i] against references[i], in order.
+
+    workers > 1 grades chunks of chunk_size pairs in a process pool; each
+    worker keeps its own canonical() cache, so repeated references parse
+    once per worker. The pool lasts for this call only; use a Grader to
+    keep it across batches.
+    """
+    with Grader(workers, chunk_size) as grader:
+        return grader.grade_batch(answers, references)
@@ -1,8 +1,122 @@
+import hashlib
+import importlib
+import random
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+# Module-level `random` functions that are bound methods of the hidden global
+# Random instance (randint, choice, getrandbits, ...). rng_scope() rebinds
+# exactly these names.
+_RANDOM_METHODS = tuple(
+    name for name in random.__all__
+    if isinstance(getattr(getattr(random, name), "__self__", None),
+                  random.Random)
+)
+
+
+def derive_seed(*key) -> int:
+    """Deterministic 64-bit seed for the independent stream named by `key`,
+    e.g. derive_seed(seed, example_index)."""
+    digest = hashlib.blake2b(":".join(map(str, key)).encode(),
+                             digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def example_rng(*key) -> random.Random:
+    """A fresh random.Random for the stream named by `key`."""
+    return random.Random(derive_seed(*key))
+
+
+@contextmanager
+def rng_scope(rng):
+    """Routes the module-level `random` functions to `rng` for the block.
+
+    Compatibility shim for generate() bodies written against the global
+    `random` module: inside the block random.randint, random.choice,
+    helpers.jid(), ... all draw from `rng`, and the global state is left
+    untouched. The rebinding is process-wide, so scopes must not be entered
+    from several threads at once.
+    """
+    saved = [getattr(random, name) for name in _RANDOM_METHODS]
+    for name in _RANDOM_METHODS:
+        setattr(random, name, getattr(rng, name))
+    try:
+        yield rng
+    finally:
+        for name, fn in zip(_RANDOM_METHODS, saved):
+            setattr(random, name, fn)
+
 
 class ProblemGenerator(ABC):
     """Abstract base class for math problem generators."""
 
+    # True when generate() takes an optional `rng` keyword and draws only
+    # from it; other generators run under rng_scope() in sample().
+    accepts_rng = False
+
+    def sample(self, rng=None) -> dict:
+        """generate() drawing from `rng` (a random.Random) when given.
+
+        With rng=None this is plain generate() on the global `random`
+        state. Pipelines pass one stream per example so output does not
+        depend on global call order.
+        """
+        if rng is None:
+            return self.generate()
+        if self.accepts_rng:
+            return self.generate(rng=rng)
+        with rng_scope(rng):
+            return self.generate()
+
+    def generate_many(self, k, rng=None) -> list:
+        """k examples drawn from `rng` (or the global `random` state).
+
+        The default loops generate(), entering rng_scope() once for the
+        whole batch. Hot generators may override it to sample all k
+        operand sets up front; an override must return exactly k examples
+        and draw only from `rng`.
+        """
+        if rng is None:
+            return [self.generate() for _ in range(k)]
+        if self.accepts_rng:
+            return [self.generate(rng=rng) for _ in range(k)]
+        with rng_scope(rng):
+            return [self.generate() for _ in range(k)]
+
+    def enumerate_space(self):
+        """The whole problem space as a sequence of parameter values, or
+        None (the default) when it is open-ended.
+
+        A generator with a small finite space may return any sequence
+        (a list, a param_space.ParamSpace, or a lazy param_space.Product /
+        Chain) whose entries generate_from() turns into pairwise distinct
+        (operation, problem) pairs. build_dataset(enumerate_spaces=True)
+        then walks it in a seeded permuted order instead of sampling, so no
+        attempt is lost to dedup and exhaustion is known exactly. Cache
+        the sequence; it is requested once per build.
+        """
+        return None
+
+    def space_size(self):
+        """len(enumerate_space()), or None for an open-ended space."""
+        space = self.enumerate_space()
+        return None if space is None else len(space)
+
+    def generate_from(self, params) -> dict:
+        """The example for one entry of enumerate_space(). Randomness
+        beyond `params` (the problem id) follows generate()'s rules."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not enumerate its problem space")
+
+    def sample_from(self, params, rng=None) -> dict:
+        """generate_from(params) drawing from `rng`, like sample()."""
+        if rng is None:
+            return self.generate_from(params)
+        if self.accepts_rng:
+            return self.generate_from(params, rng=rng)
+        with rng_scope(rng):
+            return self.generate_from(params)
+
     @abstractmethod
     def generate(self) -> dict:
         """
@@ -20,11 +134,22 @@ class ProblemGenerator(ABC):
                        'Z|<final_answer>'.
                 - 'final_answer': str or int (e.g., '30 R3')
 
+        Optionally 'dedup_key': a compact canonical description of the
+        problem (ints, strings and tuples of them, e.g. operands plus
+        variant). Builds then dedup on it instead of the problem text, so
+        two examples with equal keys (within one operation) must be the
+        same problem, however phrased; it is not written to the output.
+
         Metadata: 'grade_level' and 'difficulty' are stamped centrally from
         curriculum.py after generate() returns (every generator class needs a
         CURRICULUM entry there). A generator may emit either key itself to
         override the table, e.g. difficulty computed from its operands.
 
+        Randomness: draw from the global `random` module (sample() routes it
+        to a per-example stream), or set accepts_rng = True and take an
+        optional `rng` keyword, falling back to `random` when it is None;
+        pass it on to helpers.jid(rng).
+
         Op-code vocabulary: the scratchpad belongs to the model — new op-codes
         may be introduced freely; there is no fixed registry. Stay consistent
         within a generator, keep every step human-legible (the same cues a
@@ -32,3 +157,56 @@ class ProblemGenerator(ABC):
         (python tools/gen_opcode_legend.py) when introducing codes.
         """
         pass
+
+
+class LazyGenerator:
+    """Registry stand-in for a generator instance that is built on first use.
+
+    `module`, `class_name`, `args` and `kwargs` identify the instance without
+    importing anything; load() imports the module and builds the instance
+    once. Any other attribute access, including __class__ (so class-name
+    grouping and curriculum lookups see the real class), goes to the loaded
+    instance. Pickles as its spec, so worker processes load on their own.
+    """
+
+    __slots__ = ("module", "class_name", "args", "kwargs", "_instance")
+
+    def __init__(self, module, class_name, args=(), kwargs=None):
+        self.module = module
+        self.class_name = class_name
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self._instance = None
+
+    def load(self) -> ProblemGenerator:
+        if self._instance is None:
+            cls = getattr(importlib.import_module(self.module), self.class_name)
+            self._instance = cls(*self.args, **self.kwargs)
+        return self._instance
+
+    @property
+    def __class__(self):
+        return self.load().__class__
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __reduce__(self):
+        return (LazyGenerator, (self.module, self.class_name, self.args, self.kwargs))
+
+    def __repr__(self):
+        params = [repr(a) for a in self.args]
+        params += [f"{k}={v!r}" for k, v in self.kwargs.items()]
+        return f"<lazy {self.module}.{self.class_name}({', '.join(params)})>"
+
+
+def generator_name(gen) -> str:
+    """Class name of a generator or LazyGenerator, without loading it."""
+    if isinstance(gen, LazyGenerator):
+        return gen.class_name
+    return gen.__class__.__name__
+
+
+def materialize(gen):
+    """The real generator instance behind `gen` (loading a LazyGenerator)."""
+    return gen.load() if isinstance(gen, LazyGenerator) else gen
@@ -0,0 +1,96 @@
+"""Checkpoints for resumable dataset builds.
+
+A checkpoint is a directory holding ``state.json`` (the stream cursor,
+counters, per-generator stats and output offsets of a build) and, when the
+build dedups, a ``dedup/`` snapshot written by the index's save(). It is
+replaced atomically: the new checkpoint is written next to the old one and
+swapped in by rename, so a crash at any point leaves one complete
+checkpoint behind.
+
+Builds draw every example from streams keyed by (seed, index), so the
+cursor plus that state is enough to continue a run and produce the same
+output as an uninterrupted one.
+"""
+import json
+import os
+import shutil
+import time
+
+STATE_FILE = "state.json"
+DEDUP_DIR = "dedup"
+
+
+def write_checkpoint(directory, state, dedup_index=None):
+    """Atomically replaces the checkpoint at `directory`."""
+    tmp = f"{directory}.tmp"
+    old = f"{directory}.old"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    if dedup_index is not None:
+        os.mkdir(os.path.join(tmp, DEDUP_DIR))
+        dedup_index.save(os.path.join(tmp, DEDUP_DIR))
+    with open(os.path.join(tmp, STATE_FILE), "w", encoding="utf-8") as fp:
+        json.dump(state, fp, sort_keys=True)
+        fp.flush()
+        os.fsync(fp.fileno())
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(directory):
+        os.rename(directory, old)
+    os.rename(tmp, directory)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _complete_checkpoint(directory):
+    """`directory`, or the previous checkpoint if a swap was interrupted."""
+    for candidate in (directory, f"{directory}.old"):
+        if os.path.isfile(os.path.join(candidate, STATE_FILE)):
+            return candidate
+    return None
+
+
+def read_checkpoint(directory):
+    """The saved state dict, or None if there is no checkpoint."""
+    found = _complete_checkpoint(directory)
+    if found is None:
+        return None
+    with open(os.path.join(found, STATE_FILE), encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def restore_dedup(directory, dedup_index):
+    """Loads the checkpoint's dedup snapshot into `dedup_index`."""
+    found = _complete_checkpoint(directory)
+    dedup_index.restore(os.path.join(found, DEDUP_DIR))
+
+
+def remove_checkpoint(directory):
+    for path in (directory, f"{directory}.tmp", f"{directory}.old"):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def check_resumable(state, params):
+    """Raises ValueError if a checkpoint was written with other options."""
+    saved = state.get("params", {})
+    changed = sorted(key for key in set(saved) | set(params)
+                     if saved.get(key) != params.get(key))
+    if changed:
+        raise ValueError(
+            f"checkpoint was written with different options ({', '.join(changed)}); "
+            "rerun with the original options or without --resume")
+
+
+class CheckpointTimer:
+    """Says when a checkpoint is due: every `seconds` (0 = at every
+    opportunity), or never when seconds is None."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self._last = time.monotonic()
+
+    def due(self) -> bool:
+        if self.seconds is None:
+            return False
+        return time.monotonic() - self._last >= self.seconds
+
+    def reset(self):
+        self._last = time.monotonic()
@@ -0,0 +1,495 @@
+"""Dedup indexes for dataset builds.
+
+Builds skip exact repeats of an example's ``(operation, problem)`` key, or
+of its semantic key when the generator emitted a ``dedup_key`` (see
+semantic_digest()). The backends trade exactness for memory:
+
+- ``exact``: a Python set of the key tuples. Exact, but it holds every
+  problem text, which costs gigabytes on multi-million-row builds.
+- ``hash64`` / ``hash128``: a fixed-width BLAKE2b digest of the key in an
+  open-addressing ``array('Q')`` table, with a 16-bit check tag from
+  further bits of the same hash beside it: 10 or 18 bytes per slot.
+  Two distinct keys share a digest about n^2 / 2^(bits+1) times after n
+  keys (~2.7e-6 at 10M keys for 64 bits). The tags tell all but 1 in
+  65,536 of those collisions apart; ``on_collision`` (COLLISION_POLICIES)
+  says what happens to one: ``keep`` the row (the default), ``drop`` it
+  as if it were a duplicate, or raise an ``error``. Either way it is
+  counted in ``collisions``. A match of digest and tag is a duplicate.
+  Semantic keys at 128 bits have no bits left for a tag, so their
+  collisions are duplicates, as with ExactDedup.
+- Either hash backend can spill: once the in-memory table passes
+  ``memory_limit`` bytes its digests are sorted into a run file in
+  ``spill_dir`` and looked up there by binary search, so resident memory
+  stays bounded for builds larger than RAM.
+
+Every index can save() a snapshot to a directory and restore() it into a
+fresh index of the same kind (used by resumable builds).
+
+Use make_dedup_index() to build one from CLI-style options.
+"""
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from array import array
+
+DEDUP_KINDS = ("exact", "hash64", "hash128")
+# What a hash index does with a key whose digest is present under another
+# check tag.
+COLLISION_POLICIES = ("keep", "drop", "error")
+
+# Open-addressing tables grow (double) past this load factor.
+MAX_LOAD = 0.7
+# Sorted runs are merged into one once there are this many.
+MAX_RUNS = 8
+# Size of the check tag stored beside each digest.
+TAG_BYTES = 2
+
+
+def semantic_digest(operation, dedup_key) -> int:
+    """128-bit digest of a generator-emitted dedup_key as an int.
+
+    `dedup_key` is a compact canonical description of the problem (operands
+    plus variant, built from ints, strings and tuples), so paraphrases of
+    the same problem share a digest and long problem texts are never
+    hashed. The pipeline uses the digest itself as the dedup key.
+    """
+    data = f"{operation}\0{dedup_key!r}".encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return int.from_bytes(digest, "big")
+
+
+def key_digest(key, bits=64) -> int:
+    """Fixed-width digest of an (operation, problem) key as an int.
+
+    A semantic_digest() key is already a digest; it is truncated to `bits`.
+    """
+    if isinstance(key, int):
+        return key >> (128 - bits)
+    operation, problem = key
+    data = f"{operation}\0{problem}".encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=bits // 8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _tagged_digest(key, bits):
+    """(digest, check tag) of a key for HashDedup: a `bits`-wide digest
+    plus a 16-bit tag from the next bits of the same hash (0 for a
+    128-bit semantic key, which has none)."""
+    if isinstance(key, int):
+        if bits == 128:
+            return key, 0
+        return key >> 64, (key >> 48) & 0xFFFF
+    operation, problem = key
+    data = f"{operation}\0{problem}".encode("utf-8")
+    value = int.from_bytes(
+        hashlib.blake2b(data, digest_size=bits // 8 + TAG_BYTES).digest(), "big")
+    return value >> 16, value & 0xFFFF
+
+
+def format_bytes(n) -> str:
+    """Human-readable byte count, e.g. '12.5 MiB'."""
+    if n < 1024:
+        return f"{n} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        n /= 1024
+        if n < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}"
+
+
+class ExactDedup:
+    """Set of the full key tuples (the historical behavior); semantic keys
+    are held as their digests."""
+
+    kind = "exact"
+    # Keys are compared in full, so there are no digest collisions.
+    collisions = 0
+
+    def __init__(self):
+        self._seen = set()
+        self._key_bytes = 0
+
+    def add(self, key) -> bool:
+        """Records `key`; returns False if it was already present."""
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._key_bytes += sys.getsizeof(key)
+        if not isinstance(key, int):
+            self._key_bytes += sum(map(sys.getsizeof, key))
+        return True
+
+    def __len__(self):
+        return len(self._seen)
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size: the set plus the keys it holds."""
+        return sys.getsizeof(self._seen) + self._key_bytes
+
+    def disk_bytes(self) -> int:
+        return 0
+
+    def close(self):
+        self._seen.clear()
+
+    def save(self, directory):
+        """Writes a snapshot of the index into `directory`."""
+        with open(os.path.join(directory, "exact.pkl"), "wb") as fp:
+            pickle.dump((self._seen, self._key_bytes), fp,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, directory):
+        """Replaces the contents with a snapshot written by save()."""
+        with open(os.path.join(directory, "exact.pkl"), "rb") as fp:
+            self._seen, self._key_bytes = pickle.load(fp)
+
+    def describe(self) -> str:
+        return (f"{self.kind}: {len(self):,} keys, "
+                f"~{format_bytes(self.memory_bytes())} in memory")
+
+
+class HashDedup:
+    """Open-addressing set of fixed-width key digests.
+
+    Slots are `bits // 64` consecutive words of an array('Q'); an all-zero
+    slot is empty (a zero digest is stored as 1). Each slot's check tag
+    sits at the same index of an array('H'). Linear probing, doubling
+    past MAX_LOAD. With memory_limit set, the table is spilled to a sorted
+    run file whenever its footprint would exceed the limit.
+
+    A key whose digest is present under another tag is a collision,
+    counted in `collisions` and handled by `on_collision`: "keep" adds it
+    as its own entry, "drop" reports it as a duplicate, "error" raises
+    RuntimeError.
+    """
+
+    def __init__(self, bits=64, capacity=1 << 16, memory_limit=None,
+                 spill_dir=None, on_collision="keep"):
+        if bits not in (64, 128):
+            raise ValueError(f"bits must be 64 or 128, got {bits}")
+        if on_collision not in COLLISION_POLICIES:
+            raise ValueError(f"Unknown collision policy {on_collision!r}; "
+                             f"choose one of {', '.join(COLLISION_POLICIES)}")
+        if capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two, got {capacity}")
+        self.bits = bits
+        self.kind = f"hash{bits}"
+        self.on_collision = on_collision
+        self._words = bits // 64
+        self._initial_capacity = capacity
+        self._memory_limit = memory_limit
+        self._spill_root = spill_dir
+        self._spill_dir = None
+        self._runs = []          # (path, file, mmap, n_entries)
+        self._run_keys = 0
+        self._runs_written = 0
+        self.collisions = 0
+        if memory_limit is not None:
+            # Start small enough that the first table fits the limit.
+            slot_bytes = 8 * self._words + TAG_BYTES
+            while capacity > 1024 and capacity * slot_bytes > memory_limit:
+                capacity //= 2
+            self._initial_capacity = capacity
+        self._reset(capacity)
+
+    def _reset(self, capacity):
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._count = 0
+        self._slots = array("Q", [0]) * (capacity * self._words)
+        self._tags = array("H", [0]) * capacity
+
+    # --- in-memory table ---------------------------------------------------
+
+    def _insert(self, digest, tag, keep=True, collided=False) -> int:
+        """0 if (digest, tag) is present; otherwise inserts it and returns
+        1, or 2 if the digest was present under another tag, here or (with
+        `collided`) in a run. A collision is inserted only if `keep`."""
+        slots = self._slots
+        tags = self._tags
+        mask = self._mask
+        i = digest & mask
+        inserted = 2 if collided else 1
+        if self._words == 1:
+            while True:
+                v = slots[i]
+                if v == 0:
+                    if inserted == 2 and not keep:
+                        return 2
+                    slots[i] = digest
+                    tags[i] = tag
+                    self._count += 1
+                    return inserted
+                if v == digest:
+                    if tags[i] == tag:
+                        return 0
+                    inserted = 2
+                i = (i + 1) & mask
+        hi, lo = digest >> 64, digest & 0xFFFFFFFFFFFFFFFF
+        while True:
+            j = 2 * i
+            a, b = slots[j], slots[j + 1]
+            if a == 0 and b == 0:
+                if inserted == 2 and not keep:
+                    return 2
+                slots[j] = hi
+                slots[j + 1] = lo
+                tags[i] = tag
+                self._count += 1
+                return inserted
+            if a == hi and b == lo:
+                if tags[i] == tag:
+                    return 0
+                inserted = 2
+            i = (i + 1) & mask
+
+    def _entries(self):
+        """(digest, tag) pairs held in the in-memory table (unordered)."""
+        slots = self._slots
+        tags = self._tags
+        if self._words == 1:
+            return [(v, tags[i]) for i, v in enumerate(slots) if v]
+        return [((slots[2 * i] << 64) | slots[2 * i + 1], tags[i])
+                for i in range(len(tags))
+                if slots[2 * i] or slots[2 * i + 1]]
+
+    def _grow(self):
+        entries = self._entries()
+        self._reset(self._capacity * 2)
+        for digest, tag in entries:
+            self._insert(digest, tag)
+
+    # --- sorted runs on disk -------------------------------------------------
+
+    def _width(self):
+        return self.bits // 8
+
+    def _record_size(self):
+        return self._width() + TAG_BYTES
+
+    def _run_lookup(self, run, digest, tag) -> int:
+        """As _insert() without inserting: 0 if (digest, tag) is in `run`,
+        2 if only the digest is, else 1."""
+        _, _, mm, n = run
+        width = self._width()
+        size = self._record_size()
+        target = digest.to_bytes(width, "big")
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mm[mid * size:mid * size + width] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = 1
+        while lo < n and mm[lo * size:lo * size + width] == target:
+            if int.from_bytes(mm[lo * size + width:(lo + 1) * size], "big") == tag:
+                return 0
+            found = 2
+            lo += 1
+        return found
+
+    def _open_run(self, path, n):
+        fp = open(path, "rb")
+        mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if n else b""
+        return (path, fp, mm, n)
+
+    def _close_run(self, run):
+        path, fp, mm, _ = run
+        if isinstance(mm, mmap.mmap):
+            mm.close()
+        fp.close()
+        os.remove(path)
+
+    def _write_run(self, entries):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="quixi-dedup-",
+                                               dir=self._spill_root)
+        path = os.path.join(self._spill_dir, f"run-{self._runs_written:05d}.bin")
+        self._runs_written += 1
+        width = self._width()
+        n = 0
+        with open(path, "wb") as fp:
+            for digest, tag in entries:
+                fp.write(digest.to_bytes(width, "big") + tag.to_bytes(TAG_BYTES, "big"))
+                n += 1
+        return self._open_run(path, n)
+
+    def _iter_run(self, run):
+        _, _, mm, n = run
+        width = self._width()
+        size = self._record_size()
+        for i in range(n):
+            record = mm[i * size:(i + 1) * size]
+            yield (int.from_bytes(record[:width], "big"),
+                   int.from_bytes(record[width:], "big"))
+
+    def _spill(self):
+        entries = sorted(self._entries())
+        self._runs.append(self._write_run(entries))
+        self._run_keys += len(entries)
+        self._reset(self._initial_capacity)
+        if len(self._runs) >= MAX_RUNS:
+            merged = self._write_run(
+                heapq.merge(*(self._iter_run(r) for r in self._runs)))
+            for run in self._runs:
+                self._close_run(run)
+            self._runs = [merged]
+
+    # --- public API ----------------------------------------------------------
+
+    def add(self, key) -> bool:
+        """Records `key`; returns False if its digest and check tag were
+        already present."""
+        return self.add_digest(*_tagged_digest(key, self.bits))
+
+    def add_digest(self, digest, tag=0) -> bool:
+        digest = digest or 1
+        # Make room first: a spill moves the table into a run, which the
+        # lookup below must then see.
+        if (self._count + 1) > self._capacity * MAX_LOAD:
+            if (self._memory_limit is not None
+                    and 2 * self.table_bytes() > self._memory_limit):
+                self._spill()
+            else:
+                self._grow()
+        collided = False
+        for run in self._runs:
+            found = self._run_lookup(run, digest, tag)
+            if found == 0:
+                return False
+            collided = collided or found == 2
+        keep = self.on_collision == "keep"
+        inserted = self._insert(digest, tag, keep, collided)
+        if inserted != 2:
+            return inserted == 1
+        self.collisions += 1
+        if self.on_collision == "error":
+            raise RuntimeError(
+                f"{self.kind} dedup digest collision: two keys share digest "
+                f"{digest:#x} (use --dedup-on-collision keep or drop)")
+        return keep
+
+    def __len__(self):
+        return self._count + self._run_keys
+
+    def table_bytes(self) -> int:
+        return (self._slots.itemsize * len(self._slots)
+                + self._tags.itemsize * len(self._tags))
+
+    def memory_bytes(self) -> int:
+        """Resident size of the in-memory table."""
+        return sys.getsizeof(self._slots) + sys.getsizeof(self._tags)
+
+    def disk_bytes(self) -> int:
+        return sum(run[3] for run in self._runs) * self._record_size()
+
+    def close(self):
+        """Releases spill files (the index is unusable afterwards)."""
+        for run in self._runs:
+            self._close_run(run)
+        self._runs = []
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def save(self, directory):
+        """Writes a snapshot of the index into `directory`.
+
+        Run files are immutable once written, so they are hard-linked
+        (copied where links are unsupported) rather than rewritten.
+        """
+        with open(os.path.join(directory, "table.bin"), "wb") as fp:
+            self._slots.tofile(fp)
+        with open(os.path.join(directory, "tags.bin"), "wb") as fp:
+            self._tags.tofile(fp)
+        runs = []
+        for i, (path, _, _, n) in enumerate(self._runs):
+            name = f"run-{i:05d}.bin"
+            try:
+                os.link(path, os.path.join(directory, name))
+            except OSError:
+                shutil.copyfile(path, os.path.join(directory, name))
+            runs.append([name, n])
+        meta = {"bits": self.bits, "tag_bytes": TAG_BYTES,
+                "capacity": self._capacity, "count": self._count,
+                "collisions": self.collisions, "runs": runs}
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as fp:
+            json.dump(meta, fp)
+
+    def restore(self, directory):
+        """Replaces the contents with a snapshot written by save()."""
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as fp:
+            meta = json.load(fp)
+        if meta["bits"] != self.bits:
+            raise ValueError(f"snapshot is a hash{meta['bits']} index, "
+                             f"not {self.kind}")
+        if meta.get("tag_bytes") != TAG_BYTES:
+            raise ValueError("snapshot predates dedup check tags; "
+                             "rebuild instead of resuming")
+        self.close()
+        self._reset(meta["capacity"])
+        self._slots = array("Q")
+        with open(os.path.join(directory, "table.bin"), "rb") as fp:
+            self._slots.fromfile(fp, meta["capacity"] * self._words)
+        self._tags = array("H")
+        with open(os.path.join(directory, "tags.bin"), "rb") as fp:
+            self._tags.fromfile(fp, meta["capacity"])
+        self._count = meta["count"]
+        self.collisions = meta["collisions"]
+        self._run_keys = 0
+        for name, n in meta["runs"]:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="quixi-dedup-",
+                                                   dir=self._spill_root)
+            path = os.path.join(self._spill_dir, f"run-{self._runs_written:05d}.bin")
+            self._runs_written += 1
+            shutil.copyfile(os.path.join(directory, name), path)
+            self._runs.append(self._open_run(path, n))
+            self._run_keys += n
+
+    def describe(self) -> str:
+        text = (f"{self.kind}: {len(self):,} keys, "
+                f"{format_bytes(self.memory_bytes())} in memory")
+        if self._runs:
+            text += (f", {format_bytes(self.disk_bytes())} spilled in "
+                     f"{len(self._runs)} run(s)")
+        if self.collisions:
+            handled = {"keep": "kept", "drop": "dropped", "error": "raised"}
+            text += (f", {self.collisions:,} digest collision(s) "
+                     f"{handled[self.on_collision]}")
+        return text
+
+
+def make_dedup_index(kind="exact", memory_limit_mb=None, spill_dir=None,
+                     on_collision="keep"):
+    """Builds a dedup index from CLI-style options.
+
+    memory_limit_mb (hash kinds only) enables spilling to sorted runs under
+    spill_dir (default: the system temp dir). on_collision is one of
+    COLLISION_POLICIES; exact keys never collide, so exact ignores it.
+    """
+    if on_collision not in COLLISION_POLICIES:
+        raise ValueError(f"Unknown collision policy {on_collision!r}; "
+                         f"choose one of {', '.join(COLLISION_POLICIES)}")
+    if kind == "exact":
+        if memory_limit_mb is not None:
+            raise ValueError("a dedup memory limit needs a hash index "
+                             "(hash64 or hash128), not exact")
+        return ExactDedup()
+    if kind in ("hash64", "hash128"):
+        limit = None
+        if memory_limit_mb is not None:
+            if memory_limit_mb <= 0:
+                raise ValueError(
+                    f"dedup memory limit must be positive, got {memory_limit_mb}")
+            limit = int(memory_limit_mb * 1024 * 1024)
+        return HashDedup(bits=int(kind[4:]), memory_limit=limit,
+                         spill_dir=spill_dir, on_collision=on_collision)
+    raise ValueError(f"Unknown dedup index {kind!r}; "
+                     f"choose one of {', '.join(DEDUP_KINDS)}")
@@ -0,0 +1,316 @@
+"""Local example server for rollout workers (quixi_math_datagen.py --serve).
+
+A worker pool loads the generator pool once and keeps it warm, and an HTTP
+server on localhost hands out batches of examples as newline-delimited
+JSON. Clients do not import any generator code and do not touch the global
+`random`.
+
+    GET /examples?n=64[&seed=S][&skill=A,B][&grade_level=middle,high][&difficulty=2-4]
+        n examples, one JSON object per line (application/x-ndjson).
+        With a seed the batch is reproducible: the first n rows of
+        iter_examples(seed) over the filtered skills. Without one, rows
+        come from a buffer the workers keep topped up for that filter.
+    GET /skills   the served skills with their curriculum grade and difficulty
+    GET /health   pool size and buffer state
+
+Filters select skills by class name and by their curriculum.CURRICULUM
+grade_level/difficulty; rows are checked again after generation, since a
+generator may stamp its own metadata. Dedup applies within one batch.
+Bad requests get status 400 and a JSON {"error": ...} body.
+"""
+import json
+import multiprocessing
+import random
+import threading
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+from base_generator import materialize
+from curriculum import CURRICULUM
+from example_stream import iter_examples
+from quixi_math_datagen import group_into_skills, parse_weights, resolve_pool
+from skill_sampler import parse_mix_value
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Largest n a single request may ask for.
+MAX_BATCH_ROWS = 10_000
+# Rows one worker task generates for an unseeded buffer.
+CHUNK_ROWS = 256
+# Unseeded rows kept ready per filter.
+PREFETCH_ROWS = 1024
+# Filters with their own unseeded buffer; the least recently used one is
+# dropped beyond this.
+MAX_BUFFERS = 32
+# Rows a task may examine per row it needs before it gives up on a filter
+# that generated rows keep failing.
+MAX_SCAN_FACTOR = 50
+
+_serve_skills = None
+_serve_weights = None
+
+
+class ExampleFilter(NamedTuple):
+    """Which examples a request wants; empty tuples match everything."""
+    skills: tuple = ()
+    grade_levels: tuple = ()
+    difficulties: tuple = ()
+
+    def matches(self, row) -> bool:
+        return ((not self.grade_levels or row["grade_level"] in self.grade_levels)
+                and (not self.difficulties or row["difficulty"] in self.difficulties))
+
+    def skill_matches(self, name) -> bool:
+        meta = CURRICULUM.get(name)
+        return ((not self.skills or name in self.skills)
+                and (meta is None or not self.grade_levels
+                     or meta["grade_level"] in self.grade_levels)
+                and (meta is None or not self.difficulties
+                     or meta["difficulty"] in self.difficulties))
+
+
+def parse_filter(skill=None, grade_level=None, difficulty=None) -> ExampleFilter:
+    """An ExampleFilter from comma-separated query values; difficulty
+    takes values and N-M bands as --mix does."""
+    def split(text):
+        return [part.strip() for part in (text or "").split(",") if part.strip()]
+
+    grades = set()
+    for value in split(grade_level):
+        grades.update(parse_mix_value("grade_level", value))
+    difficulties = set()
+    for value in split(difficulty):
+        difficulties.update(parse_mix_value("difficulty", value))
+    return ExampleFilter(tuple(sorted(set(split(skill)))), tuple(sorted(grades)),
+                         tuple(sorted(difficulties)))
+
+
+def _init_serve_worker(generators, weights):
+    """Loads every generator of the pool once per worker process."""
+    global _serve_skills, _serve_weights
+    _serve_skills = {name: [materialize(entry) for entry in entries]
+                     for name, entries in group_into_skills(resolve_pool(generators)).items()}
+    _serve_weights = weights
+
+
+def _serve_rows(example_filter, seed, n):
+    """Worker task: up to n serialized rows for `example_filter` from
+    iter_examples(seed); fewer only if the filtered skills run dry."""
+    selected = [name for name in _serve_skills if example_filter.skill_matches(name)]
+    if not selected:
+        raise ValueError("no served skill matches the filter")
+    weights = {name: _serve_weights[name] for name in selected
+               if name in (_serve_weights or {})}
+    stream = iter_examples(seed, weights=weights or None,
+                           generators=[g for name in selected for g in _serve_skills[name]])
+    try:
+        scanned = islice(stream, n * MAX_SCAN_FACTOR + CHUNK_ROWS)
+        rows = islice((row for row in scanned if example_filter.matches(row)), n)
+        return [json.dumps(row, ensure_ascii=False) + "\n" for row in rows]
+    finally:
+        stream.close()
+
+
+class _Buffer:
+    """Unseeded rows for one filter, refilled by worker tasks."""
+
+    def __init__(self):
+        self.rows = deque()
+        self.in_flight = 0
+        self.error = None
+
+
+class ExampleService:
+    """The worker pool behind the server, usable without HTTP.
+
+    batch(n, seed, example_filter) returns n serialized rows. Seeded
+    batches are computed by a worker on request; unseeded ones are taken
+    from a per-filter buffer that the workers refill to prefetch_rows in
+    CHUNK_ROWS tasks, each with a fresh random seed.
+    """
+
+    def __init__(self, generators=None, weights=None, workers=2,
+                 prefetch_rows=PREFETCH_ROWS):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        skills = group_into_skills(resolve_pool(generators))
+        self.skill_names = list(skills)
+        self.weights = parse_weights(weights, self.skill_names) if weights else None
+        self.workers = workers
+        self.prefetch_rows = prefetch_rows
+        self._random = random.SystemRandom()
+        self._lock = threading.Condition()
+        self._buffers = OrderedDict()
+        self._pool = multiprocessing.Pool(workers, initializer=_init_serve_worker,
+                                          initargs=(generators, self.weights))
+        self._closed = False
+
+    def skills(self) -> list:
+        return [{"skill": name, **CURRICULUM.get(name, {})}
+                for name in self.skill_names]
+
+    def _check_filter(self, example_filter):
+        unknown = sorted(set(example_filter.skills) - set(self.skill_names))
+        if unknown:
+            raise ValueError(f"unknown skills: {', '.join(unknown)}")
+        if not any(map(example_filter.skill_matches, self.skill_names)):
+            raise ValueError("no served skill matches the filter")
+
+    def batch(self, n, seed=None, example_filter=ExampleFilter()):
+        if not 1 <= n <= MAX_BATCH_ROWS:
+            raise ValueError(f"n must be in 1..{MAX_BATCH_ROWS}, got {n}")
+        self._check_filter(example_filter)
+        if seed is not None:
+            return self._pool.apply(_serve_rows, (example_filter, seed, n))
+        return self._take(example_filter, n)
+
+    def _refill(self, example_filter, buffer, wanted):
+        """Queues tasks until buffered plus in-flight rows reach `wanted`
+        (caller holds the lock)."""
+        while len(buffer.rows) + buffer.in_flight < wanted:
+            buffer.in_flight += CHUNK_ROWS
+
+            def done(rows, buffer=buffer):
+                with self._lock:
+                    buffer.in_flight -= CHUNK_ROWS
+                    buffer.rows.extend(rows)
+                    if not rows:
+                        buffer.error = ValueError("the filtered skills produced no rows")
+                    self._lock.notify_all()
+
+            def failed(error, buffer=buffer):
+                with self._lock:
+                    buffer.in_flight -= CHUNK_ROWS
+                    buffer.error = error
+                    self._lock.notify_all()
+
+            self._pool.apply_async(_serve_rows,
+                                   (example_filter, self._random.getrandbits(64),
+                                    CHUNK_ROWS),
+                                   callback=done, error_callback=failed)
+
+    def _take(self, example_filter, n):
+        with self._lock:
+            buffer = self._buffers.get(example_filter)
+            if buffer is None:
+                buffer = self._buffers[example_filter] = _Buffer()
+                if len(self._buffers) > MAX_BUFFERS:
+                    self._buffers.popitem(last=False)
+            self._buffers.move_to_end(example_filter)
+            while len(buffer.rows) < n:
+                if buffer.error is not None:
+                    error, buffer.error = buffer.error, None
+                    raise error
+                self._refill(example_filter, buffer, max(n, self.prefetch_rows))
+                self._lock.wait()
+            rows = [buffer.rows.popleft() for _ in range(n)]
+            self._refill(example_filter, buffer, self.prefetch_rows)
+            return rows
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"workers": self.workers, "skills": len(self.skill_names),
+                    "buffers": len(self._buffers),
+                    "buffered_rows": sum(len(b.rows) for b in self._buffers.values())}
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        # Let queued refills finish: terminating a pool with queued tasks
+        # can deadlock its task handler thread.
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+    quiet = True
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({"error": message}) + "\n")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if url.path == "/examples":
+                n = int(query.get("n", 1))
+                seed = int(query["seed"]) if "seed" in query else None
+                example_filter = parse_filter(query.get("skill"), query.get("grade_level"),
+                                              query.get("difficulty"))
+                rows = self.service.batch(n, seed, example_filter)
+                headers = {"X-Rows": str(len(rows))}
+                if seed is not None:
+                    headers["X-Seed"] = str(seed)
+                self._send(200, "".join(rows), "application/x-ndjson", headers)
+            elif url.path == "/skills":
+                self._send(200, json.dumps(self.service.skills()) + "\n")
+            elif url.path == "/health":
+                self._send(200, json.dumps({"status": "ok", **self.service.stats()}) + "\n")
+            else:
+                self._error(404, f"no such endpoint: {url.path}")
+        except ValueError as e:
+            self._error(400, str(e))
+        except Exception as e:
+            self._error(500, f"{type(e).__name__}: {e}")
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, quiet=True):
+    """A ThreadingHTTPServer answering from `service` (port 0: any free
+    port, see server.server_address); call serve_forever() to run it."""
+    handler = type("ExampleHandler", (_Handler,), {"service": service, "quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def parse_address(spec) -> tuple:
+    """(host, port) from "--serve [HOST:]PORT"."""
+    host, sep, port = str(spec).rpartition(":")
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError(f"Bad --serve address {spec!r}; expected [HOST:]PORT") from None
+    return (host if sep else DEFAULT_HOST), port
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, generators=None, weights=None,
+          workers=2, prefetch_rows=PREFETCH_ROWS, quiet=False):
+    """Runs the server until interrupted."""
+    with ExampleService(generators, weights, workers, prefetch_rows) as service:
+        server = make_server(service, host, port, quiet)
+        names = ", ".join(service.skill_names[:5])
+        more = len(service.skill_names) - 5
+        print(f"Serving {len(service.skill_names)} skills ({names}"
+              f"{f', +{more} more' if more > 0 else ''}) with {workers} workers "
+              f"on http://{server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
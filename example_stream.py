@@ -0,0 +1,168 @@
+"""Streaming examples for training loops: iter_examples().
+
+iter_examples() yields the same validated, stamped examples build_dataset()
+would write, as dicts, without an output file. It shares the build's pool
+setup (resolve_pool, group_into_skills, parse_weights, --mix) and batch
+streams, so for one seed and options its first n rows are exactly the
+first n rows of the built dataset.
+
+Generation can run ahead of the consumer: prefetch=k keeps up to k build
+batches ready, produced by a child process. Generators written against
+the global `random` run under base_generator.rng_scope(), which rebinds
+the module-level functions for the whole process. A producer thread would
+therefore race the consumer's own `random` calls, and other producers,
+so prefetching always uses a separate process.
+
+For data-loader workers, worker_shard() gives each worker a shard of the
+build batches (as --shard i/N does across nodes), so workers draw disjoint
+batch streams from one seed. Dedup is per stream: two workers can still
+emit the same problem from different batches.
+"""
+import multiprocessing
+import random
+import traceback
+
+from dedup import make_dedup_index
+from quixi_math_datagen import (BUILD_BATCH_SIZE, SkillSampler, _sequential_attempts,
+                                group_into_skills, resolve_pool, skill_weights_for)
+
+
+def _example_batches(seed, weights=None, generators=None, dedup="exact", n=None,
+                     mix=None, shard=None):
+    """Yields lists of accepted examples, one list per build batch.
+
+    Errors and duplicates are dropped. Stops after n examples (None: never)
+    or once max(2000, n) attempts in a row were rejected, as a build does
+    when the selected skills run out of new problems.
+    """
+    skills = group_into_skills(resolve_pool(generators))
+    skill_names = list(skills)
+    skill_weights, _ = skill_weights_for(skill_names, weights, mix)
+    sampler = SkillSampler(skill_names, skill_weights, BUILD_BATCH_SIZE)
+    seen = make_dedup_index(dedup) if isinstance(dedup, str) else dedup
+    max_consecutive_rejects = max(2000, n or 0)
+    count = 0
+    consecutive_rejects = 0
+    try:
+        for groups in _sequential_attempts(skills, sampler, seed,
+                                           shard=shard or (0, 1), serialize=False):
+            examples = []
+            for _, _, results, _ in groups:
+                for key, example, error in results:
+                    if n is not None and count >= n:
+                        break
+                    if error is not None or (seen is not None and not seen.add(key)):
+                        consecutive_rejects += 1
+                        continue
+                    examples.append(example)
+                    count += 1
+                    consecutive_rejects = 0
+            if examples:
+                yield examples
+            if ((n is not None and count >= n)
+                    or consecutive_rejects >= max_consecutive_rejects):
+                return
+    finally:
+        if seen is not None and isinstance(dedup, str):
+            seen.close()
+
+
+def _produce_in_child(ready, kwargs):
+    try:
+        for batch in _example_batches(**kwargs):
+            ready.put(("batch", batch))
+    except BaseException:
+        ready.put(("error", traceback.format_exc()))
+    else:
+        ready.put(("done", None))
+
+
+def _process_batches(kwargs, depth):
+    """Runs _example_batches(**kwargs) in a child process, up to `depth`
+    batches ahead; the child is terminated when the consumer stops."""
+    ready = multiprocessing.Queue(depth)
+    process = multiprocessing.Process(target=_produce_in_child, args=(ready, kwargs),
+                                      daemon=True, name="example-prefetch")
+    process.start()
+    try:
+        while True:
+            kind, payload = ready.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise RuntimeError(f"example producer process failed:\n{payload}")
+            yield payload
+    finally:
+        process.terminate()
+        process.join()
+        ready.close()
+
+
+def iter_examples(seed=None, weights=None, generators=None, dedup="exact", n=None,
+                  mix=None, shard=None, prefetch=0):
+    """Yields validated, stamped examples (dicts, as written to JSONL) lazily.
+
+    `weights`, `generators` and `mix` select and weight skills as in
+    build_dataset(); `dedup` is a dedup.DEDUP_KINDS name, a ready index
+    from dedup.make_dedup_index(), or None to keep repeats. n=None streams
+    until the consumer stops (or the pool stops yielding new problems).
+    shard=(index, count), e.g. from worker_shard(), restricts the stream to
+    build batches index, index+count, ...; the rows are then not those of a
+    build, and n counts this shard's rows only. An unseeded stream draws a
+    random seed.
+
+    prefetch=k > 0 produces up to k build batches (of BUILD_BATCH_SIZE
+    attempts) ahead of the consumer in a child process; the rows are the
+    same as without prefetch. The producer builds its own dedup index, so
+    `dedup` must then be a kind name or None; its errors are re-raised as
+    RuntimeError. Closing the generator stops the producer.
+    """
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+    if prefetch and not (dedup is None or isinstance(dedup, str)):
+        raise ValueError("a process producer builds its own dedup index; "
+                         "pass a dedup kind name or None")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    kwargs = {"seed": seed, "weights": weights, "generators": generators,
+              "dedup": dedup, "n": n, "mix": mix, "shard": shard}
+    if prefetch:
+        batches = _process_batches(kwargs, prefetch)
+    else:
+        batches = _example_batches(**kwargs)
+    try:
+        for batch in batches:
+            yield from batch
+    finally:
+        batches.close()
+
+
+def worker_shard(rank=0, world_size=1, worker_id=None, num_workers=None):
+    """The (index, count) shard of one data-loader worker, for
+    iter_examples(shard=...).
+
+    `rank`/`world_size` number the training processes; worker_id and
+    num_workers the loader workers within one. They default to
+    torch.utils.data.get_worker_info() when torch is importable and this
+    runs in a loader worker, else to a single worker. Every
+    (rank, worker) pair gets a different index, so with one seed the
+    workers' batch streams are disjoint and together cover the build's.
+    """
+    if worker_id is None or num_workers is None:
+        info = None
+        try:
+            from torch.utils.data import get_worker_info
+        except ImportError:
+            pass
+        else:
+            info = get_worker_info()
+        if worker_id is None:
+            worker_id = info.id if info is not None else 0
+        if num_workers is None:
+            num_workers = info.num_workers if info is not None else 1
+    if world_size < 1 or num_workers < 1:
+        raise ValueError("world_size and num_workers must be >= 1")
+    if not (0 <= rank < world_size and 0 <= worker_id < num_workers):
+        raise ValueError(f"rank {rank} / worker {worker_id} out of range for "
+                         f"world_size {world_size} x num_workers {num_workers}")
+    return rank * num_workers + worker_id, world_size * num_workers
@@ -5,6 +5,7 @@ Import generators from their modules directly, e.g.::
     from generators.long_division_generator import LongDivisionGenerator
 
 The registry / source of truth for which generators are active is
-``ALL_GENERATORS`` in ``quixi_math_datagen.py``; grade/difficulty metadata
-lives in ``curriculum.py``.
+``GENERATOR_REGISTRY`` in ``quixi_math_datagen.py`` (lazy entries; modules
+here are imported on first use); grade/difficulty metadata lives in
+``curriculum.py``.
 """
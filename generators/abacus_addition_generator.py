@@ -1,6 +1,6 @@
 import random
 from base_generator import ProblemGenerator
-from helpers import step, jid
+from helpers import step, step3, jid
 
 class AbacusAdditionGenerator(ProblemGenerator):
     """Generates addition problems solved abacus-style: left to right,
@@ -38,7 +38,7 @@ class AbacusAdditionGenerator(ProblemGenerator):
             if component == 0:
                 continue
             new_total = total + component
-            steps.append(step("AB_ADD", f"+{component}", total, new_total))
+            steps.append(step3("AB_ADD", f"+{component}", total, new_total))
             total = new_total
 
         steps.append(step("Z", final_answer_str)) # Final answer step
@@ -126,7 +126,7 @@ class AbsoluteValueEquationGenerator(ProblemGenerator):
         solutions.append(sol2)
         
         # A0 convention: multiple roots ascending, joined with ' or '
-        from fractions import Fraction
+        from rational import Fraction
         solutions.sort(key=Fraction)
         final_ans = f"x = {solutions[0]} or x = {solutions[1]}"
         steps.append(step("Z", final_ans))
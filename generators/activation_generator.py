@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 VARIANTS = ["relu", "sigmoid", "gelu"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class ActivationGenerator(ProblemGenerator):
     """
     Activation values, derivatives, and two-layer scalar chain rule.
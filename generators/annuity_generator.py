@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec, money
+from rational import Fraction
+from rendering import dec, money
 from generators.finance_generator import exact
 
 
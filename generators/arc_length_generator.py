@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from math import lcm
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 TRIPLES = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25),
            (20, 21, 29)]
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 DISTRIBUTIONS = [
@@ -13,10 +14,6 @@ DISTRIBUTIONS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def distribution_text(symbols, probabilities):
     return ", ".join(
         f"{symbol}={fraction_text(probability)}"
@@ -1,19 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def matrix_text(matrix):
-    return "[" + ", ".join(
-        "[" + ",".join(fraction_text(value) for value in row) + "]"
-        for row in matrix
-    ) + "]"
+from rational import Fraction
+from rendering import fraction_text, matrix_text
 
 
 class AttentionGenerator(ProblemGenerator):
@@ -1,22 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def vector_text(values):
-    return "(" + ",".join(fraction_text(value) for value in values) + ")"
-
-
-def matrix_text(matrix):
-    rows = ["[" + ",".join(fraction_text(value) for value in row) + "]"
-            for row in matrix]
-    return "[" + ", ".join(rows) + "]"
+from rational import Fraction
+from rendering import fraction_text, matrix_text, vector_text
 
 
 def relu(value):
@@ -1,12 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
+from rational import Fraction
+from rendering import fraction_text
 
 
 def data_text(values):
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 COEFFS = [-5, -4, -3, -2, -1, 1, 2, 3, 4, 5]
@@ -16,10 +17,6 @@ PAIRS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def zero_matrix(size=3):
     return [[Fraction(0) for _ in range(size)] for _ in range(size)]
 
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 from math import comb
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 
 EPSILONS = [Fraction(1, 4), Fraction(1, 3), Fraction(1, 2)]
@@ -1,9 +1,9 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec, exact
 
 # Success probabilities as small fractions; p^k(1-p)^(n-k) stays exact
 # (a terminating decimal when the denominator is 2^a·5^b, else a
@@ -13,16 +13,6 @@ PS = [Fraction(1, 2), Fraction(1, 3), Fraction(1, 4), Fraction(1, 5),
       Fraction(3, 4), Fraction(7, 10)]
 
 
-def exact(fr):
-    """Terminating decimal when possible, else the reduced fraction."""
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
-
-
 def pow_step(base, e):
     """A POW step for base^e; returns (step, value)."""
     val = base ** e
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.finance_generator import exact
 
 
@@ -1,12 +1,8 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
+from rendering import fraction_text
 
 
 class BlackbodyGenerator(ProblemGenerator):
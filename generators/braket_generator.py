@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 def cx(real=0, imag=0):
@@ -28,10 +29,6 @@ COMPONENTS = [
 PHASES = [cx(1), cx(-1), cx(0, 1), cx(0, -1)]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def imag_unit_text(value):
     value = Fraction(value)
     if value == 1:
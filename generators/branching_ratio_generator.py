@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 CHANNELS = ["a", "b", "c"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class BranchingRatioGenerator(ProblemGenerator):
     """
     Particle partial widths, branching ratios, and lifetimes.
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 H_VALUES = sorted({
@@ -12,10 +13,6 @@ H_VALUES = sorted({
 })
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def matrix_text(matrix):
     return "[" + ", ".join(
         "[" + ", ".join(fraction_text(value) for value in row) + "]"
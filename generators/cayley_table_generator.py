@@ -3,6 +3,7 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 D3_ELEMENTS = ["e", "r", "r2", "s", "rs", "r2s"]
@@ -21,8 +22,14 @@ def list_text(values):
     return ", ".join(str(value) for value in values)
 
 
+@static_table
 def units(n):
-    return [value for value in range(1, n) if gcd(value, n) == 1]
+    return tuple(value for value in range(1, n) if gcd(value, n) == 1)
+
+
+@static_table
+def non_identity_units(n):
+    return tuple(value for value in units(n) if value != 1)
 
 
 def d3_multiply(left, right):
@@ -107,7 +114,7 @@ class CayleyTableGenerator(ProblemGenerator):
         n = random.choice([8, 10, 12, 14, 15, 16, 18, 20, 21, 22,
                            24, 26, 28, 30])
         elements = units(n)
-        target = random.choice([value for value in elements if value != 1])
+        target = random.choice(non_identity_units(n))
         steps = [
             step("GROUP_SETUP", f"U({n})", "multiplication mod n"),
             step("CAYLEY_HEADER", list_text(elements)),
@@ -1,33 +1,10 @@
 import math
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def dec(value):
-    value = Fraction(value)
-    num, den = value.numerator, value.denominator
-    p10 = 0
-    while den % 2 == 0:
-        den //= 2
-        num *= 5
-        p10 += 1
-    while den % 5 == 0:
-        den //= 5
-        num *= 2
-        p10 += 1
-    assert den == 1, value
-    if p10 == 0:
-        return str(num)
-    s = str(abs(num)).rjust(p10 + 1, "0")
-    out = f"{s[:-p10]}.{s[-p10:]}".rstrip("0").rstrip(".")
-    return ("-" if num < 0 else "") + out
+from rational import Fraction
+from rendering import dec, fraction_text
 
 
 def info_lookup(probability):
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec, exact
 
 # Upper-tail χ² critical values (α = 0.05) by degrees of freedom,
 # supplied in the problem text (Principle 5).
@@ -15,16 +15,6 @@ CRIT_BY_DF = {
 GOF_EXPECTED = [5, 10, 20, 25]
 
 
-def exact(fr):
-    """Terminating decimal when possible, else the reduced fraction."""
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
-
-
 def sq_txt(d):
     """(d)^2 rendered with parentheses around a negative base."""
     return f"({d})^2 = {d * d}" if d < 0 else f"{d}^2 = {d * d}"
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 SPHERE_POINTS = {
@@ -23,10 +24,6 @@ SPHERE_POINTS = {
 }
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class ChristoffelGenerator(ProblemGenerator):
     """
     Christoffel symbols for hand-friendly 2D diagonal metrics.
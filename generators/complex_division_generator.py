@@ -1,8 +1,8 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.complex_number_ops_generator import cx, wrap_i
 
 
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec, money
+from rational import Fraction
+from rendering import dec, money
 from generators.mixed_number_operation_generator import (
     to_improper, to_mixed,
 )
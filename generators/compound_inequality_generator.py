@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 
 def frac_str(num, den):
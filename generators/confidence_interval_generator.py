@@ -1,9 +1,9 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # Critical values are supplied in the problem text (Principle 5).
 Z_STARS = ["1.28", "1.645", "1.96", "2.05", "2.576"]
@@ -3,6 +3,7 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 D3_ELEMENTS = ["e", "r", "r2", "s", "rs", "r2s"]
@@ -25,8 +26,9 @@ def set_text(values):
     return "{" + list_text(values) + "}"
 
 
+@static_table
 def units(n):
-    return [value for value in range(1, n) if gcd(value, n) == 1]
+    return tuple(value for value in range(1, n) if gcd(value, n) == 1)
 
 
 def is_composite(n):
@@ -61,6 +63,36 @@ def multiplicative_subgroup(n, element):
     return subgroup
 
 
+@static_table
+def additive_choices(n):
+    """Elements of Z_n generating a proper nontrivial subgroup."""
+    return tuple(element for element in range(1, n)
+                 if 1 < len(additive_subgroup(n, element)) < n)
+
+
+@static_table
+def zn_orders():
+    return tuple(n for n in range(6, 37) if additive_choices(n))
+
+
+@static_table
+def unit_subgroup_choices():
+    """(n, element) pairs where <element> is a proper nontrivial
+    subgroup of U(n), for composite n in 8..60 with |U(n)| <= 24."""
+    choices = []
+    for n in range(8, 61):
+        group = units(n)
+        if not is_composite(n) or len(group) > 24:
+            continue
+        for element in group:
+            if element == 1:
+                continue
+            subgroup = multiplicative_subgroup(n, element)
+            if 1 < len(subgroup) < len(group):
+                choices.append((n, element))
+    return tuple(choices)
+
+
 def coset_summary(cosets):
     return "; ".join(f"{label}={set_text(values)}" for label, values in cosets)
 
@@ -108,9 +140,8 @@ class CosetGenerator(ProblemGenerator):
         )
 
     def _generate_zn(self):
-        n = random.choice([value for value in range(6, 37)
-                           if len(self._additive_choices(value)) > 0])
-        element = random.choice(self._additive_choices(n))
+        n = random.choice(zn_orders())
+        element = random.choice(additive_choices(n))
         group = list(range(n))
         subgroup, steps = self._trace_additive_subgroup(n, element)
         cosets = []
@@ -140,14 +171,6 @@ class CosetGenerator(ProblemGenerator):
         )
         return problem, steps, answer
 
-    def _additive_choices(self, n):
-        choices = []
-        for element in range(1, n):
-            size = len(additive_subgroup(n, element))
-            if 1 < size < n:
-                choices.append(element)
-        return choices
-
     def _trace_additive_subgroup(self, n, element):
         steps = [
             step("GROUP_SETUP", f"Z_{n}", "addition mod n",
@@ -171,7 +194,7 @@ class CosetGenerator(ProblemGenerator):
         return subgroup, steps
 
     def _generate_units(self):
-        n, element = random.choice(self._unit_subgroup_choices())
+        n, element = random.choice(unit_subgroup_choices())
         group = units(n)
         subgroup, steps = self._trace_multiplicative_subgroup(n, element)
         cosets = []
@@ -201,20 +224,6 @@ class CosetGenerator(ProblemGenerator):
         )
         return problem, steps, answer
 
-    def _unit_subgroup_choices(self):
-        choices = []
-        for n in range(8, 61):
-            group = units(n)
-            if not is_composite(n) or len(group) > 24:
-                continue
-            for element in group:
-                if element == 1:
-                    continue
-                subgroup = multiplicative_subgroup(n, element)
-                if 1 < len(subgroup) < len(group):
-                    choices.append((n, element))
-        return choices
-
     def _trace_multiplicative_subgroup(self, n, element):
         group = units(n)
         steps = [
@@ -1,13 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fmt_frac(value):
-    value = Fraction(value)
-    return str(value.numerator) if value.denominator == 1 else str(value)
+from rational import Fraction
+from rendering import factor_text, fraction_text as fmt_frac
 
 
 def fmt_linear(coeff, const):
@@ -20,10 +16,6 @@ def fmt_linear(coeff, const):
     return f"{first} {'+' if const > 0 else '-'} {abs(const)}"
 
 
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
-
-
 class CurveGeometryGenerator(ProblemGenerator):
     """
     Curve geometry: arc length, curvature, unit tangent, and unit normal.
@@ -3,6 +3,7 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 def list_text(values):
@@ -13,8 +14,14 @@ def set_text(values):
     return "{" + list_text(values) + "}"
 
 
+@static_table
 def units(n):
-    return [value for value in range(1, n) if gcd(value, n) == 1]
+    return tuple(value for value in range(1, n) if gcd(value, n) == 1)
+
+
+@static_table
+def non_identity_units(n):
+    return tuple(value for value in units(n) if value != 1)
 
 
 class CyclicGroupGenerator(ProblemGenerator):
@@ -92,7 +99,7 @@ class CyclicGroupGenerator(ProblemGenerator):
         n = random.choice([8, 10, 12, 14, 15, 16, 18, 20, 21, 22,
                            24, 26, 28, 30])
         elements = units(n)
-        element = random.choice([value for value in elements if value != 1])
+        element = random.choice(non_identity_units(n))
         group_size = len(elements)
         subgroup = [1]
         current = 1
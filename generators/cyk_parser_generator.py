@@ -134,4 +134,5 @@ class CYKParserGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(text,),
         )
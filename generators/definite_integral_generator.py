@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.derivative_power_rule_generator import poly_pow, term_pow
 
 
@@ -206,4 +206,5 @@ class DFAMinimizationGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(variant,),
         )
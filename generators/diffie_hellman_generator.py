@@ -2,6 +2,7 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 PRIMES = [17, 19, 23, 29, 31, 37, 41, 43]
@@ -29,9 +30,13 @@ def is_primitive_root(g, p):
     return True
 
 
+@static_table
+def primitive_roots(p):
+    return tuple(g for g in range(2, p) if is_primitive_root(g, p))
+
+
 def primitive_root(p):
-    roots = [g for g in range(2, p) if is_primitive_root(g, p)]
-    return random.choice(roots)
+    return random.choice(primitive_roots(p))
 
 
 class DiffieHellmanGenerator(ProblemGenerator):
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 
 class DimensionalAnalysisGenerator(ProblemGenerator):
@@ -133,6 +133,7 @@ class DPLLTraceGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(variant,),
         )
 
     def _search(self, clauses, variables, assignment, steps, depth):
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.matrix_ops_generator import mat
 
 
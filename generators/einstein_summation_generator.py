@@ -1,15 +1,12 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 from generators.matrix_ops_generator import mat
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def matrix_text(matrix):
     return "[" + ", ".join(
         "[" + ", ".join(fraction_text(value) for value in row) + "]"
@@ -2,6 +2,7 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 CURVES = [
@@ -27,6 +28,7 @@ def inv_mod(value, modulus):
     return pow(value % modulus, -1, modulus)
 
 
+@static_table
 def enumerate_points(p, a, b):
     points = []
     for x in range(p):
@@ -34,7 +36,21 @@ def enumerate_points(p, a, b):
         for y in range(p):
             if (y * y) % p == rhs:
                 points.append((x, y))
-    return points
+    return tuple(points)
+
+
+@static_table
+def addable_pairs(p, a, b):
+    """Ordered pairs (P, Q) of distinct affine points with Q != -P."""
+    points = enumerate_points(p, a, b)
+    return tuple((P, Q) for P in points for Q in points
+                 if P != Q and not (P[0] == Q[0] and (P[1] + Q[1]) % p == 0))
+
+
+@static_table
+def doubling_points(p, a, b):
+    """Affine points with y != 0, where the tangent is not vertical."""
+    return tuple(pt for pt in enumerate_points(p, a, b) if pt[1] % p != 0)
 
 
 def add_points(P, Q, p, a):
@@ -82,22 +98,23 @@ class EllipticCurveFiniteFieldGenerator(ProblemGenerator):
         variant = self.variant or random.choice(self.VARIANTS)
         curve = random.choice(CURVES)
         p, a, b = curve["p"], curve["a"], curve["b"]
-        points = enumerate_points(p, a, b)
         steps = [
             step("EC_SETUP", f"p={p}", f"a={a}", f"b={b}"),
         ]
         if variant == "add":
-            P, Q = self._pick_add_points(points, p)
+            P, Q = random.choice(addable_pairs(p, a, b))
             result = self._append_add_steps(steps, P, Q, p, a, b, "P+Q")
             task = f"compute P + Q for P={point_text(P)} and Q={point_text(Q)}"
             answer = f"P+Q = {point_text(result)}"
+            key = (p, a, b, P, Q)
         elif variant == "double":
-            P = random.choice([pt for pt in points if pt[1] % p != 0])
+            P = random.choice(doubling_points(p, a, b))
             result = self._append_add_steps(steps, P, P, p, a, b, "2P")
             task = f"compute 2P for P={point_text(P)}"
             answer = f"2P = {point_text(result)}"
+            key = (p, a, b, P)
         else:
-            P = random.choice([pt for pt in points if pt[1] % p != 0])
+            P = random.choice(doubling_points(p, a, b))
             k = random.randint(3, 6)
             acc = None
             steps.append(step("EC_SCALAR_SETUP", f"k={k}", f"P={point_text(P)}"))
@@ -107,6 +124,7 @@ class EllipticCurveFiniteFieldGenerator(ProblemGenerator):
                 steps.append(step("EC_ACCUM", f"{i}P", point_text(acc)))
             task = f"compute {k}P for P={point_text(P)}"
             answer = f"{k}P = {point_text(acc)}"
+            key = (p, a, b, P, k)
         problem = random.choice(PROBLEM_TEMPLATES).format(
             p=p,
             a=a,
@@ -120,16 +138,9 @@ class EllipticCurveFiniteFieldGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=key,
         )
 
-    def _pick_add_points(self, points, p):
-        candidates = []
-        for P in points:
-            for Q in points:
-                if P != Q and not (P[0] == Q[0] and (P[1] + Q[1]) % p == 0):
-                    candidates.append((P, Q))
-        return random.choice(candidates)
-
     def _append_point_check(self, steps, point, p, a, b, label):
         if point is None:
             steps.append(step("EC_POINT_CHECK", label, "O", "identity"))
@@ -1,9 +1,10 @@
 import math
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text, matrix_text, vector_text
 
 
 VARIANTS = ["cosine_distance_matrix", "analogy_arithmetic"]
@@ -14,21 +15,6 @@ BASE_VECTORS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def vector_text(vector):
-    return "(" + ",".join(fraction_text(value) for value in vector) + ")"
-
-
-def matrix_text(matrix):
-    return "[" + ", ".join(
-        "[" + ",".join(fraction_text(value) for value in row) + "]"
-        for row in matrix
-    ) + "]"
-
-
 def embeddings_text(labels, vectors):
     return ", ".join(
         f"{label}={vector_text(vector)}"
@@ -116,6 +116,7 @@ class ErrorSpottingGenerator(ProblemGenerator):
             problem=self._render_given(f"Solve for x: {equation}", given),
             steps=steps,
             final_answer=answer,
+            dedup_key=(a, x, b, sign, error_site, slip),
         )
 
     # ------------------------------------------------------------------
@@ -182,4 +183,5 @@ class ErrorSpottingGenerator(ProblemGenerator):
             problem=self._render_given(problem_line, given),
             steps=steps,
             final_answer=answer,
+            dedup_key=(a, b, k_anchor, k_missing, error_site, slip),
         )
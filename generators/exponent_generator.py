@@ -1,9 +1,23 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from param_space import ParamSpace, mixture
+from rational import Fraction
+from rendering import dec
+from static_cache import static_table
+
+
+@static_table
+def _evaluation_operands(allow_negative_base, max_exponent):
+    """(base, exponent) pairs with |base|^exponent <= 100000. With
+    negatives allowed the base is a fair coin between -9..-2 and 2..15."""
+    if allow_negative_base:
+        bases = mixture(range(-9, -1), range(2, 16))
+    else:
+        bases = range(2, 16)
+    return ParamSpace.product(bases, range(2, max_exponent + 1),
+                              where=lambda base, exp: abs(base) ** exp <= 100000)
 
 
 class ExponentEvaluationGenerator(ProblemGenerator):
@@ -31,14 +45,8 @@ class ExponentEvaluationGenerator(ProblemGenerator):
     def generate(self) -> dict:
         """Generate an exponent evaluation problem."""
         # Generate base and exponent, keeping the result hand-computable
-        while True:
-            if self.allow_negative_base and random.choice([True, False]):
-                base = random.randint(-9, -2)
-            else:
-                base = random.randint(2, 15)
-            exponent = random.randint(2, self.max_exponent)
-            if abs(base) ** exponent <= 100000:
-                break
+        base, exponent = _evaluation_operands(self.allow_negative_base,
+                                              self.max_exponent).sample()
 
         # Calculate result
         result = base ** exponent
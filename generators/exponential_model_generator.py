@@ -1,36 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def dec(fr):
-    """Exact decimal string for a Fraction whose denominator is
-    2^a·5^b: 33/10 -> '3.3', 1331/1000 -> '1.331'."""
-    num, den = fr.numerator, fr.denominator
-    p10 = 0
-    while den % 2 == 0:
-        den //= 2
-        num *= 5
-        p10 += 1
-    while den % 5 == 0:
-        den //= 5
-        num *= 2
-        p10 += 1
-    assert den == 1, fr
-    if p10 == 0:
-        return str(num)
-    s = str(abs(num)).rjust(p10 + 1, "0")
-    out = f"{s[:-p10]}.{s[-p10:]}".rstrip("0").rstrip(".")
-    return ("-" if num < 0 else "") + out
-
-
-def money(fr):
-    """Fraction dollars -> '$665.50'."""
-    cents = fr * 100
-    assert cents.denominator == 1
-    c = cents.numerator
-    return f"${c // 100}.{c % 100:02d}"
+from rational import Fraction
+from rendering import dec, money
 
 
 class ExponentialModelGenerator(ProblemGenerator):
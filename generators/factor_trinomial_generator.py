@@ -3,6 +3,8 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from param_space import ParamSpace
+from static_cache import static_table
 
 
 def sgn_num(n):
@@ -61,6 +63,21 @@ def lead_xterm(coef, var):
     return f"{mag}{var}" if coef > 0 else f"-{mag}{var}"
 
 
+NONZERO_ROOTS = [n for n in range(-9, 10) if n != 0]
+# (p, q) for (x + p)(x + q): distinct roots and a nonzero middle term.
+MONIC_ROOTS = ParamSpace.product(NONZERO_ROOTS, NONZERO_ROOTS,
+                                 where=lambda p, q: p != q and p + q != 0)
+
+
+@static_table(persist=True)
+def _general_factors():
+    """(p, q, r, s) for (px + r)(qx + s), filtered by
+    FactorTrinomialGenerator._general_ok."""
+    coefs = [v for v in range(-6, 7) if v != 0]
+    return ParamSpace.product(range(1, 5), range(1, 5), coefs, coefs,
+                              where=FactorTrinomialGenerator._general_ok)
+
+
 class FactorTrinomialGenerator(ProblemGenerator):
     """
     Factors trinomials with visible trial-and-error (A2).
@@ -104,6 +121,23 @@ class FactorTrinomialGenerator(ProblemGenerator):
                 count += 1
         return count
 
+    @classmethod
+    def _general_ok(cls, p, q, r, s):
+        if p * q < 2:
+            return False
+        if gcd(p, abs(r)) != 1 or gcd(q, abs(s)) != 1:
+            return False
+        if p == q and r == s:            # perfect square — special forms
+            return False
+        a, b, c = p * q, p * s + q * r, r * s
+        if b == 0:
+            return False
+        m, n = p * s, q * r              # the ac-method split, in
+        if m == n:                       # grouping-compatible order
+            return False
+        # Keep the trial chain humane: at most 5 rejected pairs.
+        return cls._pairs_before(a * c, min(abs(m), abs(n))) <= 5
+
     # ------------------------------------------------------------------
 
     def generate(self) -> dict:
@@ -113,12 +147,7 @@ class FactorTrinomialGenerator(ProblemGenerator):
 
     def _generate_monic(self) -> dict:
         var = random.choice(["x", "x", "x", "y", "n"])
-        while True:
-            p = random.choice([n for n in range(-9, 10) if n != 0])
-            q = random.choice([n for n in range(-9, 10) if n != 0])
-            if p != q and p + q != 0:
-                break
-        p, q = sorted((p, q))
+        p, q = sorted(MONIC_ROOTS.sample())
         b, c = p + q, p * q
 
         c_txt = f"+ {c}" if c > 0 else f"- {-c}"
@@ -143,26 +172,9 @@ class FactorTrinomialGenerator(ProblemGenerator):
 
     def _generate_general(self) -> dict:
         var = random.choice(["x", "x", "x", "y", "n"])
-        while True:
-            p, q = random.randint(1, 4), random.randint(1, 4)
-            if p * q < 2:
-                continue
-            r = random.choice([v for v in range(-6, 7) if v != 0])
-            s = random.choice([v for v in range(-6, 7) if v != 0])
-            if gcd(p, abs(r)) != 1 or gcd(q, abs(s)) != 1:
-                continue
-            if p == q and r == s:            # perfect square — special forms
-                continue
-            a, b, c = p * q, p * s + q * r, r * s
-            if b == 0:
-                continue
-            m, n = p * s, q * r              # the ac-method split, in
-            if m == n:                       # grouping-compatible order
-                continue
-            # Keep the trial chain humane: at most 5 rejected pairs.
-            if self._pairs_before(a * c, min(abs(m), abs(n))) > 5:
-                continue
-            break
+        p, q, r, s = _general_factors().sample()
+        a, b, c = p * q, p * s + q * r, r * s
+        m, n = p * s, q * r
 
         c_txt = f"+ {c}" if c > 0 else f"- {-c}"
         a_txt = str(a) if a > 1 else ""
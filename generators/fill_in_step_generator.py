@@ -22,7 +22,8 @@ class FillInStepGenerator(ProblemGenerator):
     - Z|<missing step verbatim>
 
     Flows: two-step equations, ratio tables, tip totals — the same
-    well-understood linear chains the error-spotting format uses.
+    well-understood linear chains the error-spotting format uses. Each
+    flow also returns the dedup_key: its operands plus the blanked line.
     """
 
     MODES = ["equation", "ratio", "tip"]
@@ -34,7 +35,7 @@ class FillInStepGenerator(ProblemGenerator):
 
     def generate(self) -> dict:
         mode = self.mode or random.choice(self.MODES)
-        problem_line, lines, blank_idx, need, check = getattr(
+        problem_line, lines, blank_idx, need, check, key = getattr(
             self, f"_{mode}_flow")()
 
         shown = [f"{i + 1}) {'____' if i == blank_idx else s}"
@@ -56,6 +57,7 @@ class FillInStepGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=missing,
+            dedup_key=key,
         )
 
     # ------------------------------------------------------------------
@@ -92,7 +94,8 @@ class FillInStepGenerator(ProblemGenerator):
             need = (f"line 3 shows {a}x = {rhs}",
                     f"line 5 shows x = {x}")
             check = (f"{rhs} ÷ {a} = {x}", str(x))
-        return f"Solve for x: {equation}", lines, blank_idx, need, check
+        return (f"Solve for x: {equation}", lines, blank_idx, need, check,
+                (a, x, b, sign, blank_idx))
 
     def _ratio_flow(self):
         while True:
@@ -130,7 +133,8 @@ class FillInStepGenerator(ProblemGenerator):
             check = (f"{a} × {k_missing} = {missing_val}", str(missing_val))
         problem_line = ("A recipe mixes flour and sugar in a fixed ratio. "
                         f"Find the missing value.\n{row1}\n{row2}")
-        return problem_line, lines, blank_idx, need, check
+        return (problem_line, lines, blank_idx, need, check,
+                (a, b, k_anchor, k_missing, blank_idx))
 
     def _tip_flow(self):
         tip_pct = random.choice([10, 15, 18, 20, 25])
@@ -162,4 +166,5 @@ class FillInStepGenerator(ProblemGenerator):
                      money(total))
         problem_line = (f"A meal costs ${money(bill)}. Add a {tip_pct}% tip. "
                         f"What is the total including tip?")
-        return problem_line, lines, blank_idx, need, check
+        return (problem_line, lines, blank_idx, need, check,
+                (tip_pct, bill_dollars, blank_idx))
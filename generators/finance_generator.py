@@ -1,19 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec, money
-
-
-def exact(fr):
-    """Terminating decimal when possible, else the reduced fraction."""
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
+from rational import Fraction
+from rendering import dec, exact, money
 
 
 class FinanceGenerator(ProblemGenerator):
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # Sizes whose halves have odd length, so both quartiles are actual
 # data points (median-exclusive halves).
@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 VARIANTS = ["matmul_forward", "kv_cache"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class FLOPsMemoryGenerator(ProblemGenerator):
     """
     FLOPs and memory arithmetic for transformer-adjacent computations.
@@ -1,8 +1,8 @@
 import random
 import math
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 
 class FractionComparisonGenerator(ProblemGenerator):
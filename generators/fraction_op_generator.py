@@ -1,8 +1,8 @@
 import random
 import math
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid, DELIM
+from rational import Fraction
 
 class FractionOpGenerator(ProblemGenerator):
     """Generates fraction arithmetic problems (+, -, *, /)."""
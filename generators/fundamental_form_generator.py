@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 THETA_CHOICES = [
@@ -18,10 +19,6 @@ PHI_COS = {
 }
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def pi_text(multiplier):
     multiplier = Fraction(multiplier)
     if multiplier == 0:
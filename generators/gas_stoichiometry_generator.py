@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 GAS_TO_MASS_TEMPLATES = [
@@ -24,10 +25,6 @@ MASS_TO_GAS_TEMPLATES = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def parse_term(term):
     pieces = term.split(" ", 1)
     if len(pieces) == 2 and pieces[0].isdigit():
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec, exact
 
 
 PS = [
@@ -14,16 +14,6 @@ PS = [
 ]
 
 
-def exact(fr):
-    """Terminating decimal when possible, else the reduced fraction."""
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
-
-
 def pow_step(base, exponent):
     value = base ** exponent
     return step("POW", f"({base})^{exponent}", exact(value)), value
@@ -1,18 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
-
-
-def exact(fr):
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
+from rational import Fraction
+from rendering import dec, exact, factor_text
 
 
 def fmt_formula(a, b, c, d, e):
@@ -78,10 +69,6 @@ def fmt_eval_sum(raw_terms):
     return " ".join(pieces) if pieces else "0"
 
 
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
-
-
 def tangent_plane(z0, fx, fy, x0, y0):
     pieces = [f"z = {z0}"]
     for coeff, body in ((fx, f"(x - {x0})"), (fy, f"(y - {y0})")):
@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 VARIANTS = ["two_sample", "three_sample"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def pair_text(left, right):
     return f"({fraction_text(left)},{fraction_text(right)})"
 
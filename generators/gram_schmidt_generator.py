@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text as fmt_frac
 from generators.matrix_ops_generator import mat
 
 
@@ -19,11 +20,6 @@ ORTHO_3 = [
 ]
 
 
-def fmt_frac(value):
-    value = Fraction(value)
-    return str(value.numerator) if value.denominator == 1 else str(value)
-
-
 def fmt_num(value):
     value = Fraction(value)
     text = fmt_frac(value)
@@ -2,10 +2,7 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
+from rendering import factor_text
 
 
 def fmt_linear(raw_terms):
@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 SYMBOLS = "ABCDEFGH"
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def bit_unit(value):
     return "bit" if Fraction(value) == 1 else "bits"
 
@@ -1,19 +1,16 @@
 import math
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 FEATURES = ["color", "shape", "size", "texture", "region", "source"]
 TOTAL = 16
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def decimal_text(value):
     value = Fraction(value)
     num, den = value.numerator, value.denominator
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 MASS_TRIPLES = [
@@ -33,10 +34,6 @@ TWO_BODY_CASES = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class InvariantMassGenerator(ProblemGenerator):
     """
     Relativistic kinematics with exact invariant quantities.
@@ -37,6 +37,7 @@ class JacobiSymbolGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(a, n),
         )
 
     def _trace(self, a, n):
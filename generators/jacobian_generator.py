@@ -2,6 +2,7 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rendering import factor_text
 
 
 def fmt_linear(raw_terms):
@@ -20,10 +21,6 @@ def fmt_linear(raw_terms):
     return " ".join(pieces) if pieces else "0"
 
 
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
-
-
 class JacobianGenerator(ProblemGenerator):
     """
     Jacobian determinants and linear change-of-variables area scaling.
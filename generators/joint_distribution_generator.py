@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 RHO_VALUES = [
@@ -16,10 +17,6 @@ RHO_VALUES = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def build_profiles():
     profiles = []
     marginals = {
@@ -1,22 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text, vector_text
 
 
 VARIANTS = ["polynomial_gram", "rbf_gram"]
 LABELS = ["A", "B", "C"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def vector_text(vector):
-    return "(" + ",".join(fraction_text(value) for value in vector) + ")"
-
-
 def points_text(labels, vectors):
     return ", ".join(
         f"{label}={vector_text(vector)}"
@@ -1,29 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
+from rational import Fraction
+from rendering import fraction_text, matrix_text, vector_text
 
 
 def pair_text(pairs):
     return "[" + ", ".join(f"({x},{y})" for x, y in pairs) + "]"
 
 
-def vector_text(vector):
-    return "(" + ",".join(fraction_text(value) for value in vector) + ")"
-
-
-def matrix_text(matrix):
-    return "[" + ", ".join(
-        "[" + ",".join(fraction_text(value) for value in row) + "]"
-        for row in matrix
-    ) + "]"
-
-
 class KernelRidgeGenerator(ProblemGenerator):
     """
     Kernel ridge regression with a linear kernel on two training points.
@@ -1,17 +1,14 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 POINT_COUNT = 4
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def point_text(point):
     return f"({fraction_text(point[0])},{fraction_text(point[1])})"
 
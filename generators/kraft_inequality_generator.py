@@ -1,18 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 SYMBOLS = "ABCDEFGH"
 VARIANTS = ["complete", "incomplete", "infeasible"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def lengths_text(pairs):
     return ", ".join(f"{symbol}={length}" for symbol, length in pairs)
 
@@ -77,4 +77,5 @@ class LambdaReductionGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(variant,),
         )
@@ -1,16 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
-
-
-def vector_text(values):
-    return "(" + ",".join(fraction_text(value) for value in values) + ")"
+from rational import Fraction
+from rendering import fraction_text, vector_text
 
 
 class LayerNormGenerator(ProblemGenerator):
@@ -1,13 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fmt_frac(value):
-    value = Fraction(value)
-    return str(value.numerator) if value.denominator == 1 else str(value)
+from rational import Fraction
+from rendering import fraction_text as fmt_frac
 
 
 def fmt_linear(raw_terms):
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 from math import lcm
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 
 def fstr(fr):
@@ -1,7 +1,7 @@
 import random
 from base_generator import ProblemGenerator
 from curriculum import clamp_difficulty
-from helpers import step, jid, DELIM
+from helpers import step, step3, jid, DELIM
 
 class LongDivisionGenerator(ProblemGenerator):
     """Generates long division problems (e.g., 1234 / 56).
@@ -11,6 +11,8 @@ class LongDivisionGenerator(ProblemGenerator):
     ESTIMATE_CHECK comparing the exact quotient against it.
     """
 
+    accepts_rng = True
+
     def __init__(self, estimate: bool = False):
         self.estimate = estimate
         if estimate:
@@ -28,9 +30,21 @@ class LongDivisionGenerator(ProblemGenerator):
                     best = (key, v, m * 10 ** t)
         return best[1], best[2]
 
-    def generate(self) -> dict:
-        dividend = random.randint(10, 9999)
-        divisor = random.randint(2, 99)
+    def generate(self, rng=None) -> dict:
+        rng = rng or random
+        dividend = rng.randint(10, 9999)
+        divisor = rng.randint(2, 99)
+        return self._example(dividend, divisor, rng)
+
+    def generate_many(self, k, rng=None) -> list:
+        rng = rng or random
+        randrange = rng.randrange
+        dividends = [randrange(10, 10000) for _ in range(k)]
+        divisors = [randrange(2, 100) for _ in range(k)]
+        return [self._example(dividend, divisor, rng)
+                for dividend, divisor in zip(dividends, divisors)]
+
+    def _example(self, dividend, divisor, rng) -> dict:
         steps = []
         operation = ("long_division_estimated" if self.estimate
                      else "long_division")
@@ -60,7 +74,7 @@ class LongDivisionGenerator(ProblemGenerator):
                 # Show bring down step only AFTER the first division step has produced a quotient digit
                 if q_str: # If we have already started the quotient string
                     # Args: Remainder Before, Digit Brought Down, New Number to Divide
-                    steps.append(step("B", rem_before_bringdown, digit, cur))
+                    steps.append(step3("B", rem_before_bringdown, digit, cur))
                 # Else: This is the initial part being formed (e.g., 1, then 18 for 1834/5)
 
                 if cur < divisor:
@@ -80,9 +94,9 @@ class LongDivisionGenerator(ProblemGenerator):
 
                 # Add standard long division steps
                 # The first D, M, S steps implicitly cover the initial part
-                steps.append(step("D", cur, divisor, q_dig))
-                steps.append(step("M", q_dig, divisor, prod))
-                steps.append(step("S", cur, prod, new_rem))
+                steps.append(step3("D", cur, divisor, q_dig))
+                steps.append(step3("M", q_dig, divisor, prod))
+                steps.append(step3("S", cur, prod, new_rem))
 
                 q_str += str(q_dig)
                 rem = new_rem
@@ -104,7 +118,7 @@ class LongDivisionGenerator(ProblemGenerator):
 
         # Self-verification (A1), emitted on about half of examples:
         # quotient × divisor + remainder must reproduce the dividend.
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             q_val = 0 if dividend < divisor else int(q_str)
             r_val = dividend if dividend < divisor else rem
             steps.append(step("CHECK", "multiply_back",
@@ -119,7 +133,7 @@ class LongDivisionGenerator(ProblemGenerator):
         steps.append(step("Z", final_answer_str)) # Final answer step
 
         result = dict(
-            problem_id=jid(),
+            problem_id=jid(rng),
             operation=operation,
             problem=problem,
             steps=steps,
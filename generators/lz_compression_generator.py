@@ -123,6 +123,7 @@ class LZCompressionGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(text,),
         )
 
     def _generate_lz77(self, text):
@@ -1,18 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 TRIG_SINES = [Fraction(3, 5), Fraction(4, 5), Fraction(5, 13),
               Fraction(12, 13), Fraction(7, 25), Fraction(24, 25)]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def over_pi_text(value):
     coeff = Fraction(value)
     if coeff.denominator == 1:
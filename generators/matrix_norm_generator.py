@@ -1,19 +1,16 @@
 import math
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 VARIANTS = ["vector_norms", "frobenius_norm", "spectral_condition"]
 PYTHAGOREAN = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25)]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def vector_text(values):
     return "(" + ",".join(str(value) for value in values) + ")"
 
@@ -1,6 +1,6 @@
 import random
 from base_generator import ProblemGenerator
-from helpers import step, jid
+from helpers import step, step2, step3, jid
 
 
 def mat(m):
@@ -52,10 +52,10 @@ class MatrixOpsGenerator(ProblemGenerator):
                           f"A {op} B")]
             for i in range(2):
                 for j in range(2):
-                    steps.append(step("S" if minus else "A",
-                                      A[i][j], B[i][j], R[i][j]))
-                    steps.append(step("MAT_ENTRY", f"({i + 1},{j + 1})",
-                                      R[i][j]))
+                    steps.append(step3("S" if minus else "A",
+                                       A[i][j], B[i][j], R[i][j]))
+                    steps.append(step2("MAT_ENTRY", f"({i + 1},{j + 1})",
+                                       R[i][j]))
             problem = (f"Given A = {mat(A)} and B = {mat(B)}, compute "
                        f"A {op} B.")
         elif variant == "scalar":
@@ -65,9 +65,9 @@ class MatrixOpsGenerator(ProblemGenerator):
             steps = [step("MAT_SETUP", f"A = {mat(A)}", f"{k}A")]
             for i in range(2):
                 for j in range(2):
-                    steps.append(step("M", k, A[i][j], R[i][j]))
-                    steps.append(step("MAT_ENTRY", f"({i + 1},{j + 1})",
-                                      R[i][j]))
+                    steps.append(step3("M", k, A[i][j], R[i][j]))
+                    steps.append(step2("MAT_ENTRY", f"({i + 1},{j + 1})",
+                                       R[i][j]))
             problem = f"Given A = {mat(A)}, compute {k}A."
         else:
             A = rnd_mat(2, 2, -5, 5)
@@ -83,11 +83,11 @@ class MatrixOpsGenerator(ProblemGenerator):
                 for j in range(cols):
                     p1 = A[i][0] * B[0][j]
                     p2 = A[i][1] * B[1][j]
-                    steps.append(step("M", A[i][0], B[0][j], p1))
-                    steps.append(step("M", A[i][1], B[1][j], p2))
-                    steps.append(step("A", p1, p2, R[i][j]))
-                    steps.append(step("MAT_ENTRY",
-                                      f"({i + 1},{j + 1})", R[i][j]))
+                    steps.append(step3("M", A[i][0], B[0][j], p1))
+                    steps.append(step3("M", A[i][1], B[1][j], p2))
+                    steps.append(step3("A", p1, p2, R[i][j]))
+                    steps.append(step2("MAT_ENTRY",
+                                       f"({i + 1},{j + 1})", R[i][j]))
             problem = (f"Given A = {mat(A)} and {name_b} = {mat(B)}, "
                        f"compute {goal}. Show the row-by-column work.")
 
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 RAPIDITIES = [
@@ -19,10 +20,6 @@ RAPIDITIES = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def interval_class(s2):
     if s2 > 0:
         return "timelike"
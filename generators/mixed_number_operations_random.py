@@ -1,8 +1,9 @@
 import random
+from base_generator import ProblemGenerator
 from generators.mixed_number_operation_generator import MixedNumberOperationGenerator
 
 
-class MixedNumberOperationsRandom:
+class MixedNumberOperationsRandom(ProblemGenerator):
     """
     Wrapper generator that randomly picks +, -, *, / mixed-number operation.
     Useful for sampling/dataset inclusion without listing each op separately.
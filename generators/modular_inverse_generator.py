@@ -3,6 +3,21 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from param_space import ParamSpace
+from rational import Fraction
+
+# (modulus, a) with a in modulus+1..3·modulus coprime to the modulus; the
+# a-range grows with the modulus, so pairs are weighted 1/(2·modulus).
+_INVERSE_PAIRS = [(modulus, a) for modulus in range(11, 71)
+                  for a in range(modulus + 1, 3 * modulus + 1)
+                  if gcd(a, modulus) == 1]
+INVERSE_PAIRS = ParamSpace(_INVERSE_PAIRS, [Fraction(1, 2 * modulus)
+                                            for modulus, _ in _INVERSE_PAIRS])
+# (reduced modulus, unit residue 2..modulus-1), weighted 1/(modulus-2).
+_REDUCED_UNITS = [(modulus, residue) for modulus in range(5, 19)
+                  for residue in range(2, modulus) if gcd(residue, modulus) == 1]
+REDUCED_UNITS = ParamSpace(_REDUCED_UNITS, [Fraction(1, modulus - 2)
+                                            for modulus, _ in _REDUCED_UNITS])
 
 
 def list_text(values):
@@ -84,11 +99,7 @@ class ModularInverseGenerator(ProblemGenerator):
         )
 
     def _generate_inverse(self):
-        while True:
-            modulus = random.randint(11, 70)
-            a = random.randint(modulus + 1, 3 * modulus)
-            if gcd(a, modulus) == 1:
-                break
+        modulus, a = INVERSE_PAIRS.sample()
         steps = [
             step("MOD_SETUP", "inverse", f"a={a}", f"modulus={modulus}"),
         ]
@@ -113,12 +124,8 @@ class ModularInverseGenerator(ProblemGenerator):
         return problem, steps, answer, "modular_inverse"
 
     def _generate_linear(self):
-        while True:
-            d = random.randint(1, 4)
-            reduced_modulus = random.randint(5, 18)
-            reduced_residue = random.randint(2, reduced_modulus - 1)
-            if gcd(reduced_residue, reduced_modulus) == 1:
-                break
+        d = random.randint(1, 4)
+        reduced_modulus, reduced_residue = REDUCED_UNITS.sample()
         reduced_a = reduced_residue + random.randint(1, 2) * reduced_modulus
         modulus = d * reduced_modulus
         a = d * reduced_a
@@ -1,7 +1,7 @@
 import random
 from base_generator import ProblemGenerator
 from curriculum import clamp_difficulty
-from helpers import step, jid
+from helpers import step, step3, jid
 
 
 class MultiDigitAdditionGenerator(ProblemGenerator):
@@ -11,12 +11,25 @@ class MultiDigitAdditionGenerator(ProblemGenerator):
     much carrying the specific operands force.
     """
 
-    def generate(self) -> dict:
-        operation = "multi_digit_addition"
+    accepts_rng = True
+
+    def generate(self, rng=None) -> dict:
+        rng = rng or random
         # Keep numbers at least two digits to show meaningful carrying cases
-        num1 = random.randint(10, 99999)
-        num2 = random.randint(10, 99999)
+        num1 = rng.randint(10, 99999)
+        num2 = rng.randint(10, 99999)
+        return self._example(num1, num2, rng)
 
+    def generate_many(self, k, rng=None) -> list:
+        rng = rng or random
+        randrange = rng.randrange
+        firsts = [randrange(10, 100000) for _ in range(k)]
+        seconds = [randrange(10, 100000) for _ in range(k)]
+        return [self._example(num1, num2, rng)
+                for num1, num2 in zip(firsts, seconds)]
+
+    def _example(self, num1, num2, rng) -> dict:
+        operation = "multi_digit_addition"
         s1, s2 = str(num1), str(num2)
         max_len = max(len(s1), len(s2))
         s1, s2 = s1.zfill(max_len), s2.zfill(max_len)
@@ -38,7 +51,7 @@ class MultiDigitAdditionGenerator(ProblemGenerator):
 
             add_details = f"{d1}+{d2}+{carry}"
             add_result = f"->{result_digit} (carry {new_carry})"
-            steps.append(step("ADD_COL", col_name, add_details, add_result))
+            steps.append(step3("ADD_COL", col_name, add_details, add_result))
             carry = new_carry
             carries += new_carry
 
@@ -49,7 +62,7 @@ class MultiDigitAdditionGenerator(ProblemGenerator):
         steps.append(step("Z", str(final_answer)))
 
         return dict(
-            problem_id=jid(),
+            problem_id=jid(rng),
             operation=operation,
             problem=problem,
             steps=steps,
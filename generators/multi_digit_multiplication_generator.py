@@ -1,7 +1,7 @@
 import random
 from base_generator import ProblemGenerator
 from curriculum import clamp_difficulty
-from helpers import step, jid
+from helpers import step, step3, jid
 
 
 def sig1(n):
@@ -53,7 +53,7 @@ class MultiDigitMultiplicationGenerator(ProblemGenerator):
             digit = int(digit_char)
             partial = digit * top
             shifted = partial * (10 ** idx)
-            steps.append(step("MUL_PARTIAL", digit, top_str, str(shifted)))
+            steps.append(step3("MUL_PARTIAL", digit, top_str, str(shifted)))
             partials.append(shifted)
 
         total = sum(partials)
@@ -1,7 +1,7 @@
 import random
 from base_generator import ProblemGenerator
 from curriculum import clamp_difficulty
-from helpers import step, jid
+from helpers import step, step3, jid
 
 
 class MultiDigitSubtractionGenerator(ProblemGenerator):
@@ -40,12 +40,12 @@ class MultiDigitSubtractionGenerator(ProblemGenerator):
                 d1_eff += 10
                 borrow_out = 1
                 borrows += 1
-                steps.append(step("BORROW", col_name, "from_left", 1))
+                steps.append(step3("BORROW", col_name, "from_left", 1))
 
             col_diff = d1_eff - d2
             sub_details = f"{d1}-{d2}-borrow{borrow_in}"
             sub_result = f"->{col_diff} (borrow_out {borrow_out})"
-            steps.append(step("SUB_COL", col_name, sub_details, sub_result))
+            steps.append(step3("SUB_COL", col_name, sub_details, sub_result))
 
             borrow = borrow_out
 
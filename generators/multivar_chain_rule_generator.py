@@ -1,18 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
-
-
-def exact(fr):
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
+from rational import Fraction
+from rendering import dec, exact, factor_text
 
 
 def fmt_linear(raw_terms):
@@ -57,10 +48,6 @@ def fmt_eval_sum(raw_terms):
     return " + ".join(pieces) if pieces else "0"
 
 
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
-
-
 def product_sum_text(left_a, right_a, left_b, right_b):
     return (
         f"{factor_text(left_a)}*{factor_text(right_a)} + "
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 FEATURES = ["offer", "link", "urgent", "known", "long", "money"]
@@ -11,10 +12,6 @@ VARIANTS = ["two_feature", "three_feature"]
 ALPHA = 1
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def pairs_text(pairs):
     return ", ".join(f"{name}={value}" for name, value in pairs)
 
@@ -1,9 +1,10 @@
 import math
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 EXP_VALUES = {
@@ -21,10 +22,6 @@ PHI_VALUES = {
 }
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class NamedDistributionGenerator(ProblemGenerator):
     """
     Poisson, exponential, uniform, and normal distribution arithmetic.
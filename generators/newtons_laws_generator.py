@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 TRIG_PAIRS = [
@@ -12,10 +13,6 @@ TRIG_PAIRS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class NewtonsLawsGenerator(ProblemGenerator):
     """
     Newton's-law force systems: Atwood machines and frictional inclines.
@@ -190,4 +190,5 @@ class NFASimulationGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(input_string,),
         )
@@ -1,19 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec, fraction_text
 from generators.finance_generator import exact
 
 
 VARIANTS = ["npv", "irr_newton"]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class NPVIRRGenerator(ProblemGenerator):
     """
     Net present value and IRR via Newton iterations.
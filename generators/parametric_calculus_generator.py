@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.arc_sector_generator import pi_txt
 from generators.integration_by_parts_generator import cm
 
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 COEFFS = [-4, -3, -2, -1, 1, 2, 3, 4]
@@ -94,10 +95,6 @@ def trace(matrix):
     return sum_complex(matrix[i][i] for i in range(len(matrix)))
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def imag_text(value):
     sign = "-" if value < 0 else ""
     value = abs(Fraction(value))
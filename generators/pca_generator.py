@@ -1,12 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
+from rational import Fraction
+from rendering import fraction_text, matrix_text, vector_text
 
 
 def point_text(point):
@@ -17,17 +14,6 @@ def points_text(points):
     return "[" + ", ".join(point_text(point) for point in points) + "]"
 
 
-def vector_text(values):
-    return "(" + ",".join(fraction_text(value) for value in values) + ")"
-
-
-def matrix_text(matrix):
-    return "[" + ", ".join(
-        "[" + ",".join(fraction_text(value) for value in row) + "]"
-        for row in matrix
-    ) + "]"
-
-
 def add_running_steps(steps, values):
     running = Fraction(0)
     for value in values:
@@ -53,6 +53,7 @@ class PDASimulationGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(input_text,),
         )
 
     def _balanced(self, text):
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec, money
+from rational import Fraction
+from rendering import dec, money
 
 # A4: several natural-language phrasings per scenario. Keyed by the
 # arithmetic type so the solving steps stay identical while the
@@ -86,6 +86,7 @@ class PercentWordProblemGenerator(ProblemGenerator):
         pct = random.choice([5, 8, 10, 12, 15, 20, 25, 30])
         base = random.randint(20, 200)
         problem = prompt.format(pct=pct, base=base)
+        key = (op_type, pct, base)
 
         steps = []
         if self.distractor:
@@ -94,6 +95,7 @@ class PercentWordProblemGenerator(ProblemGenerator):
             d_sentence, d_lo, d_hi = random.choice(pool)
             d_val = random.randint(d_lo, d_hi)
             problem = f"{problem} {d_sentence.format(d_val)}"
+            key += (d_sentence, d_val)
             steps.append(step("SELECT_RELEVANT",
                               f"base = {base}, rate = {pct}%",
                               f"ignore {d_val} (irrelevant)"))
@@ -126,4 +128,5 @@ class PercentWordProblemGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=final_answer,
+            dedup_key=key,
         )
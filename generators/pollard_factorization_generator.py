@@ -61,6 +61,7 @@ class PollardFactorizationGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(n, params),
         )
 
     def _rho_case(self):
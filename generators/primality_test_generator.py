@@ -1,8 +1,10 @@
 import random
+from itertools import combinations
 from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 PRIMES = [31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
@@ -40,6 +42,20 @@ def witness_passes(n, witness):
     return False
 
 
+@static_table(persist=True)
+def problem_space():
+    """Every (n, witnesses) generate() can produce: any two witnesses below
+    min(n - 1, 12) for a prime, any two units below min(n - 1, 20) with at
+    least one Miller-Rabin failure for a composite."""
+    space = [(n, pair) for n in PRIMES
+             for pair in combinations(range(2, min(n - 1, 12)), 2)]
+    for n in COMPOSITES:
+        pool = [a for a in range(2, min(n - 1, 20)) if gcd(a, n) == 1]
+        space.extend((n, pair) for pair in combinations(pool, 2)
+                     if any(not witness_passes(n, w) for w in pair))
+    return tuple(space)
+
+
 class PrimalityTestGenerator(ProblemGenerator):
     """
     Miller-Rabin primality test traces with supplied witnesses.
@@ -65,7 +81,13 @@ class PrimalityTestGenerator(ProblemGenerator):
                 if any(not witness_passes(n, witness)
                        for witness in witnesses):
                     break
+        return self.generate_from((n, witnesses))
+
+    def enumerate_space(self):
+        return problem_space()
 
+    def generate_from(self, params) -> dict:
+        n, witnesses = params
         s, d, divisions = decompose(n)
         steps = [
             step("MR_SETUP", f"n={n}", f"witnesses {list_text(witnesses)}"),
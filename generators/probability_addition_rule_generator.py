@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec, exact
 
 DENOMS = [6, 8, 10, 12, 20]
 
@@ -18,16 +18,6 @@ DIE_EVENTS = [
 ]
 
 
-def exact(fr):
-    """Terminating decimal when possible, else the reduced fraction."""
-    d = fr.denominator
-    while d % 2 == 0:
-        d //= 2
-    while d % 5 == 0:
-        d //= 5
-    return dec(fr) if d == 1 else str(fr)
-
-
 class ProbabilityAdditionRuleGenerator(ProblemGenerator):
     """
     The addition rule P(A ∪ B) = P(A) + P(B) − P(A ∩ B), for both
@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import money
+from rational import Fraction
+from rendering import money
 
 # A4: phrasing banks. Within each scenario every phrasing keeps the
 # three numbers in the SAME textual order (documented per scenario)
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 QUARK_CHARGES = {
@@ -15,10 +16,6 @@ QUARK_CHARGES = {
 QUARKS = list(QUARK_CHARGES)
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def signed_fraction(value):
     fr = Fraction(value)
     if fr > 0:
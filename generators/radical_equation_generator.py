@@ -1,6 +1,8 @@
 import random
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from param_space import ParamSpace
+from rational import Fraction
 from generators.factor_trinomial_generator import pair_search, xterm
 
 
@@ -11,6 +13,32 @@ def isqrt(n):
     return r
 
 
+def _one_extraneous_ok(r, s):
+    m = s - r
+    other = 1 - 2 * m - r
+    c_coef = m * m - (s * s - r)
+    return other != r and c_coef != 0 and 2 * m != 1 and abs(c_coef) <= 81
+
+
+def _both_valid_ok(r, s, a_in):
+    if 2 * s == a_in:                    # double root
+        return False
+    m = s - r
+    b_coef = 2 * m - a_in
+    c_coef = m * m - (s * s - a_in * r)
+    other = a_in - 2 * m - r
+    return b_coef != 0 and c_coef != 0 and other != r
+
+
+# (r, s) for a=1, and (r, s, a) for a ∈ {2, 3} with s drawn from 0..a.
+ONE_EXTRANEOUS = ParamSpace.product(range(0, 9), range(2, 10),
+                                    where=_one_extraneous_ok)
+_BOTH_VALID = [(r, s, a_in) for r in range(1, 13) for a_in in (2, 3)
+               for s in range(a_in + 1) if _both_valid_ok(r, s, a_in)]
+BOTH_VALID = ParamSpace(_BOTH_VALID, [Fraction(1, a_in + 1)
+                                      for _, _, a_in in _BOTH_VALID])
+
+
 class RadicalEquationGenerator(ProblemGenerator):
     """
     Solves radical equations. Squaring both sides produces CANDIDATES, not
@@ -145,32 +173,14 @@ class RadicalEquationGenerator(ProblemGenerator):
     def _one_extraneous(self):
         # a=1: the second candidate's rhs value is 1−s, so s ≥ 2 forces it
         # negative → extraneous.
-        while True:
-            r = random.randint(0, 8)
-            s = random.randint(2, 9)
-            m = s - r
-            other = 1 - 2 * m - r
-            c_coef = m * m - (s * s - r)
-            if (other != r and c_coef != 0 and 2 * m != 1
-                    and abs(c_coef) <= 81):
-                return self._quadratic_family(r, s, a_in=1)
+        r, s = ONE_EXTRANEOUS.sample()
+        return self._quadratic_family(r, s, a_in=1)
 
     def _both_valid(self):
         # a=2: the second candidate's rhs value is 2−s, so s ∈ {0, 2} keeps
         # both candidates valid (s=1 would be a double root).
-        while True:
-            r = random.randint(1, 12)
-            a_in = random.choice([2, 3])
-            s = random.randint(0, a_in)
-            if 2 * s == a_in:            # double root
-                continue
-            m = s - r
-            b_coef = 2 * m - a_in
-            c_coef = m * m - (s * s - a_in * r)
-            other = a_in - 2 * m - r
-            if b_coef == 0 or c_coef == 0 or other == r:
-                continue
-            return self._quadratic_family(r, s, a_in=a_in)
+        r, s, a_in = BOTH_VALID.sample()
+        return self._quadratic_family(r, s, a_in=a_in)
 
     @staticmethod
     def _pack(original, steps, answer):
@@ -3,9 +3,29 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from param_space import ParamSpace
+from static_cache import static_table
 
 ROOT_SYM = {2: "√", 3: "∛", 4: "∜"}
 
+# (n, m) for x^(m/n): already in lowest terms / worth reducing.
+LOWEST_TERMS = ParamSpace.product([2, 3, 4], range(1, 10),
+                                  where=lambda n, m: gcd(m, n) == 1)
+REDUCIBLE = ParamSpace.product([2, 3, 4], range(1, 10),
+                               where=lambda n, m: gcd(m, n) > 1 or m > n)
+
+
+@static_table
+def _numeric_exponents(b):
+    """(n, m) in lowest terms with b^m <= 1000."""
+    return ParamSpace.product([2, 3, 4], range(2, 6),
+                              where=lambda n, m: gcd(m, n) == 1 and b ** m <= 1000)
+
+
+@static_table
+def _coprime_powers(n):
+    return ParamSpace([m for m in range(1, 4) if gcd(m, n) == 1])
+
 
 def radical_txt(n, var, m):
     """'∛(x^2)', '∛x', '√(x^3)'."""
@@ -51,11 +71,7 @@ class RationalExponentGenerator(ProblemGenerator):
         # 40% numeric base: 7^(2/3) -> ∛(7^2) -> ∛49
         if random.random() < 0.4:
             b = random.choice([2, 3, 5, 6, 7, 10])
-            while True:
-                n = random.choice([2, 3, 4])
-                m = random.randint(2, 5)
-                if gcd(m, n) == 1 and b ** m <= 1000:
-                    break
+            n, m = _numeric_exponents(b).sample()
             original = f"{b}^({m}/{n})"
             answer = f"{ROOT_SYM[n]}{b ** m}"
             steps = [
@@ -70,11 +86,7 @@ class RationalExponentGenerator(ProblemGenerator):
                               f"Write as a radical: {original}", steps,
                               answer)
         var = random.choice(["x", "y", "n", "t"])
-        while True:
-            n = random.choice([2, 3, 4])
-            m = random.randint(1, 9)
-            if gcd(m, n) == 1:
-                break
+        n, m = LOWEST_TERMS.sample()
         original = f"{var}^({m}/{n})"
         answer = radical_txt(n, var, m)
         steps = [
@@ -89,11 +101,7 @@ class RationalExponentGenerator(ProblemGenerator):
 
     def _from_radical(self):
         var = random.choice(["x", "y", "n", "t"])
-        while True:
-            n = random.choice([2, 3, 4])
-            m = random.randint(1, 9)
-            if gcd(m, n) > 1 or m > n:   # make reduction/integer cases common
-                break
+        n, m = REDUCIBLE.sample()   # make reduction/integer cases common
         original = radical_txt(n, var, m)
         g = gcd(m, n)
         mr, nr = m // g, n // g
@@ -120,10 +128,7 @@ class RationalExponentGenerator(ProblemGenerator):
     def _evaluate(self):
         n = random.choice([2, 3])
         k = random.randint(2, 6 if n == 3 else 12)
-        while True:
-            m = random.randint(1, 3)
-            if gcd(m, n) == 1:
-                break
+        m = _coprime_powers(n).sample()
         base = k ** n
         negative = random.random() < 0.3
         exp_txt = f"(-{m}/{n})" if negative else f"({m}/{n})"
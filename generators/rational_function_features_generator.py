@@ -1,8 +1,8 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.polynomial_long_division_generator import poly_txt
 from generators.factor_trinomial_generator import binomial, pair_search
 
@@ -128,4 +128,5 @@ class RegexToAutomatonGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(variant,),
         )
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 from itertools import permutations
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # x is fixed at 1..5, so x̄ = 3 and Sxx = Σ(x - 3)² = 10.
 XS = [1, 2, 3, 4, 5]
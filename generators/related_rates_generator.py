@@ -1,8 +1,8 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 LADDERS = [(5, 12, 13), (12, 5, 13), (3, 4, 5), (4, 3, 5),
            (6, 8, 10), (8, 6, 10), (8, 15, 17), (15, 8, 17)]
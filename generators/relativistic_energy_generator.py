@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 MASS_SHELL_TRIPLES = [
@@ -27,10 +28,6 @@ SPEEDS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class RelativisticEnergyGenerator(ProblemGenerator):
     """
     Relativistic rest energy, mass-shell energy, and velocity addition.
@@ -1,15 +1,12 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 from generators.euler_method_generator import f_txt, f_sub
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def add_or_sub_step(steps, left, delta, result):
     if delta >= 0:
         steps.append(step("A", fraction_text(left), fraction_text(delta),
@@ -1,18 +1,15 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 DILATION_FACTORS = [Fraction(1, 2), Fraction(2, 3), Fraction(3, 5),
                     Fraction(4, 5)]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class SchwarzschildGenerator(ProblemGenerator):
     """
     Schwarzschild radius and time-dilation plug-ins with supplied constants.
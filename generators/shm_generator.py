@@ -1,13 +1,10 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from generators.arc_sector_generator import pi_txt
 from helpers import step, jid
-
-
-def fraction_text(value):
-    return str(Fraction(value))
+from rational import Fraction
+from rendering import fraction_text
 
 
 class SHMGenerator(ProblemGenerator):
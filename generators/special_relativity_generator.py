@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 BETA_GAMMA = [
@@ -16,10 +17,6 @@ BETA_GAMMA = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 class SpecialRelativityGenerator(ProblemGenerator):
     """
     Special-relativity time dilation, length contraction, and 1D Lorentz
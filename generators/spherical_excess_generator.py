@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 
 
 ANGLES = [30, 45, 60, 75, 90, 105, 120, 135, 150]
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 ANGLES = [30, 45, 60, 90, 120, 135, 150]
@@ -60,10 +61,6 @@ def exact_div_monomial(numerator, denominator):
     return exact_term(squarefree, coefficient)
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def radical_term_text(radicand, coefficient):
     coefficient = Fraction(coefficient)
     sign = "-" if coefficient < 0 else ""
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text as fmt_frac
 
 
 def factor_txt(root):
@@ -16,11 +17,6 @@ def f_txt(leading, roots):
     return body if leading > 0 else f"-{body}"
 
 
-def fmt_frac(value):
-    value = Fraction(value)
-    return str(value.numerator) if value.denominator == 1 else str(value)
-
-
 def eval_poly(leading, roots, y):
     value = Fraction(leading)
     for root in roots:
@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.geometric_mean_generator import sqrt_txt
 
 # Deviation patterns (sum 0) whose population variance is an integer,
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 COORDS = [
@@ -12,10 +13,6 @@ COORDS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def sphere_from_plane(u, v):
     u2 = u ** 2
     v2 = v ** 2
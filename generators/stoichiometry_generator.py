@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 ATOMIC_MASS = {
@@ -72,10 +73,6 @@ LIMITING_TEMPLATES = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def formula_counts(formula):
     counts = {}
     i = 0
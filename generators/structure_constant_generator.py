@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 COEFFS = [-4, -3, -2, -1, 1, 2, 3, 4]
@@ -68,11 +69,6 @@ def mat_sub(A, B):
     return [[sub(A[i][j], B[i][j]) for j in range(2)] for i in range(2)]
 
 
-def fraction_text(value):
-    value = Fraction(value)
-    return str(value)
-
-
 def imag_text(value):
     sign = "-" if value < 0 else ""
     value = abs(Fraction(value))
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 PYTHAGOREAN_WEIGHTS = [
@@ -11,10 +12,6 @@ PYTHAGOREAN_WEIGHTS = [
 ]
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def vector_text(vector):
     return "(" + ",".join(str(value) for value in vector) + ")"
 
@@ -1,9 +1,9 @@
 import random
-from fractions import Fraction
 from math import factorial
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # Maclaurin families: name -> (derivative cycle description,
 # coefficient of x^k as a Fraction).
@@ -2,15 +2,18 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from static_cache import static_table
 
 
 PRIMES = [17, 41, 73]
 
 
+@static_table
 def roots_mod(a, p):
-    return sorted(x for x in range(p) if (x * x) % p == a % p)
+    return tuple(sorted(x for x in range(p) if (x * x) % p == a % p))
 
 
+@static_table
 def nonresidue(p):
     for z in range(2, p):
         if pow(z, (p - 1) // 2, p) == p - 1:
@@ -3,6 +3,8 @@ from math import gcd
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from param_space import Chain, Product
+from static_cache import static_table
 
 
 COMPOSITES = [12, 15, 18, 20, 21, 24, 28, 30, 35, 36, 40, 42,
@@ -34,6 +36,26 @@ def factor_text(factors):
     )
 
 
+EXPONENTS = range(30, 251)
+
+
+@static_table
+def problem_space(variant):
+    """Every (variant, *operands) generate() can produce for one variant:
+    ("totient", n), ("euler_power", n, base, exponent) or
+    ("fermat_power", prime, base, exponent). Lazy, since the power
+    variants have ~10^5 problems each."""
+    if variant == "totient":
+        return tuple(("totient", n) for n in COMPOSITES + PRIMES)
+    if variant == "euler_power":
+        return Chain(*(Product([variant], [n], [b for b in range(2, 81) if gcd(b, n) == 1],
+                               EXPONENTS)
+                       for n in COMPOSITES))
+    return Chain(*(Product([variant], [p], [b for b in range(2, 81) if b % p != 0],
+                           EXPONENTS)
+                   for p in PRIMES))
+
+
 class TotientGenerator(ProblemGenerator):
     """
     Euler totient computation and Fermat/Euler power reductions.
@@ -61,11 +83,35 @@ class TotientGenerator(ProblemGenerator):
     def generate(self) -> dict:
         variant = self.variant or random.choice(self.VARIANTS)
         if variant == "totient":
-            problem, steps, answer = self._generate_totient()
+            operands = (random.choice(COMPOSITES + PRIMES),)
         elif variant == "euler_power":
-            problem, steps, answer = self._generate_euler_power()
+            operands = self._draw_power_operands(
+                random.choice(COMPOSITES), lambda base, n: gcd(base, n) == 1)
         else:
-            problem, steps, answer = self._generate_fermat_power()
+            operands = self._draw_power_operands(
+                random.choice(PRIMES), lambda base, p: base % p != 0)
+        return self.generate_from((variant, *operands))
+
+    @staticmethod
+    def _draw_power_operands(modulus, usable):
+        while True:
+            base = random.randint(2, 80)
+            if usable(base, modulus):
+                break
+        return modulus, base, random.randint(EXPONENTS.start, EXPONENTS.stop - 1)
+
+    def enumerate_space(self):
+        variants = [self.variant] if self.variant else self.VARIANTS
+        return Chain(*(problem_space(variant) for variant in variants))
+
+    def generate_from(self, params) -> dict:
+        variant, *operands = params
+        if variant == "totient":
+            problem, steps, answer = self._totient_problem(*operands)
+        elif variant == "euler_power":
+            problem, steps, answer = self._euler_power_problem(*operands)
+        else:
+            problem, steps, answer = self._fermat_power_problem(*operands)
         steps.append(step("Z", answer))
         return dict(
             problem_id=jid(),
@@ -97,20 +143,13 @@ class TotientGenerator(ProblemGenerator):
         steps.append(step("TOTIENT_RESULT", f"phi({n})", result))
         return steps, result
 
-    def _generate_totient(self):
-        n = random.choice(COMPOSITES + PRIMES)
+    def _totient_problem(self, n):
         steps, phi = self._totient_steps(n)
         answer = f"phi({n}) = {phi}"
         problem = f"Compute Euler's totient phi({n})."
         return problem, steps, answer
 
-    def _generate_euler_power(self):
-        n = random.choice(COMPOSITES)
-        while True:
-            base = random.randint(2, 80)
-            if gcd(base, n) == 1:
-                break
-        exponent = random.randint(30, 250)
+    def _euler_power_problem(self, n, base, exponent):
         steps, phi = self._totient_steps(n)
         g = gcd(base, n)
         reduced_exp = exponent % phi
@@ -129,13 +168,7 @@ class TotientGenerator(ProblemGenerator):
         )
         return problem, steps, answer
 
-    def _generate_fermat_power(self):
-        prime = random.choice(PRIMES)
-        while True:
-            base = random.randint(2, 80)
-            if base % prime != 0:
-                break
-        exponent = random.randint(30, 250)
+    def _fermat_power_problem(self, prime, base, exponent):
         phi = prime - 1
         reduced_exp = exponent % phi
         value = pow(base, reduced_exp, prime)
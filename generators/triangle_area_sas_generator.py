@@ -1,8 +1,8 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # angle label -> exact sine used (given in the problem text)
 SIN_VALUES = {30: Fraction(1, 2), 37: Fraction(3, 5),
@@ -1,9 +1,9 @@
 import math
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
-from generators.exponential_model_generator import dec
+from rational import Fraction
+from rendering import dec
 
 # angle label -> exact value used for it (Principle 5: given in text)
 SINES = {30: Fraction(1, 2), 37: Fraction(3, 5), 53: Fraction(4, 5),
@@ -136,4 +136,5 @@ class TuringMachineTraceGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(input_text,),
         )
@@ -120,6 +120,7 @@ class UnificationGenerator(ProblemGenerator):
             problem=problem,
             steps=steps,
             final_answer=answer,
+            dedup_key=(variant,),
         )
 
     def _unify(self, left, right, steps):
@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.arc_sector_generator import pi_txt
 
 SIN_REF = {0: "0", 30: "1/2", 45: "√2/2", 60: "√3/2", 90: "1"}
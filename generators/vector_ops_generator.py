@@ -1,7 +1,7 @@
 import random
-from fractions import Fraction
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
 from generators.geometric_mean_generator import sqrt_txt
 
 TRIPLES_2D = [(3, 4, 5), (6, 8, 10), (5, 12, 13), (8, 15, 17),
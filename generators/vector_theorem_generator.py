@@ -2,6 +2,7 @@ import random
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rendering import factor_text
 
 
 def fmt_pi(coeff):
@@ -32,10 +33,6 @@ def fmt_sum(values):
     return " ".join(pieces)
 
 
-def factor_text(value):
-    return f"({value})" if value < 0 else str(value)
-
-
 class VectorTheoremGenerator(ProblemGenerator):
     """
     Green's theorem, divergence theorem, and Stokes' theorem computations
@@ -1,8 +1,9 @@
 import random
-from fractions import Fraction
 
 from base_generator import ProblemGenerator
 from helpers import step, jid
+from rational import Fraction
+from rendering import fraction_text
 
 
 DISTRIBUTIONS = [
@@ -23,10 +24,6 @@ def random_dyadic_distribution():
     return values
 
 
-def fraction_text(value):
-    return str(Fraction(value))
-
-
 def list_text(values):
     return "[" + ",".join(fraction_text(v) for v in values) + "]"
 
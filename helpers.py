@@ -3,17 +3,64 @@ import uuid
 
 DELIM = "|"  # Use standard vertical bar delimiter
 
-def step(op, x="", y="", z="", o=""):
-    """Formats a step into a delimited string."""
+_EMPTY = ""  # the default field; `is` checks against it are a fast path
+
+
+def _step_trimmed(op, x, y, z, o):
+    """Reference formatting: str() every field, trim trailing empties."""
     parts = [op, str(x), str(y), str(z), str(o)]
     while parts and parts[-1] == "":  # trim empties
         parts.pop()
     return DELIM.join(parts)
 
-def jid() -> str:
+
+def step(op, x=_EMPTY, y=_EMPTY, z=_EMPTY, o=_EMPTY):
+    """Formats a step into a delimited string.
+
+    Fields are str()-ed and trailing empty fields are trimmed. Omitted
+    fields are recognised by identity and formatted in one f-string; the
+    rare result that still ends in a delimiter (a passed field that is
+    empty) goes through _step_trimmed, so output is unchanged.
+    """
+    if o is _EMPTY:
+        if z is _EMPTY:
+            if y is _EMPTY:
+                if x is _EMPTY:
+                    return _step_trimmed(op, x, y, z, o)
+                s = f"{op}{DELIM}{x!s}"
+            else:
+                s = f"{op}{DELIM}{x!s}{DELIM}{y!s}"
+        else:
+            s = f"{op}{DELIM}{x!s}{DELIM}{y!s}{DELIM}{z!s}"
+    else:
+        s = f"{op}{DELIM}{x!s}{DELIM}{y!s}{DELIM}{z!s}{DELIM}{o!s}"
+    if s[-1] == DELIM:
+        return _step_trimmed(op, x, y, z, o)
+    return s
+
+
+# Arity-specialised step(): same output, no default-argument dispatch.
+# Use them for steps emitted inside per-digit / per-entry loops.
+
+def step1(op, x):
+    s = f"{op}{DELIM}{x!s}"
+    return _step_trimmed(op, x, "", "", "") if s[-1] == DELIM else s
+
+
+def step2(op, x, y):
+    s = f"{op}{DELIM}{x!s}{DELIM}{y!s}"
+    return _step_trimmed(op, x, y, "", "") if s[-1] == DELIM else s
+
+
+def step3(op, x, y, z):
+    s = f"{op}{DELIM}{x!s}{DELIM}{y!s}{DELIM}{z!s}"
+    return _step_trimmed(op, x, y, z, "") if s[-1] == DELIM else s
+
+
+def jid(rng=None) -> str:
     """Generates a unique job ID (UUID4 format).
 
-    Drawn from the `random` module rather than os.urandom so that seeded
-    dataset builds (-s/--seed) are reproducible byte-for-byte.
+    Drawn from `rng` (default: the `random` module) rather than os.urandom
+    so that seeded dataset builds (-s/--seed) are reproducible byte-for-byte.
     """
-    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+    return str(uuid.UUID(int=(rng or random).getrandbits(128), version=4))
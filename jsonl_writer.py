@@ -0,0 +1,217 @@
+"""Buffered, optionally compressed JSONL output for dataset builds.
+
+A build hands JsonlWriter one serialized line at a time. Lines are joined
+and encoded in chunks of about CHUNK_BYTES, and a background thread
+compresses and writes each chunk, so generation does not wait on the codec
+(zlib, lzma and zstd release the GIL while they work).
+
+The codec follows the output suffix: ``.gz`` (gzip), ``.xz`` (lzma),
+``.zst`` (zstd, with the optional ``zstandard`` package or Python 3.14's
+``compression.zstd``); anything else is written uncompressed. Every chunk
+becomes a complete gzip member / xz stream / zstd frame, and concatenated
+ones decode as one file. After flush() the file therefore ends on a chunk
+boundary, so a checkpoint can record tell() and a resumed build can
+truncate back to it and append, as it does for plain JSONL.
+
+open_jsonl() reads any of these back as text.
+"""
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+import time
+
+# Uncompressed bytes per chunk handed to the writer thread.
+CHUNK_BYTES = 4 * 1024 * 1024
+# Chunks queued for the writer thread before write() blocks.
+MAX_PENDING_CHUNKS = 4
+
+GZIP_LEVEL = 6
+XZ_PRESET = 6
+ZSTD_LEVEL = 3
+
+CODECS = {".gz": "gzip", ".xz": "xz", ".zst": "zstd"}
+
+
+def _zstd_module():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        pass
+    try:
+        from compression import zstd
+        return zstd
+    except ImportError:
+        raise ValueError("writing .zst needs the zstandard package "
+                         "(uv sync --group zstd)") from None
+
+
+def codec_for(path) -> str:
+    """"gzip", "xz", "zstd" or "none", from the path's suffix."""
+    for suffix, codec in CODECS.items():
+        if str(path).endswith(suffix):
+            return codec
+    return "none"
+
+
+def _compressor(codec):
+    """bytes -> bytes: one chunk as a self-contained member/stream/frame."""
+    if codec == "gzip":
+        return lambda data: gzip.compress(data, GZIP_LEVEL, mtime=0)
+    if codec == "xz":
+        return lambda data: lzma.compress(data, preset=XZ_PRESET)
+    if codec == "zstd":
+        zstd = _zstd_module()
+        if zstd.__name__ == "zstandard":
+            return zstd.ZstdCompressor(level=ZSTD_LEVEL).compress
+        return lambda data: zstd.compress(data, ZSTD_LEVEL)
+    return lambda data: data
+
+
+def open_jsonl(path):
+    """Opens a (possibly compressed) JSONL file for reading as text."""
+    codec = codec_for(path)
+    if codec == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if codec == "xz":
+        return lzma.open(path, "rt", encoding="utf-8")
+    if codec == "zstd":
+        zstd = _zstd_module()
+        if zstd.__name__ != "zstandard":
+            return zstd.open(path, "rt", encoding="utf-8")
+        # zstandard.open() stops after the first frame.
+        reader = zstd.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+class JsonlWriter:
+    """Writes lines to `path` ("w" to start, "a" to append) in compressed
+    chunks on a background thread.
+
+    write(line) buffers a serialized line; flush() waits until everything
+    written so far is handed to the OS and ends the file on a chunk
+    boundary; sync() also fsyncs it, so a checkpoint may record tell(), the
+    file offset after the last flush(). close() flushes and stops
+    the thread. Errors from the writer thread are raised by the next
+    write(), flush() or close().
+    """
+
+    def __init__(self, path, mode="w", chunk_bytes=CHUNK_BYTES):
+        if mode not in ("w", "a"):
+            raise ValueError(f"mode must be 'w' or 'a', got {mode!r}")
+        self.path = path
+        self.codec = codec_for(path)
+        self._compress = _compressor(self.codec)
+        self.chunk_bytes = chunk_bytes
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.busy_seconds = 0.0
+        self._lines = []
+        self._buffered = 0
+        self._error = None
+        self._fp = open(path, mode + "b")
+        self._offset = self._fp.tell() if mode == "a" else 0
+        self._queue = queue.Queue(MAX_PENDING_CHUNKS)
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="jsonl-writer")
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                if self._error is None:
+                    start = time.perf_counter()
+                    data = self._compress(chunk)
+                    self._fp.write(data)
+                    self.busy_seconds += time.perf_counter() - start
+                    self.bytes_out += len(data)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self):
+        if self._lines:
+            chunk = "".join(self._lines).encode("utf-8")
+            self.bytes_in += len(chunk)
+            self._lines = []
+            self._buffered = 0
+            self._queue.put(chunk)
+
+    def write(self, line, generator=None, label=None):
+        # generator/label are for parquet_writer's interface; JSONL rows
+        # do not carry them.
+        self._lines.append(line)
+        # Characters, not bytes: close enough for sizing a chunk.
+        self._buffered += len(line)
+        if self._buffered >= self.chunk_bytes:
+            self._check()
+            self._submit()
+
+    def flush(self):
+        self._submit()
+        self._queue.join()
+        self._check()
+        self._fp.flush()
+        self._offset = self._fp.tell()
+
+    def sync(self):
+        """flush(), then fsync the file: the data up to tell() survives a
+        power loss."""
+        self.flush()
+        os.fsync(self._fp.fileno())
+
+    def tell(self) -> int:
+        return self._offset
+
+    def close(self):
+        if self._fp.closed:
+            return
+        try:
+            self._submit()
+            self._queue.put(None)
+            self._thread.join()
+            self._check()
+        finally:
+            self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> dict:
+        """Codec, bytes before/after compression, compression ratio and
+        writer-thread throughput in MB/s of uncompressed data."""
+        return {
+            "codec": self.codec,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": self.bytes_in / self.bytes_out if self.bytes_out else None,
+            "mb_per_s": (self.bytes_in / 1e6 / self.busy_seconds
+                         if self.busy_seconds else None),
+        }
+
+    def describe(self) -> str:
+        s = self.stats()
+        text = f"{s['bytes_in'] / 1e6:.1f} MB"
+        if self.codec != "none":
+            ratio = f"{s['ratio']:.2f}x" if s["ratio"] else "n/a"
+            text += f" -> {s['bytes_out'] / 1e6:.1f} MB {self.codec} (ratio {ratio})"
+        if s["mb_per_s"]:
+            text += f", {s['mb_per_s']:.0f} MB/s"
+        return text
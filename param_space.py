@@ -0,0 +1,203 @@
+"""Declarative operand spaces for generators.
+
+Many generators pick operands with a rejection loop: draw each operand,
+test the combination, retry on failure. A ParamSpace holds the valid
+combinations as a table instead, built once per process, and draws one in
+O(1) time with a fixed number of random draws.
+
+Sampling matches the loop it replaces. A rejection loop returns each valid
+tuple with probability proportional to the chance of drawing it in a
+single pass, so ParamSpace.product() weights every tuple by the product of
+its axis probabilities: uniform axes give a uniform table, and mixture()
+describes "pick a range, then a value in it" axes. Weights are exact (ints
+or Fractions) and weighted tables use Walker's alias method on integers,
+so no float rounding creeps into the distribution.
+
+Spaces that depend on a generator's options are best built by a function
+wrapped in static_cache.static_table, keyed by those options.
+
+Product and Chain are lazy sequences for spaces too large to list (a
+ProblemGenerator.enumerate_space() of a few hundred thousand problems):
+they index by arithmetic instead of holding every tuple.
+"""
+import itertools
+import random
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from fractions import Fraction
+from math import gcd, lcm
+
+
+class ParamSpace:
+    """A finite table of operand values (usually tuples) with exact
+    sampling weights; uniform when `weights` is None."""
+
+    __slots__ = ("values", "_weights", "_total", "_cutoff", "_alias")
+
+    def __init__(self, values, weights=None):
+        values = tuple(values)
+        if weights is not None:
+            weights = [Fraction(w) for w in weights]
+            if len(weights) != len(values):
+                raise ValueError("values and weights differ in length")
+            if any(w < 0 for w in weights):
+                raise ValueError("weights must be non-negative")
+            kept = [(v, w) for v, w in zip(values, weights) if w]
+            values = tuple(v for v, _ in kept)
+            weights = [w for _, w in kept]
+        if not values:
+            raise ValueError("parameter space is empty")
+        self.values = values
+        self._weights = self._alias = None
+        if weights is not None:
+            scale = lcm(*(w.denominator for w in weights))
+            ints = [w.numerator * (scale // w.denominator) for w in weights]
+            g = gcd(*ints)
+            ints = [w // g for w in ints]
+            if len(set(ints)) > 1:
+                self._weights = tuple(ints)
+                self._build_alias(ints)
+
+    @classmethod
+    def product(cls, *axes, where=None):
+        """Every combination of the axes that satisfies `where`.
+
+        Each axis is a sequence (drawn uniformly, like random.choice or
+        randint) or a mapping of value -> weight (see mixture()). The
+        result has the distribution of drawing each axis independently
+        and retrying until where(*combo) is true.
+        """
+        weighted = [isinstance(axis, Mapping) for axis in axes]
+        columns = []
+        for axis, is_map in zip(axes, weighted):
+            if is_map:
+                total = sum(axis.values())
+                columns.append([(v, Fraction(w) / total) for v, w in axis.items()])
+            else:
+                axis = list(axis)
+                columns.append([(v, 1) for v in axis])
+        values, weights = [], []
+        for combo in itertools.product(*columns):
+            key = tuple(v for v, _ in combo)
+            if where is None or where(*key):
+                values.append(key)
+                w = Fraction(1)
+                for _, p in combo:
+                    w *= p
+                weights.append(w)
+        # Uniform sequences contribute the same factor to every tuple.
+        return cls(values, weights if any(weighted) else None)
+
+    def _build_alias(self, ints):
+        # Vose's alias method on integers: entry i keeps itself with
+        # probability cutoff[i] / total and otherwise yields alias[i].
+        n = len(ints)
+        total = sum(ints)
+        scaled = [w * n for w in ints]
+        cutoff = [total] * n
+        alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < total]
+        large = [i for i, w in enumerate(scaled) if w >= total]
+        while small and large:
+            s, big = small.pop(), large.pop()
+            cutoff[s] = scaled[s]
+            alias[s] = big
+            scaled[big] -= total - scaled[s]
+            (small if scaled[big] < total else large).append(big)
+        self._total = total
+        self._cutoff = tuple(cutoff)
+        self._alias = tuple(alias)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def sample(self, rng=None):
+        """One value, drawn from `rng` (default: the `random` module)."""
+        rng = rng or random
+        if self._alias is None:
+            return rng.choice(self.values)
+        i = rng.randrange(len(self.values))
+        if rng.randrange(self._total) >= self._cutoff[i]:
+            i = self._alias[i]
+        return self.values[i]
+
+    def distribution(self) -> dict:
+        """value -> exact probability."""
+        if self._weights is None:
+            weights = [1] * len(self.values)
+        else:
+            weights = self._weights
+        total = sum(weights)
+        out = {}
+        for value, w in zip(self.values, weights):
+            out[value] = out.get(value, 0) + Fraction(w, total)
+        return out
+
+
+def mixture(*groups) -> dict:
+    """value -> weight for "pick one of `groups` uniformly, then a value in
+    it uniformly", e.g. mixture(range(-9, -1), range(2, 16)) for a coin
+    flip between negative and positive bases."""
+    weights = {}
+    for group in groups:
+        group = list(group)
+        for value in group:
+            weights[value] = weights.get(value, 0) + Fraction(1, len(group) * len(groups))
+    return weights
+
+
+class Product(Sequence):
+    """itertools.product(*axes) as an indexable sequence, without listing
+    the tuples: entry i is decoded from i in mixed radix (the last axis
+    varies fastest, as in itertools.product)."""
+
+    def __init__(self, *axes):
+        self.axes = tuple(tuple(axis) for axis in axes)
+        self._size = 1
+        for axis in self.axes:
+            self._size *= len(axis)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Product index out of range")
+        out = []
+        for axis in reversed(self.axes):
+            index, digit = divmod(index, len(axis))
+            out.append(axis[digit])
+        return tuple(reversed(out))
+
+
+class Chain(Sequence):
+    """The concatenation of several sequences, indexed by bisecting their
+    offsets."""
+
+    def __init__(self, *parts):
+        self.parts = tuple(part for part in parts if len(part))
+        self._starts = []
+        total = 0
+        for part in self.parts:
+            self._starts.append(total)
+            total += len(part)
+        self._size = total
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Chain index out of range")
+        k = bisect_right(self._starts, index) - 1
+        return self.parts[k][index - self._starts[k]]
@@ -0,0 +1,223 @@
+"""Parquet output for dataset builds (--format parquet).
+
+ParquetDatasetWriter has jsonl_writer.JsonlWriter's write(row, generator,
+label) interface but takes example dicts (builds hand them over unserialized)
+and appends their fields straight to column lists. Each row group of
+row_group_rows rows is converted and written on a background thread. The
+schema is tuned for this data:
+
+- generator, generator_label, operation and grade_level have a few hundred
+  distinct values at most. They are Arrow dictionary columns, and only
+  these get Parquet dictionary pages; the near-unique problem_id, problem
+  and steps text is not sent through a dictionary that would overflow.
+- difficulty is an int8.
+- text (the release's rendered Problem/Solution steps/Final answer
+  string) repeats problem, steps and final_answer, so it is left out
+  unless asked for; with_text() derives it from a table at read time.
+
+pyarrow is optional (uv sync --group release); importing this module does
+not need it.
+"""
+import json
+import os
+import queue
+import threading
+import time
+
+# Rows per Parquet row group: ~100 MB of uncompressed text at typical row
+# sizes, which keeps column chunks large for the codec and readers.
+ROW_GROUP_ROWS = 100_000
+# Row groups queued for the writer thread before write() blocks.
+MAX_PENDING_GROUPS = 2
+DEFAULT_COMPRESSION = "zstd"
+
+DICTIONARY_COLUMNS = ("generator", "generator_label", "operation", "grade_level")
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet output needs pyarrow "
+                         "(uv sync --group release)") from None
+    return pa, pq
+
+
+def text_for_example(example) -> str:
+    """The rendered training text of an example (the release `text` column)."""
+    steps = "\n".join(str(s) for s in example["steps"])
+    return (
+        f"Problem:\n{example['problem']}\n\n"
+        f"Solution steps:\n{steps}\n\n"
+        f"Final answer:\n{example['final_answer']}"
+    )
+
+
+def parquet_schema(text=False):
+    pa, _ = _pyarrow()
+    category = pa.dictionary(pa.int32(), pa.string())
+    fields = [
+        ("problem_id", pa.string()),
+        ("generator", category),
+        ("generator_label", category),
+        ("operation", category),
+        ("grade_level", category),
+        ("difficulty", pa.int8()),
+        ("problem", pa.string()),
+        ("steps", pa.list_(pa.string())),
+        ("final_answer", pa.string()),
+    ]
+    if text:
+        fields.append(("text", pa.string()))
+    return pa.schema(fields)
+
+
+def with_text(table):
+    """`table` (a build's Parquet output) with the text column appended,
+    rendered from problem, steps and final_answer."""
+    pa, _ = _pyarrow()
+    if "text" in table.column_names:
+        return table
+    columns = table.select(["problem", "steps", "final_answer"]).to_pydict()
+    text = [text_for_example({"problem": problem, "steps": steps,
+                              "final_answer": answer})
+            for problem, steps, answer in zip(columns["problem"], columns["steps"],
+                                              columns["final_answer"])]
+    return table.append_column("text", pa.array(text, pa.string()))
+
+
+class ParquetDatasetWriter:
+    """Writes example rows to one Parquet file at `path`.
+
+    write(example, generator, label) appends a row to the pending columns
+    (a serialized JSONL line is parsed first, e.g. rows replayed from shard
+    files); every row_group_rows rows go to the writer thread as one row
+    group. close() writes the rest and
+    the footer. There is no tell(): a Parquet file only becomes readable
+    at close, so these builds cannot checkpoint.
+    """
+
+    def __init__(self, path, text=False, row_group_rows=ROW_GROUP_ROWS,
+                 compression=DEFAULT_COMPRESSION):
+        pa, pq = _pyarrow()
+        self.path = path
+        self.text = text
+        self.row_group_rows = row_group_rows
+        self.compression = compression
+        self.codec = f"parquet/{compression}"
+        self.schema = parquet_schema(text)
+        self.rows = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.busy_seconds = 0.0
+        self._pending = self._empty_columns()
+        self._error = None
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression,
+                                        use_dictionary=list(DICTIONARY_COLUMNS))
+        self._queue = queue.Queue(MAX_PENDING_GROUPS)
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="parquet-writer")
+        self._thread.start()
+
+    def _empty_columns(self):
+        return {field.name: [] for field in self.schema}
+
+    def _table(self, columns):
+        pa, _ = _pyarrow()
+        arrays = []
+        for field in self.schema:
+            values = columns[field.name]
+            if field.name in DICTIONARY_COLUMNS:
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, field.type))
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def _run(self):
+        while True:
+            group = self._queue.get()
+            try:
+                if group is None:
+                    return
+                if self._error is None:
+                    start = time.perf_counter()
+                    table = self._table(group)
+                    self.bytes_in += table.nbytes
+                    self._writer.write_table(table, row_group_size=table.num_rows)
+                    self.busy_seconds += time.perf_counter() - start
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self):
+        if self._pending["problem"]:
+            self._queue.put(self._pending)
+            self._pending = self._empty_columns()
+
+    def write(self, example, generator=None, label=None):
+        if isinstance(example, str):
+            example = json.loads(example)
+        columns = self._pending
+        columns["problem_id"].append(str(example["problem_id"]))
+        columns["generator"].append(generator)
+        columns["generator_label"].append(label if label is not None else generator)
+        columns["operation"].append(str(example["operation"]))
+        columns["grade_level"].append(example["grade_level"])
+        columns["difficulty"].append(example["difficulty"])
+        columns["problem"].append(str(example["problem"]))
+        columns["steps"].append(example["steps"])
+        columns["final_answer"].append(str(example["final_answer"]))
+        if self.text:
+            columns["text"].append(text_for_example(example))
+        self.rows += 1
+        if len(columns["problem"]) >= self.row_group_rows:
+            self._check()
+            self._submit()
+
+    def close(self):
+        if self._writer is None:
+            return
+        try:
+            self._submit()
+            self._queue.put(None)
+            self._thread.join()
+            self._check()
+        finally:
+            self._writer.close()
+            self._writer = None
+            self.bytes_out = os.path.getsize(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> dict:
+        """As JsonlWriter.stats(): bytes_in is the size of the rows' Arrow
+        columns, bytes_out the Parquet file size (once closed)."""
+        return {
+            "codec": self.codec,
+            "rows": self.rows,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": self.bytes_in / self.bytes_out if self.bytes_out else None,
+            "mb_per_s": (self.bytes_in / 1e6 / self.busy_seconds
+                         if self.busy_seconds else None),
+        }
+
+    def describe(self) -> str:
+        s = self.stats()
+        ratio = f"{s['ratio']:.2f}x" if s["ratio"] else "n/a"
+        text = (f"{s['bytes_in'] / 1e6:.1f} MB in Arrow -> {s['bytes_out'] / 1e6:.1f} MB "
+                f"{self.codec} (ratio {ratio})")
+        if s["mb_per_s"]:
+            text += f", {s['mb_per_s']:.0f} MB/s"
+        return text
@@ -0,0 +1,57 @@
+"""Seeded bijections of range(n) for walking finite problem spaces.
+
+FeistelPermutation(n, key) maps each index in range(n) to a distinct index
+in range(n), in an order that looks random and depends only on `key`. It
+holds no table: a balanced Feistel network scrambles the smallest square
+power-of-two domain that covers n, and outputs that land outside range(n)
+are fed back in (cycle walking) until they land inside. Each position
+costs O(1) expected time and memory is O(1), whatever n is.
+"""
+from base_generator import derive_seed
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(x):
+    """Multiply-xorshift round function (the upper half of a 64-bit
+    product, so the low output bits depend on every input bit)."""
+    x = (x * 0x9E3779B97F4A7C15) & _MASK64
+    return (x ^ (x >> 29)) >> 16
+
+
+class FeistelPermutation:
+    """A keyed permutation of range(size): perm[i] for i in range(size)
+    visits every index exactly once."""
+
+    __slots__ = ("size", "_half", "_mask", "_keys")
+
+    ROUNDS = 4
+
+    def __init__(self, size, key):
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.size = size
+        self._half = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half) - 1
+        self._keys = tuple(derive_seed(key, "feistel", r) for r in range(self.ROUNDS))
+
+    def __len__(self):
+        return self.size
+
+    def _encrypt(self, x):
+        half, mask = self._half, self._mask
+        left, right = x >> half, x & mask
+        for round_key in self._keys:
+            left, right = right, left ^ (_mix(right ^ round_key) & mask)
+        return (left << half) | right
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+        x = self._encrypt(index)
+        while x >= self.size:
+            x = self._encrypt(x)
+        return x
+
+    def __iter__(self):
+        return (self[i] for i in range(self.size))
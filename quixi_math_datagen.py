@@ -6,535 +6,24 @@
 import json
 import random
 import argparse
+import itertools
+import multiprocessing
 import sys
 import os
-
-from curriculum import GRADE_LEVELS, stamp_metadata
+from collections import deque
+from functools import lru_cache
+
+from base_generator import LazyGenerator, example_rng, generator_name, materialize
+from checkpoint import (CheckpointTimer, check_resumable, read_checkpoint,
+                        remove_checkpoint, restore_dedup, write_checkpoint)
+from dedup import COLLISION_POLICIES, DEDUP_KINDS, make_dedup_index, semantic_digest
+from jsonl_writer import JsonlWriter, open_jsonl
+from parquet_writer import ROW_GROUP_ROWS, ParquetDatasetWriter
+from curriculum import GRADE_LEVELS, metadata_for, stamp_metadata
 from helpers import DELIM
-
-# Import Generator Classes (from generators subdirectory)
-from generators.long_division_generator import LongDivisionGenerator
-from generators.decimal_mult_generator import DecimalMultGenerator
-from generators.decimal_add_sub_generator import DecimalAddSubGenerator
-from generators.decimal_div_generator import DecimalDivGenerator
-from generators.fraction_op_generator import FractionOpGenerator
-from generators.linear_simple_generator import LinearSimpleGenerator
-from generators.quadratic_generator import QuadraticGenerator
-from generators.simplify_expression_generator import SimplifyExpressionGenerator
-from generators.evaluate_expression_generator import EvaluateExpressionGenerator
-from generators.linear_complex_generator import LinearComplexGenerator
-from generators.pythag_hyp_generator import PythagHypGenerator
-from generators.abacus_addition_generator import AbacusAdditionGenerator
-from generators.proportional_relationship_generator import ProportionalRelationshipGenerator
-from generators.percent_problem_generator import PercentProblemGenerator
-from generators.multi_digit_addition_generator import MultiDigitAdditionGenerator
-from generators.multi_digit_subtraction_generator import MultiDigitSubtractionGenerator
-from generators.multi_digit_multiplication_generator import MultiDigitMultiplicationGenerator
-from generators.mixed_number_operation_generator import MixedNumberOperationGenerator
-from generators.mixed_number_operations_random import MixedNumberOperationsRandom
-from generators.fraction_comparison_generator import FractionComparisonGenerator
-from generators.fraction_decimal_percent_converter import FractionDecimalPercentConverter
-from generators.factors_generator import FactorsGenerator
-from generators.prime_factorization_generator import PrimeFactorizationGenerator
-from generators.gcf_generator import GCFGenerator
-from generators.lcm_generator import LCMGenerator
-from generators.order_of_operations_generator import OrderOfOperationsGenerator
-from generators.geometry_area_perimeter_generator import GeometryAreaPerimeterGenerator
-from generators.polygon_perimeter_generator import PolygonPerimeterGenerator
-from generators.volume_rect_prism_generator import VolumeRectPrismGenerator
-from generators.place_value_rounding_generator import PlaceValueRoundingGenerator
-from generators.divisibility_classification_generator import DivisibilityClassificationGenerator
-from generators.unit_conversion_generator import UnitConversionGenerator
-from generators.multi_step_unit_conversion_generator import MultiStepUnitConversionGenerator
-from generators.rate_conversion_generator import RateConversionGenerator
-from generators.temperature_conversion_generator import TemperatureConversionGenerator
-from generators.dimensional_analysis_generator import DimensionalAnalysisGenerator
-from generators.percent_word_problem_generator import PercentWordProblemGenerator
-from generators.repeating_decimal_generator import RepeatingDecimalGenerator
-from generators.proportion_word_problem_generator import ProportionWordProblemGenerator
-from generators.simple_stats_generator import SimpleStatsGenerator
-from generators.number_comparison_generator import NumberComparisonGenerator
-from generators.simple_probability_generator import SimpleProbabilityGenerator
-from generators.graph_interpret_generator import GraphInterpretGenerator
-
-# Middle School (6-8) Generators
-from generators.integer_operations_generator import IntegerOperationsGenerator
-from generators.unit_rate_generator import UnitRateGenerator, UnitRateFromTableGenerator
-from generators.ratio_table_generator import RatioTableGenerator
-from generators.tip_bill_split_generator import TipBillSplitGenerator
-from generators.linear_fractional_generator import LinearFractionalGenerator
-from generators.special_solution_equation_generator import SpecialSolutionEquationGenerator
-from generators.exponent_mixed_rules_generator import ExponentMixedRulesGenerator
-from generators.round_solids_generator import RoundSolidsGenerator
-from generators.factor_gcf_generator import FactorGCFGenerator
-from generators.factor_trinomial_generator import FactorTrinomialGenerator
-from generators.factor_special_forms_generator import FactorSpecialFormsGenerator
-from generators.factor_grouping_generator import FactorGroupingGenerator
-from generators.quadratic_factoring_generator import QuadraticFactoringGenerator
-from generators.quadratic_square_root_generator import QuadraticSquareRootGenerator
-from generators.completing_square_generator import CompletingSquareGenerator
-from generators.discriminant_generator import DiscriminantGenerator
-from generators.radical_variable_simplify_generator import RadicalVariableSimplifyGenerator
-from generators.radical_add_sub_generator import RadicalAddSubGenerator
-from generators.radical_multiply_generator import RadicalMultiplyGenerator
-from generators.radical_rationalize_generator import RadicalRationalizeGenerator
-from generators.rational_exponent_generator import RationalExponentGenerator
-from generators.radical_equation_generator import RadicalEquationGenerator
-from generators.rational_expr_simplify_generator import RationalExprSimplifyGenerator
-from generators.rational_expr_mult_div_generator import RationalExprMultDivGenerator
-from generators.rational_expr_add_sub_generator import RationalExprAddSubGenerator
-from generators.rational_equation_generator import RationalEquationGenerator
-from generators.function_evaluation_generator import FunctionEvaluationGenerator
-from generators.function_table_generator import FunctionTableGenerator
-from generators.piecewise_evaluation_generator import PiecewiseEvaluationGenerator
-from generators.function_operations_generator import FunctionOperationsGenerator
-from generators.function_composition_generator import FunctionCompositionGenerator
-from generators.domain_range_generator import DomainRangeGenerator
-from generators.inverse_function_generator import InverseFunctionGenerator
-from generators.arithmetic_sequence_generator import ArithmeticSequenceGenerator
-from generators.geometric_sequence_generator import GeometricSequenceGenerator
-from generators.recursive_explicit_generator import RecursiveExplicitGenerator
-from generators.sigma_notation_generator import SigmaNotationGenerator
-from generators.pascal_triangle_generator import PascalTriangleGenerator
-from generators.complex_number_ops_generator import ComplexNumberOpsGenerator
-from generators.complex_division_generator import ComplexDivisionGenerator
-from generators.complex_quadratic_generator import ComplexQuadraticGenerator
-from generators.polynomial_long_division_generator import PolynomialLongDivisionGenerator
-from generators.synthetic_division_generator import SyntheticDivisionGenerator
-from generators.horner_evaluation_generator import HornerEvaluationGenerator
-from generators.remainder_factor_theorem_generator import RemainderFactorTheoremGenerator
-from generators.rational_root_generator import RationalRootGenerator
-from generators.polynomial_zeros_generator import PolynomialZerosGenerator
-from generators.rational_function_features_generator import RationalFunctionFeaturesGenerator
-from generators.exponential_model_generator import ExponentialModelGenerator
-from generators.log_conversion_generator import LogConversionGenerator
-from generators.log_properties_generator import LogPropertiesGenerator
-from generators.exponential_equation_generator import ExponentialEquationGenerator
-from generators.log_equation_generator import LogEquationGenerator
-from generators.parabola_features_generator import ParabolaFeaturesGenerator
-from generators.ellipse_features_generator import EllipseFeaturesGenerator
-from generators.hyperbola_features_generator import HyperbolaFeaturesGenerator
-from generators.conic_standard_form_generator import ConicStandardFormGenerator
-from generators.nets_surface_area_generator import NetsSurfaceAreaGenerator
-from generators.regular_polygon_area_generator import RegularPolygonAreaGenerator
-from generators.similar_triangles_generator import SimilarTrianglesGenerator
-from generators.geometric_mean_generator import GeometricMeanGenerator
-from generators.distance_formula_generator import DistanceFormulaGenerator
-from generators.midpoint_generator import MidpointGenerator
-from generators.segment_partition_generator import SegmentPartitionGenerator
-from generators.transformation_generator import TransformationGenerator
-from generators.arc_sector_generator import ArcSectorGenerator
-from generators.circle_angle_generator import CircleAngleGenerator
-from generators.circle_equation_generator import CircleEquationGenerator
-from generators.taxicab_geometry_generator import TaxicabGeometryGenerator
-from generators.euler_characteristic_generator import EulerCharacteristicGenerator
-from generators.hypercube_counting_generator import HypercubeCountingGenerator
-from generators.right_triangle_trig_generator import RightTriangleTrigGenerator
-from generators.special_right_triangle_generator import SpecialRightTriangleGenerator
-from generators.angle_measure_generator import AngleMeasureGenerator
-from generators.unit_circle_generator import UnitCircleGenerator
-from generators.sinusoid_features_generator import SinusoidFeaturesGenerator
-from generators.trig_six_functions_generator import TrigSixFunctionsGenerator
-from generators.trig_identity_eval_generator import TrigIdentityEvalGenerator
-from generators.trig_identity_verify_generator import TrigIdentityVerifyGenerator
-from generators.trig_equation_generator import TrigEquationGenerator
-from generators.triangle_solve_generator import TriangleSolveGenerator
-from generators.triangle_area_sas_generator import TriangleAreaSASGenerator
-from generators.polar_parametric_generator import PolarParametricGenerator
-from generators.vector_ops_generator import VectorOpsGenerator
-from generators.dot_product_generator import DotProductGenerator
-from generators.matrix_ops_generator import MatrixOpsGenerator
-from generators.determinant_generator import DeterminantGenerator
-from generators.matrix_inverse_generator import MatrixInverseGenerator
-from generators.cramers_rule_generator import CramersRuleGenerator
-from generators.row_reduction_generator import RowReductionGenerator
-from generators.limit_evaluation_generator import LimitEvaluationGenerator
-from generators.derivative_limit_def_generator import DerivativeLimitDefGenerator
-from generators.derivative_power_rule_generator import DerivativePowerRuleGenerator
-from generators.derivative_product_quotient_generator import DerivativeProductQuotientGenerator
-from generators.chain_rule_generator import ChainRuleGenerator
-from generators.derivative_transcendental_generator import DerivativeTranscendentalGenerator
-from generators.implicit_diff_generator import ImplicitDiffGenerator
-from generators.log_diff_higher_order_generator import LogDiffHigherOrderGenerator
-from generators.tangent_line_generator import TangentLineGenerator
-from generators.related_rates_generator import RelatedRatesGenerator
-from generators.linear_approx_generator import LinearApproxGenerator
-from generators.lhopital_generator import LHopitalGenerator
-from generators.curve_analysis_generator import CurveAnalysisGenerator
-from generators.optimization_generator import OptimizationGenerator
-from generators.mean_value_theorem_generator import MeanValueTheoremGenerator
-from generators.antiderivative_generator import AntiderivativeGenerator
-from generators.u_substitution_generator import USubstitutionGenerator
-from generators.definite_integral_generator import DefiniteIntegralGenerator
-from generators.riemann_sum_generator import RiemannSumGenerator
-from generators.area_between_curves_generator import AreaBetweenCurvesGenerator
-from generators.solid_revolution_generator import SolidRevolutionGenerator
-from generators.separable_ode_generator import SeparableODEGenerator
-from generators.integration_by_parts_generator import IntegrationByPartsGenerator
-from generators.partial_fractions_generator import PartialFractionsGenerator
-from generators.telescoping_generator import TelescopingGenerator
-from generators.improper_integral_generator import ImproperIntegralGenerator
-from generators.euler_method_generator import EulerMethodGenerator
-from generators.logistic_growth_generator import LogisticGrowthGenerator
-from generators.parametric_calculus_generator import ParametricCalculusGenerator
-from generators.arc_length_generator import ArcLengthGenerator
-from generators.series_convergence_generator import SeriesConvergenceGenerator
-from generators.power_series_generator import PowerSeriesGenerator
-from generators.taylor_series_generator import TaylorSeriesGenerator
-from generators.five_number_summary_generator import FiveNumberSummaryGenerator
-from generators.standard_deviation_generator import StandardDeviationGenerator
-from generators.composite_arithmetic_generator import CompositeArithmeticGenerator
-from generators.z_score_generator import ZScoreGenerator
-from generators.frequency_table_generator import FrequencyTableGenerator
-from generators.regression_generator import RegressionGenerator
-from generators.expected_value_generator import ExpectedValueGenerator
-from generators.confidence_interval_generator import ConfidenceIntervalGenerator
-from generators.hypothesis_test_generator import HypothesisTestGenerator
-from generators.two_sample_test_generator import TwoSampleTestGenerator
-from generators.chi_square_generator import ChiSquareGenerator
-from generators.permutation_combination_generator import PermutationCombinationGenerator
-from generators.binomial_probability_generator import BinomialProbabilityGenerator
-from generators.probability_addition_rule_generator import ProbabilityAdditionRuleGenerator
-from generators.conditional_probability_generator import ConditionalProbabilityGenerator
-from generators.geometric_probability_generator import GeometricProbabilityGenerator
-from generators.geometric_distribution_generator import GeometricDistributionGenerator
-from generators.finance_generator import FinanceGenerator
-from generators.kinematics_generator import KinematicsGenerator
-from generators.physics_formula_generator import PhysicsFormulaGenerator
-from generators.base_conversion_generator import BaseConversionGenerator
-from generators.base_arithmetic_generator import BaseArithmeticGenerator
-from generators.bitwise_ops_generator import BitwiseOpsGenerator
-from generators.modular_arithmetic_generator import ModularArithmeticGenerator
-from generators.manual_square_root_generator import ManualSquareRootGenerator
-from generators.calendar_arithmetic_generator import CalendarArithmeticGenerator
-from generators.fermi_estimation_generator import FermiEstimationGenerator
-from generators.partial_derivative_generator import PartialDerivativeGenerator
-from generators.gradient_generator import GradientGenerator
-from generators.multivar_chain_rule_generator import MultivarChainRuleGenerator
-from generators.hessian_classify_generator import HessianClassifyGenerator
-from generators.lagrange_multiplier_generator import LagrangeMultiplierGenerator
-from generators.double_integral_generator import DoubleIntegralGenerator
-from generators.triple_integral_generator import TripleIntegralGenerator
-from generators.jacobian_generator import JacobianGenerator
-from generators.div_curl_generator import DivCurlGenerator
-from generators.line_integral_generator import LineIntegralGenerator
-from generators.vector_theorem_generator import VectorTheoremGenerator
-from generators.curve_geometry_generator import CurveGeometryGenerator
-from generators.centroid_generator import CentroidGenerator
-from generators.lu_decomposition_generator import LUDecompositionGenerator
-from generators.subspace_basis_generator import SubspaceBasisGenerator
-from generators.eigenvalue_generator import EigenvalueGenerator
-from generators.diagonalization_generator import DiagonalizationGenerator
-from generators.gram_schmidt_generator import GramSchmidtGenerator
-from generators.qr_decomposition_generator import QRDecompositionGenerator
-from generators.least_squares_generator import LeastSquaresGenerator
-from generators.matrix_exponential_generator import MatrixExponentialGenerator
-from generators.svd_generator import SVDGenerator
-from generators.integrating_factor_generator import IntegratingFactorGenerator
-from generators.exact_ode_generator import ExactODEGenerator
-from generators.ode_substitution_generator import ODESubstitutionGenerator
-from generators.second_order_ode_generator import SecondOrderODEGenerator
-from generators.undetermined_coeff_generator import UndeterminedCoeffGenerator
-from generators.variation_parameters_generator import VariationParametersGenerator
-from generators.laplace_ivp_generator import LaplaceIVPGenerator
-from generators.ode_system_generator import ODESystemGenerator
-from generators.series_solution_generator import SeriesSolutionGenerator
-from generators.stability_generator import StabilityGenerator
-from generators.set_operations_generator import SetOperationsGenerator
-from generators.relation_check_generator import RelationCheckGenerator
-from generators.inclusion_exclusion_generator import InclusionExclusionGenerator
-from generators.stars_and_bars_generator import StarsAndBarsGenerator
-from generators.derangement_generator import DerangementGenerator
-from generators.recurrence_generator import RecurrenceGenerator
-from generators.master_theorem_generator import MasterTheoremGenerator
-from generators.induction_verify_generator import InductionVerifyGenerator
-from generators.counting_classics_generator import CountingClassicsGenerator
-from generators.generating_function_generator import GeneratingFunctionGenerator
-from generators.boolean_algebra_generator import BooleanAlgebraGenerator
-from generators.graph_counting_generator import GraphCountingGenerator
-from generators.dijkstra_generator import DijkstraGenerator
-from generators.mst_generator import MSTGenerator
-from generators.graph_traversal_generator import GraphTraversalGenerator
-from generators.euler_circuit_generator import EulerCircuitGenerator
-from generators.dp_table_generator import DPTableGenerator
-from generators.algorithm_trace_generator import AlgorithmTraceGenerator
-from generators.turing_machine_trace_generator import TuringMachineTraceGenerator
-from generators.dfa_simulation_generator import DFASimulationGenerator
-from generators.nfa_simulation_generator import NFASimulationGenerator
-from generators.dfa_minimization_generator import DFAMinimizationGenerator
-from generators.regex_to_automaton_generator import RegexToAutomatonGenerator
-from generators.pda_simulation_generator import PDASimulationGenerator
-from generators.cyk_parser_generator import CYKParserGenerator
-from generators.dpll_trace_generator import DPLLTraceGenerator
-from generators.resolution_proof_generator import ResolutionProofGenerator
-from generators.unification_generator import UnificationGenerator
-from generators.lambda_reduction_generator import LambdaReductionGenerator
-from generators.extended_euclid_generator import ExtendedEuclidGenerator
-from generators.modular_inverse_generator import ModularInverseGenerator
-from generators.crt_generator import CRTGenerator
-from generators.mod_exp_generator import ModExpGenerator
-from generators.totient_generator import TotientGenerator
-from generators.continued_fraction_generator import ContinuedFractionGenerator
-from generators.quadratic_residue_generator import QuadraticResidueGenerator
-from generators.jacobi_symbol_generator import JacobiSymbolGenerator
-from generators.tonelli_shanks_generator import TonelliShanksGenerator
-from generators.rsa_generator import RSAGenerator
-from generators.diffie_hellman_generator import DiffieHellmanGenerator
-from generators.primality_test_generator import PrimalityTestGenerator
-from generators.pollard_factorization_generator import PollardFactorizationGenerator
-from generators.baby_step_giant_step_generator import BabyStepGiantStepGenerator
-from generators.cayley_table_generator import CayleyTableGenerator
-from generators.cyclic_group_generator import CyclicGroupGenerator
-from generators.permutation_group_generator import PermutationGroupGenerator
-from generators.coset_generator import CosetGenerator
-from generators.finite_field_generator import FiniteFieldGenerator
-from generators.elliptic_curve_finite_field_generator import EllipticCurveFiniteFieldGenerator
-from generators.ecdh_generator import ECDHGenerator
-from generators.ecdsa_generator import ECDSAGenerator
-from generators.lll_reduction_generator import LLLReductionGenerator
-from generators.quaternion_generator import QuaternionGenerator
-from generators.euler_formula_generator import EulerFormulaGenerator
-from generators.de_moivre_generator import DeMoivreGenerator
-from generators.complex_log_generator import ComplexLogGenerator
-from generators.complex_locus_generator import ComplexLocusGenerator
-from generators.mobius_transform_generator import MobiusTransformGenerator
-from generators.fractal_iteration_generator import FractalIterationGenerator
-from generators.cauchy_riemann_generator import CauchyRiemannGenerator
-from generators.residue_generator import ResidueGenerator
-from generators.contour_integral_generator import ContourIntegralGenerator
-from generators.laurent_series_generator import LaurentSeriesGenerator
-from generators.great_circle_generator import GreatCircleGenerator
-from generators.spherical_excess_generator import SphericalExcessGenerator
-from generators.spherical_triangle_generator import SphericalTriangleGenerator
-from generators.hyperbolic_function_generator import HyperbolicFunctionGenerator
-from generators.angle_defect_generator import AngleDefectGenerator
-from generators.hyperbolic_distance_generator import HyperbolicDistanceGenerator
-from generators.stereographic_generator import StereographicGenerator
-from generators.fundamental_form_generator import FundamentalFormGenerator
-from generators.christoffel_generator import ChristoffelGenerator
-from generators.gaussian_curvature_generator import GaussianCurvatureGenerator
-from generators.gauss_bonnet_generator import GaussBonnetGenerator
-from generators.metric_arc_length_generator import MetricArcLengthGenerator
-from generators.function_inner_product_generator import FunctionInnerProductGenerator
-from generators.legendre_construction_generator import LegendreConstructionGenerator
-from generators.hermitian_check_generator import HermitianCheckGenerator
-from generators.tensor_product_generator import TensorProductGenerator
-from generators.quantum_gate_generator import QuantumGateGenerator
-from generators.partial_trace_generator import PartialTraceGenerator
-from generators.density_matrix_generator import DensityMatrixGenerator
-from generators.von_neumann_entropy_generator import VonNeumannEntropyGenerator
-from generators.projector_generator import ProjectorGenerator
-from generators.uncertainty_generator import UncertaintyGenerator
-from generators.matrix_group_check_generator import MatrixGroupCheckGenerator
-from generators.lie_exponential_generator import LieExponentialGenerator
-from generators.structure_constant_generator import StructureConstantGenerator
-from generators.pauli_algebra_generator import PauliAlgebraGenerator
-from generators.casimir_generator import CasimirGenerator
-from generators.index_gymnastics_generator import IndexGymnasticsGenerator
-from generators.bch_generator import BCHGenerator
-from generators.young_tableaux_generator import YoungTableauxGenerator
-from generators.clebsch_gordan_generator import ClebschGordanGenerator
-from generators.einstein_summation_generator import EinsteinSummationGenerator
-from generators.index_raising_generator import IndexRaisingGenerator
-from generators.riemann_tensor_generator import RiemannTensorGenerator
-from generators.four_vector_generator import FourVectorGenerator
-from generators.schwarzschild_generator import SchwarzschildGenerator
-from generators.planck_units_generator import PlanckUnitsGenerator
-from generators.hawking_generator import HawkingGenerator
-from generators.casimir_force_generator import CasimirForceGenerator
-from generators.natural_units_generator import NaturalUnitsGenerator
-from generators.invariant_mass_generator import InvariantMassGenerator
-from generators.conservation_law_generator import ConservationLawGenerator
-from generators.quark_composition_generator import QuarkCompositionGenerator
-from generators.branching_ratio_generator import BranchingRatioGenerator
-from generators.cross_section_generator import CrossSectionGenerator
-from generators.gamma_matrix_generator import GammaMatrixGenerator
-from generators.grassmann_generator import GrassmannGenerator
-from generators.running_coupling_generator import RunningCouplingGenerator
-from generators.bisection_generator import BisectionGenerator
-from generators.newton_raphson_generator import NewtonRaphsonGenerator
-from generators.fixed_point_generator import FixedPointGenerator
-from generators.interpolation_generator import InterpolationGenerator
-from generators.finite_difference_generator import FiniteDifferenceGenerator
-from generators.runge_kutta_generator import RungeKuttaGenerator
-from generators.continuous_distribution_generator import ContinuousDistributionGenerator
-from generators.named_distribution_generator import NamedDistributionGenerator
-from generators.joint_distribution_generator import JointDistributionGenerator
-from generators.mgf_generator import MGFGenerator
-from generators.rv_transform_generator import RVTransformGenerator
-from generators.mle_generator import MLEGenerator
-from generators.method_of_moments_generator import MethodOfMomentsGenerator
-from generators.bayesian_update_generator import BayesianUpdateGenerator
-from generators.markov_chain_generator import MarkovChainGenerator
-from generators.order_statistics_generator import OrderStatisticsGenerator
-from generators.simplex_generator import SimplexGenerator
-from generators.lp_corner_generator import LPCornerGenerator
-from generators.gradient_descent_generator import GradientDescentGenerator
-from generators.transportation_generator import TransportationGenerator
-from generators.game_theory_generator import GameTheoryGenerator
-from generators.or_formula_generator import ORFormulaGenerator
-from generators.convolution_generator import ConvolutionGenerator
-from generators.dft_generator import DFTGenerator
-from generators.fourier_series_generator import FourierSeriesGenerator
-from generators.separable_pde_generator import SeparablePDEGenerator
-from generators.z_transform_generator import ZTransformGenerator
-from generators.signal_arithmetic_generator import SignalArithmeticGenerator
-from generators.transfer_function_generator import TransferFunctionGenerator
-from generators.routh_hurwitz_generator import RouthHurwitzGenerator
-from generators.projectile_motion_generator import ProjectileMotionGenerator
-from generators.newtons_laws_generator import NewtonsLawsGenerator
-from generators.collision_generator import CollisionGenerator
-from generators.energy_conservation_generator import EnergyConservationGenerator
-from generators.orbital_mechanics_generator import OrbitalMechanicsGenerator
-from generators.statics_generator import StaticsGenerator
-from generators.rotational_dynamics_generator import RotationalDynamicsGenerator
-from generators.shm_generator import SHMGenerator
-from generators.lagrangian_generator import LagrangianGenerator
-from generators.hamiltonian_generator import HamiltonianGenerator
-from generators.electrostatics_generator import ElectrostaticsGenerator
-from generators.gauss_law_generator import GaussLawGenerator
-from generators.transient_circuit_generator import TransientCircuitGenerator
-from generators.ac_circuit_generator import ACCircuitGenerator
-from generators.magnetism_generator import MagnetismGenerator
-from generators.gas_law_generator import GasLawGenerator
-from generators.first_law_generator import FirstLawGenerator
-from generators.heat_engine_generator import HeatEngineGenerator
-from generators.entropy_change_generator import EntropyChangeGenerator
-from generators.calorimetry_generator import CalorimetryGenerator
-from generators.partition_function_generator import PartitionFunctionGenerator
-from generators.blackbody_generator import BlackbodyGenerator
-from generators.quantum_formula_generator import QuantumFormulaGenerator
-from generators.particle_in_box_generator import ParticleInBoxGenerator
-from generators.wavefunction_generator import WavefunctionGenerator
-from generators.spin_half_generator import SpinHalfGenerator
-from generators.commutator_generator import CommutatorGenerator
-from generators.ladder_operator_generator import LadderOperatorGenerator
-from generators.hydrogen_atom_generator import HydrogenAtomGenerator
-from generators.braket_generator import BraKetGenerator
-from generators.special_relativity_generator import SpecialRelativityGenerator
-from generators.relativistic_energy_generator import RelativisticEnergyGenerator
-from generators.minkowski_interval_generator import MinkowskiIntervalGenerator
-from generators.doppler_generator import DopplerGenerator
-from generators.optics_generator import OpticsGenerator
-from generators.interference_generator import InterferenceGenerator
-from generators.standing_wave_generator import StandingWaveGenerator
-from generators.stoichiometry_generator import StoichiometryGenerator
-from generators.solution_chem_generator import SolutionChemGenerator
-from generators.ph_calculation_generator import PHCalculationGenerator
-from generators.gas_stoichiometry_generator import GasStoichiometryGenerator
-from generators.equilibrium_ice_generator import EquilibriumICEGenerator
-from generators.entropy_generator import EntropyGenerator
-from generators.mutual_information_generator import MutualInformationGenerator
-from generators.kl_divergence_generator import KLDivergenceGenerator
-from generators.channel_capacity_generator import ChannelCapacityGenerator
-from generators.bec_channel_generator import BECChannelGenerator
-from generators.entropy_rate_markov_generator import EntropyRateMarkovGenerator
-from generators.viterbi_generator import ViterbiGenerator
-from generators.huffman_coding_generator import HuffmanCodingGenerator
-from generators.arithmetic_coding_generator import ArithmeticCodingGenerator
-from generators.lz_compression_generator import LZCompressionGenerator
-from generators.convolutional_code_viterbi_generator import ConvolutionalCodeViterbiGenerator
-from generators.reed_solomon_generator import ReedSolomonGenerator
-from generators.hamming_code_generator import HammingCodeGenerator
-from generators.crc_generator import CRCGenerator
-from generators.kraft_inequality_generator import KraftInequalityGenerator
-from generators.gradient_step_generator import GradientStepGenerator
-from generators.perceptron_generator import PerceptronGenerator
-from generators.backprop_generator import BackpropGenerator
-from generators.naive_bayes_generator import NaiveBayesGenerator
-from generators.information_gain_generator import InformationGainGenerator
-from generators.kmeans_step_generator import KMeansStepGenerator
-from generators.knn_generator import KNNGenerator
-from generators.classifier_metrics_generator import ClassifierMetricsGenerator
-from generators.matrix_calculus_generator import MatrixCalculusGenerator
-from generators.matrix_norm_generator import MatrixNormGenerator
-from generators.positive_definite_generator import PositiveDefiniteGenerator
-from generators.cholesky_generator import CholeskyGenerator
-from generators.pca_generator import PCAGenerator
-from generators.embedding_similarity_generator import EmbeddingSimilarityGenerator
-from generators.low_rank_approx_generator import LowRankApproxGenerator
-from generators.kernel_evaluation_generator import KernelEvaluationGenerator
-from generators.feature_map_generator import FeatureMapGenerator
-from generators.kernel_validity_generator import KernelValidityGenerator
-from generators.kernel_ridge_generator import KernelRidgeGenerator
-from generators.svm_margin_generator import SVMMarginGenerator
-from generators.kernel_perceptron_generator import KernelPerceptronGenerator
-from generators.attention_generator import AttentionGenerator
-from generators.softmax_gradient_generator import SoftmaxGradientGenerator
-from generators.layer_norm_generator import LayerNormGenerator
-from generators.activation_generator import ActivationGenerator
-from generators.positional_encoding_generator import PositionalEncodingGenerator
-from generators.param_count_generator import ParamCountGenerator
-from generators.flops_memory_generator import FLOPsMemoryGenerator
-from generators.scaling_law_generator import ScalingLawGenerator
-from generators.adam_step_generator import AdamStepGenerator
-from generators.lr_schedule_generator import LRScheduleGenerator
-from generators.perplexity_generator import PerplexityGenerator
-from generators.quantization_generator import QuantizationGenerator
-from generators.annuity_generator import AnnuityGenerator
-from generators.bond_pricing_generator import BondPricingGenerator
-from generators.npv_irr_generator import NPVIRRGenerator
-from generators.portfolio_generator import PortfolioGenerator
-from generators.black_scholes_generator import BlackScholesGenerator
-from generators.error_spotting_generator import ErrorSpottingGenerator
-from generators.fill_in_step_generator import FillInStepGenerator
-from generators.normal_table_generator import NormalTableGenerator
-from generators.scaling_generator import ScalingGenerator, SimilarFiguresScaleGenerator
-from generators.one_step_equation_generator import OneStepEquationGenerator
-from generators.two_step_equation_generator import TwoStepEquationGenerator
-from generators.one_step_inequality_generator import OneStepInequalityGenerator
-from generators.two_step_inequality_generator import TwoStepInequalityGenerator
-from generators.literal_equation_generator import LiteralEquationGenerator
-from generators.absolute_value_equation_generator import AbsoluteValueEquationGenerator
-from generators.absolute_value_inequality_generator import AbsoluteValueInequalityGenerator
-from generators.compound_inequality_generator import CompoundInequalityGenerator
-from generators.polynomial_inequality_generator import PolynomialInequalityGenerator
-from generators.slope_two_points_generator import SlopeTwoPointsGenerator
-from generators.slope_intercept_form_generator import SlopeInterceptFormGenerator
-from generators.equation_from_two_points_generator import EquationFromTwoPointsGenerator
-from generators.point_slope_generator import PointSlopeGenerator
-from generators.standard_form_conversion_generator import StandardFormConversionGenerator
-from generators.parallel_perpendicular_line_generator import ParallelPerpendicularLineGenerator
-from generators.systems_substitution_generator import SystemsSubstitutionGenerator
-from generators.systems_elimination_generator import SystemsEliminationGenerator
-from generators.polynomial_add_sub_generator import PolynomialAddSubGenerator
-from generators.monomial_mult_div_generator import MonomialMultDivGenerator
-from generators.multiplying_binomials_generator import MultiplyingBinomialsGenerator
-from generators.multiplying_polynomials_generator import MultiplyingPolynomialsGenerator
-from generators.polynomial_div_monomial_generator import PolynomialDivMonomialGenerator
-from generators.exponent_generator import (
-    ExponentEvaluationGenerator,
-    ExponentRulesGenerator,
-    ScientificNotationGenerator,
-    RootsAndRadicalsGenerator,
-)
-from generators.angle_relationships_generator import (
-    AngleRelationshipsGenerator,
-    AnglesWithParallelLinesGenerator,
-    TriangleAngleSumGenerator,
-)
-from generators.circle_generator import CircleAreaCircumferenceGenerator
-from generators.volume_3d_generator import (
-    VolumePrismGenerator,
-    VolumeCylinderGenerator,
-    SurfaceAreaPrismGenerator,
-    SurfaceAreaCylinderGenerator,
-)
-from generators.pythag_leg_generator import PythagoreanLegGenerator, PythagoreanWordProblemGenerator
-from generators.statistics_generator import (
-    MeanGenerator,
-    MedianGenerator,
-    ModeGenerator,
-    RangeGenerator,
-    MeanAbsoluteDeviationGenerator,
-)
-from generators.compound_probability_generator import (
-    CompoundProbabilityIndependentGenerator,
-    CompoundProbabilityDependentGenerator,
-)
-
-# Import Helpers if needed (jid is used in generate methods, step/DELIM are used internally)
-# from helpers import jid, step, DELIM # Not strictly needed here anymore
+from permutation import FeistelPermutation
+from skill_sampler import (QuotaSchedule, SkillSampler, mix_to_json, parse_mix,
+                           resolve_mix)
 
 # -----------------------------------------------------------
 # Op-code legend: see OPCODES.md (generated; regenerate with
@@ -543,588 +32,597 @@ from generators.compound_probability_generator import (
 # -----------------------------------------------------------
 
 # ===========================================================================
-# ALL_GENERATORS - Master list of all problem generators
+# GENERATOR_REGISTRY - Master list of all problem generators
 # ===========================================================================
-# For generators requiring args (like fractions, decimal add/sub),
-# we instantiate one for each variant.
+# Each entry names a generator module (under generators/), its class, and
+# the constructor arguments of one instance; for generators requiring args
+# (like fractions, decimal add/sub) there is one entry per variant. Modules
+# are imported only when an entry is first used, so selecting or sampling a
+# few skills does not pay for importing the rest. ALL_GENERATORS is the
+# same list, instantiated.
 #
 # The grade-band banners below are the source of truth for grade_level;
 # per-class grade/difficulty metadata lives in curriculum.py and every class
 # listed here must have a CURRICULUM entry (enforced by tests).
 # ===========================================================================
 
-ALL_GENERATORS = [
+
+def _lazy(module, class_name, *args, **kwargs):
+    return LazyGenerator(f"generators.{module}", class_name, args, kwargs)
+
+
+GENERATOR_REGISTRY = [
     # ===== ELEMENTARY (Grades 3-5) =====
 
     # --- Basic Arithmetic ---
-    LongDivisionGenerator(),
-    MultiDigitAdditionGenerator(),
-    MultiDigitSubtractionGenerator(),
-    MultiDigitMultiplicationGenerator(),
-    AbacusAdditionGenerator(),
+    _lazy("long_division_generator", "LongDivisionGenerator"),
+    _lazy("multi_digit_addition_generator", "MultiDigitAdditionGenerator"),
+    _lazy("multi_digit_subtraction_generator", "MultiDigitSubtractionGenerator"),
+    _lazy("multi_digit_multiplication_generator", "MultiDigitMultiplicationGenerator"),
+    _lazy("abacus_addition_generator", "AbacusAdditionGenerator"),
 
     # --- Decimals ---
-    DecimalAddSubGenerator('+'),
-    DecimalAddSubGenerator('-'),
-    DecimalMultGenerator(),
-    DecimalDivGenerator(),
+    _lazy("decimal_add_sub_generator", "DecimalAddSubGenerator", '+'),
+    _lazy("decimal_add_sub_generator", "DecimalAddSubGenerator", '-'),
+    _lazy("decimal_mult_generator", "DecimalMultGenerator"),
+    _lazy("decimal_div_generator", "DecimalDivGenerator"),
 
     # --- Fractions ---
-    FractionOpGenerator('+'),
-    FractionOpGenerator('-'),
-    FractionOpGenerator('*'),
-    FractionOpGenerator('/'),
-    FractionComparisonGenerator(),
-    MixedNumberOperationsRandom(),  # Random operation picker
-    MixedNumberOperationGenerator('+'),
-    MixedNumberOperationGenerator('-'),
-    MixedNumberOperationGenerator('*'),
-    MixedNumberOperationGenerator('/'),
+    _lazy("fraction_op_generator", "FractionOpGenerator", '+'),
+    _lazy("fraction_op_generator", "FractionOpGenerator", '-'),
+    _lazy("fraction_op_generator", "FractionOpGenerator", '*'),
+    _lazy("fraction_op_generator", "FractionOpGenerator", '/'),
+    _lazy("fraction_comparison_generator", "FractionComparisonGenerator"),
+    _lazy("mixed_number_operations_random", "MixedNumberOperationsRandom"),  # Random operation picker
+    _lazy("mixed_number_operation_generator", "MixedNumberOperationGenerator", '+'),
+    _lazy("mixed_number_operation_generator", "MixedNumberOperationGenerator", '-'),
+    _lazy("mixed_number_operation_generator", "MixedNumberOperationGenerator", '*'),
+    _lazy("mixed_number_operation_generator", "MixedNumberOperationGenerator", '/'),
 
     # --- Conversions ---
-    FractionDecimalPercentConverter(),
+    _lazy("fraction_decimal_percent_converter", "FractionDecimalPercentConverter"),
 
     # --- Factors & Multiples ---
-    FactorsGenerator(),
-    PrimeFactorizationGenerator(),
-    GCFGenerator(),
-    LCMGenerator(),
+    _lazy("factors_generator", "FactorsGenerator"),
+    _lazy("prime_factorization_generator", "PrimeFactorizationGenerator"),
+    _lazy("gcf_generator", "GCFGenerator"),
+    _lazy("lcm_generator", "LCMGenerator"),
 
     # --- Order of Operations ---
-    OrderOfOperationsGenerator(),
-    OrderOfOperationsGenerator("decimals"),
-    OrderOfOperationsGenerator("mixed_numbers"),
+    _lazy("order_of_operations_generator", "OrderOfOperationsGenerator"),
+    _lazy("order_of_operations_generator", "OrderOfOperationsGenerator", "decimals"),
+    _lazy("order_of_operations_generator", "OrderOfOperationsGenerator", "mixed_numbers"),
 
     # --- Number Sense ---
-    PlaceValueRoundingGenerator(),
-    NumberComparisonGenerator(),
-    DivisibilityClassificationGenerator(),
+    _lazy("place_value_rounding_generator", "PlaceValueRoundingGenerator"),
+    _lazy("number_comparison_generator", "NumberComparisonGenerator"),
+    _lazy("divisibility_classification_generator", "DivisibilityClassificationGenerator"),
 
     # --- Geometry (Elementary) ---
-    GeometryAreaPerimeterGenerator(),
-    PolygonPerimeterGenerator(),
-    VolumeRectPrismGenerator(),
+    _lazy("geometry_area_perimeter_generator", "GeometryAreaPerimeterGenerator"),
+    _lazy("polygon_perimeter_generator", "PolygonPerimeterGenerator"),
+    _lazy("volume_rect_prism_generator", "VolumeRectPrismGenerator"),
 
     # --- Units & Measurement ---
-    UnitConversionGenerator(),
-    MultiStepUnitConversionGenerator(),
-    RateConversionGenerator(),
-    TemperatureConversionGenerator(),
-    DimensionalAnalysisGenerator(),
-    PercentWordProblemGenerator(),
-    PercentWordProblemGenerator(distractor=True),
-    RepeatingDecimalGenerator(),
-    ProportionWordProblemGenerator(),
-    ProportionWordProblemGenerator(distractor=True),
+    _lazy("unit_conversion_generator", "UnitConversionGenerator"),
+    _lazy("multi_step_unit_conversion_generator", "MultiStepUnitConversionGenerator"),
+    _lazy("rate_conversion_generator", "RateConversionGenerator"),
+    _lazy("temperature_conversion_generator", "TemperatureConversionGenerator"),
+    _lazy("dimensional_analysis_generator", "DimensionalAnalysisGenerator"),
+    _lazy("percent_word_problem_generator", "PercentWordProblemGenerator"),
+    _lazy("percent_word_problem_generator", "PercentWordProblemGenerator", distractor=True),
+    _lazy("repeating_decimal_generator", "RepeatingDecimalGenerator"),
+    _lazy("proportion_word_problem_generator", "ProportionWordProblemGenerator"),
+    _lazy("proportion_word_problem_generator", "ProportionWordProblemGenerator", distractor=True),
 
     # --- Data & Statistics (Elementary) ---
-    SimpleStatsGenerator(),
-    SimpleProbabilityGenerator(),
-    GraphInterpretGenerator(),
+    _lazy("simple_stats_generator", "SimpleStatsGenerator"),
+    _lazy("simple_probability_generator", "SimpleProbabilityGenerator"),
+    _lazy("graph_interpret_generator", "GraphInterpretGenerator"),
 
     # ===== MIDDLE SCHOOL (Grades 6-8) =====
 
     # --- Integer Operations ---
-    IntegerOperationsGenerator(),
+    _lazy("integer_operations_generator", "IntegerOperationsGenerator"),
 
     # --- Ratios & Proportions ---
-    UnitRateGenerator(),
-    UnitRateFromTableGenerator(),
-    RatioTableGenerator(),
-    TipBillSplitGenerator(),
-    ScalingGenerator(),
-    SimilarFiguresScaleGenerator(),
-    ProportionalRelationshipGenerator(),
+    _lazy("unit_rate_generator", "UnitRateGenerator"),
+    _lazy("unit_rate_generator", "UnitRateFromTableGenerator"),
+    _lazy("ratio_table_generator", "RatioTableGenerator"),
+    _lazy("tip_bill_split_generator", "TipBillSplitGenerator"),
+    _lazy("scaling_generator", "ScalingGenerator"),
+    _lazy("scaling_generator", "SimilarFiguresScaleGenerator"),
+    _lazy("proportional_relationship_generator", "ProportionalRelationshipGenerator"),
 
     # --- Expressions & Equations ---
-    OneStepEquationGenerator(),
-    TwoStepEquationGenerator(),
-    LinearSimpleGenerator(),
-    LinearComplexGenerator(),
-    SimplifyExpressionGenerator(),
-    EvaluateExpressionGenerator(),
+    _lazy("one_step_equation_generator", "OneStepEquationGenerator"),
+    _lazy("two_step_equation_generator", "TwoStepEquationGenerator"),
+    _lazy("linear_simple_generator", "LinearSimpleGenerator"),
+    _lazy("linear_complex_generator", "LinearComplexGenerator"),
+    _lazy("simplify_expression_generator", "SimplifyExpressionGenerator"),
+    _lazy("evaluate_expression_generator", "EvaluateExpressionGenerator"),
 
     # --- Inequalities ---
-    OneStepInequalityGenerator(),
-    TwoStepInequalityGenerator(),
-    LinearFractionalGenerator(),
-    SpecialSolutionEquationGenerator(),
+    _lazy("one_step_inequality_generator", "OneStepInequalityGenerator"),
+    _lazy("two_step_inequality_generator", "TwoStepInequalityGenerator"),
+    _lazy("linear_fractional_generator", "LinearFractionalGenerator"),
+    _lazy("special_solution_equation_generator", "SpecialSolutionEquationGenerator"),
 
     # --- Exponents & Roots ---
-    ExponentEvaluationGenerator(),
-    ExponentRulesGenerator(),
-    ExponentRulesGenerator(base_style="decimal"),
-    ExponentRulesGenerator(base_style="fraction"),
-    ExponentMixedRulesGenerator(),
-    ScientificNotationGenerator(),
-    RootsAndRadicalsGenerator(),
+    _lazy("exponent_generator", "ExponentEvaluationGenerator"),
+    _lazy("exponent_generator", "ExponentRulesGenerator"),
+    _lazy("exponent_generator", "ExponentRulesGenerator", base_style="decimal"),
+    _lazy("exponent_generator", "ExponentRulesGenerator", base_style="fraction"),
+    _lazy("exponent_mixed_rules_generator", "ExponentMixedRulesGenerator"),
+    _lazy("exponent_generator", "ScientificNotationGenerator"),
+    _lazy("exponent_generator", "RootsAndRadicalsGenerator"),
 
     # --- Geometry (Middle School) ---
-    AngleRelationshipsGenerator(),
-    AnglesWithParallelLinesGenerator(),
-    TriangleAngleSumGenerator(),
-    CircleAreaCircumferenceGenerator(),
-    VolumePrismGenerator(),
-    VolumeCylinderGenerator(),
-    SurfaceAreaPrismGenerator(),
-    SurfaceAreaCylinderGenerator(),
-    RoundSolidsGenerator(),
-    PythagHypGenerator(),
-    PythagoreanLegGenerator(),
-    PythagoreanWordProblemGenerator(),
+    _lazy("angle_relationships_generator", "AngleRelationshipsGenerator"),
+    _lazy("angle_relationships_generator", "AnglesWithParallelLinesGenerator"),
+    _lazy("angle_relationships_generator", "TriangleAngleSumGenerator"),
+    _lazy("circle_generator", "CircleAreaCircumferenceGenerator"),
+    _lazy("volume_3d_generator", "VolumePrismGenerator"),
+    _lazy("volume_3d_generator", "VolumeCylinderGenerator"),
+    _lazy("volume_3d_generator", "SurfaceAreaPrismGenerator"),
+    _lazy("volume_3d_generator", "SurfaceAreaCylinderGenerator"),
+    _lazy("round_solids_generator", "RoundSolidsGenerator"),
+    _lazy("pythag_hyp_generator", "PythagHypGenerator"),
+    _lazy("pythag_leg_generator", "PythagoreanLegGenerator"),
+    _lazy("pythag_leg_generator", "PythagoreanWordProblemGenerator"),
 
     # --- Statistics (Middle School) ---
-    MeanGenerator(),
-    MedianGenerator(),
-    ModeGenerator(),
-    RangeGenerator(),
-    MeanAbsoluteDeviationGenerator(),
+    _lazy("statistics_generator", "MeanGenerator"),
+    _lazy("statistics_generator", "MedianGenerator"),
+    _lazy("statistics_generator", "ModeGenerator"),
+    _lazy("statistics_generator", "RangeGenerator"),
+    _lazy("statistics_generator", "MeanAbsoluteDeviationGenerator"),
 
     # --- Probability (Middle School) ---
-    CompoundProbabilityIndependentGenerator(),
-    CompoundProbabilityDependentGenerator(),
-    GeometricProbabilityGenerator(),
-    FinanceGenerator(),
-    KinematicsGenerator(),
-    PhysicsFormulaGenerator(),
-    BaseConversionGenerator(),
-    BaseArithmeticGenerator(),
-    BitwiseOpsGenerator(),
-    ModularArithmeticGenerator(),
-    ManualSquareRootGenerator(),
-    CalendarArithmeticGenerator(),
+    _lazy("compound_probability_generator", "CompoundProbabilityIndependentGenerator"),
+    _lazy("compound_probability_generator", "CompoundProbabilityDependentGenerator"),
+    _lazy("geometric_probability_generator", "GeometricProbabilityGenerator"),
+    _lazy("finance_generator", "FinanceGenerator"),
+    _lazy("kinematics_generator", "KinematicsGenerator"),
+    _lazy("physics_formula_generator", "PhysicsFormulaGenerator"),
+    _lazy("base_conversion_generator", "BaseConversionGenerator"),
+    _lazy("base_arithmetic_generator", "BaseArithmeticGenerator"),
+    _lazy("bitwise_ops_generator", "BitwiseOpsGenerator"),
+    _lazy("modular_arithmetic_generator", "ModularArithmeticGenerator"),
+    _lazy("manual_square_root_generator", "ManualSquareRootGenerator"),
+    _lazy("calendar_arithmetic_generator", "CalendarArithmeticGenerator"),
 
     # ===== HIGH SCHOOL =====
 
     # --- Algebra ---
-    QuadraticGenerator(),
-    PercentProblemGenerator(),
-    LiteralEquationGenerator(),
-    AbsoluteValueEquationGenerator(),
-    AbsoluteValueInequalityGenerator(),
-    CompoundInequalityGenerator(),
-    PolynomialInequalityGenerator(),
-    SlopeTwoPointsGenerator(),
-    SlopeInterceptFormGenerator(),
-    EquationFromTwoPointsGenerator(),
-    PointSlopeGenerator(),
-    StandardFormConversionGenerator(),
-    ParallelPerpendicularLineGenerator(),
-    SystemsSubstitutionGenerator(),
-    SystemsEliminationGenerator(),
-    PolynomialAddSubGenerator(),
-    MonomialMultDivGenerator(),
-    FactorGCFGenerator(),
-    FactorTrinomialGenerator(),
-    FactorTrinomialGenerator("general"),
-    FactorSpecialFormsGenerator(),
-    FactorGroupingGenerator(),
-    QuadraticFactoringGenerator(),
-    QuadraticSquareRootGenerator(),
-    CompletingSquareGenerator(),
-    DiscriminantGenerator(),
-    RadicalVariableSimplifyGenerator(),
-    RadicalAddSubGenerator(),
-    RadicalMultiplyGenerator(),
-    RadicalRationalizeGenerator(),
-    RationalExponentGenerator(),
-    RadicalEquationGenerator(),
-    RationalExprSimplifyGenerator(),
-    RationalExprMultDivGenerator(),
-    RationalExprAddSubGenerator(),
-    RationalEquationGenerator(),
-    FunctionEvaluationGenerator(),
-    FunctionTableGenerator(),
-    PiecewiseEvaluationGenerator(),
-    FunctionOperationsGenerator(),
-    FunctionCompositionGenerator(),
-    DomainRangeGenerator(),
-    InverseFunctionGenerator(),
-    ArithmeticSequenceGenerator(),
-    GeometricSequenceGenerator(),
-    RecursiveExplicitGenerator(),
-    SigmaNotationGenerator(),
-    PascalTriangleGenerator(),
-    ComplexNumberOpsGenerator(),
-    ComplexDivisionGenerator(),
-    ComplexQuadraticGenerator(),
-    PolynomialLongDivisionGenerator(),
-    SyntheticDivisionGenerator(),
-    HornerEvaluationGenerator(),
-    RemainderFactorTheoremGenerator(),
-    RationalRootGenerator(),
-    PolynomialZerosGenerator(),
-    RationalFunctionFeaturesGenerator(),
-    ExponentialModelGenerator(),
-    LogConversionGenerator(),
-    LogPropertiesGenerator(),
-    ExponentialEquationGenerator(),
-    LogEquationGenerator(),
-    ParabolaFeaturesGenerator(),
-    EllipseFeaturesGenerator(),
-    HyperbolaFeaturesGenerator(),
-    ConicStandardFormGenerator(),
-    NetsSurfaceAreaGenerator(),
-    RegularPolygonAreaGenerator(),
-    SimilarTrianglesGenerator(),
-    GeometricMeanGenerator(),
-    DistanceFormulaGenerator(),
-    MidpointGenerator(),
-    SegmentPartitionGenerator(),
-    TransformationGenerator(),
-    ArcSectorGenerator(),
-    CircleAngleGenerator(),
-    CircleEquationGenerator(),
-    TaxicabGeometryGenerator(),
-    EulerCharacteristicGenerator(),
-    HypercubeCountingGenerator(),
-    RightTriangleTrigGenerator(),
-    SpecialRightTriangleGenerator(),
-    AngleMeasureGenerator(),
-    UnitCircleGenerator(),
-    SinusoidFeaturesGenerator(),
-    TrigSixFunctionsGenerator(),
-    TrigIdentityEvalGenerator(),
-    TrigIdentityVerifyGenerator(),
-    TrigEquationGenerator(),
-    TriangleSolveGenerator(),
-    TriangleAreaSASGenerator(),
-    PolarParametricGenerator(),
-    VectorOpsGenerator(),
-    DotProductGenerator(),
-    MatrixOpsGenerator(),
-    DeterminantGenerator(),
-    MatrixInverseGenerator(),
-    CramersRuleGenerator(),
-    RowReductionGenerator(),
-    LimitEvaluationGenerator(),
-    DerivativeLimitDefGenerator(),
-    DerivativePowerRuleGenerator(),
-    DerivativeProductQuotientGenerator(),
-    ChainRuleGenerator(),
-    DerivativeTranscendentalGenerator(),
-    ImplicitDiffGenerator(),
-    LogDiffHigherOrderGenerator(),
-    TangentLineGenerator(),
-    RelatedRatesGenerator(),
-    LinearApproxGenerator(),
-    LHopitalGenerator(),
-    CurveAnalysisGenerator(),
-    OptimizationGenerator(),
-    MeanValueTheoremGenerator(),
-    AntiderivativeGenerator(),
-    USubstitutionGenerator(),
-    DefiniteIntegralGenerator(),
-    RiemannSumGenerator(),
-    AreaBetweenCurvesGenerator(),
-    SolidRevolutionGenerator(),
-    SeparableODEGenerator(),
-    IntegrationByPartsGenerator(),
-    PartialFractionsGenerator(),
-    TelescopingGenerator(),
-    ImproperIntegralGenerator(),
-    EulerMethodGenerator(),
-    LogisticGrowthGenerator(),
-    ParametricCalculusGenerator(),
-    ArcLengthGenerator(),
-    SeriesConvergenceGenerator(),
-    PowerSeriesGenerator(),
-    TaylorSeriesGenerator(),
-    FiveNumberSummaryGenerator(),
-    StandardDeviationGenerator(),
-    CompositeArithmeticGenerator(),
-    ZScoreGenerator(),
-    FrequencyTableGenerator(),
-    RegressionGenerator(),
-    ExpectedValueGenerator(),
-    ConfidenceIntervalGenerator(),
-    HypothesisTestGenerator(),
-    TwoSampleTestGenerator(),
-    ChiSquareGenerator(),
-    PermutationCombinationGenerator(),
-    BinomialProbabilityGenerator(),
-    ProbabilityAdditionRuleGenerator(),
-    ConditionalProbabilityGenerator(),
-    GeometricDistributionGenerator(),
-    FermiEstimationGenerator(),
+    _lazy("quadratic_generator", "QuadraticGenerator"),
+    _lazy("percent_problem_generator", "PercentProblemGenerator"),
+    _lazy("literal_equation_generator", "LiteralEquationGenerator"),
+    _lazy("absolute_value_equation_generator", "AbsoluteValueEquationGenerator"),
+    _lazy("absolute_value_inequality_generator", "AbsoluteValueInequalityGenerator"),
+    _lazy("compound_inequality_generator", "CompoundInequalityGenerator"),
+    _lazy("polynomial_inequality_generator", "PolynomialInequalityGenerator"),
+    _lazy("slope_two_points_generator", "SlopeTwoPointsGenerator"),
+    _lazy("slope_intercept_form_generator", "SlopeInterceptFormGenerator"),
+    _lazy("equation_from_two_points_generator", "EquationFromTwoPointsGenerator"),
+    _lazy("point_slope_generator", "PointSlopeGenerator"),
+    _lazy("standard_form_conversion_generator", "StandardFormConversionGenerator"),
+    _lazy("parallel_perpendicular_line_generator", "ParallelPerpendicularLineGenerator"),
+    _lazy("systems_substitution_generator", "SystemsSubstitutionGenerator"),
+    _lazy("systems_elimination_generator", "SystemsEliminationGenerator"),
+    _lazy("polynomial_add_sub_generator", "PolynomialAddSubGenerator"),
+    _lazy("monomial_mult_div_generator", "MonomialMultDivGenerator"),
+    _lazy("factor_gcf_generator", "FactorGCFGenerator"),
+    _lazy("factor_trinomial_generator", "FactorTrinomialGenerator"),
+    _lazy("factor_trinomial_generator", "FactorTrinomialGenerator", "general"),
+    _lazy("factor_special_forms_generator", "FactorSpecialFormsGenerator"),
+    _lazy("factor_grouping_generator", "FactorGroupingGenerator"),
+    _lazy("quadratic_factoring_generator", "QuadraticFactoringGenerator"),
+    _lazy("quadratic_square_root_generator", "QuadraticSquareRootGenerator"),
+    _lazy("completing_square_generator", "CompletingSquareGenerator"),
+    _lazy("discriminant_generator", "DiscriminantGenerator"),
+    _lazy("radical_variable_simplify_generator", "RadicalVariableSimplifyGenerator"),
+    _lazy("radical_add_sub_generator", "RadicalAddSubGenerator"),
+    _lazy("radical_multiply_generator", "RadicalMultiplyGenerator"),
+    _lazy("radical_rationalize_generator", "RadicalRationalizeGenerator"),
+    _lazy("rational_exponent_generator", "RationalExponentGenerator"),
+    _lazy("radical_equation_generator", "RadicalEquationGenerator"),
+    _lazy("rational_expr_simplify_generator", "RationalExprSimplifyGenerator"),
+    _lazy("rational_expr_mult_div_generator", "RationalExprMultDivGenerator"),
+    _lazy("rational_expr_add_sub_generator", "RationalExprAddSubGenerator"),
+    _lazy("rational_equation_generator", "RationalEquationGenerator"),
+    _lazy("function_evaluation_generator", "FunctionEvaluationGenerator"),
+    _lazy("function_table_generator", "FunctionTableGenerator"),
+    _lazy("piecewise_evaluation_generator", "PiecewiseEvaluationGenerator"),
+    _lazy("function_operations_generator", "FunctionOperationsGenerator"),
+    _lazy("function_composition_generator", "FunctionCompositionGenerator"),
+    _lazy("domain_range_generator", "DomainRangeGenerator"),
+    _lazy("inverse_function_generator", "InverseFunctionGenerator"),
+    _lazy("arithmetic_sequence_generator", "ArithmeticSequenceGenerator"),
+    _lazy("geometric_sequence_generator", "GeometricSequenceGenerator"),
+    _lazy("recursive_explicit_generator", "RecursiveExplicitGenerator"),
+    _lazy("sigma_notation_generator", "SigmaNotationGenerator"),
+    _lazy("pascal_triangle_generator", "PascalTriangleGenerator"),
+    _lazy("complex_number_ops_generator", "ComplexNumberOpsGenerator"),
+    _lazy("complex_division_generator", "ComplexDivisionGenerator"),
+    _lazy("complex_quadratic_generator", "ComplexQuadraticGenerator"),
+    _lazy("polynomial_long_division_generator", "PolynomialLongDivisionGenerator"),
+    _lazy("synthetic_division_generator", "SyntheticDivisionGenerator"),
+    _lazy("horner_evaluation_generator", "HornerEvaluationGenerator"),
+    _lazy("remainder_factor_theorem_generator", "RemainderFactorTheoremGenerator"),
+    _lazy("rational_root_generator", "RationalRootGenerator"),
+    _lazy("polynomial_zeros_generator", "PolynomialZerosGenerator"),
+    _lazy("rational_function_features_generator", "RationalFunctionFeaturesGenerator"),
+    _lazy("exponential_model_generator", "ExponentialModelGenerator"),
+    _lazy("log_conversion_generator", "LogConversionGenerator"),
+    _lazy("log_properties_generator", "LogPropertiesGenerator"),
+    _lazy("exponential_equation_generator", "ExponentialEquationGenerator"),
+    _lazy("log_equation_generator", "LogEquationGenerator"),
+    _lazy("parabola_features_generator", "ParabolaFeaturesGenerator"),
+    _lazy("ellipse_features_generator", "EllipseFeaturesGenerator"),
+    _lazy("hyperbola_features_generator", "HyperbolaFeaturesGenerator"),
+    _lazy("conic_standard_form_generator", "ConicStandardFormGenerator"),
+    _lazy("nets_surface_area_generator", "NetsSurfaceAreaGenerator"),
+    _lazy("regular_polygon_area_generator", "RegularPolygonAreaGenerator"),
+    _lazy("similar_triangles_generator", "SimilarTrianglesGenerator"),
+    _lazy("geometric_mean_generator", "GeometricMeanGenerator"),
+    _lazy("distance_formula_generator", "DistanceFormulaGenerator"),
+    _lazy("midpoint_generator", "MidpointGenerator"),
+    _lazy("segment_partition_generator", "SegmentPartitionGenerator"),
+    _lazy("transformation_generator", "TransformationGenerator"),
+    _lazy("arc_sector_generator", "ArcSectorGenerator"),
+    _lazy("circle_angle_generator", "CircleAngleGenerator"),
+    _lazy("circle_equation_generator", "CircleEquationGenerator"),
+    _lazy("taxicab_geometry_generator", "TaxicabGeometryGenerator"),
+    _lazy("euler_characteristic_generator", "EulerCharacteristicGenerator"),
+    _lazy("hypercube_counting_generator", "HypercubeCountingGenerator"),
+    _lazy("right_triangle_trig_generator", "RightTriangleTrigGenerator"),
+    _lazy("special_right_triangle_generator", "SpecialRightTriangleGenerator"),
+    _lazy("angle_measure_generator", "AngleMeasureGenerator"),
+    _lazy("unit_circle_generator", "UnitCircleGenerator"),
+    _lazy("sinusoid_features_generator", "SinusoidFeaturesGenerator"),
+    _lazy("trig_six_functions_generator", "TrigSixFunctionsGenerator"),
+    _lazy("trig_identity_eval_generator", "TrigIdentityEvalGenerator"),
+    _lazy("trig_identity_verify_generator", "TrigIdentityVerifyGenerator"),
+    _lazy("trig_equation_generator", "TrigEquationGenerator"),
+    _lazy("triangle_solve_generator", "TriangleSolveGenerator"),
+    _lazy("triangle_area_sas_generator", "TriangleAreaSASGenerator"),
+    _lazy("polar_parametric_generator", "PolarParametricGenerator"),
+    _lazy("vector_ops_generator", "VectorOpsGenerator"),
+    _lazy("dot_product_generator", "DotProductGenerator"),
+    _lazy("matrix_ops_generator", "MatrixOpsGenerator"),
+    _lazy("determinant_generator", "DeterminantGenerator"),
+    _lazy("matrix_inverse_generator", "MatrixInverseGenerator"),
+    _lazy("cramers_rule_generator", "CramersRuleGenerator"),
+    _lazy("row_reduction_generator", "RowReductionGenerator"),
+    _lazy("limit_evaluation_generator", "LimitEvaluationGenerator"),
+    _lazy("derivative_limit_def_generator", "DerivativeLimitDefGenerator"),
+    _lazy("derivative_power_rule_generator", "DerivativePowerRuleGenerator"),
+    _lazy("derivative_product_quotient_generator", "DerivativeProductQuotientGenerator"),
+    _lazy("chain_rule_generator", "ChainRuleGenerator"),
+    _lazy("derivative_transcendental_generator", "DerivativeTranscendentalGenerator"),
+    _lazy("implicit_diff_generator", "ImplicitDiffGenerator"),
+    _lazy("log_diff_higher_order_generator", "LogDiffHigherOrderGenerator"),
+    _lazy("tangent_line_generator", "TangentLineGenerator"),
+    _lazy("related_rates_generator", "RelatedRatesGenerator"),
+    _lazy("linear_approx_generator", "LinearApproxGenerator"),
+    _lazy("lhopital_generator", "LHopitalGenerator"),
+    _lazy("curve_analysis_generator", "CurveAnalysisGenerator"),
+    _lazy("optimization_generator", "OptimizationGenerator"),
+    _lazy("mean_value_theorem_generator", "MeanValueTheoremGenerator"),
+    _lazy("antiderivative_generator", "AntiderivativeGenerator"),
+    _lazy("u_substitution_generator", "USubstitutionGenerator"),
+    _lazy("definite_integral_generator", "DefiniteIntegralGenerator"),
+    _lazy("riemann_sum_generator", "RiemannSumGenerator"),
+    _lazy("area_between_curves_generator", "AreaBetweenCurvesGenerator"),
+    _lazy("solid_revolution_generator", "SolidRevolutionGenerator"),
+    _lazy("separable_ode_generator", "SeparableODEGenerator"),
+    _lazy("integration_by_parts_generator", "IntegrationByPartsGenerator"),
+    _lazy("partial_fractions_generator", "PartialFractionsGenerator"),
+    _lazy("telescoping_generator", "TelescopingGenerator"),
+    _lazy("improper_integral_generator", "ImproperIntegralGenerator"),
+    _lazy("euler_method_generator", "EulerMethodGenerator"),
+    _lazy("logistic_growth_generator", "LogisticGrowthGenerator"),
+    _lazy("parametric_calculus_generator", "ParametricCalculusGenerator"),
+    _lazy("arc_length_generator", "ArcLengthGenerator"),
+    _lazy("series_convergence_generator", "SeriesConvergenceGenerator"),
+    _lazy("power_series_generator", "PowerSeriesGenerator"),
+    _lazy("taylor_series_generator", "TaylorSeriesGenerator"),
+    _lazy("five_number_summary_generator", "FiveNumberSummaryGenerator"),
+    _lazy("standard_deviation_generator", "StandardDeviationGenerator"),
+    _lazy("composite_arithmetic_generator", "CompositeArithmeticGenerator"),
+    _lazy("z_score_generator", "ZScoreGenerator"),
+    _lazy("frequency_table_generator", "FrequencyTableGenerator"),
+    _lazy("regression_generator", "RegressionGenerator"),
+    _lazy("expected_value_generator", "ExpectedValueGenerator"),
+    _lazy("confidence_interval_generator", "ConfidenceIntervalGenerator"),
+    _lazy("hypothesis_test_generator", "HypothesisTestGenerator"),
+    _lazy("two_sample_test_generator", "TwoSampleTestGenerator"),
+    _lazy("chi_square_generator", "ChiSquareGenerator"),
+    _lazy("permutation_combination_generator", "PermutationCombinationGenerator"),
+    _lazy("binomial_probability_generator", "BinomialProbabilityGenerator"),
+    _lazy("probability_addition_rule_generator", "ProbabilityAdditionRuleGenerator"),
+    _lazy("conditional_probability_generator", "ConditionalProbabilityGenerator"),
+    _lazy("geometric_distribution_generator", "GeometricDistributionGenerator"),
+    _lazy("fermi_estimation_generator", "FermiEstimationGenerator"),
 
     # --- Critic formats (see DESIGN.md "Derived Record Formats") ---
-    ErrorSpottingGenerator(),
-    FillInStepGenerator(),
-    MultiDigitMultiplicationGenerator(estimate=True),
-    LongDivisionGenerator(estimate=True),
-    NormalTableGenerator(),
-    MultiplyingBinomialsGenerator(),
-    MultiplyingPolynomialsGenerator(),
-    PolynomialDivMonomialGenerator(),
-    PartialDerivativeGenerator(),
-    GradientGenerator(),
-    MultivarChainRuleGenerator(),
-    HessianClassifyGenerator(),
-    LagrangeMultiplierGenerator(),
-    DoubleIntegralGenerator(),
-    TripleIntegralGenerator(),
-    JacobianGenerator(),
-    DivCurlGenerator(),
-    LineIntegralGenerator(),
-    VectorTheoremGenerator(),
-    CurveGeometryGenerator(),
-    CentroidGenerator(),
-    LUDecompositionGenerator(),
-    SubspaceBasisGenerator(),
-    EigenvalueGenerator(),
-    DiagonalizationGenerator(),
-    GramSchmidtGenerator(),
-    QRDecompositionGenerator(),
-    LeastSquaresGenerator(),
-    MatrixExponentialGenerator(),
-    SVDGenerator(),
-    IntegratingFactorGenerator(),
-    ExactODEGenerator(),
-    ODESubstitutionGenerator(),
-    SecondOrderODEGenerator(),
-    UndeterminedCoeffGenerator(),
-    VariationParametersGenerator(),
-    LaplaceIVPGenerator(),
-    ODESystemGenerator(),
-    SeriesSolutionGenerator(),
-    StabilityGenerator(),
-    SetOperationsGenerator(),
-    RelationCheckGenerator(),
-    InclusionExclusionGenerator(),
-    StarsAndBarsGenerator(),
-    DerangementGenerator(),
-    RecurrenceGenerator(),
-    MasterTheoremGenerator(),
-    InductionVerifyGenerator(),
-    CountingClassicsGenerator(),
-    GeneratingFunctionGenerator(),
-    BooleanAlgebraGenerator(),
-    GraphCountingGenerator(),
-    DijkstraGenerator(),
-    MSTGenerator(),
-    GraphTraversalGenerator(),
-    EulerCircuitGenerator(),
-    DPTableGenerator(),
-    AlgorithmTraceGenerator(),
-    TuringMachineTraceGenerator(),
-    DFASimulationGenerator(),
-    NFASimulationGenerator(),
-    DFAMinimizationGenerator(),
-    RegexToAutomatonGenerator(),
-    PDASimulationGenerator(),
-    CYKParserGenerator(),
-    DPLLTraceGenerator(),
-    ResolutionProofGenerator(),
-    UnificationGenerator(),
-    LambdaReductionGenerator(),
-    ExtendedEuclidGenerator(),
-    ModularInverseGenerator(),
-    CRTGenerator(),
-    ModExpGenerator(),
-    TotientGenerator(),
-    ContinuedFractionGenerator(),
-    QuadraticResidueGenerator(),
-    JacobiSymbolGenerator(),
-    TonelliShanksGenerator(),
-    RSAGenerator(),
-    DiffieHellmanGenerator(),
-    PrimalityTestGenerator(),
-    PollardFactorizationGenerator(),
-    BabyStepGiantStepGenerator(),
-    CayleyTableGenerator(),
-    CyclicGroupGenerator(),
-    PermutationGroupGenerator(),
-    CosetGenerator(),
-    FiniteFieldGenerator(),
-    EllipticCurveFiniteFieldGenerator(),
-    ECDHGenerator(),
-    ECDSAGenerator(),
-    LLLReductionGenerator(),
-    QuaternionGenerator(),
-    EulerFormulaGenerator(),
-    DeMoivreGenerator(),
-    ComplexLogGenerator(),
-    ComplexLocusGenerator(),
-    MobiusTransformGenerator(),
-    FractalIterationGenerator(),
-    CauchyRiemannGenerator(),
-    ResidueGenerator(),
-    ContourIntegralGenerator(),
-    LaurentSeriesGenerator(),
-    GreatCircleGenerator(),
-    SphericalExcessGenerator(),
-    SphericalTriangleGenerator(),
-    HyperbolicFunctionGenerator(),
-    AngleDefectGenerator(),
-    HyperbolicDistanceGenerator(),
-    StereographicGenerator(),
-    FundamentalFormGenerator(),
-    ChristoffelGenerator(),
-    GaussianCurvatureGenerator(),
-    GaussBonnetGenerator(),
-    MetricArcLengthGenerator(),
-    FunctionInnerProductGenerator(),
-    LegendreConstructionGenerator(),
-    HermitianCheckGenerator(),
-    TensorProductGenerator(),
-    QuantumGateGenerator(),
-    PartialTraceGenerator(),
-    DensityMatrixGenerator(),
-    VonNeumannEntropyGenerator(),
-    ProjectorGenerator(),
-    UncertaintyGenerator(),
-    MatrixGroupCheckGenerator(),
-    LieExponentialGenerator(),
-    StructureConstantGenerator(),
-    PauliAlgebraGenerator(),
-    CasimirGenerator(),
-    IndexGymnasticsGenerator(),
-    BCHGenerator(),
-    YoungTableauxGenerator(),
-    ClebschGordanGenerator(),
-    EinsteinSummationGenerator(),
-    IndexRaisingGenerator(),
-    RiemannTensorGenerator(),
-    FourVectorGenerator(),
-    SchwarzschildGenerator(),
-    PlanckUnitsGenerator(),
-    HawkingGenerator(),
-    CasimirForceGenerator(),
-    NaturalUnitsGenerator(),
-    InvariantMassGenerator(),
-    ConservationLawGenerator(),
-    QuarkCompositionGenerator(),
-    BranchingRatioGenerator(),
-    CrossSectionGenerator(),
-    GammaMatrixGenerator(),
-    GrassmannGenerator(),
-    RunningCouplingGenerator(),
-    BisectionGenerator(),
-    NewtonRaphsonGenerator(),
-    FixedPointGenerator(),
-    InterpolationGenerator(),
-    FiniteDifferenceGenerator(),
-    RungeKuttaGenerator(),
-    ContinuousDistributionGenerator(),
-    NamedDistributionGenerator(),
-    JointDistributionGenerator(),
-    MGFGenerator(),
-    RVTransformGenerator(),
-    MLEGenerator(),
-    MethodOfMomentsGenerator(),
-    BayesianUpdateGenerator(),
-    MarkovChainGenerator(),
-    OrderStatisticsGenerator(),
-    SimplexGenerator(),
-    LPCornerGenerator(),
-    GradientDescentGenerator(),
-    TransportationGenerator(),
-    GameTheoryGenerator(),
-    ORFormulaGenerator(),
-    ConvolutionGenerator(),
-    DFTGenerator(),
-    FourierSeriesGenerator(),
-    SeparablePDEGenerator(),
-    ZTransformGenerator(),
-    SignalArithmeticGenerator(),
-    TransferFunctionGenerator(),
-    RouthHurwitzGenerator(),
-    ProjectileMotionGenerator(),
-    NewtonsLawsGenerator(),
-    CollisionGenerator(),
-    EnergyConservationGenerator(),
-    OrbitalMechanicsGenerator(),
-    StaticsGenerator(),
-    RotationalDynamicsGenerator(),
-    SHMGenerator(),
-    LagrangianGenerator(),
-    HamiltonianGenerator(),
-    ElectrostaticsGenerator(),
-    GaussLawGenerator(),
-    TransientCircuitGenerator(),
-    ACCircuitGenerator(),
-    MagnetismGenerator(),
-    GasLawGenerator(),
-    FirstLawGenerator(),
-    HeatEngineGenerator(),
-    EntropyChangeGenerator(),
-    CalorimetryGenerator(),
-    PartitionFunctionGenerator(),
-    BlackbodyGenerator(),
-    QuantumFormulaGenerator(),
-    ParticleInBoxGenerator(),
-    WavefunctionGenerator(),
-    SpinHalfGenerator(),
-    CommutatorGenerator(),
-    LadderOperatorGenerator(),
-    HydrogenAtomGenerator(),
-    BraKetGenerator(),
-    SpecialRelativityGenerator(),
-    RelativisticEnergyGenerator(),
-    MinkowskiIntervalGenerator(),
-    DopplerGenerator(),
-    OpticsGenerator(),
-    InterferenceGenerator(),
-    StandingWaveGenerator(),
-    StoichiometryGenerator(),
-    SolutionChemGenerator(),
-    PHCalculationGenerator(),
-    GasStoichiometryGenerator(),
-    EquilibriumICEGenerator(),
-    EntropyGenerator(),
-    MutualInformationGenerator(),
-    KLDivergenceGenerator(),
-    ChannelCapacityGenerator(),
-    BECChannelGenerator(),
-    EntropyRateMarkovGenerator(),
-    ViterbiGenerator(),
-    HuffmanCodingGenerator(),
-    ArithmeticCodingGenerator(),
-    LZCompressionGenerator(),
-    ConvolutionalCodeViterbiGenerator(),
-    ReedSolomonGenerator(),
-    HammingCodeGenerator(),
-    CRCGenerator(),
-    KraftInequalityGenerator(),
-    GradientStepGenerator(),
-    PerceptronGenerator(),
-    BackpropGenerator(),
-    NaiveBayesGenerator(),
-    InformationGainGenerator(),
-    KMeansStepGenerator(),
-    KNNGenerator(),
-    ClassifierMetricsGenerator(),
-    MatrixCalculusGenerator(),
-    MatrixNormGenerator(),
-    PositiveDefiniteGenerator(),
-    CholeskyGenerator(),
-    PCAGenerator(),
-    EmbeddingSimilarityGenerator(),
-    LowRankApproxGenerator(),
-    KernelEvaluationGenerator(),
-    FeatureMapGenerator(),
-    KernelValidityGenerator(),
-    KernelRidgeGenerator(),
-    SVMMarginGenerator(),
-    KernelPerceptronGenerator(),
-    AttentionGenerator(),
-    SoftmaxGradientGenerator(),
-    LayerNormGenerator(),
-    ActivationGenerator(),
-    PositionalEncodingGenerator(),
-    ParamCountGenerator(),
-    FLOPsMemoryGenerator(),
-    ScalingLawGenerator(),
-    AdamStepGenerator(),
-    LRScheduleGenerator(),
-    PerplexityGenerator(),
-    QuantizationGenerator(),
-    AnnuityGenerator(),
-    BondPricingGenerator(),
-    NPVIRRGenerator(),
-    PortfolioGenerator(),
-    BlackScholesGenerator(),
+    _lazy("error_spotting_generator", "ErrorSpottingGenerator"),
+    _lazy("fill_in_step_generator", "FillInStepGenerator"),
+    _lazy("multi_digit_multiplication_generator", "MultiDigitMultiplicationGenerator", estimate=True),
+    _lazy("long_division_generator", "LongDivisionGenerator", estimate=True),
+    _lazy("normal_table_generator", "NormalTableGenerator"),
+    _lazy("multiplying_binomials_generator", "MultiplyingBinomialsGenerator"),
+    _lazy("multiplying_polynomials_generator", "MultiplyingPolynomialsGenerator"),
+    _lazy("polynomial_div_monomial_generator", "PolynomialDivMonomialGenerator"),
+    _lazy("partial_derivative_generator", "PartialDerivativeGenerator"),
+    _lazy("gradient_generator", "GradientGenerator"),
+    _lazy("multivar_chain_rule_generator", "MultivarChainRuleGenerator"),
+    _lazy("hessian_classify_generator", "HessianClassifyGenerator"),
+    _lazy("lagrange_multiplier_generator", "LagrangeMultiplierGenerator"),
+    _lazy("double_integral_generator", "DoubleIntegralGenerator"),
+    _lazy("triple_integral_generator", "TripleIntegralGenerator"),
+    _lazy("jacobian_generator", "JacobianGenerator"),
+    _lazy("div_curl_generator", "DivCurlGenerator"),
+    _lazy("line_integral_generator", "LineIntegralGenerator"),
+    _lazy("vector_theorem_generator", "VectorTheoremGenerator"),
+    _lazy("curve_geometry_generator", "CurveGeometryGenerator"),
+    _lazy("centroid_generator", "CentroidGenerator"),
+    _lazy("lu_decomposition_generator", "LUDecompositionGenerator"),
+    _lazy("subspace_basis_generator", "SubspaceBasisGenerator"),
+    _lazy("eigenvalue_generator", "EigenvalueGenerator"),
+    _lazy("diagonalization_generator", "DiagonalizationGenerator"),
+    _lazy("gram_schmidt_generator", "GramSchmidtGenerator"),
+    _lazy("qr_decomposition_generator", "QRDecompositionGenerator"),
+    _lazy("least_squares_generator", "LeastSquaresGenerator"),
+    _lazy("matrix_exponential_generator", "MatrixExponentialGenerator"),
+    _lazy("svd_generator", "SVDGenerator"),
+    _lazy("integrating_factor_generator", "IntegratingFactorGenerator"),
+    _lazy("exact_ode_generator", "ExactODEGenerator"),
+    _lazy("ode_substitution_generator", "ODESubstitutionGenerator"),
+    _lazy("second_order_ode_generator", "SecondOrderODEGenerator"),
+    _lazy("undetermined_coeff_generator", "UndeterminedCoeffGenerator"),
+    _lazy("variation_parameters_generator", "VariationParametersGenerator"),
+    _lazy("laplace_ivp_generator", "LaplaceIVPGenerator"),
+    _lazy("ode_system_generator", "ODESystemGenerator"),
+    _lazy("series_solution_generator", "SeriesSolutionGenerator"),
+    _lazy("stability_generator", "StabilityGenerator"),
+    _lazy("set_operations_generator", "SetOperationsGenerator"),
+    _lazy("relation_check_generator", "RelationCheckGenerator"),
+    _lazy("inclusion_exclusion_generator", "InclusionExclusionGenerator"),
+    _lazy("stars_and_bars_generator", "StarsAndBarsGenerator"),
+    _lazy("derangement_generator", "DerangementGenerator"),
+    _lazy("recurrence_generator", "RecurrenceGenerator"),
+    _lazy("master_theorem_generator", "MasterTheoremGenerator"),
+    _lazy("induction_verify_generator", "InductionVerifyGenerator"),
+    _lazy("counting_classics_generator", "CountingClassicsGenerator"),
+    _lazy("generating_function_generator", "GeneratingFunctionGenerator"),
+    _lazy("boolean_algebra_generator", "BooleanAlgebraGenerator"),
+    _lazy("graph_counting_generator", "GraphCountingGenerator"),
+    _lazy("dijkstra_generator", "DijkstraGenerator"),
+    _lazy("mst_generator", "MSTGenerator"),
+    _lazy("graph_traversal_generator", "GraphTraversalGenerator"),
+    _lazy("euler_circuit_generator", "EulerCircuitGenerator"),
+    _lazy("dp_table_generator", "DPTableGenerator"),
+    _lazy("algorithm_trace_generator", "AlgorithmTraceGenerator"),
+    _lazy("turing_machine_trace_generator", "TuringMachineTraceGenerator"),
+    _lazy("dfa_simulation_generator", "DFASimulationGenerator"),
+    _lazy("nfa_simulation_generator", "NFASimulationGenerator"),
+    _lazy("dfa_minimization_generator", "DFAMinimizationGenerator"),
+    _lazy("regex_to_automaton_generator", "RegexToAutomatonGenerator"),
+    _lazy("pda_simulation_generator", "PDASimulationGenerator"),
+    _lazy("cyk_parser_generator", "CYKParserGenerator"),
+    _lazy("dpll_trace_generator", "DPLLTraceGenerator"),
+    _lazy("resolution_proof_generator", "ResolutionProofGenerator"),
+    _lazy("unification_generator", "UnificationGenerator"),
+    _lazy("lambda_reduction_generator", "LambdaReductionGenerator"),
+    _lazy("extended_euclid_generator", "ExtendedEuclidGenerator"),
+    _lazy("modular_inverse_generator", "ModularInverseGenerator"),
+    _lazy("crt_generator", "CRTGenerator"),
+    _lazy("mod_exp_generator", "ModExpGenerator"),
+    _lazy("totient_generator", "TotientGenerator"),
+    _lazy("continued_fraction_generator", "ContinuedFractionGenerator"),
+    _lazy("quadratic_residue_generator", "QuadraticResidueGenerator"),
+    _lazy("jacobi_symbol_generator", "JacobiSymbolGenerator"),
+    _lazy("tonelli_shanks_generator", "TonelliShanksGenerator"),
+    _lazy("rsa_generator", "RSAGenerator"),
+    _lazy("diffie_hellman_generator", "DiffieHellmanGenerator"),
+    _lazy("primality_test_generator", "PrimalityTestGenerator"),
+    _lazy("pollard_factorization_generator", "PollardFactorizationGenerator"),
+    _lazy("baby_step_giant_step_generator", "BabyStepGiantStepGenerator"),
+    _lazy("cayley_table_generator", "CayleyTableGenerator"),
+    _lazy("cyclic_group_generator", "CyclicGroupGenerator"),
+    _lazy("permutation_group_generator", "PermutationGroupGenerator"),
+    _lazy("coset_generator", "CosetGenerator"),
+    _lazy("finite_field_generator", "FiniteFieldGenerator"),
+    _lazy("elliptic_curve_finite_field_generator", "EllipticCurveFiniteFieldGenerator"),
+    _lazy("ecdh_generator", "ECDHGenerator"),
+    _lazy("ecdsa_generator", "ECDSAGenerator"),
+    _lazy("lll_reduction_generator", "LLLReductionGenerator"),
+    _lazy("quaternion_generator", "QuaternionGenerator"),
+    _lazy("euler_formula_generator", "EulerFormulaGenerator"),
+    _lazy("de_moivre_generator", "DeMoivreGenerator"),
+    _lazy("complex_log_generator", "ComplexLogGenerator"),
+    _lazy("complex_locus_generator", "ComplexLocusGenerator"),
+    _lazy("mobius_transform_generator", "MobiusTransformGenerator"),
+    _lazy("fractal_iteration_generator", "FractalIterationGenerator"),
+    _lazy("cauchy_riemann_generator", "CauchyRiemannGenerator"),
+    _lazy("residue_generator", "ResidueGenerator"),
+    _lazy("contour_integral_generator", "ContourIntegralGenerator"),
+    _lazy("laurent_series_generator", "LaurentSeriesGenerator"),
+    _lazy("great_circle_generator", "GreatCircleGenerator"),
+    _lazy("spherical_excess_generator", "SphericalExcessGenerator"),
+    _lazy("spherical_triangle_generator", "SphericalTriangleGenerator"),
+    _lazy("hyperbolic_function_generator", "HyperbolicFunctionGenerator"),
+    _lazy("angle_defect_generator", "AngleDefectGenerator"),
+    _lazy("hyperbolic_distance_generator", "HyperbolicDistanceGenerator"),
+    _lazy("stereographic_generator", "StereographicGenerator"),
+    _lazy("fundamental_form_generator", "FundamentalFormGenerator"),
+    _lazy("christoffel_generator", "ChristoffelGenerator"),
+    _lazy("gaussian_curvature_generator", "GaussianCurvatureGenerator"),
+    _lazy("gauss_bonnet_generator", "GaussBonnetGenerator"),
+    _lazy("metric_arc_length_generator", "MetricArcLengthGenerator"),
+    _lazy("function_inner_product_generator", "FunctionInnerProductGenerator"),
+    _lazy("legendre_construction_generator", "LegendreConstructionGenerator"),
+    _lazy("hermitian_check_generator", "HermitianCheckGenerator"),
+    _lazy("tensor_product_generator", "TensorProductGenerator"),
+    _lazy("quantum_gate_generator", "QuantumGateGenerator"),
+    _lazy("partial_trace_generator", "PartialTraceGenerator"),
+    _lazy("density_matrix_generator", "DensityMatrixGenerator"),
+    _lazy("von_neumann_entropy_generator", "VonNeumannEntropyGenerator"),
+    _lazy("projector_generator", "ProjectorGenerator"),
+    _lazy("uncertainty_generator", "UncertaintyGenerator"),
+    _lazy("matrix_group_check_generator", "MatrixGroupCheckGenerator"),
+    _lazy("lie_exponential_generator", "LieExponentialGenerator"),
+    _lazy("structure_constant_generator", "StructureConstantGenerator"),
+    _lazy("pauli_algebra_generator", "PauliAlgebraGenerator"),
+    _lazy("casimir_generator", "CasimirGenerator"),
+    _lazy("index_gymnastics_generator", "IndexGymnasticsGenerator"),
+    _lazy("bch_generator", "BCHGenerator"),
+    _lazy("young_tableaux_generator", "YoungTableauxGenerator"),
+    _lazy("clebsch_gordan_generator", "ClebschGordanGenerator"),
+    _lazy("einstein_summation_generator", "EinsteinSummationGenerator"),
+    _lazy("index_raising_generator", "IndexRaisingGenerator"),
+    _lazy("riemann_tensor_generator", "RiemannTensorGenerator"),
+    _lazy("four_vector_generator", "FourVectorGenerator"),
+    _lazy("schwarzschild_generator", "SchwarzschildGenerator"),
+    _lazy("planck_units_generator", "PlanckUnitsGenerator"),
+    _lazy("hawking_generator", "HawkingGenerator"),
+    _lazy("casimir_force_generator", "CasimirForceGenerator"),
+    _lazy("natural_units_generator", "NaturalUnitsGenerator"),
+    _lazy("invariant_mass_generator", "InvariantMassGenerator"),
+    _lazy("conservation_law_generator", "ConservationLawGenerator"),
+    _lazy("quark_composition_generator", "QuarkCompositionGenerator"),
+    _lazy("branching_ratio_generator", "BranchingRatioGenerator"),
+    _lazy("cross_section_generator", "CrossSectionGenerator"),
+    _lazy("gamma_matrix_generator", "GammaMatrixGenerator"),
+    _lazy("grassmann_generator", "GrassmannGenerator"),
+    _lazy("running_coupling_generator", "RunningCouplingGenerator"),
+    _lazy("bisection_generator", "BisectionGenerator"),
+    _lazy("newton_raphson_generator", "NewtonRaphsonGenerator"),
+    _lazy("fixed_point_generator", "FixedPointGenerator"),
+    _lazy("interpolation_generator", "InterpolationGenerator"),
+    _lazy("finite_difference_generator", "FiniteDifferenceGenerator"),
+    _lazy("runge_kutta_generator", "RungeKuttaGenerator"),
+    _lazy("continuous_distribution_generator", "ContinuousDistributionGenerator"),
+    _lazy("named_distribution_generator", "NamedDistributionGenerator"),
+    _lazy("joint_distribution_generator", "JointDistributionGenerator"),
+    _lazy("mgf_generator", "MGFGenerator"),
+    _lazy("rv_transform_generator", "RVTransformGenerator"),
+    _lazy("mle_generator", "MLEGenerator"),
+    _lazy("method_of_moments_generator", "MethodOfMomentsGenerator"),
+    _lazy("bayesian_update_generator", "BayesianUpdateGenerator"),
+    _lazy("markov_chain_generator", "MarkovChainGenerator"),
+    _lazy("order_statistics_generator", "OrderStatisticsGenerator"),
+    _lazy("simplex_generator", "SimplexGenerator"),
+    _lazy("lp_corner_generator", "LPCornerGenerator"),
+    _lazy("gradient_descent_generator", "GradientDescentGenerator"),
+    _lazy("transportation_generator", "TransportationGenerator"),
+    _lazy("game_theory_generator", "GameTheoryGenerator"),
+    _lazy("or_formula_generator", "ORFormulaGenerator"),
+    _lazy("convolution_generator", "ConvolutionGenerator"),
+    _lazy("dft_generator", "DFTGenerator"),
+    _lazy("fourier_series_generator", "FourierSeriesGenerator"),
+    _lazy("separable_pde_generator", "SeparablePDEGenerator"),
+    _lazy("z_transform_generator", "ZTransformGenerator"),
+    _lazy("signal_arithmetic_generator", "SignalArithmeticGenerator"),
+    _lazy("transfer_function_generator", "TransferFunctionGenerator"),
+    _lazy("routh_hurwitz_generator", "RouthHurwitzGenerator"),
+    _lazy("projectile_motion_generator", "ProjectileMotionGenerator"),
+    _lazy("newtons_laws_generator", "NewtonsLawsGenerator"),
+    _lazy("collision_generator", "CollisionGenerator"),
+    _lazy("energy_conservation_generator", "EnergyConservationGenerator"),
+    _lazy("orbital_mechanics_generator", "OrbitalMechanicsGenerator"),
+    _lazy("statics_generator", "StaticsGenerator"),
+    _lazy("rotational_dynamics_generator", "RotationalDynamicsGenerator"),
+    _lazy("shm_generator", "SHMGenerator"),
+    _lazy("lagrangian_generator", "LagrangianGenerator"),
+    _lazy("hamiltonian_generator", "HamiltonianGenerator"),
+    _lazy("electrostatics_generator", "ElectrostaticsGenerator"),
+    _lazy("gauss_law_generator", "GaussLawGenerator"),
+    _lazy("transient_circuit_generator", "TransientCircuitGenerator"),
+    _lazy("ac_circuit_generator", "ACCircuitGenerator"),
+    _lazy("magnetism_generator", "MagnetismGenerator"),
+    _lazy("gas_law_generator", "GasLawGenerator"),
+    _lazy("first_law_generator", "FirstLawGenerator"),
+    _lazy("heat_engine_generator", "HeatEngineGenerator"),
+    _lazy("entropy_change_generator", "EntropyChangeGenerator"),
+    _lazy("calorimetry_generator", "CalorimetryGenerator"),
+    _lazy("partition_function_generator", "PartitionFunctionGenerator"),
+    _lazy("blackbody_generator", "BlackbodyGenerator"),
+    _lazy("quantum_formula_generator", "QuantumFormulaGenerator"),
+    _lazy("particle_in_box_generator", "ParticleInBoxGenerator"),
+    _lazy("wavefunction_generator", "WavefunctionGenerator"),
+    _lazy("spin_half_generator", "SpinHalfGenerator"),
+    _lazy("commutator_generator", "CommutatorGenerator"),
+    _lazy("ladder_operator_generator", "LadderOperatorGenerator"),
+    _lazy("hydrogen_atom_generator", "HydrogenAtomGenerator"),
+    _lazy("braket_generator", "BraKetGenerator"),
+    _lazy("special_relativity_generator", "SpecialRelativityGenerator"),
+    _lazy("relativistic_energy_generator", "RelativisticEnergyGenerator"),
+    _lazy("minkowski_interval_generator", "MinkowskiIntervalGenerator"),
+    _lazy("doppler_generator", "DopplerGenerator"),
+    _lazy("optics_generator", "OpticsGenerator"),
+    _lazy("interference_generator", "InterferenceGenerator"),
+    _lazy("standing_wave_generator", "StandingWaveGenerator"),
+    _lazy("stoichiometry_generator", "StoichiometryGenerator"),
+    _lazy("solution_chem_generator", "SolutionChemGenerator"),
+    _lazy("ph_calculation_generator", "PHCalculationGenerator"),
+    _lazy("gas_stoichiometry_generator", "GasStoichiometryGenerator"),
+    _lazy("equilibrium_ice_generator", "EquilibriumICEGenerator"),
+    _lazy("entropy_generator", "EntropyGenerator"),
+    _lazy("mutual_information_generator", "MutualInformationGenerator"),
+    _lazy("kl_divergence_generator", "KLDivergenceGenerator"),
+    _lazy("channel_capacity_generator", "ChannelCapacityGenerator"),
+    _lazy("bec_channel_generator", "BECChannelGenerator"),
+    _lazy("entropy_rate_markov_generator", "EntropyRateMarkovGenerator"),
+    _lazy("viterbi_generator", "ViterbiGenerator"),
+    _lazy("huffman_coding_generator", "HuffmanCodingGenerator"),
+    _lazy("arithmetic_coding_generator", "ArithmeticCodingGenerator"),
+    _lazy("lz_compression_generator", "LZCompressionGenerator"),
+    _lazy("convolutional_code_viterbi_generator", "ConvolutionalCodeViterbiGenerator"),
+    _lazy("reed_solomon_generator", "ReedSolomonGenerator"),
+    _lazy("hamming_code_generator", "HammingCodeGenerator"),
+    _lazy("crc_generator", "CRCGenerator"),
+    _lazy("kraft_inequality_generator", "KraftInequalityGenerator"),
+    _lazy("gradient_step_generator", "GradientStepGenerator"),
+    _lazy("perceptron_generator", "PerceptronGenerator"),
+    _lazy("backprop_generator", "BackpropGenerator"),
+    _lazy("naive_bayes_generator", "NaiveBayesGenerator"),
+    _lazy("information_gain_generator", "InformationGainGenerator"),
+    _lazy("kmeans_step_generator", "KMeansStepGenerator"),
+    _lazy("knn_generator", "KNNGenerator"),
+    _lazy("classifier_metrics_generator", "ClassifierMetricsGenerator"),
+    _lazy("matrix_calculus_generator", "MatrixCalculusGenerator"),
+    _lazy("matrix_norm_generator", "MatrixNormGenerator"),
+    _lazy("positive_definite_generator", "PositiveDefiniteGenerator"),
+    _lazy("cholesky_generator", "CholeskyGenerator"),
+    _lazy("pca_generator", "PCAGenerator"),
+    _lazy("embedding_similarity_generator", "EmbeddingSimilarityGenerator"),
+    _lazy("low_rank_approx_generator", "LowRankApproxGenerator"),
+    _lazy("kernel_evaluation_generator", "KernelEvaluationGenerator"),
+    _lazy("feature_map_generator", "FeatureMapGenerator"),
+    _lazy("kernel_validity_generator", "KernelValidityGenerator"),
+    _lazy("kernel_ridge_generator", "KernelRidgeGenerator"),
+    _lazy("svm_margin_generator", "SVMMarginGenerator"),
+    _lazy("kernel_perceptron_generator", "KernelPerceptronGenerator"),
+    _lazy("attention_generator", "AttentionGenerator"),
+    _lazy("softmax_gradient_generator", "SoftmaxGradientGenerator"),
+    _lazy("layer_norm_generator", "LayerNormGenerator"),
+    _lazy("activation_generator", "ActivationGenerator"),
+    _lazy("positional_encoding_generator", "PositionalEncodingGenerator"),
+    _lazy("param_count_generator", "ParamCountGenerator"),
+    _lazy("flops_memory_generator", "FLOPsMemoryGenerator"),
+    _lazy("scaling_law_generator", "ScalingLawGenerator"),
+    _lazy("adam_step_generator", "AdamStepGenerator"),
+    _lazy("lr_schedule_generator", "LRScheduleGenerator"),
+    _lazy("perplexity_generator", "PerplexityGenerator"),
+    _lazy("quantization_generator", "QuantizationGenerator"),
+    _lazy("annuity_generator", "AnnuityGenerator"),
+    _lazy("bond_pricing_generator", "BondPricingGenerator"),
+    _lazy("npv_irr_generator", "NPVIRRGenerator"),
+    _lazy("portfolio_generator", "PortfolioGenerator"),
+    _lazy("black_scholes_generator", "BlackScholesGenerator"),
 
     # --- (More High School generators coming soon) ---
 ]
@@ -1136,19 +634,46 @@ ALL_GENERATORS = [
 DEFAULT_POOL_EXCLUDED = {"MixedNumberOperationsRandom"}
 
 
+_CLASS_MODULES = {entry.class_name: entry.module for entry in GENERATOR_REGISTRY}
+
+
+def _all_generators():
+    instances = globals().get("ALL_GENERATORS")
+    if instances is None:
+        instances = [entry.load() for entry in GENERATOR_REGISTRY]
+        globals()["ALL_GENERATORS"] = instances
+    return instances
+
+
+def __getattr__(name):
+    """Lazy module attributes.
+
+    ALL_GENERATORS instantiates every registry entry on first access (and
+    keeps the list); generator class names resolve to their classes, for
+    code that imported them from this module.
+    """
+    if name == "ALL_GENERATORS":
+        return _all_generators()
+    if name in _CLASS_MODULES:
+        import importlib
+        return getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def resolve_pool(generators=None):
     """Returns the working generator pool.
 
     An explicit selection is honored as-is; the default pool is
-    ALL_GENERATORS minus DEFAULT_POOL_EXCLUDED wrapper duplicates.
+    ALL_GENERATORS minus DEFAULT_POOL_EXCLUDED wrapper duplicates, as
+    not-yet-loaded GENERATOR_REGISTRY entries.
     """
     if generators is not None:
         pool = list(generators)
         if not pool:
             raise ValueError("No generators selected; cannot build dataset.")
         return pool
-    return [g for g in ALL_GENERATORS
-            if g.__class__.__name__ not in DEFAULT_POOL_EXCLUDED]
+    return [g for g in GENERATOR_REGISTRY
+            if g.class_name not in DEFAULT_POOL_EXCLUDED]
 
 
 def group_into_skills(gen_pool):
@@ -1156,11 +681,12 @@ def group_into_skills(gen_pool):
 
     Variant instances of one class (e.g. the four FractionOpGenerator ops)
     form a single skill so each skill gets equal sampling probability by
-    default, regardless of how many instances implement it.
+    default, regardless of how many instances implement it. Registry
+    entries are grouped without being loaded.
     """
     skills = {}
     for gen in gen_pool:
-        skills.setdefault(gen.__class__.__name__, []).append(gen)
+        skills.setdefault(generator_name(gen), []).append(gen)
     return skills
 
 
@@ -1216,24 +742,25 @@ def parse_weights(spec, available):
 def select_generators(generator_arg: str):
     """
     Returns a filtered list of generators based on a comma-separated list of
-    class names. If no argument is provided, returns all generators.
+    class names. If no argument is provided, returns all generators. Only
+    the selected classes' modules are imported.
     """
     if not generator_arg:
-        return ALL_GENERATORS
+        return _all_generators()
 
     requested = {name.strip() for name in generator_arg.split(",") if name.strip()}
     if not requested:
-        return ALL_GENERATORS
+        return _all_generators()
 
-    available = {gen.__class__.__name__ for gen in ALL_GENERATORS}
+    available = set(_CLASS_MODULES)
     missing = requested - available
     if missing:
         raise ValueError(f"Unknown generator(s): {', '.join(sorted(missing))}. "
                          f"Available: {', '.join(sorted(available))}")
 
     # All instances of each requested class (variant instances included).
-    return [gen for gen in ALL_GENERATORS
-            if gen.__class__.__name__ in requested]
+    return [entry.load() for entry in GENERATOR_REGISTRY
+            if entry.class_name in requested]
 
 
 def validate_example(example):
@@ -1287,91 +814,691 @@ def _instance_label(gen_instance):
     return name
 
 
+# Attempts per build batch: one stream, one generate_many() call per
+# chosen instance.
+BUILD_BATCH_SIZE = 64
+# Build batches per worker task in parallel builds.
+WORKER_TASK_BATCHES = 4
+
+_worker_skills = None
+_worker_sampler = None
+_worker_sizes = None
+_worker_serialize = True
+
+
+def _check_examples(gen_instance, examples, serialize=True):
+    """Stamps, validates and serializes one instance's examples.
+
+    Returns a (key, line, error) tuple per example: on success the dedup
+    key and the JSONL line (with serialize=False the example dict itself,
+    for Parquet output), on failure the error message (a string, since
+    it may cross a process boundary). The dedup key is the
+    dedup.semantic_digest() of a generator-emitted `dedup_key` (which is
+    not written out), else the (operation, problem) text.
+    """
+    meta = metadata_for(gen_instance)
+    results = []
+    for example in examples:
+        try:
+            if not example:
+                raise ValueError("generate() returned an empty example")
+            dedup_key = example.pop("dedup_key", None)
+            if meta is not None:
+                example.setdefault("grade_level", meta["grade_level"])
+                example.setdefault("difficulty", meta["difficulty"])
+            else:
+                stamp_metadata(example, gen_instance)
+            validate_example(example)
+        except Exception as e:
+            results.append((None, None, str(e)))
+            continue
+        if dedup_key is None:
+            key = (example["operation"], example["problem"])
+        else:
+            key = semantic_digest(example["operation"], dedup_key)
+        line = json.dumps(example, ensure_ascii=False) + "\n" if serialize else example
+        results.append((key, line, None))
+    return results
+
+
+def _run_instance(gen_instance, k, rng, serialize=True):
+    """k attempts of one instance: a single generate_many() call, falling
+    back to one sample() per attempt if the batch call fails, so one bad
+    draw costs one attempt rather than the batch."""
+    try:
+        examples = gen_instance.generate_many(k, rng)
+        if len(examples) != k:
+            raise ValueError(f"generate_many({k}) returned {len(examples)} examples")
+    except Exception:
+        pass
+    else:
+        return _check_examples(gen_instance, examples, serialize)
+    results = []
+    for _ in range(k):
+        try:
+            example = gen_instance.sample(rng)
+        except Exception as e:
+            results.append((None, None, str(e)))
+        else:
+            results.extend(_check_examples(gen_instance, [example], serialize))
+    return results
+
+
+# Result error for an attempt on an instance whose enumerated problem
+# space has been walked to the end.
+SPACE_EXHAUSTED = "problem space exhausted"
+
+OUTPUT_FORMATS = ("jsonl", "parquet")
+
+
+def _plan_batch(skills, sampler, rng, batch):
+    """Draws build batch `batch`'s picks from `rng`: [skill, index, k] per
+    chosen instance (skills[skill][index], chosen k times), in order of
+    first draw. `sampler` (a SkillSampler or QuotaSchedule) names the
+    skills. The rest of the batch draws from `rng` afterwards."""
+    counts = {}
+    for skill in sampler.picks(rng, batch):
+        # randrange(n) is the draw rng.choice() makes, so batches are
+        # unchanged by recording the index.
+        index = rng.randrange(len(skills[skill]))
+        entry = skills[skill][index]
+        counts.setdefault(id(entry), [skill, index, 0])[2] += 1
+    return list(counts.values())
+
+
+@lru_cache(maxsize=None)
+def _space_order(size, seed, skill, index):
+    """The seeded walk order of one instance's enumerated problem space."""
+    return FeistelPermutation(size, (seed, "space", skill, index))
+
+
+def _run_walk(gen_instance, k, rng, order, cursor, serialize=True):
+    """k attempts taking positions cursor.. of the instance's space in
+    `order`; positions past the end give SPACE_EXHAUSTED."""
+    space = gen_instance.enumerate_space()
+    results = []
+    for position in range(cursor, cursor + k):
+        if position >= len(order):
+            results.append((None, None, SPACE_EXHAUSTED))
+            continue
+        try:
+            example = gen_instance.sample_from(space[order[position]], rng)
+        except Exception as e:
+            results.append((None, None, str(e)))
+        else:
+            results.extend(_check_examples(gen_instance, [example], serialize))
+    return results
+
+
+def _attempt_batch(skills, sampler, seed, batch, walk=None, serialize=True):
+    """Build batch `batch`: up to BUILD_BATCH_SIZE sampling attempts drawn
+    entirely from example_rng(seed, batch).
+
+    Each attempt's skill (from `sampler`) and instance within it are
+    drawn first; every chosen instance then produces its share with one
+    generate_many() call. With walk=(sizes, cursors), an instance
+    listed in cursors instead takes its share from its enumerated space,
+    starting at that cursor. Returns (label, class_name, results, walk_key)
+    groups in order of first draw, results as from _check_examples() and
+    walk_key the (skill, index) of a walked instance or None.
+    serialize=False leaves accepted examples as dicts (see _check_examples).
+    """
+    rng = example_rng(seed, batch)
+    groups = []
+    for skill, index, k in _plan_batch(skills, sampler, rng, batch):
+        gen_instance = materialize(skills[skill][index])
+        walk_key = (skill, index)
+        if walk is not None and walk_key in walk[1]:
+            sizes, cursors = walk
+            order = _space_order(sizes[walk_key], seed, skill, index)
+            results = _run_walk(gen_instance, k, rng, order, cursors[walk_key],
+                                serialize)
+        else:
+            walk_key = None
+            results = _run_instance(gen_instance, k, rng, serialize)
+        groups.append((_instance_label(gen_instance),
+                       gen_instance.__class__.__name__, results, walk_key))
+    return groups
+
+
+def _walk_cursors(skills, sampler, seed, sizes, start=0):
+    """Yields, for build batches start, start+1, ..., the starting cursor
+    of every enumerated instance the batch picks.
+
+    Cursors depend only on the picks of earlier batches, so this replays
+    the cheap pick draws from batch 0 and can run ahead of the workers.
+    """
+    cursors = dict.fromkeys(sizes, 0)
+    for index in itertools.count():
+        batch = {}
+        for skill, i, k in _plan_batch(skills, sampler,
+                                       example_rng(seed, index), index):
+            if (skill, i) in cursors:
+                batch[skill, i] = cursors[skill, i]
+                cursors[skill, i] += k
+        if index >= start:
+            yield batch
+
+
+def _init_worker(skills, sampler, sizes=None, serialize=True):
+    global _worker_skills, _worker_sampler, _worker_sizes, _worker_serialize
+    _worker_skills = skills
+    _worker_sampler = sampler
+    _worker_sizes = sizes
+    _worker_serialize = serialize
+
+
+def _shard_batch(slot, shard):
+    """The build batch a shard (index, count) runs as its `slot`-th."""
+    index, count = shard
+    return slot * count + index
+
+
+def _generate_batches(seed, start, size, cursors=None, shard=(0, 1)):
+    """Worker task: the groups of slots start .. start+size-1 (see
+    _sequential_attempts; `cursors`: one walk-cursor dict per batch when
+    walking spaces)."""
+    return [_attempt_batch(_worker_skills, _worker_sampler, seed,
+                           _shard_batch(slot, shard),
+                           None if cursors is None
+                           else (_worker_sizes, cursors[slot - start]),
+                           _worker_serialize)
+            for slot in range(start, start + size)]
+
+
+def _sequential_attempts(skills, sampler, seed, start=0, sizes=None,
+                         stop=None, shard=(0, 1), serialize=True):
+    """Yields the groups of build batches start, start+1, ... in order,
+    up to (not including) `stop` when given.
+
+    `sizes` ({(skill, index): space_size}) walks those instances'
+    enumerated spaces instead of sampling them. With shard=(index, count)
+    start and stop count the shard's own batches, index, index+count, ...
+    serialize=False yields accepted examples as dicts.
+    """
+    cursors = (_walk_cursors(skills, sampler, seed, sizes, start)
+               if sizes else None)
+    for slot in itertools.count(start) if stop is None else range(start, stop):
+        walk = None if cursors is None else (sizes, next(cursors))
+        yield _attempt_batch(skills, sampler, seed, _shard_batch(slot, shard), walk,
+                             serialize)
+
+
+def _parallel_attempts(skills, sampler, seed, workers, start=0, sizes=None,
+                       stop=None, shard=(0, 1), serialize=True):
+    """Yields the same batch stream as _sequential_attempts, computed by a
+    worker pool in WORKER_TASK_BATCHES ranges and consumed in order.
+
+    Ranges still in flight when the consumer stops are finished and
+    discarded; terminating a pool with queued tasks can deadlock its task
+    handler thread.
+    """
+    max_in_flight = workers * 2
+    pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                initargs=(skills, sampler, sizes, serialize))
+    cursors = (_walk_cursors(skills, sampler, seed, sizes, start)
+               if sizes else None)
+    pending = deque()
+    try:
+        next_start = start
+        while True:
+            while len(pending) < max_in_flight and (stop is None
+                                                    or next_start < stop):
+                size = (WORKER_TASK_BATCHES if stop is None
+                        else min(WORKER_TASK_BATCHES, stop - next_start))
+                task_cursors = (None if cursors is None else
+                                [next(cursors) for _ in range(size)])
+                pending.append(pool.apply_async(
+                    _generate_batches,
+                    (seed, next_start, size, task_cursors, shard)))
+                next_start += size
+            if not pending:
+                return
+            yield from pending.popleft().get()
+    finally:
+        for result in pending:
+            result.wait()
+        pool.close()
+        pool.join()
+
+
+# Rounds in a row without progress after which an exact-count build gives
+# up on what is left of a skill's quota (its problem space is likely used up).
+QUOTA_STALL_ROUNDS = 3
+
+
+def _quota_attempts(skills, plan, seed, workers, start, serialize=True):
+    """Yields the batches of an exact-count build, round by round, from
+    build batch `start` on.
+
+    `plan` holds every skill's quota and emitted count (the consumer
+    counts accepted rows into plan["emitted"]) and the current round. A
+    round deals each unmet quota's shortfall out as one QuotaSchedule of
+    exactly that many attempts, keyed by (seed, "quota", round), over its
+    own range of batch indices; the next round is planned only after the
+    consumer has taken the last batch, so no skill gets more attempts than
+    it still needs. A skill that gains nothing for QUOTA_STALL_ROUNDS
+    rounds in a row is given up on.
+    """
+    next_batch = start
+    while True:
+        if plan["counts"] is None:
+            emitted = plan["emitted"]
+            deficits = {skill: quota - emitted[skill]
+                        for skill, quota in plan["quotas"].items()
+                        if quota > emitted[skill]
+                        and plan["stalls"][skill] < QUOTA_STALL_ROUNDS}
+            if not deficits:
+                return
+            plan.update(round=plan["round"] + 1, start=next_batch,
+                        counts=deficits,
+                        base={skill: emitted[skill] for skill in deficits})
+        schedule = QuotaSchedule(plan["counts"], (seed, "quota", plan["round"]),
+                                 plan["start"], BUILD_BATCH_SIZE)
+        if workers > 1:
+            yield from _parallel_attempts(skills, schedule, seed, workers,
+                                          next_batch, stop=schedule.stop,
+                                          serialize=serialize)
+        else:
+            yield from _sequential_attempts(skills, schedule, seed, next_batch,
+                                            stop=schedule.stop, serialize=serialize)
+        next_batch = schedule.stop
+        for skill, base in plan["base"].items():
+            stalled = plan["emitted"][skill] == base
+            plan["stalls"][skill] = plan["stalls"][skill] + 1 if stalled else 0
+        plan["counts"] = None
+
+
+def skill_weights_for(skill_names, weights=None, mix=None):
+    """(per-skill weights or None for uniform, parsed mix or None) from
+    --weights and --mix style arguments."""
+    skill_weights = None
+    if weights:
+        weights = parse_weights(weights, skill_names)
+        skill_weights = [weights.get(name, 1.0) for name in skill_names]
+    if mix:
+        mix = parse_mix(mix)
+        skill_weights = resolve_mix(skill_names, mix, skill_weights)
+    return skill_weights, mix or None
+
+
+def parse_shard(spec):
+    """"i/N" -> (i, N), for --shard."""
+    index, sep, count = str(spec).partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Bad --shard {spec!r}; expected i/N, e.g. 0/4") from None
+    if not sep or not 0 <= index < count:
+        raise ValueError(f"Bad --shard {spec!r}; expected i/N with 0 <= i < N")
+    return index, count
+
+
+def _shard_record(batch, groups):
+    """One shard-file line: build batch `batch`'s groups with their results
+    as [key, line, error] (a duplicate keeps only its key)."""
+    return json.dumps({"batch": batch, "groups": groups}, ensure_ascii=False) + "\n"
+
+
+def _read_shard_header(path, params):
+    with open_jsonl(path) as fp:
+        header = json.loads(fp.readline() or "{}")
+    if "shard" not in header:
+        raise ValueError(f"{path} is not a shard file (build one with --shard i/N)")
+    saved = header["params"]
+    changed = sorted(key for key in set(saved) | set(params)
+                     if saved.get(key) != params.get(key))
+    if changed:
+        raise ValueError(f"shard {path} was built with different options "
+                         f"({', '.join(changed)}); merge with the shard options")
+    return tuple(header["shard"])
+
+
+def _merged_attempts(shard_paths, params, start, live):
+    """Yields build batches start, start+1, ... from the shard files while
+    they hold them, then `live(batch)`'s stream from the first batch none
+    does (a shard that stopped early leaves the rest to this process).
+
+    Shard i of N holds batches i, i+N, ... in order, so batch b is the next
+    record of shard b % N.
+    """
+    shards = {}
+    for path in shard_paths:
+        index, count = _read_shard_header(path, params)
+        if count != len(shard_paths) or index in shards:
+            raise ValueError(f"shard files do not form one i/N set: {path} is "
+                             f"shard {index}/{count}, {len(shard_paths)} given")
+        shards[index] = path
+    files = [open_jsonl(shards[index]) for index in range(len(shards))]
+    batch = start
+    try:
+        for fp in files:
+            fp.readline()
+        while True:
+            fp = files[batch % len(files)]
+            text = fp.readline()
+            record = json.loads(text) if text.strip() else None
+            while record is not None and record["batch"] < batch:
+                text = fp.readline()
+                record = json.loads(text) if text.strip() else None
+            if record is None or record["batch"] != batch:
+                break
+            yield [(label, name,
+                    [(tuple(key) if isinstance(key, list) else key, line, error)
+                     for key, line, error in results], None)
+                   for label, name, results in record["groups"]]
+            batch += 1
+    finally:
+        for fp in files:
+            fp.close()
+    print(f"Shards end at batch {batch}; generating the rest.")
+    yield from live(batch)
+
+
 def build_dataset(n=10_000, path="math_visible_dataset_refactored.jsonl", seed=None,
-                  generators=None, weights=None, allow_duplicates=False):
+                  generators=None, weights=None, allow_duplicates=False,
+                  workers=1, dedup="exact", checkpoint_every=None,
+                  resume=False, enumerate_spaces=False, mix=None,
+                  exact_counts=False, shard=None, merge=None,
+                  output_format="jsonl", parquet_text=False,
+                  row_group_rows=ROW_GROUP_ROWS):
     """Generates the dataset by calling the generate() method of chosen generators.
 
     Sampling is balanced per skill (generator class): each skill gets equal
     probability by default, and a skill's variant instances are chosen
     uniformly within it. `weights` (a {skill_name: float} dict or --weights
     spec string) overrides individual skill weights; unlisted skills keep
-    weight 1.0.
+    weight 1.0. `mix` (--mix specs, see skill_sampler.parse_mix()) sets
+    target shares by curriculum grade_level and/or difficulty, resolved
+    once into per-skill weights on top of `weights`. Skills are drawn from
+    a skill_sampler.SkillSampler (an alias table when weighted).
+
+    exact_counts=True replaces independent skill draws with a plan: n rows
+    apportioned over the skills by weight (largest remainder), dealt out
+    in a seeded order, and each round's dedup or error shortfalls retried
+    in a further round, so every skill ends at exactly its quota unless
+    its problem space runs dry (see _quota_attempts()). The summary's
+    "quotas" gives each skill's target and emitted rows.
+
+    Attempts run in batches of BUILD_BATCH_SIZE: batch b draws everything
+    (per-skill counts, instances, generate_many()) from its own stream
+    example_rng(seed, b) and is validated as a whole, so with workers > 1
+    a process pool computes batches in index ranges and this process
+    consumes them in order: dedup, stats and the output bytes depend only
+    on the seed, not on the worker count.
 
     Exact repeats of (operation, problem) are skipped unless
-    allow_duplicates is set. Returns a summary dict with per-instance stats.
+    allow_duplicates is set. `dedup` picks the index that remembers seen
+    keys: a dedup.DEDUP_KINDS name or a ready index from
+    dedup.make_dedup_index() (e.g. a hash index that spills to disk).
+
+    With checkpoint_every (seconds; 0 = after every batch) the build saves
+    its batch cursor, counters, stats, output offset and a dedup snapshot
+    to `<path>.ckpt/` at batch boundaries. resume=True continues from that
+    checkpoint (same options required) and writes exactly what an
+    uninterrupted run would have; the checkpoint is removed on completion.
+
+    enumerate_spaces=True walks every instance that enumerates a finite
+    problem space (ProblemGenerator.enumerate_space()) in a seeded
+    Feistel-permuted order instead of sampling it: each pick of such an
+    instance takes the next unseen problem, so none is lost to dedup, and
+    picks after the last one count as exhausted attempts. The build stops
+    as soon as a pool made only of such instances is fully walked.
+    Skill and instance picks are unchanged, so a walked space is uniform
+    over its problems rather than over generate()'s distribution.
+
+    shard=(i, N) (--shard i/N) builds one of N independent slices for a
+    multi-node build: build batches i, i+N, ... (with the full build's
+    streams), until about n/N rows pass this shard's own dedup. `path` then
+    gets a shard file rather than JSONL: a header with the build options,
+    then every batch's results, duplicates reduced to their keys.
+    merge=[shard files] (--merge) builds the full dataset from them: batches
+    are replayed in order through the usual dedup (a hash join on the keys,
+    dropping cross-shard duplicates), batches no shard reached are
+    generated here, and the output and stats are exactly those of a
+    single-process build with the same options. Neither combines with
+    exact_counts or enumerate_spaces, whose plans follow the whole build.
+
+    A `path` ending in .gz, .xz or .zst is compressed with that codec on a
+    background thread (see jsonl_writer); the summary's "output" gives the
+    bytes before and after compression, the ratio and the writer's MB/s
+    for this run.
+
+    output_format="parquet" writes `path` as one Parquet file instead
+    (parquet_writer.ParquetDatasetWriter: dictionary-encoded category
+    columns, row groups of row_group_rows, the rendered text column only
+    with parquet_text=True). A Parquet file is only readable once closed, so
+    such builds cannot checkpoint, resume or shard.
+
+    Returns a summary dict with per-instance stats, the index footprint
+    and, when walking, each walked space's size and progress.
     """
-    if seed is not None:
-        random.seed(seed)
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if exact_counts and enumerate_spaces:
+        raise ValueError("exact_counts and enumerate_spaces cannot be combined")
+    if shard is not None and merge:
+        raise ValueError("shard and merge cannot be combined")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {', '.join(OUTPUT_FORMATS)}, "
+                         f"got {output_format!r}")
+    if output_format == "parquet" and (resume or checkpoint_every is not None
+                                       or shard is not None):
+        raise ValueError("Parquet output cannot checkpoint, resume or shard")
+    if shard is not None or merge:
+        if exact_counts or enumerate_spaces:
+            raise ValueError("shard/merge builds cannot use exact_counts or "
+                             "enumerate_spaces")
+        if seed is None:
+            raise ValueError("shard/merge builds need a seed")
+    checkpoint_dir = f"{path}.ckpt"
+    state = read_checkpoint(checkpoint_dir) if resume else None
+    if seed is None:
+        # An unseeded build resumes with the seed it started with.
+        seed = (state["params"]["seed"] if state is not None
+                else random.SystemRandom().getrandbits(64))
     gen_pool = resolve_pool(generators)
     skills = group_into_skills(gen_pool)
     skill_names = list(skills)
-    if weights:
-        weights = parse_weights(weights, skill_names)
-        skill_weights = [weights.get(name, 1.0) for name in skill_names]
-    else:
-        skill_weights = None
+    skill_weights, mix = skill_weights_for(skill_names, weights, mix)
+    sampler = SkillSampler(skill_names, skill_weights, BUILD_BATCH_SIZE)
+    plan = None
+    if exact_counts:
+        quotas = sampler.plan_counts(n)
+        plan = {"quotas": quotas, "emitted": dict.fromkeys(quotas, 0),
+                "stalls": dict.fromkeys(quotas, 0), "round": -1, "start": 0,
+                "counts": None, "base": {}}
+    sizes = {}
+    if enumerate_spaces:
+        for skill in skill_names:
+            for index, entry in enumerate(skills[skill]):
+                size = materialize(entry).space_size()
+                if size is not None:
+                    sizes[skill, index] = size
+    walked = dict.fromkeys(sizes, 0)
+    # Only a pool made entirely of walked spaces can run out for certain.
+    walk_only = len(sizes) == sum(len(entries) for entries in skills.values())
 
     count = 0
     attempts = 0
-    seen = set()
+    next_batch = 0
+    seen = None
+    if not allow_duplicates:
+        seen = make_dedup_index(dedup) if isinstance(dedup, str) else dedup
     stats = {}
+    # A shard stops after the batch that brings it to its share of n.
+    target = n if shard is None else -(-n // shard[1])
     # Generous budget: dedup can reject heavily when a skill's problem space
     # is small, so allow many more attempts than examples...
-    max_attempts = n * 10 + 1000
+    max_attempts = target * 10 + 1000
     # ...but stop early if nothing new has been accepted for a long stretch
     # (likely an exhausted problem space).
     consecutive_rejects = 0
-    max_consecutive_rejects = max(2000, n)
-
-    print(f"Attempting to generate {n} examples...")
-    # Explicitly set encoding='utf-8' for writing
-    with open(path, "w", encoding="utf-8") as fp:
-        while count < n and attempts < max_attempts:
-            if consecutive_rejects >= max_consecutive_rejects:
-                print(f"WARN: no new examples accepted in the last "
-                      f"{consecutive_rejects} attempts; the problem space of the "
-                      f"selected skills is likely exhausted. Stopping early.")
-                break
-            attempts += 1
-            # Choose a skill (optionally weighted), then an instance within it
-            skill = random.choices(skill_names, weights=skill_weights)[0]
-            gen_instance = random.choice(skills[skill])
-            entry = stats.setdefault(
-                _instance_label(gen_instance),
-                {"emitted": 0, "duplicates_skipped": 0, "errors": 0})
-            try:
-                example = gen_instance.generate()
-                if not example:
-                    raise ValueError("generate() returned an empty example")
-                example = stamp_metadata(example, gen_instance)
-                validate_example(example)
-            except Exception as e:
-                entry["errors"] += 1
-                consecutive_rejects += 1
-                if entry["errors"] <= 5:
-                    print(f"ERROR: Generator {gen_instance.__class__.__name__} failed "
-                          f"during generation or validation: {e}. Skipping attempt {attempts}.")
-                elif entry["errors"] == 6:
-                    print(f"ERROR: suppressing further errors from "
-                          f"{gen_instance.__class__.__name__} (see stats table).")
-                continue
+    max_consecutive_rejects = max(2000, target)
+    stopped = False
+
+    params = {"n": n, "seed": seed, "allow_duplicates": allow_duplicates,
+              "dedup": None if seen is None else seen.kind,
+              "dedup_on_collision": getattr(seen, "on_collision", None),
+              "skills": {name: len(skills[name]) for name in skill_names},
+              "skill_weights": skill_weights,
+              "batch_size": BUILD_BATCH_SIZE,
+              "enumerate_spaces": enumerate_spaces,
+              "mix": mix_to_json(mix) if mix else None,
+              "exact_counts": exact_counts}
+    build_params = params
+    if shard is not None:
+        shard = tuple(shard)
+        build_params = {**params, "shard": list(shard)}
+    if state is not None:
+        check_resumable(state, build_params)
+        count, attempts = state["count"], state["attempts"]
+        next_batch = state["next_batch"]
+        consecutive_rejects = state["consecutive_rejects"]
+        stats = state["stats"]
+        for skill, index, done in state.get("walked", []):
+            walked[skill, index] = done
+        if plan is not None:
+            plan = state["quota"]
+        if seen is not None:
+            restore_dedup(checkpoint_dir, seen)
+        # Drop anything written after the checkpoint.
+        os.truncate(path, state["offset"])
+        print(f"Resuming from checkpoint: {count}/{n} examples, "
+              f"{attempts} attempts.")
+    elif resume:
+        print(f"No checkpoint at {checkpoint_dir}; starting from scratch.")
+    timer = CheckpointTimer(checkpoint_every)
+
+    # Parquet output takes example dicts straight from the workers rather
+    # than reparsing serialized lines.
+    serialize = output_format != "parquet"
+
+    def live(start):
+        if workers > 1:
+            return _parallel_attempts(skills, sampler, seed, workers, start,
+                                      sizes, shard=shard or (0, 1), serialize=serialize)
+        return _sequential_attempts(skills, sampler, seed, start, sizes,
+                                    shard=shard or (0, 1), serialize=serialize)
+
+    if plan is not None:
+        stream = _quota_attempts(skills, plan, seed, workers, next_batch, serialize)
+    elif merge:
+        stream = _merged_attempts(merge, params, next_batch, live)
+    else:
+        stream = live(next_batch)
+    remaining = sum(sizes.values()) - sum(walked.values())
 
-            key = (example["operation"], example["problem"])
-            if not allow_duplicates:
-                if key in seen:
-                    entry["duplicates_skipped"] += 1
-                    consecutive_rejects += 1
-                    continue
-                seen.add(key)
-
-            write_jsonl(fp, example)
-            entry["emitted"] += 1
-            count += 1
-            consecutive_rejects = 0
-            if count % 1000 == 0:
-                print(f"... successfully generated {count}/{n} examples")
-
-    print(f"✔  Successfully wrote {count} lines → {path} (after {attempts} attempts)")
+    if shard is None:
+        print(f"Attempting to generate {n} examples...")
+    else:
+        print(f"Building shard {shard[0]}/{shard[1]}: about {target} of {n} examples...")
+    # Rows are encoded (and compressed, or converted to Parquet columns) in
+    # chunks on a background thread.
+    if output_format == "parquet":
+        output = ParquetDatasetWriter(path, parquet_text, row_group_rows)
+    else:
+        output = JsonlWriter(path, "a" if state is not None else "w")
+    with output as fp:
+        if shard is not None and state is None:
+            fp.write(json.dumps({"shard": list(shard), "params": params}) + "\n")
+        try:
+            for groups in stream:
+                # A shard records whole batches, so it only stops between them.
+                record = [] if shard is not None else None
+                for label, name, results, walk_key in groups:
+                    if record is None and (count >= n or attempts >= max_attempts
+                                           or stopped):
+                        break
+                    entry = stats.setdefault(
+                        label, {"emitted": 0, "duplicates_skipped": 0, "errors": 0})
+                    kept = []
+                    for key, line, error in results:
+                        if record is None and (count >= n or attempts >= max_attempts):
+                            break
+                        if record is None and consecutive_rejects >= max_consecutive_rejects:
+                            print(f"WARN: no new examples accepted in the last "
+                                  f"{consecutive_rejects} attempts; the problem space of the "
+                                  f"selected skills is likely exhausted. Stopping early.")
+                            stopped = True
+                            break
+                        if walk_only and remaining == 0:
+                            print(f"All {len(sizes)} enumerated problem spaces "
+                                  f"are exhausted ({sum(sizes.values())} problems). "
+                                  f"Stopping early.")
+                            stopped = True
+                            break
+                        attempts += 1
+                        if error == SPACE_EXHAUSTED:
+                            consecutive_rejects += 1
+                            continue
+                        if walk_key is not None:
+                            walked[walk_key] += 1
+                            remaining -= 1
+                        if error is not None:
+                            entry["errors"] += 1
+                            consecutive_rejects += 1
+                            if entry["errors"] <= 5:
+                                print(f"ERROR: Generator {name} failed "
+                                      f"during generation or validation: {error}. Skipping attempt {attempts}.")
+                            elif entry["errors"] == 6:
+                                print(f"ERROR: suppressing further errors from "
+                                      f"{name} (see stats table).")
+                            kept.append([None, None, error])
+                            continue
+
+                        if seen is not None and not seen.add(key):
+                            entry["duplicates_skipped"] += 1
+                            consecutive_rejects += 1
+                            kept.append([key, None, None])
+                            continue
+
+                        if record is None:
+                            fp.write(line, name, label)
+                        else:
+                            kept.append([key, line, None])
+                        entry["emitted"] += 1
+                        if plan is not None:
+                            plan["emitted"][name] += 1
+                        count += 1
+                        consecutive_rejects = 0
+                        if count % 1000 == 0:
+                            print(f"... successfully generated {count}/{target} examples")
+                    if record is not None:
+                        record.append([label, name, kept])
+                if record is not None:
+                    fp.write(_shard_record(_shard_batch(next_batch, shard), record))
+                    stopped = (count >= target or attempts >= max_attempts
+                               or consecutive_rejects >= max_consecutive_rejects)
+                elif count >= n or attempts >= max_attempts or stopped:
+                    break
+                next_batch += 1
+                if timer.due():
+                    # Batch boundary: everything before next_batch is final.
+                    # It must be on disk before the checkpoint points past it.
+                    fp.sync()
+                    write_checkpoint(checkpoint_dir, {
+                        "params": build_params, "next_batch": next_batch,
+                        "count": count, "attempts": attempts,
+                        "consecutive_rejects": consecutive_rejects,
+                        "stats": stats, "offset": fp.tell(),
+                        "walked": [[skill, index, done] for (skill, index), done
+                                   in walked.items()],
+                        "quota": plan,
+                    }, seen)
+                    timer.reset()
+                if stopped and record is not None:
+                    break
+        finally:
+            stream.close()
+    remove_checkpoint(checkpoint_dir)
+
+    if shard is None:
+        print(f"✔  Successfully wrote {count} lines → {path} (after {attempts} attempts)")
+    else:
+        print(f"✔  Shard {shard[0]}/{shard[1]}: {count} rows in {next_batch} batches "
+              f"→ {path} (after {attempts} attempts)")
+    print(f"Output: {fp.describe()}")
     if stats:
         width = max(len(name) for name in stats)
         totals = {"emitted": 0, "duplicates_skipped": 0, "errors": 0}
@@ -1384,9 +1511,33 @@ def build_dataset(n=10_000, path="math_visible_dataset_refactored.jsonl", seed=N
                   f"{s['duplicates_skipped']:>8}  {s['errors']:>6}")
         print(f"{'TOTAL'.ljust(width)}  {totals['emitted']:>8}  "
               f"{totals['duplicates_skipped']:>8}  {totals['errors']:>6}")
-    if count < n:
-        print(f"WARN: Target of {n} examples not reached ({count}/{n}). Consider increasing max_attempts or checking generator logic.")
-    return {"count": count, "attempts": attempts, "stats": stats}
+    spaces = {}
+    for (skill, index), size in sizes.items():
+        label = _instance_label(materialize(skills[skill][index]))
+        spaces[label] = {"size": size, "walked": walked[skill, index]}
+        print(f"Space {label}: walked {walked[skill, index]}/{size}"
+              + (" (exhausted)" if walked[skill, index] == size else ""))
+    quotas = None
+    if plan is not None:
+        quotas = {skill: {"target": quota, "emitted": plan["emitted"][skill]}
+                  for skill, quota in plan["quotas"].items()}
+        for skill, row in quotas.items():
+            if row["emitted"] < row["target"]:
+                print(f"Quota {skill}: {row['emitted']}/{row['target']} rows")
+    dedup_stats = None
+    if seen is not None:
+        print(f"Dedup index: {seen.describe()}")
+        dedup_stats = {"kind": seen.kind, "keys": len(seen),
+                       "memory_bytes": seen.memory_bytes(),
+                       "disk_bytes": seen.disk_bytes(),
+                       "collisions": seen.collisions}
+        if isinstance(dedup, str):
+            seen.close()
+    if count < target:
+        print(f"WARN: Target of {target} examples not reached ({count}/{target}). Consider increasing max_attempts or checking generator logic.")
+    return {"count": count, "attempts": attempts, "stats": stats,
+            "dedup": dedup_stats, "spaces": spaces, "quotas": quotas,
+            "output": fp.stats()}
 
 # ---------- Main Execution Block ----------
 if __name__ == "__main__":
@@ -1429,35 +1580,191 @@ if __name__ == "__main__":
              "or a path to a JSON file of {\"SkillName\": weight}. Unlisted skills "
              "keep weight 1.0. Ignored with --sample."
     )
+    parser.add_argument(
+        "--mix",
+        action="append",
+        default=None,
+        metavar="DIMENSION=VALUE:SHARE,...",
+        help="Curriculum target for dataset builds, e.g. "
+             "'grade_level=college:0.3,graduate:0.2' or "
+             "'difficulty=1-2:0.25,5:0.1'; unlisted values share the rest. "
+             "Repeat once per dimension. Resolved into per-skill weights "
+             "(on top of --weights)."
+    )
+    parser.add_argument(
+        "--exact-counts",
+        action="store_true",
+        help="Plan exact per-skill row counts from the weights up front and "
+             "retry shortfalls instead of drawing skills independently."
+    )
     parser.add_argument(
         "--allow-duplicates",
         action="store_true",
         help="Keep exact repeats of (operation, problem) instead of skipping them."
     )
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_KINDS,
+        default="exact",
+        help="Dedup index: 'exact' keeps every (operation, problem) key; "
+             "'hash64'/'hash128' keep a fixed-width digest per key (far less "
+             "memory; see --dedup-on-collision)."
+    )
+    parser.add_argument(
+        "--dedup-on-collision",
+        choices=COLLISION_POLICIES,
+        default="keep",
+        help="What a hash index does with two keys that share a digest but "
+             "not a check tag: keep the row (default), drop it as a "
+             "duplicate, or stop with an error. Collisions are counted in "
+             "the dedup stats either way."
+    )
+    parser.add_argument(
+        "--dedup-memory-mb",
+        type=float,
+        default=None,
+        help="With a hash index, spill digests to sorted runs on disk once the "
+             "in-memory table would exceed this many MiB."
+    )
+    parser.add_argument(
+        "--dedup-spill-dir",
+        type=str,
+        default=None,
+        help="Directory for dedup spill runs (default: the system temp dir)."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for dataset builds. Every example draws from "
+             "its own seed-derived stream, so a seeded build produces the same "
+             "bytes for any worker count."
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="jsonl",
+        help="Output format. 'parquet' writes one Parquet file with "
+             "dictionary-encoded category columns (needs pyarrow; no "
+             "checkpoints)."
+    )
+    parser.add_argument(
+        "--parquet-text",
+        action="store_true",
+        help="With --format parquet, also store the rendered text column "
+             "(otherwise derive it at read time with parquet_writer.with_text)."
+    )
+    parser.add_argument(
+        "--row-group-rows",
+        type=int,
+        default=ROW_GROUP_ROWS,
+        help=f"Rows per Parquet row group (default: {ROW_GROUP_ROWS:,})."
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="Save a resumable checkpoint to <output>.ckpt/ this often "
+             "(default: 300; 0 = after every batch)."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted build from <output>.ckpt/. Use the same "
+             "options as the original run; the output is identical to an "
+             "uninterrupted build."
+    )
+
+    parser.add_argument(
+        "--enumerate-spaces",
+        action="store_true",
+        help="Walk generators with a finite, enumerable problem space (e.g. "
+             "PrimalityTestGenerator, TotientGenerator) in a seeded permuted "
+             "order instead of sampling them: no duplicate misses, and the "
+             "build reports exactly when a space is used up."
+    )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        default=None,
+        metavar="i/N",
+        help="Build slice i of an N-way multi-node build into a shard file "
+             "(needs --seed); merge the N shard files with --merge."
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        default=None,
+        metavar="SHARD",
+        help="Merge the shard files of a --shard build into the dataset, "
+             "dropping cross-shard duplicates and generating any shortfall; "
+             "use the options the shards were built with."
+    )
+    parser.add_argument(
+        "--serve",
+        type=str,
+        default=None,
+        metavar="[HOST:]PORT",
+        help="Serve examples over HTTP on localhost instead of building "
+             "(see example_server.py): --workers warm worker processes, "
+             "newline-delimited JSON batches, seeded requests reproducible."
+    )
 
     args = parser.parse_args()
-    selected_generators = select_generators(args.generators)
+    # Only an explicit --generators selection is loaded up front; without
+    # one the default pool stays unloaded registry entries.
+    selected_generators = select_generators(args.generators) if args.generators else None
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
 
     # Determine the output filename if not provided
     if args.output is None:
-        args.output = f"quixi_math_{args.num_examples}.jsonl"
+        args.output = f"quixi_math_{args.num_examples}.{args.format}"
 
     # Check if any arguments were passed (other than the script name itself)
     # OR if the --sample flag was explicitly used.
     # If no args, default to sample. If args are present but not --sample, generate dataset.
-    if len(sys.argv) > 1 and not args.sample:
+    if args.serve:
+        from example_server import parse_address, serve
+        try:
+            host, port = parse_address(args.serve)
+            serve(host, port, generators=selected_generators,
+                  weights=args.weights, workers=args.workers)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(2)
+    elif len(sys.argv) > 1 and not args.sample:
         # Generate dataset if arguments like -n, -o, -s are provided.
         # Only an explicit --generators selection overrides the default pool
         # (which excludes wrapper duplicates, see DEFAULT_POOL_EXCLUDED).
-        explicit_selection = selected_generators if args.generators else None
-        pool = resolve_pool(explicit_selection)
-        names = ", ".join(gen.__class__.__name__ for gen in pool)
+        pool = resolve_pool(selected_generators)
+        names = ", ".join(generator_name(gen) for gen in pool)
         print(f"Generating dataset with n={args.num_examples}, output={args.output}, seed={args.seed}...")
         print(f"Using generators: {names}")
         try:
-            build_dataset(n=args.num_examples, path=args.output, seed=args.seed,
-                          generators=explicit_selection, weights=args.weights,
-                          allow_duplicates=args.allow_duplicates)
+            dedup_index = make_dedup_index(args.dedup, args.dedup_memory_mb,
+                                           args.dedup_spill_dir,
+                                           args.dedup_on_collision)
+            try:
+                build_dataset(n=args.num_examples, path=args.output,
+                              seed=args.seed, generators=selected_generators,
+                              weights=args.weights, mix=args.mix,
+                              exact_counts=args.exact_counts,
+                              allow_duplicates=args.allow_duplicates,
+                              workers=args.workers, dedup=dedup_index,
+                              checkpoint_every=(args.checkpoint_every
+                                                if args.format == "jsonl" else None),
+                              resume=args.resume,
+                              enumerate_spaces=args.enumerate_spaces,
+                              shard=shard, merge=args.merge,
+                              output_format=args.format,
+                              parquet_text=args.parquet_text,
+                              row_group_rows=args.row_group_rows)
+            finally:
+                dedup_index.close()
         except ValueError as e:
             print(f"ERROR: {e}")
             sys.exit(2)
@@ -1467,22 +1774,25 @@ if __name__ == "__main__":
         action_reason = "Default Action" if len(sys.argv) == 1 else "--sample specified"
         print(f"Generating one sample from each generator type ({action_reason}):")
         print("(Use -n, -o, or -s arguments to generate the full dataset file)")
-        if args.generators:
+        if selected_generators is not None:
             names = ", ".join(gen.__class__.__name__ for gen in selected_generators)
             print(f"Limiting to generators: {names}")
+        else:
+            selected_generators = _all_generators()
         print("-" * 50)
         if args.seed is not None:
             random.seed(args.seed) # Use specified seed for samples
 
         for gen_instance in selected_generators:
-            generator_name = gen_instance.__class__.__name__
+            display_name = gen_instance.__class__.__name__
             # Handle generators that take arguments in __init__
             if hasattr(gen_instance, 'op_symbol'):
-                 generator_name += f" (op='{gen_instance.op_symbol}')"
+                 display_name += f" (op='{gen_instance.op_symbol}')"
 
-            print(f"Generator: {generator_name}")
+            print(f"Generator: {display_name}")
             try:
                 example = stamp_metadata(gen_instance.generate(), gen_instance)
+                example.pop("dedup_key", None)
                 print(json.dumps(example, indent=2, ensure_ascii=False))
             except Exception as e:
                 print(f"  ERROR generating sample: {e}")
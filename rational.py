@@ -0,0 +1,276 @@
+"""Fast exact rationals for generator arithmetic.
+
+``rational.Fraction`` is a drop-in replacement for ``fractions.Fraction``:
+swap ``from fractions import Fraction`` for ``from rational import Fraction``.
+It subclasses the stdlib class, so every method, str()/repr() output, hash,
+equality and pickling behave exactly as before; only the hot paths are
+replaced:
+
+- construction from ints or fractions skips the generic numbers.Rational
+  dispatch and builds the object directly;
+- +, -, *, / and comparisons against ints and fractions read the slots
+  instead of the numerator/denominator properties, and int operands skip
+  the gcd where the result is already in lowest terms (n/d + k needs none,
+  n/d * k needs one small gcd);
+- hash() is computed inline, and an integral value hashes as its int.
+
+Results stay rational.Fraction, so a chain of operations keeps the fast
+paths; anything else (floats, Decimals, strings, other numbers.Rational
+types) goes through the stdlib implementation. isinstance(x, Fraction) is
+true for any fractions.Fraction, so a module's existing isinstance checks
+keep their meaning after the import swap.
+"""
+import fractions
+import sys
+from abc import ABCMeta
+from math import gcd
+
+_Fraction = fractions.Fraction
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+_object_new = object.__new__
+
+
+class _FractionMeta(ABCMeta):
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, _Fraction)
+
+
+class Fraction(_Fraction, metaclass=_FractionMeta):
+    """fractions.Fraction with fast paths for int and Fraction operands."""
+
+    __slots__ = ()
+
+    def __new__(cls, numerator=0, denominator=None):
+        if cls is Fraction:
+            if denominator is None:
+                tn = type(numerator)
+                if tn is int:
+                    return _make(numerator, 1)
+                if tn is Fraction or tn is _Fraction:
+                    return _make(numerator._numerator, numerator._denominator)
+            elif type(numerator) is int and type(denominator) is int:
+                if denominator == 0:
+                    raise ZeroDivisionError(f"Fraction({numerator}, 0)")
+                g = gcd(numerator, denominator)
+                if denominator < 0:
+                    g = -g
+                return _make(numerator // g, denominator // g)
+        return super().__new__(cls, numerator, denominator)
+
+    # --- arithmetic --------------------------------------------------------
+
+    def __add__(a, b):
+        tb = type(b)
+        if tb is int:
+            da = a._denominator
+            return _make(a._numerator + b * da, da)
+        if tb is Fraction or tb is _Fraction:
+            return _add(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__add__(a, b)
+
+    def __radd__(b, a):
+        ta = type(a)
+        if ta is int:
+            db = b._denominator
+            return _make(a * db + b._numerator, db)
+        if ta is _Fraction:
+            return _add(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__radd__(b, a)
+
+    def __sub__(a, b):
+        tb = type(b)
+        if tb is int:
+            da = a._denominator
+            return _make(a._numerator - b * da, da)
+        if tb is Fraction or tb is _Fraction:
+            return _add(a._numerator, a._denominator, -b._numerator, b._denominator)
+        return _Fraction.__sub__(a, b)
+
+    def __rsub__(b, a):
+        ta = type(a)
+        if ta is int:
+            db = b._denominator
+            return _make(a * db - b._numerator, db)
+        if ta is _Fraction:
+            return _add(a._numerator, a._denominator, -b._numerator, b._denominator)
+        return _Fraction.__rsub__(b, a)
+
+    def __mul__(a, b):
+        tb = type(b)
+        if tb is int:
+            return _mul_int(a._numerator, a._denominator, b)
+        if tb is Fraction or tb is _Fraction:
+            return _mul(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__mul__(a, b)
+
+    def __rmul__(b, a):
+        ta = type(a)
+        if ta is int:
+            return _mul_int(b._numerator, b._denominator, a)
+        if ta is _Fraction:
+            return _mul(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__rmul__(b, a)
+
+    def __truediv__(a, b):
+        tb = type(b)
+        if tb is int:
+            if b:
+                n, d = a._numerator, a._denominator * b
+                if b < 0:
+                    n, d = -n, -d
+                g = gcd(n, b)
+                return _make(n // g, d // g) if g > 1 else _make(n, d)
+        elif tb is Fraction or tb is _Fraction:
+            if b._numerator:
+                return _div(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__truediv__(a, b)
+
+    def __rtruediv__(b, a):
+        ta = type(a)
+        if b._numerator:
+            if ta is int:
+                return _div(a, 1, b._numerator, b._denominator)
+            if ta is _Fraction:
+                return _div(a._numerator, a._denominator, b._numerator, b._denominator)
+        return _Fraction.__rtruediv__(b, a)
+
+    def __pow__(a, b):
+        if type(b) is int:
+            if b >= 0:
+                return _make(a._numerator ** b, a._denominator ** b)
+            if a._numerator > 0:
+                return _make(a._denominator ** -b, a._numerator ** -b)
+            if a._numerator < 0:
+                return _make((-a._denominator) ** -b, (-a._numerator) ** -b)
+        return _Fraction.__pow__(a, b)
+
+    def __neg__(a):
+        return _make(-a._numerator, a._denominator)
+
+    def __abs__(a):
+        return _make(abs(a._numerator), a._denominator)
+
+    def __float__(a):
+        return a._numerator / a._denominator
+
+    # --- comparison and hashing --------------------------------------------
+
+    def __eq__(a, b):
+        tb = type(b)
+        if tb is int:
+            return a._denominator == 1 and a._numerator == b
+        if tb is Fraction or tb is _Fraction:
+            return a._numerator == b._numerator and a._denominator == b._denominator
+        return _Fraction.__eq__(a, b)
+
+    def __lt__(a, b):
+        tb = type(b)
+        if tb is int:
+            return a._numerator < b * a._denominator
+        if tb is Fraction or tb is _Fraction:
+            return a._numerator * b._denominator < b._numerator * a._denominator
+        return _Fraction.__lt__(a, b)
+
+    def __gt__(a, b):
+        tb = type(b)
+        if tb is int:
+            return a._numerator > b * a._denominator
+        if tb is Fraction or tb is _Fraction:
+            return a._numerator * b._denominator > b._numerator * a._denominator
+        return _Fraction.__gt__(a, b)
+
+    def __le__(a, b):
+        tb = type(b)
+        if tb is int:
+            return a._numerator <= b * a._denominator
+        if tb is Fraction or tb is _Fraction:
+            return a._numerator * b._denominator <= b._numerator * a._denominator
+        return _Fraction.__le__(a, b)
+
+    def __ge__(a, b):
+        tb = type(b)
+        if tb is int:
+            return a._numerator >= b * a._denominator
+        if tb is Fraction or tb is _Fraction:
+            return a._numerator * b._denominator >= b._numerator * a._denominator
+        return _Fraction.__ge__(a, b)
+
+    def __hash__(self):
+        # The stdlib algorithm, inlined.
+        n, d = self._numerator, self._denominator
+        if d == 1:
+            return hash(n)
+        try:
+            dinv = pow(d, -1, _HASH_MODULUS)
+        except ValueError:
+            hash_ = _HASH_INF
+        else:
+            hash_ = hash(hash(abs(n)) * dinv)
+        result = hash_ if n >= 0 else -hash_
+        return -2 if result == -1 else result
+
+
+def _make(n, d):
+    """A Fraction from a numerator and positive denominator already in
+    lowest terms."""
+    self = _object_new(Fraction)
+    self._numerator = n
+    self._denominator = d
+    return self
+
+
+def _add(na, da, nb, db):
+    """na/da + nb/db (the stdlib algorithm, on plain ints)."""
+    if da == db:
+        if da == 1:
+            return _make(na + nb, 1)
+        n = na + nb
+        g = gcd(n, da)
+        return _make(n // g, da // g) if g > 1 else _make(n, da)
+    g = gcd(da, db)
+    if g == 1:
+        return _make(na * db + da * nb, da * db)
+    s = da // g
+    t = na * (db // g) + nb * s
+    g2 = gcd(t, g)
+    if g2 == 1:
+        return _make(t, s * db)
+    return _make(t // g2, s * (db // g2))
+
+
+def _mul(na, da, nb, db):
+    g1 = gcd(na, db)
+    if g1 > 1:
+        na //= g1
+        db //= g1
+    g2 = gcd(nb, da)
+    if g2 > 1:
+        nb //= g2
+        da //= g2
+    return _make(na * nb, db * da)
+
+
+def _mul_int(n, d, k):
+    if d == 1:
+        return _make(n * k, 1)
+    g = gcd(k, d)
+    if g > 1:
+        return _make(n * (k // g), d // g)
+    return _make(n * k, d)
+
+
+def _div(na, da, nb, db):
+    """na/da / nb/db for nb != 0."""
+    g1 = gcd(na, nb)
+    if g1 > 1:
+        na //= g1
+        nb //= g1
+    g2 = gcd(db, da)
+    if g2 > 1:
+        da //= g2
+        db //= g2
+    n, d = na * db, nb * da
+    if d < 0:
+        n, d = -n, -d
+    return _make(n, d)
@@ -0,0 +1,99 @@
+"""Shared text renderers for exact values.
+
+Generators used to carry their own copies of these helpers; the versions
+here produce the same strings and are tuned for the hot paths:
+
+- fraction_text() renders ints and Fractions with a single str() call and
+  only converts other values (floats, strings, Decimals) through Fraction.
+- dec() and exact() cache their results in bounded LRU caches keyed by
+  (numerator, denominator), so the repeated divisions by 2 and 5 run once
+  per distinct value. The key is an int pair on purpose: hashing a
+  non-integral Fraction costs a modular inverse, more than rendering it.
+  fraction_text() is not cached for the same reason.
+"""
+import fractions
+from functools import lru_cache
+
+from rational import Fraction
+
+# Types whose str() is already the reduced-fraction text.
+_PLAIN_TYPES = frozenset((int, Fraction, fractions.Fraction))
+
+
+def fraction_text(value):
+    """Reduced-fraction text of a number: 3 -> '3', 0.5 -> '1/2'."""
+    if type(value) in _PLAIN_TYPES:
+        return str(value)
+    return str(Fraction(value))
+
+
+def dec(value):
+    """Exact decimal string for a value whose reduced denominator is
+    2^a·5^b: 33/10 -> '3.3', 1331/1000 -> '1.331'."""
+    if type(value) is int:
+        return str(value)
+    if not isinstance(value, fractions.Fraction):
+        value = Fraction(value)
+    return _dec(value.numerator, value.denominator)
+
+
+@lru_cache(maxsize=8192)
+def _dec(num, den):
+    value = (num, den)
+    p10 = 0
+    while den % 2 == 0:
+        den //= 2
+        num *= 5
+        p10 += 1
+    while den % 5 == 0:
+        den //= 5
+        num *= 2
+        p10 += 1
+    assert den == 1, Fraction(*value)
+    if p10 == 0:
+        return str(num)
+    s = str(abs(num)).rjust(p10 + 1, "0")
+    out = f"{s[:-p10]}.{s[-p10:]}".rstrip("0").rstrip(".")
+    return ("-" if num < 0 else "") + out
+
+
+def exact(fr):
+    """Terminating decimal when possible, else the reduced fraction."""
+    return _exact(fr.numerator, fr.denominator)
+
+
+@lru_cache(maxsize=8192)
+def _exact(num, den):
+    d = den
+    while d % 2 == 0:
+        d //= 2
+    while d % 5 == 0:
+        d //= 5
+    if d == 1:
+        return _dec(num, den)
+    return f"{num}/{den}"
+
+
+def money(fr):
+    """Fraction dollars -> '$665.50'."""
+    cents = fr * 100
+    assert cents.denominator == 1
+    c = cents.numerator
+    return f"${c // 100}.{c % 100:02d}"
+
+
+def factor_text(value):
+    """A value as a product factor: negatives are parenthesised."""
+    return f"({value})" if value < 0 else str(value)
+
+
+def vector_text(values):
+    """'(a,b,c)' with each entry as fraction_text()."""
+    return "(" + ",".join(map(fraction_text, values)) + ")"
+
+
+def matrix_text(matrix):
+    """'[[a,b], [c,d]]' with each entry as fraction_text()."""
+    return "[" + ", ".join(
+        "[" + ",".join(map(fraction_text, row)) + "]" for row in matrix
+    ) + "]"
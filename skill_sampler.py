@@ -0,0 +1,296 @@
+"""Skill selection for dataset builds.
+
+A build picks a skill (generator class) for every attempt. SkillSampler
+prepares the per-skill weights once: unweighted builds draw with
+rng.choices(), weighted ones from a Walker alias table, so a pick costs one
+rng.random() and O(1) work however many skills there are (rng.choices()
+with weights rebuilds its cumulative table on every call).
+
+Weights can also be derived from curriculum targets. A --mix spec such as
+"grade_level=college:0.3,graduate:0.2" or "difficulty=1-2:0.25,5:0.1"
+asks for shares of the build by curriculum.CURRICULUM dimension; values
+not listed share what is left. resolve_mix() turns one or more such specs
+into per-skill weights, keeping the relative weights of skills within a
+group (iterative proportional fitting when several dimensions are given).
+
+For exact composition, plan_counts() apportions n rows over the skills
+(largest remainder) and QuotaSchedule deals those rows out in a seeded
+permuted order, one build batch at a time, so no skill is drawn past its
+quota.
+"""
+from bisect import bisect_right
+from fractions import Fraction
+
+from curriculum import CURRICULUM, GRADE_LEVELS
+from permutation import FeistelPermutation
+
+MIX_DIMENSIONS = ("grade_level", "difficulty")
+
+# Iterative proportional fitting stops once every target share is met to
+# within this tolerance.
+_FIT_TOLERANCE = 1e-12
+_FIT_ROUNDS = 1000
+
+
+class SkillSampler:
+    """Draws skill names in proportion to `weights` (uniform when None).
+
+    picks(rng, batch) returns one build batch's skill names; `batch` is
+    unused here (QuotaSchedule needs it) and the draws come from `rng` only.
+    """
+
+    def __init__(self, names, weights=None, batch_size=64):
+        self.names = tuple(names)
+        if weights is not None and len(weights) != len(self.names):
+            raise ValueError("names and weights differ in length")
+        if weights is not None and len(set(weights)) <= 1:
+            weights = None
+        self.weights = None if weights is None else tuple(weights)
+        self.batch_size = batch_size
+        self._cutoff = self._alias = None
+        if self.weights is not None:
+            self._build_alias(self.weights)
+
+    def _build_alias(self, weights):
+        # Vose's alias method: slot i keeps names[i] when the fractional
+        # part of the draw is below cutoff[i] and yields alias[i] otherwise.
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        cutoff = [1.0] * n
+        alias = list(self.names)
+        small = [i for i, w in enumerate(scaled) if w < 1]
+        large = [i for i, w in enumerate(scaled) if w >= 1]
+        while small and large:
+            s, big = small.pop(), large.pop()
+            cutoff[s] = scaled[s]
+            alias[s] = self.names[big]
+            scaled[big] -= 1 - scaled[s]
+            (small if scaled[big] < 1 else large).append(big)
+        self._cutoff = tuple(cutoff)
+        self._alias = tuple(alias)
+
+    def picks(self, rng, batch=None):
+        if self._alias is None:
+            return rng.choices(self.names, k=self.batch_size)
+        names, alias, cutoff = self.names, self._alias, self._cutoff
+        n = len(names)
+        random = rng.random
+        out = []
+        for _ in range(self.batch_size):
+            u = random() * n
+            i = int(u)
+            out.append(names[i] if u - i < cutoff[i] else alias[i])
+        return out
+
+    def probabilities(self) -> dict:
+        """skill -> exact probability of a pick."""
+        if self.weights is None:
+            return {name: Fraction(1, len(self.names)) for name in self.names}
+        total = sum(map(Fraction, self.weights))
+        return {name: Fraction(w) / total
+                for name, w in zip(self.names, self.weights)}
+
+    def plan_counts(self, n) -> dict:
+        """skill -> rows, summing to n, proportional to the weights.
+
+        Largest-remainder apportionment: every skill gets the floor of its
+        exact share and the leftover rows go to the largest remainders
+        (earlier skills first on ties).
+        """
+        shares = {name: p * n for name, p in self.probabilities().items()}
+        counts = {name: int(share) for name, share in shares.items()}
+        leftover = n - sum(counts.values())
+        order = sorted(self.names, key=lambda name: shares[name] - counts[name],
+                       reverse=True)
+        for name in order[:leftover]:
+            counts[name] += 1
+        return counts
+
+
+class QuotaSchedule:
+    """The rows of `counts` ({skill: rows}) as a sequence of skill names in
+    a seeded permuted order, dealt out batch_size per build batch from
+    batch `start` on; the same picks() interface as SkillSampler."""
+
+    def __init__(self, counts, key, start=0, batch_size=64):
+        # Sorted, so the order does not depend on how `counts` was built
+        # (checkpoints store it as JSON with sorted keys).
+        self.counts = {name: counts[name] for name in sorted(counts)
+                       if counts[name] > 0}
+        self.start = start
+        self.batch_size = batch_size
+        self._names = list(self.counts)
+        self._ends = []
+        total = 0
+        for name in self._names:
+            total += self.counts[name]
+            self._ends.append(total)
+        self.size = total
+        self._order = FeistelPermutation(total, key) if total else None
+        self.stop = start + -(-total // batch_size)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, slot):
+        index = self._order[slot]
+        return self._names[bisect_right(self._ends, index)]
+
+    def picks(self, rng, batch):
+        first = (batch - self.start) * self.batch_size
+        if not 0 <= first < self.size:
+            return []
+        return [self[slot] for slot in
+                range(first, min(first + self.batch_size, self.size))]
+
+
+def parse_mix_value(dimension, text) -> tuple:
+    """The curriculum values one --mix value covers: ("college",) for a
+    grade_level, (1, 2, 3) for the difficulty band "1-3"."""
+    if dimension == "grade_level":
+        if text not in GRADE_LEVELS:
+            raise ValueError(f"Unknown grade_level {text!r}; expected one of "
+                             f"{', '.join(GRADE_LEVELS)}")
+        return (text,)
+    low, sep, high = text.partition("-")
+    try:
+        low = int(low)
+        high = int(high) if sep else low
+    except ValueError:
+        raise ValueError(f"Bad difficulty {text!r}; expected N or N-M "
+                         f"within 1-5") from None
+    if not 1 <= low <= high <= 5:
+        raise ValueError(f"Bad difficulty {text!r}; expected N or N-M "
+                         f"within 1-5")
+    return tuple(range(low, high + 1))
+
+
+def _label(values):
+    if len(values) == 1:
+        return str(values[0])
+    return f"{values[0]}-{values[-1]}"
+
+
+def parse_mix(specs) -> dict:
+    """Parses --mix specs into {dimension: {values: share}}.
+
+    `specs` is one "dimension=value:share,value:share" string, a list of
+    them (one per dimension), or a dict {dimension: {value: share}}.
+    Values are grade levels or difficulties (a band "1-3" is one group);
+    shares are positive and sum to at most 1 per dimension. `values` in
+    the result is the tuple of curriculum values the group covers.
+    """
+    if isinstance(specs, dict):
+        raw = [(dimension, list(groups.items()))
+               for dimension, groups in specs.items()]
+    else:
+        raw = []
+        for spec in [specs] if isinstance(specs, str) else specs:
+            dimension, sep, body = spec.partition("=")
+            if not sep or not body.strip():
+                raise ValueError(f"Bad --mix spec {spec!r}; expected "
+                                 f"DIMENSION=VALUE:SHARE[,VALUE:SHARE...]")
+            groups = []
+            for part in body.split(","):
+                part = part.strip()
+                if not part:
+                    continue
+                value, sep, share = part.rpartition(":")
+                if not sep:
+                    raise ValueError(f"Bad --mix entry {part!r}; expected VALUE:SHARE")
+                groups.append((value, share))
+            raw.append((dimension.strip(), groups))
+
+    mix = {}
+    for dimension, groups in raw:
+        if dimension not in MIX_DIMENSIONS:
+            raise ValueError(f"Unknown --mix dimension {dimension!r}; expected "
+                             f"one of {', '.join(MIX_DIMENSIONS)}")
+        if dimension in mix:
+            raise ValueError(f"--mix dimension {dimension!r} given twice")
+        shares = {}
+        for value, share in groups:
+            values = parse_mix_value(dimension, str(value).strip())
+            try:
+                share = float(share)
+            except (TypeError, ValueError):
+                raise ValueError(f"Share for {dimension}={value} must be a "
+                                 f"number, got {share!r}") from None
+            if not share > 0:
+                raise ValueError(f"Share for {dimension}={value} must be "
+                                 f"positive, got {share}")
+            overlap = {v for group in shares for v in group} & set(values)
+            if overlap:
+                raise ValueError(f"--mix {dimension} groups overlap at "
+                                 f"{', '.join(map(str, sorted(overlap)))}")
+            shares[values] = share
+        if sum(shares.values()) > 1 + 1e-9:
+            raise ValueError(f"--mix {dimension} shares sum to "
+                             f"{sum(shares.values()):g}; at most 1 allowed")
+        mix[dimension] = shares
+    return mix
+
+
+def mix_to_json(mix) -> dict:
+    """A parse_mix() result with string keys, as accepted back by
+    parse_mix() (for checkpoints and summaries)."""
+    return {dimension: {_label(values): share for values, share in groups.items()}
+            for dimension, groups in mix.items()}
+
+
+def _groups(names, dimension, shares):
+    """[(skill indices, target share)] for one dimension; skills outside
+    every listed group form a remainder group sharing what is left."""
+    listed = []
+    covered = set()
+    for values, share in shares.items():
+        members = [i for i, name in enumerate(names)
+                   if CURRICULUM[name][dimension] in values]
+        if not members:
+            raise ValueError(f"--mix {dimension}={_label(values)} matches "
+                             f"none of the selected skills")
+        listed.append((members, share))
+        covered.update(members)
+    rest = [i for i in range(len(names)) if i not in covered]
+    rest_share = 1 - sum(share for _, share in listed)
+    if rest and rest_share > 1e-9:
+        return listed + [(rest, rest_share)]
+    # Nothing (or nobody) left over: listed groups split the whole build.
+    total = sum(share for _, share in listed)
+    return ([(members, share / total) for members, share in listed]
+            + ([(rest, 0.0)] if rest else []))
+
+
+def resolve_mix(names, mix, base_weights=None) -> list:
+    """Per-skill weights (summing to 1) meeting every `mix` target.
+
+    `base_weights` (default: all 1) sets the relative weight of skills
+    inside a group. Raises ValueError for skills without a CURRICULUM
+    entry, groups matching no skill, or targets that cannot all hold.
+    """
+    names = list(names)
+    missing = [name for name in names if name not in CURRICULUM]
+    if missing:
+        raise ValueError(f"--mix needs a curriculum entry for "
+                         f"{', '.join(missing)}")
+    weights = list(base_weights) if base_weights else [1.0] * len(names)
+    dimensions = [_groups(names, dimension, shares)
+                  for dimension, shares in mix.items()]
+    for _ in range(_FIT_ROUNDS):
+        worst = 0.0
+        for groups in dimensions:
+            total = sum(weights)
+            for members, share in groups:
+                mass = sum(weights[i] for i in members)
+                worst = max(worst, abs(mass / total - share))
+                scale = share * total / mass if mass else 0.0
+                for i in members:
+                    weights[i] *= scale
+        if worst <= _FIT_TOLERANCE:
+            break
+    else:
+        raise ValueError("--mix targets conflict; no skill weights satisfy "
+                         "all of them")
+    total = sum(weights)
+    return [w / total for w in weights]
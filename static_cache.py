@@ -0,0 +1,96 @@
+"""Process-wide caches for generator tables that never change.
+
+Some generators need structures that depend only on a few fixed inputs (a
+prime from a constant list, a curve, a modulus): the points of an
+elliptic curve, the unit group of Z_n, the subgroups worth asking about.
+Wrapping the function that builds one in @static_table computes it once
+per process per argument tuple and hands every later call the same
+object, so the table must be treated as read-only; return tuples.
+
+@static_table(persist=True) also keeps results on disk when the
+QUIXI_TABLE_CACHE_DIR environment variable names a directory, so a fresh
+process (a build worker, the next run) loads instead of rebuilding. Each
+file is keyed by the function's name, its arguments and a hash of its
+module's source, so editing the module invalidates it. Without the
+variable a persisted table is cached in memory only.
+
+Every wrapped function is listed in TABLES; `fn.__wrapped__` is the
+uncached original (tools/bench_static_tables.py times one against the
+other).
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sys
+
+CACHE_DIR_ENV = "QUIXI_TABLE_CACHE_DIR"
+
+# Every static_table-wrapped function, in definition order.
+TABLES = []
+
+
+def _source_digest(fn) -> str:
+    module = sys.modules.get(fn.__module__)
+    path = getattr(module, "__file__", None)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{fn.__module__}.{fn.__qualname__}".encode())
+    if path:
+        with open(path, "rb") as fp:
+            h.update(fp.read())
+    return h.hexdigest()
+
+
+def _disk_path(fn, args):
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return None
+    key = hashlib.blake2b(repr(args).encode(), digest_size=16).hexdigest()
+    name = f"{fn.__module__}.{fn.__qualname__}-{_source_digest(fn)[:16]}-{key}.pickle"
+    return os.path.join(directory, name)
+
+
+def _load(path):
+    try:
+        with open(path, "rb") as fp:
+            return True, pickle.load(fp)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return False, None
+
+
+def _store(path, value):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fp:
+        pickle.dump(value, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def static_table(fn=None, *, persist=False):
+    """Caches fn(*args) for the life of the process (args must be
+    hashable); with persist=True, also under QUIXI_TABLE_CACHE_DIR."""
+    def decorate(fn):
+        cache = {}
+
+        @functools.wraps(fn)
+        def table(*args):
+            try:
+                return cache[args]
+            except KeyError:
+                pass
+            path = _disk_path(fn, args) if persist else None
+            found, value = _load(path) if path else (False, None)
+            if not found:
+                value = fn(*args)
+                if path:
+                    _store(path, value)
+            cache[args] = value
+            return value
+
+        table.cache = cache
+        table.cache_clear = cache.clear
+        table.persist = persist
+        TABLES.append(table)
+        return table
+
+    return decorate if fn is None else decorate(fn)
@@ -0,0 +1,156 @@
+import json
+import re
+import unittest
+
+from answer_grader import (EQUIVALENT, EXACT, WRONG, Grader, canonical, grade,
+                           grade_batch)
+from base_generator import example_rng
+from quixi_math_datagen import GENERATOR_REGISTRY, _run_instance
+
+# (answer, reference, verdict) for each A0 shape.
+CASES = [
+    ("366 R4", "366 R4", EXACT),
+    ("366 R5", "366 R4", WRONG),
+    ("$20.060", "$20.06", EQUIVALENT),
+    ("20.06", "$20.06", WRONG),
+    ("15%", "15%", EXACT),
+    ("0.15", "15%", WRONG),
+    ("10/4", "5/2", EQUIVALENT),
+    ("2.5", "5/2", EQUIVALENT),
+    ("17/2", "8 1/2", EQUIVALENT),
+    ("8 1/3", "8 1/2", WRONG),
+    ("11.40", "11.4", EQUIVALENT),
+    ("36 π cubic units", "36π cubic units", EQUIVALENT),
+    ("36π square units", "36π cubic units", WRONG),
+    ("1000pi/6 cubic units", "500π/3 cubic units", EQUIVALENT),
+    ("500/3 cubic units", "500π/3 cubic units", WRONG),
+    ("x<=9", "x ≤ 9", EQUIVALENT),
+    ("x < 9", "x ≤ 9", WRONG),
+    ("y=-3, x=-2", "x=-2, y=-3", EQUIVALENT),
+    ("no solution", "No solution", EQUIVALENT),
+    ("[2, 5) ∪ (-∞, -3)", "(-∞, -3) ∪ [2, 5)", EQUIVALENT),
+    ("(-∞, -3] ∪ [2, 5)", "(-∞, -3) ∪ [2, 5)", WRONG),
+    ("(-∞, -6/2) ∪ [2, 5)", "(-∞, -3) ∪ [2, 5)", EQUIVALENT),
+    ("case 1;Θ(n^2)", "case 1; Θ(n^2)", EQUIVALENT),
+    ("case 2; Θ(n^2)", "case 1; Θ(n^2)", WRONG),
+    ("3(x-4)(x+2)", "3(x - 4)(x + 2)", EQUIVALENT),
+    ("x = 2 or x = -3", "x = -3 or x = 2", EQUIVALENT),
+    ("x = -3", "x = -3 or x = 2", WRONG),
+    ("2√18", "6√2", EQUIVALENT),
+    ("6√3", "6√2", WRONG),
+    ("7", "x = 7", EQUIVALENT),
+    ("x = 7", "7", EQUIVALENT),
+    ("step 4; 40.0", "step 4; 40", EQUIVALENT),
+    ("step 3; 40", "step 4; 40", WRONG),
+    ("40", "step 4; 40", WRONG),
+    ("x^1/6", "x^2/12", WRONG),
+    ("√3/2", "√6/4", WRONG),
+    ("48000 slices/year", "4.8 × 10^4 slices/year", EQUIVALENT),
+    ("<5>={1,5}; generator=yes", "<5> = {1, 5}; generator = yes", EQUIVALENT),
+    ("{2, 1}", "{1, 2}", EQUIVALENT),
+    ("{1, 2, 2}", "{1, 2}", EQUIVALENT),
+    ("{1, 3}", "{1, 2}", WRONG),
+    ("<5>={5,1}; generator=yes", "<5> = {1, 5}; generator = yes", EQUIVALENT),
+    ("(2, 1)", "(1, 2)", WRONG),
+    ("2 or 2 or 3", "2 or 3", WRONG),
+    ("x = 2 or x = 2", "x = 2", WRONG),
+    ("1,000", "1000", EQUIVALENT),
+    ("$1,234.50", "$1234.5", EQUIVALENT),
+    ("x = 12,500", "x = 12500", EQUIVALENT),
+    ("1,000, 2", "1000, 2", WRONG),
+    ("1,00", "100", WRONG),
+    ("", "7", WRONG),
+    (None, "7", WRONG),
+]
+
+# Standalone decimals and fractions, which have another spelling of the
+# same value.
+DECIMAL = re.compile(r"(?<![\w.^/])(\d+\.\d+)(?![\w.^/(√π\d])")
+FRACTION = re.compile(r"(?<![\w.^/√])(\d+)/(\d+)(?![\w.^/(√π\d])")
+
+
+def respell(answer):
+    """An equivalent spelling: decimals padded, fractions unreduced, no
+    spaces around = or after commas."""
+    answer = DECIMAL.sub(r"\g<1>0", answer)
+    answer = FRACTION.sub(lambda m: f"{2 * int(m[1])}/{2 * int(m[2])}", answer)
+    return answer.replace(" = ", "=").replace(", ", ",")
+
+
+def change_last_digit(answer):
+    digits = list(re.finditer(r"\d", answer))
+    if not digits:
+        return None
+    last = digits[-1]
+    return answer[:last.start()] + str((int(last.group()) + 1) % 10) + answer[last.end():]
+
+
+class TestGrade(unittest.TestCase):
+    def test_a0_shapes(self):
+        for answer, reference, verdict in CASES:
+            with self.subTest(answer=answer, reference=reference):
+                self.assertEqual(grade(answer, reference), verdict)
+
+    def test_canonical_is_cached(self):
+        canonical.cache_clear()
+        canonical("x = -3 or x = 2")
+        canonical("x = -3 or x = 2")
+        self.assertEqual(canonical.cache_info().hits, 1)
+
+    def test_batch_matches_serial(self):
+        answers = [answer or "" for answer, _, _ in CASES] * 20
+        references = [reference for _, reference, _ in CASES] * 20
+        serial = grade_batch(answers, references)
+        self.assertEqual(grade_batch(answers, references, workers=2, chunk_size=64), serial)
+        self.assertEqual(serial, [grade(a, r) for a, r in zip(answers, references)])
+        with self.assertRaises(ValueError):
+            grade_batch(["1"], ["1", "2"])
+        with self.assertRaises(ValueError):
+            grade_batch(iter(["1", "2"]), iter(["1"]), workers=2, chunk_size=1)
+
+    def test_grader_reuses_its_pool(self):
+        answers = [answer or "" for answer, _, _ in CASES] * 4
+        references = [reference for _, reference, _ in CASES] * 4
+        with Grader(workers=2, chunk_size=32) as grader:
+            first = grader.grade_batch(answers, references)
+            pool = grader._pool
+            self.assertIsNotNone(pool)
+            self.assertEqual(grader.grade_batch(iter(answers), iter(references)), first)
+            self.assertIs(grader._pool, pool)
+        self.assertEqual(first, grade_batch(answers, references))
+        self.assertIsNone(grader._pool)
+        with self.assertRaises(ValueError):
+            grader.grade_batch(["1"], ["1"])
+        with self.assertRaises(ValueError):
+            Grader(workers=0)
+
+
+class TestEveryGenerator(unittest.TestCase):
+    """Every registry entry's own final answers grade as expected."""
+
+    def test_generator_answers(self):
+        for index, entry in enumerate(GENERATOR_REGISTRY):
+            gen_instance = entry.load()
+            results = _run_instance(gen_instance, 6, example_rng(0, ("grader", index)))
+            answers = sorted({json.loads(line)["final_answer"]
+                              for _, line, _ in results if line})
+            with self.subTest(generator=entry.class_name, index=index):
+                self.assertTrue(answers)
+                for answer in answers:
+                    self.assertEqual(grade(answer, answer), EXACT)
+                    self.assertEqual(grade(f" {answer} ", answer), EXACT)
+                    respelled = respell(answer)
+                    if respelled != answer:
+                        self.assertEqual(grade(respelled, answer), EQUIVALENT, respelled)
+                    changed = change_last_digit(answer)
+                    if changed is not None:
+                        self.assertEqual(grade(changed, answer), WRONG, changed)
+                for answer in answers:
+                    for other in answers:
+                        if other != answer and grade(other, answer) != WRONG:
+                            # Only a bare value against its labelled form.
+                            self.assertIn(" = ", answer + other, (answer, other))
+
+
+if __name__ == "__main__":
+    unittest.main()
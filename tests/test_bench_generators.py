@@ -0,0 +1,92 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from base_generator import ProblemGenerator
+from helpers import jid
+from generators.multi_digit_addition_generator import MultiDigitAdditionGenerator
+from tools.bench_generators import (
+    CountingRandom,
+    bench_generators,
+    compare_rows,
+    main,
+    percentile,
+)
+
+
+class RetryingGenerator(ProblemGenerator):
+    """Draws until it hits an even number: a small rejection loop."""
+
+    def generate(self):
+        value = random.randint(1, 99)
+        while value % 2:
+            value = random.randint(1, 99)
+        return {
+            "problem_id": jid(),
+            "operation": "retrying",
+            "problem": f"{value} + 0",
+            "steps": [f"A|{value}|0|{value}", f"Z|{value}"],
+            "final_answer": str(value),
+        }
+
+
+class TestBenchGenerators(unittest.TestCase):
+    def test_counting_random_keeps_the_stream(self):
+        plain, counted = random.Random(7), CountingRandom(7)
+        self.assertEqual([plain.randint(1, 9) for _ in range(5)],
+                         [counted.randint(1, 9) for _ in range(5)])
+        self.assertEqual(plain.random(), counted.random())
+        self.assertGreaterEqual(counted.draws, 6)
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([5], 99), 5)
+
+    def test_rows_report_rejection_and_share(self):
+        rows = bench_generators([RetryingGenerator(),
+                                 MultiDigitAdditionGenerator()],
+                                samples=40, profile_samples=40, seed=1)
+        by_name = {row["generator"]: row for row in rows}
+        self.assertGreater(by_name["RetryingGenerator"]["rejection"], 1.0)
+        self.assertAlmostEqual(sum(row["share"] for row in rows), 1.0, places=2)
+        for row in rows:
+            self.assertEqual(row["errors"], 0)
+            self.assertGreater(row["examples_per_sec"], 0)
+            self.assertLessEqual(row["p50_us"], row["p99_us"])
+
+    def test_compare_flags_only_large_drops(self):
+        baseline = [{"generator": "A", "examples_per_sec": 1000.0},
+                    {"generator": "B", "examples_per_sec": 1000.0}]
+        rows = [{"generator": "A", "examples_per_sec": 800.0},
+                {"generator": "B", "examples_per_sec": 500.0},
+                {"generator": "C", "examples_per_sec": 1.0}]
+        self.assertEqual(compare_rows(rows, baseline, 0.25),
+                         [("B", 1000.0, 500.0)])
+
+    def test_cli_json_output_and_compare_gate(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            baseline = os.path.join(tmp, "baseline.json")
+            with open(baseline, "w", encoding="utf-8") as fh:
+                json.dump([{"generator": "MultiDigitAdditionGenerator",
+                            "examples_per_sec": 1e12}], fh)
+            args = ["--samples", "20", "--profile-samples", "5",
+                    "--generators", "MultiDigitAdditionGenerator"]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(args + ["--json", path]), 0)
+                self.assertEqual(main(args + ["--compare", path,
+                                              "--tolerance", "0.99"]), 0)
+                self.assertEqual(main(args + ["--compare", baseline]), 1)
+            with open(path, encoding="utf-8") as fh:
+                rows = json.load(fh)
+            self.assertEqual(rows[0]["generator"], "MultiDigitAdditionGenerator")
+
+
+if __name__ == "__main__":
+    unittest.main()
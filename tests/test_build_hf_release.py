@@ -0,0 +1,301 @@
+import contextlib
+import gzip
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pyarrow.parquet as pq
+
+from tools import build_hf_release
+from tools.build_hf_release import generate_release
+
+CONFIGS = {
+    "preview": {"train": 70, "test": 30},
+    "10M_tokens": {"train": 130, "validation": 50, "test": 45},
+}
+
+
+FIVE_FIVE_NINETY = {"test": 0.05, "validation": 0.05, "train": 0.90}
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def quiet_release(output_dir, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_release(output_dir=output_dir, configs=CONFIGS, seed=11,
+                                shard_rows=20, compression="zstd", **kwargs)
+
+
+def read_shards(output_dir):
+    return {
+        str(path.relative_to(output_dir)): pq.read_table(path).to_pylist()
+        for path in sorted(output_dir.rglob("*.parquet"))
+    }
+
+
+class TestResumableRelease(unittest.TestCase):
+    def test_resume_matches_uninterrupted_release(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            whole = Path(tmp, "whole")
+            expected = quiet_release(whole)
+
+            part = Path(tmp, "part")
+            real = build_hf_release.write_checkpoint
+            calls = []
+
+            def write_then_die(*args):
+                real(*args)
+                calls.append(1)
+                if len(calls) == 5:  # mid-way through the pass
+                    raise _Interrupted
+            with mock.patch.object(build_hf_release, "write_checkpoint", write_then_die):
+                with self.assertRaises(_Interrupted):
+                    quiet_release(part, checkpoint_every=0)
+            self.assertTrue((part / ".checkpoint").is_dir())
+
+            resumed = quiet_release(part, checkpoint_every=0, resume=True)
+            self.assertFalse((part / ".checkpoint").exists())
+            self.assertEqual(read_shards(part), read_shards(whole))
+            for key in ("rows_by_config_split", "rough_tokens_by_config_split",
+                        "attempts_by_split", "generator_stats", "rows_by_generator"):
+                self.assertEqual(resumed[key], expected[key], key)
+
+
+class TestSplitPartition(unittest.TestCase):
+    def test_split_buckets_apportion_fractions(self):
+        buckets = build_hf_release.split_buckets(FIVE_FIVE_NINETY)
+        self.assertEqual(buckets, {"test": (0, 500), "validation": (500, 1000),
+                                   "train": (1000, 10_000)})
+        buckets = build_hf_release.split_buckets({"test": 1, "train": 2})
+        self.assertEqual(buckets["validation"][0], buckets["validation"][1])
+        self.assertEqual(buckets["train"], (3333, 10_000))
+        for bad in ({"train": 0}, {"train": 1, "test": -0.5}):
+            with self.assertRaises(ValueError, msg=bad):
+                build_hf_release.split_buckets(bad)
+
+    def test_default_fractions_follow_the_targets(self):
+        fractions = build_hf_release.default_split_fractions(build_hf_release.DEFAULT_CONFIGS)
+        self.assertEqual(fractions, {"test": 0.011111, "validation": 0.011111,
+                                     "train": 0.977778})
+        targets = build_hf_release.max_rows_by_split(build_hf_release.DEFAULT_CONFIGS)
+        self.assertLess(build_hf_release.split_waste(fractions, targets), 0.001)
+        self.assertGreater(build_hf_release.split_waste(FIVE_FIVE_NINETY, targets), 0.05)
+        self.assertEqual(build_hf_release.default_split_fractions({"c": {"train": 5}}),
+                         {"train": 1.0})
+        with self.assertRaises(ValueError):
+            build_hf_release.default_split_fractions({"c": {}})
+
+    def test_mismatched_fractions_warn(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                generate_release(output_dir=Path(tmp), configs={"c": {"test": 10}},
+                                 seed=1, shard_rows=20, compression="zstd",
+                                 split_fractions={"test": 0.1, "train": 0.9})
+            self.assertIn("WARN: split fractions", out.getvalue())
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                metadata = generate_release(output_dir=Path(tmp, "default"),
+                                            configs={"c": {"test": 10}}, seed=1,
+                                            shard_rows=20, compression="zstd")
+            self.assertNotIn("WARN", out.getvalue())
+            self.assertEqual(metadata["split_fractions"], {"test": 1.0})
+            self.assertEqual(metadata["other_split_by_split"]["test"], 0)
+
+    def test_parse_split_fractions(self):
+        self.assertEqual(build_hf_release.parse_split_fractions("test=0.1, train=0.9"),
+                         {"test": 0.1, "train": 0.9})
+        for bad in ("test", "dev=0.1", "test=x", "test=0.1,test=0.2"):
+            with self.assertRaises(ValueError, msg=bad):
+                build_hf_release.parse_split_fractions(bad)
+
+    def test_attempts_render_only_built_splits(self):
+        from quixi_math_datagen import group_into_skills, resolve_pool
+
+        skills = group_into_skills(resolve_pool(None))
+        names = list(skills)
+        buckets = build_hf_release.split_buckets(FIVE_FIVE_NINETY)
+        kept = other = 0
+        for i in range(300):
+            label, key, split, row, exc = build_hf_release.release_attempt(
+                skills, names, 3, i, buckets, ["validation"])
+            if exc is not None:
+                continue
+            lo, hi = buckets[split]
+            self.assertTrue(lo <= build_hf_release.key_bucket(key) < hi, label)
+            self.assertEqual(row is not None, split == "validation", label)
+            kept += split == "validation"
+            other += split != "validation"
+        self.assertGreater(kept, 0)
+        self.assertGreater(other, kept)
+
+    def test_one_pass_generates_each_attempt_once(self):
+        calls = []
+        real = build_hf_release.release_attempt
+
+        def counted(*args):
+            calls.append(args[3])
+            return real(*args)
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(build_hf_release, "release_attempt", counted):
+            metadata = quiet_release(Path(tmp))
+        # Attempts are generated in whole batches, each once.
+        self.assertEqual(calls, list(range(len(calls))))
+        surplus = len(calls) - max(metadata["attempts_by_split"].values())
+        self.assertTrue(0 <= surplus < build_hf_release.PRODUCER_BATCH_SIZE, surplus)
+
+    def test_splits_share_no_problem(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            metadata = quiet_release(Path(tmp))
+            problems = {}
+            for split in ("train", "validation", "test"):
+                rows = [row for path in sorted(Path(tmp, "10M_tokens").glob(f"{split}-*"))
+                        for row in pq.read_table(path).to_pylist()]
+                problems[split] = {(row["operation"], row["problem"]) for row in rows}
+            self.assertFalse(problems["train"] & problems["test"])
+            self.assertFalse(problems["train"] & problems["validation"])
+            self.assertFalse(problems["test"] & problems["validation"])
+            self.assertEqual(set(metadata["attempts_by_split"]), {"train", "validation", "test"})
+            # test owns a fifth of the keys (its share of the targets): most
+            # of its attempts land in another split.
+            self.assertGreater(metadata["other_split_by_split"]["test"],
+                               metadata["rows_by_largest_split"]["test"])
+
+
+class TestIndependentSplits(unittest.TestCase):
+    def test_split_subsets_combine_into_the_whole_release(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            whole = Path(tmp, "whole")
+            expected = quiet_release(whole)
+            parts = Path(tmp, "parts")
+            self.assertIsNone(quiet_release(parts, splits=["train"]))
+            combined = quiet_release(parts, splits=["test", "validation"])
+            self.assertEqual(read_shards(parts), read_shards(whole))
+            for key in ("rows_by_config_split", "rough_tokens_by_config_split",
+                        "attempts_by_split", "other_split_by_split",
+                        "generator_stats", "rows_by_generator", "dedup_index"):
+                self.assertEqual(combined[key], expected[key], key)
+            with self.assertRaises(ValueError):
+                quiet_release(parts, splits=["test"], split_fractions={"test": 0.5,
+                                                                      "validation": 0.5})
+
+    def test_collision_policy_reaches_every_index(self):
+        made = []
+        real = build_hf_release.make_dedup_index
+
+        def make_index(*args, **kwargs):
+            made.append(real(*args, **kwargs))
+            return made[-1]
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(build_hf_release, "make_dedup_index", make_index):
+            metadata = quiet_release(Path(tmp), dedup_on_collision="drop")
+        self.assertEqual(metadata["dedup_index"]["on_collision"], "drop")
+        self.assertEqual(metadata["dedup_index"]["collisions"], 0)
+        self.assertTrue(made)
+        self.assertEqual({index.on_collision for index in made}, {"drop"})
+
+    def test_release_independent_of_workers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            one = Path(tmp, "one")
+            two = Path(tmp, "two")
+            quiet_release(one, splits=["validation"])
+            quiet_release(two, splits=["validation"], workers=2)
+            self.assertEqual(read_shards(one), read_shards(two))
+
+
+class TestShardedRelease(unittest.TestCase):
+    def test_merged_shards_match_unsharded_release(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            whole = Path(tmp, "whole")
+            expected = quiet_release(whole)
+            paths = [str(Path(tmp, f"shard-{i}.jsonl.gz")) for i in range(2)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                for i, path in enumerate(paths):
+                    build_hf_release.generate_release_shard(
+                        path, CONFIGS, 11, (i, 2), shard_rows=20, compression="zstd",
+                        workers=2 if i else 1)
+            for name, shards in (("merged", paths), ("reversed", paths[::-1])):
+                merged = quiet_release(Path(tmp, name), merge=shards)
+                self.assertEqual(read_shards(Path(tmp, name)), read_shards(whole), name)
+                for key in ("rows_by_config_split", "attempts_by_split",
+                            "other_split_by_split", "generator_stats", "dedup_index"):
+                    self.assertEqual(merged[key], expected[key], key)
+
+            # A shard that stopped early: the merge generates the rest.
+            with gzip.open(paths[1], "rt", encoding="utf-8") as fp:
+                head = [next(fp), next(fp)]
+            with gzip.open(paths[1], "wt", encoding="utf-8") as fp:
+                fp.writelines(head)
+            quiet_release(Path(tmp, "short"), merge=paths, workers=2)
+            self.assertEqual(read_shards(Path(tmp, "short")), read_shards(whole))
+
+    def test_merge_checks_the_shard_set(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp, "shard-0.jsonl"))
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_hf_release.generate_release_shard(
+                    path, CONFIGS, 11, (0, 2), shard_rows=20, compression="zstd")
+            with self.assertRaisesRegex(ValueError, "i/N set"):
+                quiet_release(Path(tmp, "out"), merge=[path])
+            with self.assertRaisesRegex(ValueError, "different options"):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    generate_release(output_dir=Path(tmp, "out2"), configs=CONFIGS,
+                                     seed=12, shard_rows=20, compression="zstd",
+                                     merge=[path, path])
+
+
+def sink_columns(split, start, count):
+    """`count` schema-shaped rows numbered from `start`, column-wise."""
+    rows = [{"row_id": i, "example_id": f"{split}-{i:09d}", "problem_id": str(i),
+             "generator": "G", "generator_label": "G", "operation": "op",
+             "grade_level": "middle", "difficulty": 1 + i % 5,
+             "problem": f"What is {i} + 1?", "steps": [f"add|{i}|1"],
+             "final_answer": str(i + 1), "text": f"What is {i} + 1? {i + 1}"}
+            for i in range(start, start + count)]
+    return {field.name: [row[field.name] for row in rows]
+            for field in build_hf_release.SCHEMA}
+
+
+class TestProcessSink(unittest.TestCase):
+    SPECS = [("preview", "train", 25), ("10M_tokens", "train", 60)]
+
+    def feed(self, sink):
+        sink.write("train", 0, sink_columns("train", 0, 20))
+        state = sink.sync()
+        for start in (20, 40):
+            sink.write("train", start, sink_columns("train", start, 20))
+        return state, sink.close()
+
+    def test_writer_process_matches_in_process_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            local = Path(tmp, "local")
+            child = Path(tmp, "child")
+            expected = self.feed(build_hf_release.ReleaseSink(local, self.SPECS, 20, "zstd"))
+            got = self.feed(build_hf_release.ProcessReleaseSink(child, self.SPECS, 20, "zstd"))
+            self.assertEqual(got, expected)
+            self.assertEqual(expected[1][("10M_tokens", "train")][0], 60)
+            self.assertEqual(read_shards(child), read_shards(local))
+
+    def test_dead_writer_raises(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(build_hf_release, "SINK_POLL_SECONDS", 0.05):
+            sink = build_hf_release.ProcessReleaseSink(Path(tmp), self.SPECS, 20, "zstd")
+            sink.write("train", 0, sink_columns("train", 0, 5))
+            sink.process.kill()
+            sink.process.join()
+            with self.assertRaisesRegex(RuntimeError, "writer process exited"):
+                sink.sync()
+            with self.assertRaisesRegex(RuntimeError, "writer process exited"):
+                for start in range(5, 200, 5):
+                    sink.write("train", start, sink_columns("train", start, 5))
+            with self.assertRaisesRegex(RuntimeError, "writer process exited"):
+                sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import unittest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from checkpoint import (CheckpointTimer, check_resumable, read_checkpoint,
+                        remove_checkpoint, write_checkpoint)
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_write_replaces_and_remove_clears(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ckpt = os.path.join(tmp, "out.jsonl.ckpt")
+            self.assertIsNone(read_checkpoint(ckpt))
+            write_checkpoint(ckpt, {"next_batch": 1})
+            write_checkpoint(ckpt, {"next_batch": 2})
+            self.assertEqual(read_checkpoint(ckpt), {"next_batch": 2})
+            self.assertEqual(os.listdir(tmp), ["out.jsonl.ckpt"])
+            remove_checkpoint(ckpt)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_interrupted_swap_falls_back_to_previous(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ckpt = os.path.join(tmp, "out.jsonl.ckpt")
+            write_checkpoint(ckpt, {"next_batch": 1})
+            # Crash between the two renames: only the old copy is complete.
+            os.rename(ckpt, ckpt + ".old")
+            self.assertEqual(read_checkpoint(ckpt), {"next_batch": 1})
+
+    def test_check_resumable_names_changed_options(self):
+        state = {"params": {"seed": 1, "n": 10}}
+        check_resumable(state, {"seed": 1, "n": 10})
+        with self.assertRaisesRegex(ValueError, r"\(n\)"):
+            check_resumable(state, {"seed": 1, "n": 20})
+
+    def test_timer(self):
+        self.assertFalse(CheckpointTimer(None).due())
+        self.assertTrue(CheckpointTimer(0).due())
+        self.assertFalse(CheckpointTimer(3600).due())
+
+
+if __name__ == "__main__":
+    unittest.main()
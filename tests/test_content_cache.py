@@ -0,0 +1,123 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from tools.content_cache import ContentCache, SourceFingerprints, open_cache
+from tools.gen_opcode_legend import sample_steps, scan_opcodes
+
+
+def _write(root, rel, text):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+class TestSourceFingerprints(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        _write(self.root, "helpers.py", "X = 1\n")
+        _write(self.root, "pkg/__init__.py", "")
+        _write(self.root, "pkg/a.py", "import json\nfrom pkg import b\n")
+        _write(self.root, "pkg/b.py", "def f():\n    from helpers import X\n")
+        _write(self.root, "pkg/c.py", "Y = 2\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fingerprint(self, module):
+        return SourceFingerprints(root=self.root).fingerprint([module])
+
+    def test_closure_follows_repo_imports_only(self):
+        sources = SourceFingerprints(root=self.root)
+        self.assertEqual(sources.closure("pkg/a.py"),
+                         ["helpers.py", "pkg/__init__.py", "pkg/a.py", "pkg/b.py"])
+
+    def test_fingerprint_tracks_transitive_changes_only(self):
+        before = self._fingerprint("pkg.a")
+        _write(self.root, "pkg/c.py", "Y = 3\n")
+        self.assertEqual(self._fingerprint("pkg.a"), before)
+        _write(self.root, "helpers.py", "X = 2\n")
+        self.assertNotEqual(self._fingerprint("pkg.a"), before)
+
+    def test_extra_values_change_fingerprint(self):
+        sources = SourceFingerprints(root=self.root)
+        self.assertNotEqual(sources.fingerprint(["pkg.c"], 0),
+                            sources.fingerprint(["pkg.c"], 1))
+
+
+class TestContentCache(unittest.TestCase):
+    def test_round_trip_and_pruning(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = open_cache("tool", tmp)
+            cache.put("ns", "kept", "f1", {"v": [1, 2]})
+            cache.put("ns", "dropped", "f1", 0)
+            cache.save()
+
+            cache = open_cache("tool", tmp)
+            self.assertEqual(cache.get("ns", "kept", "f1"), {"v": [1, 2]})
+            self.assertIsNone(cache.get("ns", "kept", "f2"))
+            self.assertEqual(cache.summary("ns"), "1 reused, 1 regenerated")
+            cache.save()
+
+            with open(os.path.join(tmp, "tool.json"), encoding="utf-8") as fh:
+                self.assertEqual(list(json.load(fh)["entries"]["ns"]), ["kept"])
+
+    def test_unreadable_or_old_cache_starts_empty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tool.json")
+            for text in ("not json", json.dumps({"version": -1, "entries": {
+                    "ns": {"k": ["f", 1]}}})):
+                with open(path, "w", encoding="utf-8") as fh:
+                    fh.write(text)
+                self.assertIsNone(ContentCache(path).get("ns", "k", "f"))
+
+    def test_tool_change_discards_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tool = os.path.join(tmp, "tool.py")
+            _write(tmp, "tool.py", "V = 1\n")
+            cache = open_cache("tool", tmp, tool=tool)
+            cache.put("ns", "k", "f", 1)
+            cache.save()
+            self.assertEqual(open_cache("tool", tmp, tool=tool).get("ns", "k", "f"), 1)
+            _write(tmp, "tool.py", "V = 2\n")
+            self.assertIsNone(open_cache("tool", tmp, tool=tool).get("ns", "k", "f"))
+
+    def test_disabled(self):
+        self.assertIsNone(open_cache("tool", enabled=False))
+
+
+class TestCachedDocTools(unittest.TestCase):
+    def test_cached_scan_matches_fresh_scan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fresh, fresh_sites = scan_opcodes()
+            for _ in range(2):
+                cache = open_cache("legend", tmp)
+                cached, cached_sites = scan_opcodes(cache=cache)
+                cache.save()
+            self.assertEqual(cache.summary("scan").split(",")[1].strip(),
+                             "0 regenerated")
+            self.assertEqual(cached_sites, fresh_sites)
+            self.assertEqual(
+                {c: (i.arities, i.files) for c, i in cached.items()},
+                {c: (i.arities, i.files) for c, i in fresh.items()})
+
+    def test_sampled_steps_depend_only_on_seed_and_entry(self):
+        from quixi_math_datagen import GENERATOR_REGISTRY
+
+        entry = GENERATOR_REGISTRY[0]
+        first = sample_steps(entry, seed=0, samples_per_gen=20)
+        sample_steps(GENERATOR_REGISTRY[1], seed=0, samples_per_gen=20)
+        self.assertEqual(sample_steps(entry, seed=0, samples_per_gen=20), first)
+        self.assertEqual(first["Z"].split("|", 1)[0], "Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
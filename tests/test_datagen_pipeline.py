@@ -3,23 +3,30 @@ import io
 import json
 import os
 import random
+import subprocess
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
 
 import curriculum
+import quixi_math_datagen
+from dedup import HashDedup
+from jsonl_writer import JsonlWriter
 from curriculum import CURRICULUM, GRADE_LEVELS, stamp_metadata
 from quixi_math_datagen import (
     ALL_GENERATORS,
     DEFAULT_POOL_EXCLUDED,
     build_dataset,
     group_into_skills,
+    parse_shard,
     parse_weights,
     resolve_pool,
+    select_generators,
     validate_example,
 )
 from generators.multi_digit_addition_generator import MultiDigitAdditionGenerator
@@ -28,7 +35,7 @@ from generators.long_division_generator import LongDivisionGenerator
 from generators.mixed_number_operations_random import MixedNumberOperationsRandom
 
 
-from base_generator import ProblemGenerator
+from base_generator import ProblemGenerator, derive_seed, example_rng, rng_scope
 from helpers import jid
 
 
@@ -247,6 +254,61 @@ class TestSkillSampling(unittest.TestCase):
             resolve_pool([])
 
 
+class TestLazyRegistry(unittest.TestCase):
+    def _run(self, code):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run([sys.executable, "-c", code], cwd=root,
+                              capture_output=True, text=True, check=True)
+        return json.loads(proc.stdout)
+
+    def test_import_loads_no_generator_modules(self):
+        loaded = self._run(
+            "import json, sys, quixi_math_datagen\n"
+            "print(json.dumps([m for m in sys.modules "
+            "if m.startswith('generators.')]))")
+        self.assertEqual(loaded, [])
+
+    def test_selection_imports_only_selected_modules(self):
+        loaded = self._run(
+            "import json, sys, quixi_math_datagen as q\n"
+            "q.select_generators('LongDivisionGenerator')\n"
+            "print(json.dumps([m for m in sys.modules "
+            "if m.startswith('generators.')]))")
+        self.assertEqual(loaded, ["generators.long_division_generator"])
+
+    def test_cli_build_loads_only_sampled_generators(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "out.jsonl")
+            loaded = self._run(
+                "import contextlib, io, json, runpy, sys\n"
+                f"sys.argv = ['quixi_math_datagen.py', '-n', '3', '-s', '1', "
+                f"'-o', {output!r}]\n"
+                "with contextlib.redirect_stdout(io.StringIO()):\n"
+                "    runpy.run_path('quixi_math_datagen.py', run_name='__main__')\n"
+                "print(json.dumps([m for m in sys.modules "
+                "if m.startswith('generators.')]))")
+            with open(output, encoding="utf-8") as fp:
+                self.assertEqual(len(fp.readlines()), 3)
+        # Only the skills of the first attempt batch, not the whole registry
+        # (several hundred modules).
+        self.assertLess(len(loaded), 100)
+
+    def test_registry_entries_behave_like_instances(self):
+        entry = next(e for e in resolve_pool()
+                     if e.class_name == "LongDivisionGenerator")
+        self.assertEqual(entry.__class__.__name__, "LongDivisionGenerator")
+        self.assertIsInstance(entry, LongDivisionGenerator)
+        example = stamp_metadata(entry.generate(), entry)
+        self.assertEqual(example["grade_level"],
+                         CURRICULUM["LongDivisionGenerator"]["grade_level"])
+
+    def test_select_generators_returns_instances(self):
+        selected = select_generators("FractionOpGenerator")
+        self.assertEqual(len(selected), 4)
+        self.assertTrue(all(type(g).__name__ == "FractionOpGenerator"
+                            for g in selected))
+
+
 class TestParseWeights(unittest.TestCase):
     AVAILABLE = {"LongDivisionGenerator", "QuadraticGenerator"}
 
@@ -312,6 +374,39 @@ class _TinySpaceGenerator(ProblemGenerator):
         }
 
 
+class _EnumeratedTinyGenerator(_TinySpaceGenerator):
+    """_TinySpaceGenerator's 3 problems, enumerated."""
+
+    def generate(self):
+        return self.generate_from(random.randint(1, 3))
+
+    def enumerate_space(self):
+        return (1, 2, 3)
+
+    def generate_from(self, a):
+        return {
+            "problem_id": jid(),
+            "operation": "tiny_add",
+            "problem": f"{a} + 0",
+            "steps": [f"A|{a}|0|{a}", f"Z|{a}"],
+            "final_answer": str(a),
+            "grade_level": "elementary",
+            "difficulty": 1,
+        }
+
+
+class _ParaphrasingGenerator(_TinySpaceGenerator):
+    """_TinySpaceGenerator's 3 problems in 2 phrasings, with dedup keys."""
+
+    def generate(self):
+        a = random.randint(1, 3)
+        example = super().generate()
+        example["problem"] = random.choice(["{} + 0", "Add 0 to {}."]).format(a)
+        example.update(steps=[f"A|{a}|0|{a}", f"Z|{a}"], final_answer=str(a),
+                       dedup_key=(a,))
+        return example
+
+
 class TestDeduplication(unittest.TestCase):
     def test_duplicates_skipped_by_default(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -338,6 +433,36 @@ class TestDeduplication(unittest.TestCase):
             self.assertEqual(len(rows), 10)
             self.assertEqual(summary["stats"]["_TinySpaceGenerator"]["duplicates_skipped"], 0)
 
+    def test_hash_index_matches_exact_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = {}
+            for kind in ("exact", "hash64"):
+                path = os.path.join(tmp, f"{kind}.jsonl")
+                summary = quiet_build_dataset(
+                    path=path, n=40, seed=9, dedup=kind,
+                    generators=[_TinySpaceGenerator(), FactorsGenerator()])
+                self.assertEqual(summary["dedup"]["kind"], kind)
+                self.assertEqual(summary["dedup"]["keys"], summary["count"])
+                self.assertGreater(summary["dedup"]["memory_bytes"], 0)
+                self.assertEqual(summary["dedup"]["collisions"], 0)
+                with open(path, encoding="utf-8") as fp:
+                    outputs[kind] = fp.read()
+            self.assertEqual(outputs["exact"], outputs["hash64"])
+
+    def test_dedup_key_catches_paraphrases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for kind in ("exact", "hash64"):
+                path = os.path.join(tmp, f"{kind}.jsonl")
+                summary = quiet_build_dataset(path=path, n=10, seed=5, dedup=kind,
+                                              generators=[_ParaphrasingGenerator()])
+                with open(path, encoding="utf-8") as fp:
+                    rows = [json.loads(line) for line in fp]
+                with self.subTest(kind=kind):
+                    self.assertEqual(summary["count"], 3)
+                    self.assertEqual(sorted(r["final_answer"] for r in rows),
+                                     ["1", "2", "3"])
+                    self.assertTrue(all("dedup_key" not in r for r in rows))
+
     def test_errors_counted_in_stats(self):
         class _Broken(ProblemGenerator):
             def generate(self):
@@ -382,5 +507,412 @@ class TestBuildDatasetEndToEnd(unittest.TestCase):
                 self.assertEqual(f1.read(), f2.read())
 
 
+class _Interrupted(Exception):
+    pass
+
+
+class TestResumableBuild(unittest.TestCase):
+    POOL = [MultiDigitAdditionGenerator(), FactorsGenerator(),
+            LongDivisionGenerator()]
+
+    def _interrupted_build(self, path, after, **kwargs):
+        """Runs a checkpointing build that dies right after its `after`-th
+        checkpoint, leaving a partial file and the checkpoint behind."""
+        real = quixi_math_datagen.write_checkpoint
+        calls = []
+
+        def write_then_die(*args):
+            real(*args)
+            calls.append(1)
+            if len(calls) == after:
+                # Unflushed output past the checkpoint is cut on resume.
+                raise _Interrupted
+        with mock.patch.object(quixi_math_datagen, "write_checkpoint",
+                               write_then_die):
+            with self.assertRaises(_Interrupted):
+                quiet_build_dataset(path=path, checkpoint_every=0, **kwargs)
+
+    def test_resume_matches_uninterrupted_build(self):
+        for dedup_kind in ("exact", "hash64"):
+            with self.subTest(dedup=dedup_kind), \
+                    tempfile.TemporaryDirectory() as tmp:
+                options = dict(n=300, seed=8, generators=self.POOL,
+                               dedup=dedup_kind)
+                whole = os.path.join(tmp, "whole.jsonl")
+                expected = quiet_build_dataset(path=whole, **options)
+                part = os.path.join(tmp, "part.jsonl")
+                self._interrupted_build(part, 2, **options)
+                self.assertTrue(os.path.isdir(part + ".ckpt"))
+                with open(part, "a", encoding="utf-8") as fp:
+                    fp.write('{"torn": ')  # a half-written line
+                resumed = quiet_build_dataset(path=part, resume=True, **options)
+                with open(whole, "rb") as f1, open(part, "rb") as f2:
+                    self.assertEqual(f1.read(), f2.read())
+                self.assertEqual(resumed["stats"], expected["stats"])
+                self.assertEqual(resumed["attempts"], expected["attempts"])
+                self.assertFalse(os.path.exists(part + ".ckpt"))
+
+    def test_output_is_synced_before_each_checkpoint(self):
+        events = []
+        real_sync = JsonlWriter.sync
+        real_checkpoint = quixi_math_datagen.write_checkpoint
+
+        def sync(writer):
+            real_sync(writer)
+            events.append(("sync", writer.tell()))
+
+        def checkpoint(directory, state, dedup_index=None):
+            events.append(("checkpoint", state["offset"]))
+            real_checkpoint(directory, state, dedup_index)
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(JsonlWriter, "sync", sync), \
+                mock.patch.object(quixi_math_datagen, "write_checkpoint", checkpoint):
+            quiet_build_dataset(path=os.path.join(tmp, "out.jsonl.gz"), n=200, seed=2,
+                                generators=self.POOL, checkpoint_every=0)
+        checkpoints = [i for i, (kind, _) in enumerate(events) if kind == "checkpoint"]
+        self.assertGreater(len(checkpoints), 1)
+        for i in checkpoints:
+            self.assertEqual(events[i - 1], ("sync", events[i][1]))
+
+    def test_resume_with_spilled_hash_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            def index():
+                # A 64-slot table spills every ~50 keys.
+                return HashDedup(64, capacity=64, memory_limit=512,
+                                 spill_dir=tmp)
+            options = dict(n=400, seed=3, generators=self.POOL)
+            whole = os.path.join(tmp, "whole.jsonl")
+            quiet_build_dataset(path=whole, dedup=index(), **options)
+            part = os.path.join(tmp, "part.jsonl")
+            self._interrupted_build(part, 4, dedup=index(), **options)
+            restored = index()
+            quiet_build_dataset(path=part, resume=True, dedup=restored, **options)
+            self.assertGreater(restored.disk_bytes(), 0)
+            restored.close()
+            with open(whole, "rb") as f1, open(part, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+    def test_resume_rejects_changed_options(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.jsonl")
+            self._interrupted_build(path, 1, n=200, seed=1, generators=self.POOL)
+            with self.assertRaisesRegex(ValueError, "seed"):
+                quiet_build_dataset(path=path, n=200, seed=2,
+                                    generators=self.POOL, resume=True)
+
+    def test_resume_without_checkpoint_starts_fresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.jsonl")
+            summary = quiet_build_dataset(path=path, n=20, seed=4,
+                                          generators=self.POOL, resume=True)
+            self.assertEqual(summary["count"], 20)
+
+
+class TestRngStreams(unittest.TestCase):
+    def test_sample_is_keyed_by_stream(self):
+        gen = FactorsGenerator()  # legacy global-random generator
+        a = gen.sample(example_rng(3, 0))
+        b = gen.sample(example_rng(3, 0))
+        c = gen.sample(example_rng(3, 1))
+        self.assertEqual(a, b)
+        self.assertNotEqual(a["problem_id"], c["problem_id"])
+
+    def test_rng_scope_leaves_global_state_alone(self):
+        random.seed(99)
+        state = random.getstate()
+        with rng_scope(random.Random(1)):
+            random.randint(1, 10)
+            jid()
+        self.assertEqual(random.getstate(), state)
+
+    def test_native_and_shimmed_paths_agree(self):
+        gen = MultiDigitAdditionGenerator()
+        self.assertTrue(gen.accepts_rng)
+        native = gen.sample(example_rng(5, 2))
+        with rng_scope(example_rng(5, 2)):
+            shimmed = gen.generate()
+        self.assertEqual(native, shimmed)
+
+    def test_derive_seed_distinguishes_keys(self):
+        self.assertNotEqual(derive_seed(1, 23), derive_seed(12, 3))
+        self.assertEqual(derive_seed(1, 23), derive_seed(1, 23))
+
+
+class TestGenerateMany(unittest.TestCase):
+    def test_default_matches_repeated_sample(self):
+        for gen in (FactorsGenerator(), LongDivisionGenerator(estimate=True)):
+            with self.subTest(gen=type(gen).__name__):
+                rng = example_rng(8, 0)
+                singles = [gen.sample(rng) for _ in range(5)]
+                batch = ProblemGenerator.generate_many(gen, 5, example_rng(8, 0))
+                self.assertEqual(batch, singles)
+
+    def test_one_failing_draw_costs_one_attempt(self):
+        class _Flaky(ProblemGenerator):
+            calls = 0
+
+            def generate(self):
+                _Flaky.calls += 1
+                if _Flaky.calls % 3 == 0:
+                    raise RuntimeError("flaky")
+                return _TinySpaceGenerator().generate()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "flaky.jsonl")
+            summary = quiet_build_dataset(path=path, n=3, seed=2,
+                                          generators=[_Flaky()],
+                                          allow_duplicates=True)
+            stats = summary["stats"]["_Flaky"]
+            self.assertEqual(stats["emitted"], 3)
+            self.assertLessEqual(stats["errors"], 1)
+
+
+class TestEnumeratedSpaces(unittest.TestCase):
+    def test_walk_emits_each_problem_once_and_stops_exactly(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "walk.jsonl")
+            summary = quiet_build_dataset(path=path, n=10, seed=5,
+                                          generators=[_EnumeratedTinyGenerator()],
+                                          enumerate_spaces=True)
+            with open(path, encoding="utf-8") as fp:
+                rows = [json.loads(line) for line in fp]
+            self.assertEqual(sorted(r["problem"] for r in rows),
+                             ["1 + 0", "2 + 0", "3 + 0"])
+            self.assertEqual(summary["attempts"], 3)
+            self.assertEqual(summary["stats"]["_EnumeratedTinyGenerator"]
+                             ["duplicates_skipped"], 0)
+            self.assertEqual(summary["spaces"],
+                             {"_EnumeratedTinyGenerator": {"size": 3, "walked": 3}})
+
+    def test_order_depends_on_seed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            orders = set()
+            for seed in range(6):
+                path = os.path.join(tmp, f"{seed}.jsonl")
+                quiet_build_dataset(path=path, n=3, seed=seed,
+                                    generators=[_EnumeratedTinyGenerator()],
+                                    enumerate_spaces=True)
+                with open(path, encoding="utf-8") as fp:
+                    orders.add(tuple(json.loads(line)["problem"] for line in fp))
+            self.assertGreater(len(orders), 1)
+
+    def test_mixed_pool_keeps_sampling_open_spaces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mixed.jsonl")
+            summary = quiet_build_dataset(
+                path=path, n=40, seed=2, enumerate_spaces=True,
+                generators=[_EnumeratedTinyGenerator(), FactorsGenerator()])
+            self.assertEqual(summary["count"], 40)
+            self.assertEqual(summary["stats"]["_EnumeratedTinyGenerator"]["emitted"], 3)
+            self.assertEqual(summary["spaces"]["_EnumeratedTinyGenerator"]["walked"], 3)
+
+    def test_walk_is_independent_of_workers_and_resumable(self):
+        from generators.primality_test_generator import PrimalityTestGenerator
+
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=300, seed=4, enumerate_spaces=True,
+                           generators=[PrimalityTestGenerator(), FactorsGenerator()])
+            texts = []
+            for workers in (1, 2):
+                path = os.path.join(tmp, f"w{workers}.jsonl")
+                quiet_build_dataset(path=path, workers=workers, **options)
+                with open(path, encoding="utf-8") as fp:
+                    texts.append(fp.read())
+            self.assertEqual(texts[0], texts[1])
+            rows = [json.loads(line) for line in texts[0].splitlines()]
+            primality = [r for r in rows if r["operation"].startswith("primality")]
+            self.assertEqual(len({r["problem"] for r in primality}), len(primality))
+
+            part = os.path.join(tmp, "part.jsonl")
+            TestResumableBuild()._interrupted_build(part, 2, **options)
+            resumed = quiet_build_dataset(path=part, resume=True, **options)
+            with open(part, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), texts[0])
+            self.assertEqual(resumed["spaces"]["PrimalityTestGenerator"]["walked"],
+                             len(primality))
+
+
+class TestMixAndExactCounts(unittest.TestCase):
+    POOL = [MultiDigitAdditionGenerator(), FactorsGenerator(),
+            LongDivisionGenerator()]
+
+    @staticmethod
+    def _rows(path):
+        with open(path, encoding="utf-8") as fp:
+            return [json.loads(line) for line in fp]
+
+    def test_mix_targets_difficulty_share(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mix.jsonl")
+            # FactorsGenerator is the pool's only difficulty-1 skill.
+            quiet_build_dataset(path=path, n=400, seed=2, generators=self.POOL,
+                                mix="difficulty=1:0.6")
+            rows = self._rows(path)
+            share = sum(r["operation"].startswith("factors") for r in rows) / len(rows)
+            self.assertAlmostEqual(share, 0.6, delta=0.07)
+
+    def test_exact_counts_hit_every_quota(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=250, seed=6, generators=self.POOL,
+                           weights={"FactorsGenerator": 3.0},
+                           exact_counts=True)
+            texts = []
+            for workers in (1, 2):
+                path = os.path.join(tmp, f"w{workers}.jsonl")
+                summary = quiet_build_dataset(path=path, workers=workers, **options)
+                with open(path, encoding="utf-8") as fp:
+                    texts.append(fp.read())
+            self.assertEqual(texts[0], texts[1])
+            self.assertEqual(summary["count"], 250)
+            self.assertEqual(summary["quotas"], {
+                "MultiDigitAdditionGenerator": {"target": 50, "emitted": 50},
+                "FactorsGenerator": {"target": 150, "emitted": 150},
+                "LongDivisionGenerator": {"target": 50, "emitted": 50},
+            })
+            emitted = sum(s["emitted"] for s in summary["stats"].values())
+            self.assertEqual(emitted, 250)
+
+    def test_exact_counts_give_up_on_an_exhausted_skill(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tiny.jsonl")
+            summary = quiet_build_dataset(
+                path=path, n=20, seed=1, exact_counts=True,
+                generators=[_TinySpaceGenerator(), FactorsGenerator()])
+            self.assertEqual(summary["quotas"]["_TinySpaceGenerator"],
+                             {"target": 10, "emitted": 3})
+            self.assertEqual(summary["quotas"]["FactorsGenerator"],
+                             {"target": 10, "emitted": 10})
+            self.assertEqual(summary["count"], 13)
+
+    def test_exact_counts_resume(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=300, seed=9, generators=self.POOL, exact_counts=True,
+                           mix="difficulty=2:0.5")
+            whole = os.path.join(tmp, "whole.jsonl")
+            expected = quiet_build_dataset(path=whole, **options)
+            part = os.path.join(tmp, "part.jsonl")
+            TestResumableBuild()._interrupted_build(part, 3, **options)
+            resumed = quiet_build_dataset(path=part, resume=True, **options)
+            with open(whole, "rb") as f1, open(part, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+            self.assertEqual(resumed["quotas"], expected["quotas"])
+
+    def test_exact_counts_reject_enumerated_spaces(self):
+        with self.assertRaises(ValueError):
+            quiet_build_dataset(path=os.devnull, n=1, exact_counts=True,
+                                enumerate_spaces=True)
+
+
+class TestParallelBuild(unittest.TestCase):
+    def _build(self, path, **kwargs):
+        summary = quiet_build_dataset(path=path, **kwargs)
+        with open(path, encoding="utf-8") as fp:
+            return summary, fp.read()
+
+    def test_output_independent_of_worker_count(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kwargs = dict(n=60, seed=11,
+                          generators=[MultiDigitAdditionGenerator(),
+                                      LongDivisionGenerator(),
+                                      FactorsGenerator()])
+            s1, t1 = self._build(os.path.join(tmp, "a.jsonl"), workers=1,
+                                 **kwargs)
+            s2, t2 = self._build(os.path.join(tmp, "b.jsonl"), workers=2,
+                                 **kwargs)
+            s3, t3 = self._build(os.path.join(tmp, "c.jsonl"), workers=3,
+                                 **kwargs)
+            self.assertEqual(t1, t2)
+            self.assertEqual(t1, t3)
+            # Only the output writer's throughput is timing-dependent.
+            s1["output"].pop("mb_per_s")
+            s2["output"].pop("mb_per_s")
+            self.assertEqual(s1, s2)
+
+    def test_parallel_build_dedups_and_counts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary, text = self._build(os.path.join(tmp, "p.jsonl"), n=10,
+                                        seed=5, workers=2,
+                                        generators=[_TinySpaceGenerator()])
+            rows = [json.loads(line) for line in text.splitlines()]
+            self.assertEqual(len(rows), 3)
+            self.assertEqual(summary["count"], 3)
+            stats = summary["stats"]["_TinySpaceGenerator"]
+            self.assertEqual(stats["emitted"], 3)
+            self.assertEqual(stats["emitted"] + stats["duplicates_skipped"]
+                             + stats["errors"], summary["attempts"])
+
+    def test_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            quiet_build_dataset(path=os.devnull, n=1, workers=0)
+
+
+class TestShardedBuild(unittest.TestCase):
+    POOL = [MultiDigitAdditionGenerator(), FactorsGenerator(),
+            _TinySpaceGenerator()]
+
+    def _shards(self, tmp, count, **options):
+        paths = [os.path.join(tmp, f"shard-{i}.jsonl") for i in range(count)]
+        for i, path in enumerate(paths):
+            quiet_build_dataset(path=path, shard=(i, count), **options)
+        return paths
+
+    def test_merge_matches_single_process_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=300, seed=4, generators=self.POOL)
+            whole = os.path.join(tmp, "whole.jsonl")
+            expected = quiet_build_dataset(path=whole, **options)
+            paths = self._shards(tmp, 3, **options)
+            merged = os.path.join(tmp, "merged.jsonl")
+            summary = quiet_build_dataset(path=merged, merge=paths, **options)
+            with open(whole, "rb") as f1, open(merged, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+            self.assertEqual(summary["stats"], expected["stats"])
+            self.assertEqual(summary["attempts"], expected["attempts"])
+            # The tiny space repeats across shards; the merge drops those.
+            self.assertGreater(expected["stats"]["_TinySpaceGenerator"]
+                               ["duplicates_skipped"], 0)
+
+    def test_merge_generates_what_the_shards_lack(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=200, seed=6, generators=self.POOL)
+            whole = os.path.join(tmp, "whole.jsonl")
+            quiet_build_dataset(path=whole, **options)
+            paths = self._shards(tmp, 2, **options)
+            # Shard 1 stops after its first two batches (header + 2 lines).
+            with open(paths[1], encoding="utf-8") as fp:
+                lines = fp.readlines()
+            with open(paths[1], "w", encoding="utf-8") as fp:
+                fp.writelines(lines[:3])
+            merged = os.path.join(tmp, "merged.jsonl")
+            for workers in (1, 2):
+                quiet_build_dataset(path=merged, merge=paths, workers=workers,
+                                    **options)
+                with open(whole, "rb") as f1, open(merged, "rb") as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+    def test_merge_checks_shard_set_and_options(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=50, seed=2, generators=self.POOL)
+            paths = self._shards(tmp, 2, **options)
+            out = os.path.join(tmp, "out.jsonl")
+            with self.assertRaisesRegex(ValueError, "seed"):
+                quiet_build_dataset(path=out, merge=paths,
+                                    **{**options, "seed": 3})
+            with self.assertRaisesRegex(ValueError, "i/N set"):
+                quiet_build_dataset(path=out, merge=paths[:1], **options)
+            with self.assertRaisesRegex(ValueError, "seed"):
+                quiet_build_dataset(path=out, n=10, shard=(0, 2))
+            with self.assertRaises(ValueError):
+                quiet_build_dataset(path=out, shard=(0, 2), exact_counts=True,
+                                    **options)
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/5"), (2, 5))
+        for spec in ("5/5", "-1/2", "1", "a/b", "0/0"):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                parse_shard(spec)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,258 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import dedup
+from dedup import (ExactDedup, HashDedup, key_digest, make_dedup_index,
+                   semantic_digest)
+
+
+def _keys(n, space, seed=0):
+    rng = random.Random(seed)
+    return [("op", f"{rng.randrange(space)} + 1") for _ in range(n)]
+
+
+def _expected(keys):
+    seen = set()
+    out = []
+    for key in keys:
+        out.append(key not in seen)
+        seen.add(key)
+    return out
+
+
+class TestDedupIndexes(unittest.TestCase):
+    def test_backends_agree_with_a_set(self):
+        keys = _keys(5000, 2000)
+        for index in (ExactDedup(), HashDedup(64), HashDedup(128)):
+            with self.subTest(kind=index.kind):
+                self.assertEqual([index.add(k) for k in keys], _expected(keys))
+                self.assertEqual(len(index), len(set(keys)))
+
+    def test_table_grows_past_initial_capacity(self):
+        index = HashDedup(64, capacity=1024)
+        keys = _keys(3000, 10 ** 9)
+        self.assertEqual([index.add(k) for k in keys], _expected(keys))
+        self.assertGreater(index.table_bytes(), 1024 * 8)
+
+    def test_zero_digest_is_storable(self):
+        index = HashDedup(128)
+        self.assertTrue(index.add_digest(0))
+        self.assertFalse(index.add_digest(0))
+
+    def test_digest_collisions_are_kept_and_counted(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(dedup, "MAX_RUNS", 2):
+            for bits in (64, 128):
+                index = HashDedup(bits, capacity=1024, memory_limit=4096,
+                                  spill_dir=tmp)
+                with self.subTest(bits=bits):
+                    digest = 12345 << (bits - 32)
+                    self.assertTrue(index.add_digest(digest, tag=1))
+                    self.assertFalse(index.add_digest(digest, tag=1))
+                    self.assertTrue(index.add_digest(digest, tag=2))
+                    self.assertEqual((len(index), index.collisions), (2, 1))
+                    # The same holds once both entries are in spilled runs.
+                    for k in range(3000):
+                        index.add(("op", f"{k} + 1"))
+                    self.assertGreater(index.disk_bytes(), 0)
+                    self.assertFalse(index.add_digest(digest, tag=2))
+                    self.assertTrue(index.add_digest(digest, tag=3))
+                    self.assertEqual(index.collisions, 2)
+                    self.assertIn("2 digest collision(s) kept", index.describe())
+                    snapshot = tempfile.mkdtemp(dir=tmp)
+                    index.save(snapshot)
+                    restored = HashDedup(bits)
+                    restored.restore(snapshot)
+                    self.assertEqual(restored.collisions, 2)
+                    self.assertFalse(restored.add_digest(digest, tag=1))
+                    self.assertTrue(restored.add_digest(digest, tag=4))
+                    self.assertEqual(restored.collisions, 3)
+                index.close()
+                restored.close()
+        self.assertEqual(ExactDedup().collisions, 0)
+
+    def test_collision_policies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for policy in ("drop", "error"):
+                for spilled in (False, True):
+                    index = HashDedup(64, capacity=1024, memory_limit=4096,
+                                      spill_dir=tmp, on_collision=policy)
+                    with self.subTest(policy=policy, spilled=spilled):
+                        digest = 12345 << 32
+                        self.assertTrue(index.add_digest(digest, tag=1))
+                        if spilled:
+                            for k in range(3000):
+                                index.add(("op", f"{k} + 1"))
+                            self.assertGreater(index.disk_bytes(), 0)
+                        size = len(index)
+                        if policy == "drop":
+                            self.assertFalse(index.add_digest(digest, tag=2))
+                        else:
+                            with self.assertRaisesRegex(RuntimeError, "collision"):
+                                index.add_digest(digest, tag=2)
+                        self.assertEqual((len(index), index.collisions), (size, 1))
+                        # The stored key is still a plain duplicate.
+                        self.assertFalse(index.add_digest(digest, tag=1))
+                        self.assertEqual(index.collisions, 1)
+                    index.close()
+        index = HashDedup(64, on_collision="drop")
+        index.add_digest(1, tag=1)
+        index.add_digest(1, tag=2)
+        self.assertIn("1 digest collision(s) dropped", index.describe())
+        with self.assertRaises(ValueError):
+            HashDedup(64, on_collision="ignore")
+
+    def test_tagged_digests_of_keys(self):
+        key = ("op", "1 + 1")
+        for bits in (64, 128):
+            digest, tag = dedup._tagged_digest(key, bits)
+            self.assertLess(digest, 2 ** bits)
+            self.assertLess(tag, 2 ** 16)
+        semantic = semantic_digest("op", (3, "+", 4))
+        self.assertEqual(dedup._tagged_digest(semantic, 128), (semantic, 0))
+        self.assertEqual(dedup._tagged_digest(semantic, 64),
+                         (semantic >> 64, (semantic >> 48) & 0xFFFF))
+
+    def test_restore_rejects_untagged_snapshot(self):
+        index = HashDedup(64)
+        index.add(("op", "1 + 1"))
+        with tempfile.TemporaryDirectory() as tmp:
+            index.save(tmp)
+            with open(os.path.join(tmp, "meta.json")) as fp:
+                meta = json.load(fp)
+            del meta["tag_bytes"]
+            with open(os.path.join(tmp, "meta.json"), "w") as fp:
+                json.dump(meta, fp)
+            with self.assertRaises(ValueError):
+                HashDedup(64).restore(tmp)
+
+    def test_spilling_index_stays_exact_and_bounded(self):
+        keys = _keys(20000, 12000, seed=3)
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(dedup, "MAX_RUNS", 3):
+            for bits in (64, 128):
+                index = HashDedup(bits, memory_limit=20 * 1024, spill_dir=tmp)
+                with self.subTest(bits=bits):
+                    self.assertEqual([index.add(k) for k in keys],
+                                     _expected(keys))
+                    self.assertEqual(len(index), len(set(keys)))
+                    self.assertLessEqual(index.table_bytes(), 20 * 1024)
+                    self.assertGreater(index.disk_bytes(), 0)
+                    self.assertIn("spilled", index.describe())
+                index.close()
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_snapshot_round_trip(self):
+        keys = _keys(6000, 4000, seed=5)
+        first, rest = keys[:3000], keys[3000:]
+        with tempfile.TemporaryDirectory() as tmp:
+            for make in (ExactDedup,
+                         lambda: HashDedup(128),
+                         lambda: HashDedup(64, capacity=64, memory_limit=512,
+                                           spill_dir=tmp)):
+                index = make()
+                with self.subTest(kind=index.kind):
+                    for key in first:
+                        index.add(key)
+                    snapshot = tempfile.mkdtemp(dir=tmp)
+                    index.save(snapshot)
+                    restored = make()
+                    restored.restore(snapshot)
+                    self.assertEqual(len(restored), len(index))
+                    self.assertEqual([restored.add(k) for k in rest],
+                                     [index.add(k) for k in rest])
+                index.close()
+                restored.close()
+
+    def test_restore_rejects_other_width(self):
+        index = HashDedup(64)
+        index.add(("op", "1 + 1"))
+        with tempfile.TemporaryDirectory() as tmp:
+            index.save(tmp)
+            with self.assertRaises(ValueError):
+                HashDedup(128).restore(tmp)
+
+    def test_key_digest_width(self):
+        key = ("op", "1 + 1")
+        self.assertLess(key_digest(key, 64), 2 ** 64)
+        self.assertNotEqual(key_digest(key, 128), key_digest(("op", "1 + 2"), 128))
+
+    def test_semantic_digest_keys(self):
+        digest = semantic_digest("op", (3, "+", 4))
+        self.assertLess(digest, 2 ** 128)
+        self.assertEqual(digest, semantic_digest("op", (3, "+", 4)))
+        self.assertNotEqual(digest, semantic_digest("op", (4, "+", 3)))
+        self.assertNotEqual(digest, semantic_digest("op2", (3, "+", 4)))
+        # A digest is its own 128-bit key digest, truncated for 64 bits.
+        self.assertEqual(key_digest(digest, 128), digest)
+        self.assertEqual(key_digest(digest, 64), digest >> 64)
+
+    def test_backends_accept_semantic_keys(self):
+        keys = [semantic_digest("op", (k % 50,)) for k in range(200)]
+        keys += _keys(200, 100)
+        for index in (ExactDedup(), HashDedup(64), HashDedup(128)):
+            with self.subTest(kind=index.kind):
+                self.assertEqual([index.add(k) for k in keys], _expected(keys))
+                self.assertGreater(index.memory_bytes(), 0)
+
+    def test_make_dedup_index_options(self):
+        self.assertIsInstance(make_dedup_index("exact"), ExactDedup)
+        self.assertEqual(make_dedup_index("hash128").bits, 128)
+        self.assertEqual(make_dedup_index("hash64", on_collision="drop").on_collision,
+                         "drop")
+        self.assertIsInstance(make_dedup_index("exact", on_collision="error"), ExactDedup)
+        for bad in (("nope", None), ("exact", 64), ("hash64", 0),
+                    ("hash64", None, None, "ignore")):
+            with self.assertRaises(ValueError, msg=bad):
+                make_dedup_index(*bad)
+
+
+class TestGeneratorDedupKeys(unittest.TestCase):
+    def test_equal_keys_are_the_same_problem(self):
+        from quixi_math_datagen import select_generators
+        from tools.dedup_key_report import emits_dedup_key
+        from tools.probe_generator_capacity import grouped_generators
+        from base_generator import example_rng
+
+        emitting = [(name, instances) for name, instances
+                    in grouped_generators(select_generators(None))
+                    if emits_dedup_key(instances)]
+        self.assertGreaterEqual(len(emitting), 15)
+        for name, instances in emitting:
+            solutions = {}
+            for i in range(150):
+                rng = example_rng(1, name, i)
+                example = rng.choice(instances).sample(rng)
+                key = semantic_digest(example["operation"], example["dedup_key"])
+                solution = (example["steps"], example["final_answer"])
+                with self.subTest(generator=name, key=example["dedup_key"]):
+                    self.assertEqual(solutions.setdefault(key, solution), solution)
+
+    def test_report_counts_paraphrases(self):
+        from quixi_math_datagen import select_generators
+        from tools.dedup_key_report import build_report
+
+        report = build_report(
+            select_generators("JacobiSymbolGenerator,ErrorSpottingGenerator"),
+            rows=600, repeat=1)
+        by_name = {row["generator"]: row for row in report}
+        self.assertEqual(set(by_name), {"JacobiSymbolGenerator",
+                                        "ErrorSpottingGenerator"})
+        self.assertGreater(by_name["JacobiSymbolGenerator"]["extra"], 0)
+        for row in report:
+            self.assertEqual(row["attempts"], 300)
+            self.assertEqual(row["extra"],
+                             row["text_unique"] - row["semantic_unique"])
+
+
+if __name__ == "__main__":
+    unittest.main()
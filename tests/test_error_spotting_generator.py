@@ -131,6 +131,15 @@ class TestErrorSpottingGenerator(unittest.TestCase):
             self.assertIn("CHECK", tail)
             self.assertEqual(tail[-1], "Z")
 
+    def test_dedup_key_identifies_the_problem(self):
+        problems = {}
+        for _ in range(300):
+            result = self.gen.generate()
+            key = (result["operation"], result["dedup_key"])
+            self.assertEqual(problems.setdefault(key, result["problem"]),
+                             result["problem"])
+        self.assertEqual(len(set(problems.values())), len(problems))
+
     def test_modes_reachable_and_fixed(self):
         seen = {self.gen.generate()["operation"] for _ in range(60)}
         self.assertEqual(seen, {"error_spotting_equation",
@@ -0,0 +1,145 @@
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+
+import example_server
+from example_server import (CHUNK_ROWS, ExampleFilter, ExampleService, _serve_rows,
+                            make_server, parse_address, parse_filter)
+from example_stream import iter_examples
+from quixi_math_datagen import select_generators
+from tools.load_test_server import percentile, run_load
+
+SKILLS = "LongDivisionGenerator,FactorsGenerator,TotientGenerator"
+
+_tasks = 0
+
+
+def _failing_second_task(example_filter, seed, n):
+    """_serve_rows, except that a worker process's second task fails."""
+    global _tasks
+    _tasks += 1
+    if _tasks == 2:
+        raise RuntimeError("worker failed mid-refill")
+    return _serve_rows(example_filter, seed, n)
+
+
+class TestParsing(unittest.TestCase):
+    def test_filter(self):
+        self.assertEqual(parse_filter("B,A", "college", "2-3,5"),
+                         ExampleFilter(("A", "B"), ("college",), (2, 3, 5)))
+        self.assertEqual(parse_filter(), ExampleFilter())
+        with self.assertRaises(ValueError):
+            parse_filter(difficulty="0-9")
+        with self.assertRaises(ValueError):
+            parse_filter(grade_level="kindergarten")
+
+    def test_address(self):
+        self.assertEqual(parse_address("9000"), ("127.0.0.1", 9000))
+        self.assertEqual(parse_address("0.0.0.0:80"), ("0.0.0.0", 80))
+        with self.assertRaises(ValueError):
+            parse_address("localhost")
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+
+class TestRefillFailure(unittest.TestCase):
+    def test_failed_refill_reaches_the_next_batch(self):
+        with mock.patch.object(example_server, "_serve_rows", _failing_second_task), \
+                ExampleService(select_generators("LongDivisionGenerator"), workers=1,
+                               prefetch_rows=CHUNK_ROWS) as service:
+            # The first task fills the buffer; taking all of it queues the
+            # refill that fails.
+            self.assertEqual(len(service.batch(CHUNK_ROWS)), CHUNK_ROWS)
+            with self.assertRaisesRegex(RuntimeError, "worker failed mid-refill"):
+                service.batch(10)
+            buffer = service._buffers[ExampleFilter()]
+            self.assertEqual((buffer.in_flight, buffer.error), (0, None))
+            # The error is raised once; the next batch refills again.
+            self.assertEqual(len(service.batch(10)), 10)
+
+
+class TestExampleServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ExampleService(select_generators(SKILLS), workers=2,
+                                     prefetch_rows=64)
+        cls.server = make_server(cls.service, port=0)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.base + path) as response:
+            return response.headers, response.read().decode("utf-8")
+
+    def rows(self, path):
+        _, body = self.get(path)
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_seeded_batches_are_reproducible(self):
+        first = self.rows("/examples?n=40&seed=12")
+        self.assertEqual(len(first), 40)
+        self.assertEqual(self.rows("/examples?n=40&seed=12"), first)
+        self.assertNotEqual(self.rows("/examples?n=40&seed=13"), first)
+        expected = list(iter_examples(12, generators=select_generators(SKILLS), n=40))
+        self.assertEqual(first, expected)
+
+    def test_filters(self):
+        rows = self.rows("/examples?n=30&seed=1&grade_level=college")
+        self.assertEqual({row["grade_level"] for row in rows}, {"college"})
+        rows = self.rows("/examples?n=30&difficulty=1")
+        self.assertEqual(len(rows), 30)
+        self.assertEqual({row["difficulty"] for row in rows}, {1})
+        rows = self.rows("/examples?n=30&seed=1&skill=LongDivisionGenerator")
+        self.assertEqual(rows, list(iter_examples(
+            1, generators=select_generators("LongDivisionGenerator"), n=30)))
+
+    def test_unseeded_batches_are_fresh(self):
+        first = self.rows("/examples?n=50")
+        second = self.rows("/examples?n=50")
+        self.assertEqual(len(first) + len(second), 100)
+        self.assertNotEqual([row["problem_id"] for row in first],
+                            [row["problem_id"] for row in second])
+
+    def test_bad_requests(self):
+        for path in ("/examples?n=0", "/examples?n=5&skill=NoSuchGenerator",
+                     "/examples?n=5&grade_level=graduate", "/examples?n=x"):
+            with self.subTest(path=path):
+                with self.assertRaises(urllib.error.HTTPError) as caught:
+                    self.get(path)
+                self.assertEqual(caught.exception.code, 400)
+                self.assertIn("error", json.loads(caught.exception.read()))
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            self.get("/nowhere")
+        self.assertEqual(caught.exception.code, 404)
+
+    def test_skills_and_health(self):
+        _, body = self.get("/skills")
+        self.assertEqual(sorted(entry["skill"] for entry in json.loads(body)),
+                         sorted(SKILLS.split(",")))
+        _, body = self.get("/health")
+        health = json.loads(body)
+        self.assertEqual((health["status"], health["workers"], health["skills"]),
+                         ("ok", 2, 3))
+
+    def test_load_test_reports(self):
+        result = run_load(self.base, requests=20, concurrency=4, batch=8, seeded=True)
+        self.assertEqual(result["rows"], 160)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertGreater(result["requests_per_s"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import unittest
+from itertools import islice
+from unittest import mock
+
+import quixi_math_datagen
+from dedup import ExactDedup
+from example_stream import iter_examples, worker_shard
+from generators.primality_test_generator import PrimalityTestGenerator
+from quixi_math_datagen import build_dataset
+
+
+def built_rows(n, seed, **kwargs):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.jsonl")
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_dataset(n=n, path=path, seed=seed, **kwargs)
+        with open(path, encoding="utf-8") as fp:
+            return [json.loads(line) for line in fp]
+
+
+class TestIterExamples(unittest.TestCase):
+    def test_rows_match_build(self):
+        expected = built_rows(400, 11, weights="LongDivisionGenerator=3")
+        for prefetch in (0, 2):
+            with self.subTest(prefetch=prefetch):
+                rows = list(iter_examples(seed=11, n=400,
+                                          weights="LongDivisionGenerator=3",
+                                          prefetch=prefetch))
+                self.assertEqual(rows, expected)
+
+    def test_rows_are_never_serialized(self):
+        # The stream hands over the example dicts: no JSON round trip.
+        with mock.patch.object(quixi_math_datagen, "json") as encoder:
+            encoder.dumps.side_effect = AssertionError("row serialized")
+            rows = list(iter_examples(seed=11, n=200))
+        self.assertEqual(len(rows), 200)
+
+    def test_consumer_random_does_not_change_prefetched_stream(self):
+        # Generators that draw from the global `random` (under rng_scope)
+        # run while the consumer draws from it too, from two streams.
+        expected = list(iter_examples(seed=6, n=2000))
+        global_random = random.random
+        streams = [iter_examples(seed=6, n=2000, prefetch=2) for _ in range(2)]
+        rows = [[], []]
+        for pair in zip(*streams):
+            for out, row in zip(rows, pair):
+                out.append(row)
+                for _ in range(200):
+                    random.random()
+        self.assertEqual(rows, [expected, expected])
+        self.assertIs(random.random.__self__, global_random.__self__)
+
+    def test_unbounded_stream_extends_bounded_one(self):
+        rows = list(islice(iter_examples(seed=2, prefetch=2), 150))
+        self.assertEqual(rows, list(iter_examples(seed=2, n=150)))
+
+    def test_closing_stops_producers(self):
+        before = threading.active_count()
+        stream = iter_examples(seed=4, prefetch=1)
+        next(stream)
+        stream.close()
+        self.assertEqual(threading.active_count(), before)
+
+    def test_small_space_stops(self):
+        # PrimalityTestGenerator's space is finite, so a stream without n
+        # ends once dedup rejects everything.
+        rows = list(iter_examples(seed=0, generators=[PrimalityTestGenerator()],
+                                  prefetch=2))
+        problems = [row["problem"] for row in rows]
+        self.assertEqual(len(problems), len(set(problems)))
+        self.assertLessEqual(len(rows), PrimalityTestGenerator().space_size())
+        self.assertGreater(len(rows), 0)
+
+    def test_producer_errors_reach_consumer(self):
+        with self.assertRaises(ValueError):
+            list(iter_examples(seed=1, weights="NoSuchGenerator=2"))
+        with self.assertRaises(RuntimeError):
+            list(iter_examples(seed=1, weights="NoSuchGenerator=2", prefetch=1))
+
+    def test_rejects_bad_options(self):
+        with self.assertRaises(ValueError):
+            next(iter_examples(seed=1, prefetch=-1))
+        with self.assertRaises(ValueError):
+            next(iter_examples(seed=1, prefetch=1, dedup=ExactDedup()))
+
+
+class TestWorkerShard(unittest.TestCase):
+    def test_numbering(self):
+        shards = [worker_shard(rank, 2, worker, 3) for rank in range(2)
+                  for worker in range(3)]
+        self.assertEqual(shards, [(i, 6) for i in range(6)])
+        self.assertEqual(worker_shard(), (0, 1))
+        with self.assertRaises(ValueError):
+            worker_shard(2, 2, 0, 1)
+
+    def test_worker_streams_are_disjoint_and_seeded(self):
+        streams = [[row["problem_id"] for row in
+                    iter_examples(seed=8, n=100, shard=worker_shard(0, 1, worker, 3))]
+                   for worker in range(3)]
+        ids = [problem_id for stream in streams for problem_id in stream]
+        self.assertEqual(len(ids), len(set(ids)))
+        again = [row["problem_id"] for row in
+                 iter_examples(seed=8, n=100, shard=worker_shard(0, 1, 1, 3))]
+        self.assertEqual(again, streams[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
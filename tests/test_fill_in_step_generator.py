@@ -118,6 +118,15 @@ class TestFillInStepGenerator(unittest.TestCase):
             positions.add((result["operation"], blank))
         self.assertGreaterEqual(len(positions), 7)
 
+    def test_dedup_key_identifies_the_problem(self):
+        problems = {}
+        for _ in range(300):
+            result = self.gen.generate()
+            key = (result["operation"], result["dedup_key"])
+            self.assertEqual(problems.setdefault(key, result["problem"]),
+                             result["problem"])
+        self.assertEqual(len(set(problems.values())), len(problems))
+
     def test_modes_reachable_and_fixed(self):
         seen = {self.gen.generate()["operation"] for _ in range(80)}
         self.assertEqual(seen, {"fill_in_step_equation", "fill_in_step_ratio",
@@ -0,0 +1,47 @@
+import itertools
+import os
+import random
+import sys
+import unittest
+from fractions import Fraction
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from helpers import DELIM, jid, step, step1, step2, step3
+from tools.bench_steps import legacy_step
+
+FIELDS = ["", "a", 0, 7, None, "x|", DELIM, Fraction(1, 2), 2.5, True]
+
+
+class TestStepFormatting(unittest.TestCase):
+    def test_step_matches_original_formatter(self):
+        for op in ("Z", "OP", ""):
+            for arity in range(5):
+                for fields in itertools.product(FIELDS, repeat=arity):
+                    self.assertEqual(step(op, *fields), legacy_step(op, *fields),
+                                     (op, fields))
+
+    def test_arity_variants_match_step(self):
+        for arity, fn in ((1, step1), (2, step2), (3, step3)):
+            for fields in itertools.product(FIELDS, repeat=arity):
+                self.assertEqual(fn("OP", *fields), legacy_step("OP", *fields),
+                                 fields)
+
+    def test_trailing_empties_trimmed(self):
+        self.assertEqual(step("R", 5), "R|5")
+        self.assertEqual(step("A", 1, "", 2), "A|1||2")
+        self.assertEqual(step3("B", 1, 2, ""), "B|1|2")
+        self.assertEqual(step("Z"), "Z")
+
+
+class TestJid(unittest.TestCase):
+    def test_seeded_and_uuid4_shaped(self):
+        a, b = jid(random.Random(3)), jid(random.Random(3))
+        self.assertEqual(a, b)
+        self.assertEqual(a[14], "4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import quixi_math_datagen
+from generators.factors_generator import FactorsGenerator
+from generators.multi_digit_addition_generator import MultiDigitAdditionGenerator
+from jsonl_writer import JsonlWriter, _zstd_module, codec_for, open_jsonl
+
+LINES = [f'{{"problem": "p{i}", "final_answer": "{i * i}"}}\n' for i in range(2000)]
+
+
+def _zstd_available():
+    try:
+        _zstd_module()
+    except ValueError:
+        return False
+    return True
+
+
+def read_text(path):
+    with open_jsonl(path) as fp:
+        return fp.read()
+
+
+class TestJsonlWriter(unittest.TestCase):
+    SUFFIXES = [".jsonl", ".jsonl.gz", ".jsonl.xz"] + (
+        [".jsonl.zst"] if _zstd_available() else [])
+
+    def test_codec_from_suffix(self):
+        self.assertEqual(codec_for("a.jsonl"), "none")
+        self.assertEqual(codec_for("a.jsonl.gz"), "gzip")
+        self.assertEqual(codec_for("a.jsonl.xz"), "xz")
+        self.assertEqual(codec_for("a.jsonl.zst"), "zstd")
+
+    def test_round_trip_in_many_chunks(self):
+        for suffix in self.SUFFIXES:
+            with self.subTest(suffix=suffix), tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "out" + suffix)
+                with JsonlWriter(path, chunk_bytes=4096) as writer:
+                    for line in LINES:
+                        writer.write(line)
+                self.assertEqual(read_text(path), "".join(LINES))
+                stats = writer.stats()
+                self.assertEqual(stats["bytes_in"], len("".join(LINES)))
+                self.assertEqual(stats["bytes_out"], os.path.getsize(path))
+                if suffix != ".jsonl":
+                    self.assertGreater(stats["ratio"], 1)
+
+    def test_truncate_to_flushed_offset_and_append(self):
+        # What a resumed build does: cut back to the checkpoint's tell().
+        for suffix in self.SUFFIXES:
+            with self.subTest(suffix=suffix), tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "out" + suffix)
+                writer = JsonlWriter(path, chunk_bytes=4096)
+                for line in LINES[:700]:
+                    writer.write(line)
+                writer.flush()
+                offset = writer.tell()
+                for line in LINES[700:900]:
+                    writer.write(line)
+                writer.close()
+                os.truncate(path, offset)
+                with JsonlWriter(path, "a", chunk_bytes=4096) as writer:
+                    for line in LINES[700:]:
+                        writer.write(line)
+                self.assertEqual(read_text(path), "".join(LINES))
+
+    def test_sync_fsyncs_the_flushed_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.jsonl.gz")
+            with JsonlWriter(path, chunk_bytes=4096) as writer, \
+                    mock.patch("jsonl_writer.os.fsync") as fsync:
+                for line in LINES[:300]:
+                    writer.write(line)
+                writer.sync()
+                fsync.assert_called_once_with(writer._fp.fileno())
+                self.assertEqual(writer.tell(), os.path.getsize(path))
+
+    def test_writer_thread_errors_are_raised(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = JsonlWriter(os.path.join(tmp, "out.jsonl.gz"))
+            with mock.patch.object(writer, "_compress",
+                                   side_effect=OSError("disk full")):
+                writer.write(LINES[0])
+                with self.assertRaisesRegex(OSError, "disk full"):
+                    writer.flush()
+            writer.close()
+
+    @unittest.skipIf(_zstd_available(), "zstd is available")
+    def test_zst_without_zstd_raises(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                self.assertRaisesRegex(ValueError, "zstandard"):
+            JsonlWriter(os.path.join(tmp, "out.jsonl.zst"))
+
+
+class TestCompressedBuild(unittest.TestCase):
+    POOL = [MultiDigitAdditionGenerator(), FactorsGenerator()]
+
+    def test_compressed_build_matches_plain_and_resumes(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                contextlib.redirect_stdout(io.StringIO()):
+            options = dict(n=300, seed=5, generators=self.POOL)
+            plain = os.path.join(tmp, "plain.jsonl")
+            quixi_math_datagen.build_dataset(path=plain, **options)
+            packed = os.path.join(tmp, "packed.jsonl.gz")
+            summary = quixi_math_datagen.build_dataset(path=packed, **options)
+            self.assertEqual(read_text(packed), read_text(plain))
+            self.assertEqual(summary["output"]["codec"], "gzip")
+            self.assertEqual(summary["output"]["bytes_out"], os.path.getsize(packed))
+
+            # Interrupted after its second checkpoint, then resumed.
+            part = os.path.join(tmp, "part.jsonl.gz")
+            real = quixi_math_datagen.write_checkpoint
+            calls = []
+
+            def write_then_die(*args):
+                real(*args)
+                calls.append(1)
+                if len(calls) == 2:
+                    raise KeyboardInterrupt
+            with mock.patch.object(quixi_math_datagen, "write_checkpoint",
+                                   write_then_die), \
+                    self.assertRaises(KeyboardInterrupt):
+                quixi_math_datagen.build_dataset(path=part, checkpoint_every=0,
+                                                 **options)
+            quixi_math_datagen.build_dataset(path=part, resume=True, **options)
+            self.assertEqual(read_text(part), read_text(plain))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,6 +72,15 @@ class TestLongDivisionGenerator(unittest.TestCase):
                     int(b_parts[3]) # New num
                 except ValueError:
                     self.fail(f"B step arguments are not integers: {b_step}")
+    def test_generate_many_batch(self):
+        batch = self.generator.generate_many(20, random.Random(4))
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(batch, self.generator.generate_many(20, random.Random(4)))
+        for res in batch:
+            dividend, divisor = map(int, res["problem"].split("/"))
+            q, r = divmod(dividend, divisor)
+            expected = f"{q}" + (f" R{r}" if r else "")
+            self.assertEqual(res["final_answer"], expected)
 
 if __name__ == '__main__':
     unittest.main()
@@ -51,6 +51,16 @@ class TestMultiDigitAdditionGenerator(unittest.TestCase):
             if num1 + num2 >= 10 ** len(str(max(num1, num2))):
                 self.assertTrue(carry_steps, "Expect final carry when result has extra digit")
 
+    def test_generate_many_batch(self):
+        batch = self.generator.generate_many(20, random.Random(4))
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(batch, self.generator.generate_many(20, random.Random(4)))
+        for res in batch:
+            left, right = res["problem"].split("+")
+            self.assertEqual(int(res["final_answer"]),
+                             int(left) + int(right))
+            self.assertEqual(res["steps"][-1], f"Z{DELIM}{res['final_answer']}")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,165 @@
+import itertools
+import os
+import random
+import sys
+import unittest
+from collections import Counter
+from fractions import Fraction
+from math import gcd
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from param_space import ParamSpace, mixture
+
+
+def rejection_distribution(prior, accept):
+    """Exact output distribution of "draw from `prior` until accept()"."""
+    kept = {value: p for value, p in prior.items() if accept(*value)}
+    total = sum(kept.values())
+    return {value: p / total for value, p in kept.items()}
+
+
+def uniform(*axes):
+    """Prior of independent uniform draws over the axes."""
+    size = 1
+    for axis in axes:
+        size *= len(axis)
+    return {combo: Fraction(1, size) for combo in itertools.product(*axes)}
+
+
+def alias_distribution(space):
+    """The exact distribution implied by a weighted space's alias table."""
+    n = len(space.values)
+    out = Counter()
+    for i in range(n):
+        keep = Fraction(space._cutoff[i], space._total)
+        out[space.values[i]] += Fraction(1, n) * keep
+        out[space.values[space._alias[i]]] += Fraction(1, n) * (1 - keep)
+    return {value: p for value, p in out.items() if p}
+
+
+class TestParamSpace(unittest.TestCase):
+    def test_uniform_product_matches_rejection(self):
+        space = ParamSpace.product(range(1, 7), range(1, 7),
+                                   where=lambda a, b: a < b)
+        expected = rejection_distribution(uniform(range(1, 7), range(1, 7)),
+                                          lambda a, b: a < b)
+        self.assertEqual(space.distribution(), expected)
+        self.assertEqual(len(space), 15)
+
+    def test_weighted_alias_table_is_exact(self):
+        rng = random.Random(3)
+        for _ in range(30):
+            n = rng.randint(1, 12)
+            weights = [Fraction(rng.randint(0, 9), rng.randint(1, 5)) for _ in range(n)]
+            if not any(weights):
+                continue
+            space = ParamSpace(range(n), weights)
+            total = sum(weights)
+            expected = {i: w / total for i, w in enumerate(weights) if w}
+            self.assertEqual(space.distribution(), expected)
+            if space._alias is not None:
+                self.assertEqual(alias_distribution(space), expected)
+
+    def test_mixture_models_branch_then_range(self):
+        bases = mixture(range(-9, -1), range(2, 16))
+        self.assertEqual(bases[-5], Fraction(1, 16))
+        self.assertEqual(bases[7], Fraction(1, 28))
+        self.assertEqual(sum(bases.values()), 1)
+
+    def test_sampling_uses_the_given_rng(self):
+        space = ParamSpace(["a", "b", "c"], [1, 2, 3])
+        draws = [space.sample(random.Random(5)) for _ in range(3)]
+        self.assertEqual(len(set(draws)), 1)
+        counts = Counter(space.sample(random.Random(i)) for i in range(6000))
+        self.assertLess(abs(counts["c"] / 6000 - 0.5), 0.03)
+        self.assertLess(abs(counts["a"] / 6000 - 1 / 6), 0.03)
+
+    def test_zero_weights_are_dropped_and_empty_spaces_rejected(self):
+        space = ParamSpace("abc", [0, 1, 1])
+        self.assertEqual(space.values, ("b", "c"))
+        self.assertIsNone(space._alias)
+        with self.assertRaises(ValueError):
+            ParamSpace([])
+        with self.assertRaises(ValueError):
+            ParamSpace.product(range(3), where=lambda a: a > 5)
+        with self.assertRaises(ValueError):
+            ParamSpace("ab", [1])
+
+
+class TestConvertedGenerators(unittest.TestCase):
+    """Each space has the distribution of the rejection loop it replaced."""
+
+    def test_exponent_evaluation(self):
+        from generators.exponent_generator import _evaluation_operands
+
+        for max_exponent in (2, 4, 6):
+            exponents = range(2, max_exponent + 1)
+            prior = {}
+            for base in range(-9, -1):
+                for exp in exponents:
+                    prior[base, exp] = Fraction(1, 2 * 8 * len(exponents))
+            for base in range(2, 16):
+                for exp in exponents:
+                    prior[base, exp] = Fraction(1, 2 * 14 * len(exponents))
+            expected = rejection_distribution(
+                prior, lambda b, e: abs(b) ** e <= 100000)
+            self.assertEqual(
+                _evaluation_operands(True, max_exponent).distribution(), expected)
+            expected = rejection_distribution(
+                uniform(range(2, 16), exponents), lambda b, e: abs(b) ** e <= 100000)
+            self.assertEqual(
+                _evaluation_operands(False, max_exponent).distribution(), expected)
+
+    def test_rational_exponent(self):
+        from generators import rational_exponent_generator as mod
+
+        self.assertEqual(mod.LOWEST_TERMS.distribution(), rejection_distribution(
+            uniform([2, 3, 4], range(1, 10)), lambda n, m: gcd(m, n) == 1))
+        self.assertEqual(mod.REDUCIBLE.distribution(), rejection_distribution(
+            uniform([2, 3, 4], range(1, 10)), lambda n, m: gcd(m, n) > 1 or m > n))
+        for b in (2, 3, 5, 6, 7, 10):
+            self.assertEqual(
+                mod._numeric_exponents(b).distribution(),
+                rejection_distribution(uniform([2, 3, 4], range(2, 6)),
+                                       lambda n, m: gcd(m, n) == 1 and b ** m <= 1000))
+
+    def test_radical_equation(self):
+        from generators import radical_equation_generator as mod
+
+        self.assertEqual(mod.ONE_EXTRANEOUS.distribution(), rejection_distribution(
+            uniform(range(0, 9), range(2, 10)), mod._one_extraneous_ok))
+        prior = {(r, s, a): Fraction(1, 12 * 2 * (a + 1))
+                 for r in range(1, 13) for a in (2, 3) for s in range(a + 1)}
+        self.assertEqual(mod.BOTH_VALID.distribution(),
+                         rejection_distribution(prior, mod._both_valid_ok))
+
+    def test_modular_inverse(self):
+        from generators import modular_inverse_generator as mod
+
+        prior = {(m, a): Fraction(1, 60 * 2 * m)
+                 for m in range(11, 71) for a in range(m + 1, 3 * m + 1)}
+        self.assertEqual(mod.INVERSE_PAIRS.distribution(),
+                         rejection_distribution(prior, lambda m, a: gcd(a, m) == 1))
+        prior = {(m, r): Fraction(1, 14 * (m - 2))
+                 for m in range(5, 19) for r in range(2, m)}
+        self.assertEqual(mod.REDUCED_UNITS.distribution(),
+                         rejection_distribution(prior, lambda m, r: gcd(r, m) == 1))
+
+    def test_factor_trinomial(self):
+        from generators import factor_trinomial_generator as mod
+
+        roots = mod.NONZERO_ROOTS
+        self.assertEqual(mod.MONIC_ROOTS.distribution(), rejection_distribution(
+            uniform(roots, roots), lambda p, q: p != q and p + q != 0))
+        coefs = [v for v in range(-6, 7) if v != 0]
+        self.assertEqual(
+            mod._general_factors().distribution(),
+            rejection_distribution(uniform(range(1, 5), range(1, 5), coefs, coefs),
+                                   mod.FactorTrinomialGenerator._general_ok))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import parquet_writer
+from generators.factors_generator import FactorsGenerator
+from generators.fraction_op_generator import FractionOpGenerator
+from parquet_writer import DICTIONARY_COLUMNS, text_for_example, with_text
+from quixi_math_datagen import build_dataset
+from tools import bench_parquet_output
+
+POOL = [FactorsGenerator(), FractionOpGenerator("+"), FractionOpGenerator("*")]
+
+
+def quiet_build(**kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_dataset(**kwargs)
+
+
+class TestParquetOutput(unittest.TestCase):
+    def test_parquet_rows_match_jsonl_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=250, seed=3, generators=POOL)
+            jsonl = os.path.join(tmp, "out.jsonl")
+            quiet_build(path=jsonl, **options)
+            path = os.path.join(tmp, "out.parquet")
+            summary = quiet_build(path=path, output_format="parquet",
+                                  row_group_rows=100, **options)
+            with open(jsonl, encoding="utf-8") as fp:
+                expected = [json.loads(line) for line in fp]
+            table = pq.read_table(path)
+            rows = table.to_pylist()
+            self.assertEqual([{key: row[key] for key in expected[0]} for row in rows],
+                             expected)
+            self.assertEqual({row["generator"] for row in rows},
+                             {"FactorsGenerator", "FractionOpGenerator"})
+            self.assertEqual({row["generator_label"] for row in rows},
+                             {"FactorsGenerator", "FractionOpGenerator(+)",
+                              "FractionOpGenerator(*)"})
+            for name in DICTIONARY_COLUMNS:
+                self.assertTrue(pa.types.is_dictionary(table.schema.field(name).type))
+            self.assertNotIn("text", table.column_names)
+            self.assertEqual(pq.ParquetFile(path).metadata.num_row_groups, 3)
+            self.assertEqual(summary["output"]["rows"], 250)
+            self.assertEqual(summary["output"]["bytes_out"], os.path.getsize(path))
+
+    def test_builds_hand_over_dicts(self):
+        # Rows reach the writer as dicts: nothing is parsed back from JSON.
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(parquet_writer, "json") as parser:
+            parser.loads.side_effect = AssertionError("row reparsed")
+            for workers in (1, 2):
+                path = os.path.join(tmp, f"out{workers}.parquet")
+                summary = quiet_build(path=path, n=80, seed=5, generators=POOL,
+                                      workers=workers, output_format="parquet")
+                self.assertEqual(pq.read_table(path).num_rows, 80)
+                self.assertGreater(summary["output"]["bytes_in"], 0)
+
+    def test_text_is_stored_or_derived_identically(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(n=60, seed=4, generators=POOL, output_format="parquet")
+            bare = os.path.join(tmp, "bare.parquet")
+            stored = os.path.join(tmp, "text.parquet")
+            quiet_build(path=bare, **options)
+            quiet_build(path=stored, parquet_text=True, **options)
+            table = pq.read_table(stored)
+            self.assertEqual(with_text(pq.read_table(bare)).to_pylist(),
+                             table.to_pylist())
+            row = table.to_pylist()[0]
+            self.assertEqual(row["text"], text_for_example(row))
+
+    def test_parquet_builds_cannot_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.parquet")
+            for extra in ({"checkpoint_every": 0}, {"resume": True},
+                          {"shard": (0, 2)}):
+                with self.subTest(**extra), self.assertRaisesRegex(ValueError, "Parquet"):
+                    quiet_build(path=path, n=5, seed=1, output_format="parquet",
+                                **extra)
+            with self.assertRaisesRegex(ValueError, "output_format"):
+                quiet_build(path=path, n=5, seed=1, output_format="csv")
+
+    def test_bench_layouts_hold_the_same_rows(self):
+        lines, generators, labels = bench_parquet_output.build_rows(40, seed=2)
+        results = bench_parquet_output.bench(lines, generators, labels,
+                                             repeat=1, check=True)
+        self.assertEqual(set(results), set(bench_parquet_output.LAYOUTS))
+        self.assertLess(results["parquet"][0], results["release"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from param_space import Chain, Product
+from permutation import FeistelPermutation
+
+
+class TestFeistelPermutation(unittest.TestCase):
+    def test_is_a_bijection(self):
+        for size in (1, 2, 3, 4, 5, 17, 64, 100, 675, 1000, 4097):
+            perm = FeistelPermutation(size, key=size)
+            self.assertEqual(sorted(perm), list(range(size)), size)
+            self.assertEqual(len(perm), size)
+
+    def test_keyed_and_deterministic(self):
+        a = list(FeistelPermutation(500, key=(1, "space")))
+        self.assertEqual(a, list(FeistelPermutation(500, key=(1, "space"))))
+        self.assertNotEqual(a, list(FeistelPermutation(500, key=(2, "space"))))
+        self.assertNotEqual(a, list(range(500)))
+
+    def test_random_access_on_large_domains(self):
+        perm = FeistelPermutation(10 ** 12, key=3)
+        values = {perm[i] for i in range(0, 10 ** 12, 10 ** 9)}
+        self.assertEqual(len(values), 1000)
+        self.assertTrue(all(0 <= v < 10 ** 12 for v in values))
+
+    def test_bounds(self):
+        with self.assertRaises(ValueError):
+            FeistelPermutation(0, key=1)
+        with self.assertRaises(IndexError):
+            FeistelPermutation(5, key=1)[5]
+
+
+class TestLazySequences(unittest.TestCase):
+    def test_product_matches_itertools(self):
+        import itertools
+
+        axes = (["a", "b"], range(3), (7, 8, 9, 10))
+        lazy = Product(*axes)
+        self.assertEqual(list(lazy), list(itertools.product(*axes)))
+        self.assertEqual(lazy[-1], ("b", 2, 10))
+        with self.assertRaises(IndexError):
+            lazy[24]
+
+    def test_chain_concatenates(self):
+        chain = Chain((1, 2), (), Product("xy"), [3])
+        self.assertEqual(list(chain), [1, 2, ("x",), ("y",), 3])
+        self.assertEqual(len(chain), 5)
+        self.assertEqual(chain[-1], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
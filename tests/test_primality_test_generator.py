@@ -162,6 +162,17 @@ class TestPrimalityTestGenerator(unittest.TestCase):
                                      int(fields[3]), raw_step)
         self.assertEqual(saw, {"composite", "probably"})
 
+    def test_enumerated_space_is_distinct_and_covers_generate(self):
+        from generators.primality_test_generator import problem_space
+
+        space = self.gen.enumerate_space()
+        self.assertEqual(self.gen.space_size(), len(space))
+        keys = {self.gen.generate_from(params)["problem"] for params in space}
+        self.assertEqual(len(keys), len(space))
+        for _ in range(200):
+            self.assertIn(self.gen.generate()["problem"], keys)
+        self.assertIs(space, problem_space())
+
     def test_pipe_safe(self):
         for _ in range(300):
             result = self.gen.generate()
@@ -0,0 +1,94 @@
+import copy
+import fractions
+import itertools
+import math
+import os
+import pickle
+import random
+import sys
+import unittest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from rational import Fraction
+
+StdFraction = fractions.Fraction
+
+_rng = random.Random(7)
+PAIRS = ([(_rng.randint(-40, 40), _rng.randint(1, 30)) for _ in range(40)]
+         + [(0, 1), (6, 1), (-6, 1), (1, 2 ** 61 - 1), (-(2 ** 61 - 1), 4)])
+SCALARS = [0, 1, -1, 3, -12, 10 ** 20 + 1, True, 0.25, -2.5]
+OPS = ("+", "-", "*", "/", "<", "<=", ">", ">=", "==", "!=")
+
+
+def outcome(expr, env):
+    """(value, str, type is float) of `expr`, or the exception it raised."""
+    try:
+        value = eval(expr, env)
+    except (ZeroDivisionError, OverflowError) as exc:
+        return repr(exc)
+    return value, str(value), type(value) is float
+
+
+class TestFractionEquivalence(unittest.TestCase):
+    def test_binary_ops_match_stdlib(self):
+        for (a, b), (c, d) in itertools.product(PAIRS, repeat=2):
+            env = {"x": Fraction(a, b), "y": Fraction(c, d),
+                   "X": StdFraction(a, b), "Y": StdFraction(c, d)}
+            for op in OPS:
+                expected = outcome(f"X {op} Y", env)
+                for expr in (f"x {op} y", f"X {op} y", f"x {op} Y"):
+                    self.assertEqual(outcome(expr, env), expected, (expr, env))
+
+    def test_scalar_ops_match_stdlib(self):
+        for (a, b), k in itertools.product(PAIRS, SCALARS):
+            env = {"x": Fraction(a, b), "X": StdFraction(a, b), "k": k}
+            for op in OPS + ("**",):
+                if op == "**" and type(k) is int and abs(k) > 5:
+                    continue
+                for left, right in (("x", "k"), ("k", "x")):
+                    std = left.replace("x", "X"), right.replace("x", "X")
+                    self.assertEqual(outcome(f"{left} {op} {right}", env),
+                                     outcome(f"{std[0]} {op} {std[1]}", env),
+                                     (left, op, right, a, b, k))
+
+    def test_unary_hash_and_conversions_match_stdlib(self):
+        for a, b in PAIRS:
+            x, X = Fraction(a, b), StdFraction(a, b)
+            self.assertEqual(hash(x), hash(X))
+            self.assertEqual((str(-x), str(abs(x)), str(+x)),
+                             (str(-X), str(abs(X)), str(+X)))
+            self.assertEqual(repr(x), repr(X))
+            self.assertEqual(float(x), float(X))
+            self.assertEqual((math.floor(x), math.ceil(x), round(x), int(x)),
+                             (math.floor(X), math.ceil(X), round(X), int(X)))
+            self.assertEqual(pickle.loads(pickle.dumps(x)), x)
+            self.assertEqual(copy.deepcopy(x), x)
+
+    def test_constructors(self):
+        self.assertEqual(Fraction(10, -8), StdFraction(-5, 4))
+        self.assertEqual(Fraction("3/4"), StdFraction(3, 4))
+        self.assertEqual(Fraction(0.5), StdFraction(1, 2))
+        self.assertEqual(Fraction(StdFraction(2, 4)), StdFraction(1, 2))
+        self.assertEqual(Fraction(Fraction(1, 3), Fraction(2, 3)), StdFraction(1, 2))
+        with self.assertRaisesRegex(ZeroDivisionError, r"Fraction\(1, 0\)"):
+            Fraction(1, 0)
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 2) / 0
+
+    def test_results_keep_the_fast_type(self):
+        x = Fraction(1, 3)
+        for value in (x + 1, 1 + x, x - x, x * 2, 2 / x, x / StdFraction(1, 2),
+                      StdFraction(1, 2) + x, x ** -2, -x, abs(x)):
+            self.assertIs(type(value), Fraction)
+
+    def test_isinstance_accepts_stdlib_fractions(self):
+        self.assertIsInstance(StdFraction(1, 2), Fraction)
+        self.assertIsInstance(Fraction(1, 2), StdFraction)
+        self.assertNotIsInstance(0.5, Fraction)
+
+
+if __name__ == "__main__":
+    unittest.main()
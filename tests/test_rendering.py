@@ -0,0 +1,88 @@
+import fractions
+import os
+import sys
+import unittest
+from decimal import Decimal
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import rendering
+from rational import Fraction
+from tools import bench_rendering
+
+VALUES = [0, 7, -7, 10 ** 20, True, 0.5, -2.25, 1.1, "3/4", Decimal("1.331"),
+          Fraction(5, 12), Fraction(-7, 8), Fraction(1331, 1000),
+          fractions.Fraction(-1, 3), Fraction(123456789, 2 ** 12 * 5 ** 3)]
+TERMINATING = [0, 7, -7, Fraction(33, 10), Fraction(-1, 16), Fraction(1331, 1000),
+               fractions.Fraction(5, 4), Fraction(10 ** 30 + 1, 10 ** 12), 0.125,
+               "2.5"]
+
+
+class TestRendering(unittest.TestCase):
+    def test_fraction_text_matches_original(self):
+        for value in VALUES:
+            self.assertEqual(rendering.fraction_text(value),
+                             bench_rendering.legacy_fraction_text(value), value)
+            self.assertEqual(rendering.fraction_text(value),
+                             bench_rendering.legacy_fmt_frac(value), value)
+
+    def test_dec_matches_original(self):
+        for value in TERMINATING:
+            self.assertEqual(rendering.dec(value), bench_rendering.legacy_dec(value),
+                             value)
+        self.assertEqual(rendering.dec(Fraction(1331, 1000)), "1.331")
+        self.assertEqual(rendering.dec(Fraction(-1, 20)), "-0.05")
+
+    def test_dec_rejects_non_terminating_values(self):
+        for value in (Fraction(1, 3), Fraction(-5, 12)):
+            with self.assertRaises(AssertionError) as ctx:
+                rendering.dec(value)
+            self.assertEqual(str(ctx.exception), str(value))
+            # cached entries fail the same way again
+            with self.assertRaises(AssertionError):
+                rendering.dec(value)
+
+    def test_exact_matches_original(self):
+        for value in VALUES:
+            if isinstance(value, (int, fractions.Fraction)):
+                fr = Fraction(value)
+                self.assertEqual(rendering.exact(fr), bench_rendering.legacy_exact(fr),
+                                 fr)
+        self.assertEqual(rendering.exact(Fraction(-7, 8)), "-0.875")
+        self.assertEqual(rendering.exact(Fraction(5, 12)), "5/12")
+
+    def test_vector_and_matrix_text_match_original(self):
+        row = [Fraction(1, 2), 3, -0.25, Fraction(-2, 5)]
+        matrix = [row, [0, 1, 2, 3], []]
+        self.assertEqual(rendering.vector_text(row),
+                         bench_rendering.legacy_vector_text(row))
+        self.assertEqual(rendering.vector_text(row), "(1/2,3,-1/4,-2/5)")
+        self.assertEqual(rendering.vector_text(iter(row)),
+                         bench_rendering.legacy_vector_text(row))
+        self.assertEqual(rendering.matrix_text(matrix),
+                         bench_rendering.legacy_matrix_text(matrix))
+        self.assertEqual(rendering.matrix_text([[1, 0], [0, 1]]), "[[1,0], [0,1]]")
+
+    def test_money_and_factor_text(self):
+        self.assertEqual(rendering.money(Fraction(1331, 2)), "$665.50")
+        self.assertEqual(rendering.money(Fraction(7)), "$7.00")
+        self.assertEqual(rendering.factor_text(-3), "(-3)")
+        self.assertEqual(rendering.factor_text(Fraction(-1, 2)), "(-1/2)")
+        self.assertEqual(rendering.factor_text(4), "4")
+
+    def test_bench_reports_identical_examples(self):
+        from generators.exponential_model_generator import ExponentialModelGenerator
+
+        instances = [ExponentialModelGenerator()]
+        old, new = bench_rendering.bench_class(instances, "ExponentialModelGenerator",
+                                               samples=5, repeat=1, seed=0)
+        self.assertGreater(old, 0)
+        self.assertGreater(new, 0)
+        module = sys.modules[ExponentialModelGenerator.__module__]
+        self.assertIs(module.dec, rendering.dec)
+
+
+if __name__ == "__main__":
+    unittest.main()
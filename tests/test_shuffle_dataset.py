@@ -0,0 +1,109 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from tools.build_hf_release import generate_release
+from tools.shuffle_dataset import shuffle_jsonl, shuffle_release, sort_key
+
+CONFIGS = {
+    "preview": {"train": 45, "test": 12},
+    "10M_tokens": {"train": 110, "validation": 20, "test": 30},
+}
+
+
+def read_split(output_dir, config, split):
+    rows = []
+    for path in sorted(Path(output_dir, config).glob(f"{split}-*.parquet")):
+        rows.extend(pq.read_table(path).to_pylist())
+    return rows
+
+
+def content(row):
+    return (row["problem_id"], row["text"])
+
+
+class TestShuffleJsonl(unittest.TestCase):
+    def test_sort_keys_are_distinct(self):
+        keys = {sort_key(7, i) for i in range(10_000)}
+        self.assertEqual(len(keys), 10_000)
+
+    def test_shuffle_is_seeded_permutation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp, "in.jsonl")
+            lines = [json.dumps({"problem": f"p{i}", "final_answer": str(i)})
+                     for i in range(500)]
+            src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            outputs = {}
+            # A tiny budget forces many buckets; the order must not change.
+            for name, seed, memory_mb in (("a", 1, 512), ("b", 1, 0.002),
+                                          ("c", 2, 512)):
+                dst = Path(tmp, f"{name}.jsonl")
+                self.assertEqual(shuffle_jsonl(src, dst, seed, memory_mb, tmp), 500)
+                outputs[name] = dst.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(sorted(outputs["a"]), sorted(lines))
+            self.assertNotEqual(outputs["a"], lines)
+            self.assertEqual(outputs["a"], outputs["b"])
+            self.assertNotEqual(outputs["a"], outputs["c"])
+            # Only the output is left behind.
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()),
+                             ["a.jsonl", "b.jsonl", "c.jsonl", "in.jsonl"])
+
+
+class TestShuffleRelease(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.release = Path(cls._tmp.name, "release")
+        with contextlib.redirect_stdout(io.StringIO()):
+            metadata = generate_release(output_dir=cls.release, configs=CONFIGS, seed=3,
+                                        shard_rows=16, compression="zstd")
+        (cls.release / "generation_stats.json").write_text(json.dumps(metadata),
+                                                           encoding="utf-8")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_configs_keep_rows_and_nesting(self):
+        out = Path(self._tmp.name, "shuffled")
+        result = shuffle_release(self.release, out, seed=5, memory_mb=0.01)
+        self.assertEqual(result["train"], {"preview": 45, "10M_tokens": 110})
+        self.assertEqual(result["validation"], {"10M_tokens": 20})
+        for config, splits in CONFIGS.items():
+            for split, rows in splits.items():
+                with self.subTest(config=config, split=split):
+                    before = read_split(self.release, config, split)
+                    after = read_split(out, config, split)
+                    self.assertEqual(len(after), rows)
+                    self.assertEqual(sorted(map(content, after)),
+                                     sorted(map(content, before)))
+                    self.assertEqual([row["row_id"] for row in after], list(range(rows)))
+                    self.assertEqual([row["example_id"] for row in after],
+                                     [f"{split}-{i:09d}" for i in range(rows)])
+        small = read_split(out, "preview", "train")
+        large = read_split(out, "10M_tokens", "train")
+        self.assertEqual(small, large[:45])
+        self.assertNotEqual(list(map(content, large)),
+                            list(map(content, read_split(self.release, "10M_tokens", "train"))))
+        # Shard layout follows the source release.
+        self.assertEqual(sorted(p.name for p in (out / "10M_tokens").iterdir()),
+                         sorted(p.name for p in (self.release / "10M_tokens").iterdir()))
+        stats = json.loads((out / "generation_stats.json").read_text(encoding="utf-8"))
+        self.assertEqual(stats["shuffle_seed"], 5)
+
+    def test_shuffle_is_reproducible(self):
+        first = Path(self._tmp.name, "first")
+        second = Path(self._tmp.name, "second")
+        shuffle_release(self.release, first, seed=9)
+        shuffle_release(self.release, second, seed=9, memory_mb=0.005)
+        self.assertEqual(read_split(first, "10M_tokens", "train"),
+                         read_split(second, "10M_tokens", "train"))
+
+
+if __name__ == "__main__":
+    unittest.main()
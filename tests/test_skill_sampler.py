@@ -0,0 +1,152 @@
+import collections
+import os
+import random
+import sys
+import unittest
+from fractions import Fraction
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from curriculum import CURRICULUM
+from skill_sampler import (
+    QuotaSchedule,
+    SkillSampler,
+    mix_to_json,
+    parse_mix,
+    parse_mix_value,
+    resolve_mix,
+)
+
+SKILLS = ["LongDivisionGenerator", "FactorsGenerator",
+          "QuadraticGenerator", "BlackScholesGenerator", "PortfolioGenerator",
+          "NPVIRRGenerator"]
+
+
+class TestSkillSampler(unittest.TestCase):
+    def test_unweighted_matches_random_choices(self):
+        sampler = SkillSampler(SKILLS, batch_size=64)
+        self.assertEqual(sampler.picks(random.Random(5)),
+                         random.Random(5).choices(SKILLS, k=64))
+        # Equal weights are the unweighted sampler.
+        equal = SkillSampler(SKILLS, [2.0] * len(SKILLS), batch_size=64)
+        self.assertEqual(equal.picks(random.Random(5)),
+                         sampler.picks(random.Random(5)))
+
+    def test_alias_table_follows_weights(self):
+        weights = [6, 3, 1, 0, 2, 0]
+        sampler = SkillSampler(SKILLS, weights, batch_size=1000)
+        rng = random.Random(1)
+        counts = collections.Counter()
+        for _ in range(60):
+            counts.update(sampler.picks(rng))
+        total = sum(counts.values())
+        for name, w in zip(SKILLS, weights):
+            self.assertAlmostEqual(counts[name] / total, w / 12, delta=0.01)
+        self.assertEqual(counts["BlackScholesGenerator"], 0)
+        self.assertEqual(sampler.probabilities()["LongDivisionGenerator"],
+                         Fraction(1, 2))
+
+    def test_plan_counts_is_largest_remainder(self):
+        sampler = SkillSampler(SKILLS[:3], [1, 1, 1])
+        self.assertEqual(sampler.plan_counts(10),
+                         {SKILLS[0]: 4, SKILLS[1]: 3, SKILLS[2]: 3})
+        sampler = SkillSampler(SKILLS[:3], [0.5, 0.3, 0.2])
+        self.assertEqual(sampler.plan_counts(7),
+                         {SKILLS[0]: 4, SKILLS[1]: 2, SKILLS[2]: 1})
+        for n in (0, 1, 99, 1000):
+            self.assertEqual(sum(sampler.plan_counts(n).values()), n)
+
+
+class TestQuotaSchedule(unittest.TestCase):
+    def test_deals_out_exactly_the_counts(self):
+        counts = {"A": 70, "B": 5, "C": 0, "D": 30}
+        schedule = QuotaSchedule(counts, (1, "quota", 0), start=10, batch_size=64)
+        self.assertEqual(len(schedule), 105)
+        self.assertEqual(schedule.stop, 12)
+        picks = schedule.picks(None, 10) + schedule.picks(None, 11)
+        self.assertEqual(len(schedule.picks(None, 10)), 64)
+        self.assertEqual(collections.Counter(picks), {"A": 70, "B": 5, "D": 30})
+        self.assertEqual(schedule.picks(None, 12), [])
+        self.assertEqual(schedule.picks(None, 9), [])
+        # Seeded: the same key deals the same order, another key a new one.
+        again = QuotaSchedule(counts, (1, "quota", 0), start=10, batch_size=64)
+        other = QuotaSchedule(counts, (2, "quota", 0), start=10, batch_size=64)
+        self.assertEqual(list(again), list(schedule))
+        self.assertNotEqual(list(other), list(schedule))
+
+    def test_empty_schedule(self):
+        schedule = QuotaSchedule({"A": 0}, "k", start=3)
+        self.assertEqual(len(schedule), 0)
+        self.assertEqual(schedule.stop, 3)
+
+
+class TestMix(unittest.TestCase):
+    def test_parse_specs(self):
+        mix = parse_mix(["grade_level=college:0.3, graduate:0.2",
+                         "difficulty=1-2:0.25,5:0.1"])
+        self.assertEqual(mix, {
+            "grade_level": {("college",): 0.3, ("graduate",): 0.2},
+            "difficulty": {(1, 2): 0.25, (5,): 0.1},
+        })
+        self.assertEqual(parse_mix(mix_to_json(mix)), mix)
+        self.assertEqual(parse_mix("difficulty=3:1"), {"difficulty": {(3,): 1.0}})
+
+    def test_parse_rejects_bad_specs(self):
+        for spec in ("grade_level", "grade_level=college", "topic=algebra:0.5",
+                     "grade_level=phd:0.5", "difficulty=0-2:0.5",
+                     "difficulty=3-2:0.5", "difficulty=1-3:0.2,3:0.2",
+                     "grade_level=college:0.8,graduate:0.4",
+                     "grade_level=college:-0.1", "grade_level=college:lots",
+                     ["difficulty=1:0.1", "difficulty=2:0.1"]):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                parse_mix(spec)
+
+    def test_parse_mix_value(self):
+        self.assertEqual(parse_mix_value("grade_level", "college"), ("college",))
+        self.assertEqual(parse_mix_value("difficulty", "2-4"), (2, 3, 4))
+        self.assertEqual(parse_mix_value("difficulty", "5"), (5,))
+        for dimension, text in (("grade_level", "phd"), ("difficulty", "0"),
+                                ("difficulty", "4-2"), ("difficulty", "x")):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_mix_value(dimension, text)
+
+    def _shares(self, weights, dimension):
+        shares = collections.Counter()
+        for name, w in zip(SKILLS, weights):
+            shares[CURRICULUM[name][dimension]] += w
+        return shares
+
+    def test_single_dimension_targets_hold(self):
+        mix = parse_mix("grade_level=graduate:0.5")
+        weights = resolve_mix(SKILLS, mix)
+        self.assertAlmostEqual(sum(weights), 1)
+        self.assertAlmostEqual(self._shares(weights, "grade_level")["graduate"], 0.5)
+        # Skills within a group keep their relative base weights.
+        base = [1, 3, 1, 1, 1, 1]
+        weights = resolve_mix(SKILLS, mix, base)
+        self.assertAlmostEqual(weights[1] / weights[0], 3)
+
+    def test_two_dimensions_are_fitted_jointly(self):
+        mix = parse_mix(["grade_level=graduate:0.4",
+                         "difficulty=4:0.5"])
+        weights = resolve_mix(SKILLS, mix)
+        self.assertAlmostEqual(self._shares(weights, "grade_level")["graduate"], 0.4)
+        self.assertAlmostEqual(self._shares(weights, "difficulty")[4], 0.5)
+
+    def test_full_shares_exclude_unlisted_skills(self):
+        weights = resolve_mix(SKILLS, parse_mix("grade_level=graduate:1"))
+        for name, w in zip(SKILLS, weights):
+            expected = 0.5 if CURRICULUM[name]["grade_level"] == "graduate" else 0
+            self.assertAlmostEqual(w, expected)
+
+    def test_unmatched_group_and_missing_curriculum_raise(self):
+        with self.assertRaisesRegex(ValueError, "matches none"):
+            resolve_mix(SKILLS[:2], parse_mix("grade_level=graduate:0.2"))
+        with self.assertRaisesRegex(ValueError, "curriculum"):
+            resolve_mix(["NoSuchGenerator"], parse_mix("difficulty=1:0.2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
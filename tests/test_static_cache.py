@@ -0,0 +1,137 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import static_cache
+from static_cache import static_table
+from tools import bench_static_tables
+
+CALLS = []
+
+
+@static_table
+def squares(n):
+    CALLS.append(n)
+    return tuple(k * k for k in range(n))
+
+
+@static_table(persist=True)
+def cubes(n):
+    CALLS.append(n)
+    return tuple(k ** 3 for k in range(n))
+
+
+class TestStaticTable(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        squares.cache_clear()
+        cubes.cache_clear()
+
+    def test_builds_once_per_argument_tuple(self):
+        first = squares(5)
+        self.assertEqual(first, (0, 1, 4, 9, 16))
+        self.assertIs(squares(5), first)
+        squares(3)
+        self.assertEqual(CALLS, [5, 3])
+        self.assertEqual(set(squares.cache), {(5,), (3,)})
+
+    def test_cache_clear_rebuilds(self):
+        squares(4)
+        squares.cache_clear()
+        squares(4)
+        self.assertEqual(CALLS, [4, 4])
+
+    def test_wrapped_is_uncached_original(self):
+        self.assertEqual(squares.__wrapped__(4), squares(4))
+        self.assertEqual(CALLS, [4, 4])
+        squares(4)
+        self.assertEqual(CALLS, [4, 4])
+        self.assertEqual(squares.__name__, "squares")
+
+    def test_tables_are_registered(self):
+        self.assertIn(squares, static_cache.TABLES)
+        self.assertIn(cubes, static_cache.TABLES)
+        self.assertFalse(squares.persist)
+        self.assertTrue(cubes.persist)
+
+    def test_persist_without_directory_stays_in_memory(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(static_cache.CACHE_DIR_ENV, None)
+            self.assertEqual(cubes(3), (0, 1, 8))
+        self.assertEqual(CALLS, [3])
+
+    def test_persisted_table_loads_in_a_fresh_process(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(os.environ, {static_cache.CACHE_DIR_ENV: tmp}):
+            self.assertEqual(cubes(4), (0, 1, 8, 27))
+            files = os.listdir(tmp)
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].endswith(".pickle"))
+            cubes.cache_clear()  # as if in a new process
+            self.assertEqual(cubes(4), (0, 1, 8, 27))
+            self.assertEqual(CALLS, [4])
+            cubes(5)
+            self.assertEqual(len(os.listdir(tmp)), 2)
+
+    def test_unreadable_file_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(os.environ, {static_cache.CACHE_DIR_ENV: tmp}):
+            cubes(3)
+            path = os.path.join(tmp, os.listdir(tmp)[0])
+            with open(path, "wb") as fp:
+                fp.write(b"not a pickle")
+            cubes.cache_clear()
+            self.assertEqual(cubes(3), (0, 1, 8))
+            self.assertEqual(CALLS, [3, 3])
+
+    def test_file_name_tracks_module_source(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(os.environ, {static_cache.CACHE_DIR_ENV: tmp}):
+            path = static_cache._disk_path(cubes.__wrapped__, (3,))
+            with mock.patch.object(static_cache, "_source_digest",
+                                   return_value="0" * 32):
+                other = static_cache._disk_path(cubes.__wrapped__, (3,))
+        self.assertNotEqual(path, other)
+        self.assertIn("test_static_cache.cubes", os.path.basename(path))
+
+
+class TestConvertedGenerators(unittest.TestCase):
+    def test_tables_match_original_definitions(self):
+        from math import gcd
+
+        from generators import (
+            coset_generator,
+            diffie_hellman_generator,
+            elliptic_curve_finite_field_generator as ec,
+        )
+        self.assertEqual(coset_generator.units(12), (1, 5, 7, 11))
+        self.assertEqual(diffie_hellman_generator.primitive_roots(17),
+                         (3, 5, 6, 7, 10, 11, 12, 14))
+        points = ec.enumerate_points(17, 2, 2)
+        self.assertEqual(len(ec.addable_pairs(17, 2, 2)),
+                         sum(1 for P in points for Q in points
+                             if P != Q and not (P[0] == Q[0]
+                                                and (P[1] + Q[1]) % 17 == 0)))
+        for n, element in coset_generator.unit_subgroup_choices():
+            self.assertEqual(gcd(n, element), 1)
+            self.assertLess(len(coset_generator.multiplicative_subgroup(n, element)),
+                            len(coset_generator.units(n)))
+
+    def test_bench_reports_identical_examples(self):
+        from generators.coset_generator import CosetGenerator
+
+        instances = [CosetGenerator(variant) for variant in CosetGenerator.VARIANTS]
+        uncached, cached = bench_static_tables.bench_class(
+            instances, "CosetGenerator", samples=20, repeat=1, seed=3)
+        self.assertGreater(uncached, 0)
+        self.assertGreater(cached, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -207,6 +207,34 @@ class TestTotientGenerator(unittest.TestCase):
         with self.assertRaises(ValueError):
             TotientGenerator("bogus")
 
+    def test_enumerated_space(self):
+        space = self.gen.enumerate_space()
+        sizes = {v: TotientGenerator(v).space_size() for v in TotientGenerator.VARIANTS}
+        self.assertEqual(sizes["totient"], 32)
+        self.assertEqual(len(space), sum(sizes.values()))
+        # Spread-out entries render distinct problems that pass the oracle.
+        picks = random.Random(3).sample(range(len(space)), 400)
+        problems = set()
+        for index in picks:
+            result = self.gen.generate_from(space[index])
+            expected_steps, answer = expected_flow(result)
+            self.assertEqual(result["steps"], expected_steps, result["problem"])
+            problems.add(result["problem"])
+        self.assertEqual(len(problems), len(picks))
+        # Every drawn problem lies in the space.
+        members = set(space)
+        for _ in range(300):
+            problem = self.gen.generate()["problem"]
+            if TOTIENT_RE.match(problem):
+                params = ("totient", int(TOTIENT_RE.match(problem).group(1)))
+            elif EULER_RE.match(problem):
+                base, exponent, n = map(int, EULER_RE.match(problem).groups())
+                params = ("euler_power", n, base, exponent)
+            else:
+                base, exponent, p = map(int, FERMAT_RE.match(problem).groups())
+                params = ("fermat_power", p, base, exponent)
+            self.assertIn(params, members)
+
     def test_pipe_safe(self):
         for _ in range(300):
             result = self.gen.generate()
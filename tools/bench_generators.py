@@ -0,0 +1,214 @@
+"""Benchmark per-generator throughput.
+
+For each registered generator class: examples per second, p50/p99 latency
+of one generate() call, peak memory allocated per example (tracemalloc),
+and RNG draws per example. Draws are the rejection-loop signal: a class
+whose mean draw count is well above its minimum keeps re-drawing
+operands, and ``rejection`` reports that ratio (1.0 = no retries).
+
+Under uniform skill sampling every class is picked equally often, so the
+``share`` column (a class's mean latency over the sum of all classes'
+mean latencies) is its share of build wall-clock.
+
+Usage:
+    uv run python tools/bench_generators.py
+    uv run python tools/bench_generators.py --samples 500 --top 30 --json /tmp/bench.json
+    uv run python tools/bench_generators.py --compare /tmp/bench.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from base_generator import derive_seed, example_rng  # noqa: E402
+from tools.probe_generator_capacity import grouped_generators  # noqa: E402
+
+
+class CountingRandom(random.Random):
+    """random.Random that counts its primitive draws.
+
+    Every Random method bottoms out in random() or getrandbits(), so
+    `draws` counts all draws; the stream itself is unchanged.
+    """
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.draws = 0
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile (0 < q <= 100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def bench_class(instances, name, samples, profile_samples, seed):
+    """Times `samples` examples of one class, then profiles a subset."""
+    latencies = []
+    errors = 0
+    for i in range(samples):
+        rng = example_rng(seed, name, i)
+        gen = rng.choice(instances)
+        start = time.perf_counter_ns()
+        try:
+            gen.sample(rng)
+        except Exception:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter_ns() - start)
+
+    # Same streams again, instrumented: tracemalloc and draw counting
+    # would distort the timings above.
+    alloc = []
+    draws = []
+    tracemalloc.start()
+    try:
+        for i in range(min(samples, profile_samples)):
+            rng = CountingRandom(derive_seed(seed, name, i))
+            gen = rng.choice(instances)
+            rng.draws = 0
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            try:
+                gen.sample(rng)
+            except Exception:
+                continue
+            alloc.append(tracemalloc.get_traced_memory()[1] - base)
+            draws.append(rng.draws)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    total_s = sum(latencies) / 1e9
+    mean_draws = sum(draws) / len(draws) if draws else 0.0
+    return {
+        "generator": name,
+        "samples": samples,
+        "errors": errors,
+        "examples_per_sec": round(len(latencies) / total_s, 1) if total_s else 0.0,
+        "mean_us": round(total_s * 1e6 / len(latencies), 2) if latencies else 0.0,
+        "p50_us": round(percentile(latencies, 50) / 1e3, 2),
+        "p99_us": round(percentile(latencies, 99) / 1e3, 2),
+        "alloc_peak_bytes": round(sum(alloc) / len(alloc)) if alloc else 0,
+        "draws_per_example": round(mean_draws, 2),
+        "rejection": round(mean_draws / min(draws), 2) if draws and min(draws) else 1.0,
+    }
+
+
+def bench_generators(generators, samples=200, profile_samples=50, seed=0):
+    rows = [bench_class(instances, name, samples, profile_samples, seed)
+            for name, instances in grouped_generators(generators)]
+    total_us = sum(row["mean_us"] for row in rows)
+    for row in rows:
+        row["share"] = round(row["mean_us"] / total_us, 4) if total_us else 0.0
+    return rows
+
+
+def render_table(rows, top=None):
+    rows = sorted(rows, key=lambda row: row["share"], reverse=True)
+    if top:
+        rows = rows[:top]
+    headers = ("generator", "ex/s", "p50 us", "p99 us", "alloc KiB",
+               "draws", "reject", "share")
+    lines = [
+        f"{headers[0]:36} {headers[1]:>9} {headers[2]:>9} {headers[3]:>9} "
+        f"{headers[4]:>9} {headers[5]:>7} {headers[6]:>6} {headers[7]:>6}",
+        "-" * 98,
+    ]
+    for row in rows:
+        mark = "!" if row["errors"] else " "
+        lines.append(
+            f"{mark}{row['generator'][:35]:35} "
+            f"{row['examples_per_sec']:9.0f} "
+            f"{row['p50_us']:9.1f} "
+            f"{row['p99_us']:9.1f} "
+            f"{row['alloc_peak_bytes'] / 1024:9.1f} "
+            f"{row['draws_per_example']:7.1f} "
+            f"{row['rejection']:6.2f} "
+            f"{row['share']:6.1%}"
+        )
+    return "\n".join(lines)
+
+
+def compare_rows(rows, baseline, tolerance):
+    """Classes whose examples/sec fell more than `tolerance` below baseline.
+
+    Returns (generator, baseline ex/s, current ex/s) tuples; classes
+    missing from either side are ignored.
+    """
+    before = {row["generator"]: row["examples_per_sec"] for row in baseline}
+    regressions = []
+    for row in rows:
+        old = before.get(row["generator"])
+        if old and row["examples_per_sec"] < old * (1 - tolerance):
+            regressions.append((row["generator"], old, row["examples_per_sec"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="timed examples per class")
+    parser.add_argument("--profile-samples", type=int, default=50,
+                        help="examples per class for tracemalloc/draw counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generators",
+                        help="comma-separated class names to benchmark")
+    parser.add_argument("--top", type=int,
+                        help="show only the N classes with the largest share")
+    parser.add_argument("--json", dest="json_path",
+                        help="write machine-readable rows to this path")
+    parser.add_argument("--compare", metavar="BASELINE_JSON",
+                        help="exit 1 if any class is slower than this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed ex/s drop vs the baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+    if args.samples < 1 or args.profile_samples < 1:
+        parser.error("--samples and --profile-samples must be at least 1")
+
+    from quixi_math_datagen import select_generators
+
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    rows = bench_generators(generators, args.samples, args.profile_samples,
+                            args.seed)
+    print(render_table(rows, args.top))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare_rows(rows, baseline, args.tolerance)
+        if regressions:
+            print(f"\nSlower than baseline by more than {args.tolerance:.0%}:")
+            for name, old, new in regressions:
+                print(f"  {name}: {old:,.0f} -> {new:,.0f} ex/s")
+            return 1
+        print(f"\nNo class slower than baseline by more than {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Compare build output formats: size on disk and write throughput.
+
+Generates one seeded set of rows, then writes the same rows in each layout
+and reports the file size and the best-of-N write time:
+
+- jsonl / jsonl.gz: what `quixi_math_datagen.py -o x.jsonl[.gz]` writes
+- release: tools/build_hf_release.py's layout (plain string columns plus
+  row_id, example_id and the rendered text, RECORD_BATCH_ROWS-row groups,
+  dictionary pages tried on every column)
+- parquet / parquet+text: `--format parquet` (parquet_writer), without
+  and with the stored text column
+
+Every writer is timed from the rows a build hands it, in the calling
+thread: serialized lines for JSONL, example dicts for the Parquet layouts.
+"MB/s" is JSONL-equivalent megabytes converted and written per second.
+Pass --check to read every output back and compare it with the rows.
+
+Usage:
+    uv run python tools/bench_parquet_output.py
+    uv run python tools/bench_parquet_output.py --rows 200000 --repeat 3 --check
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import pyarrow as pa  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from jsonl_writer import JsonlWriter, open_jsonl  # noqa: E402
+from parquet_writer import ParquetDatasetWriter, with_text  # noqa: E402
+from tools.build_hf_release import (  # noqa: E402
+    RECORD_BATCH_ROWS,
+    SCHEMA,
+    text_for_example,
+)
+
+LAYOUTS = ("jsonl", "jsonl.gz", "release", "parquet", "parquet+text")
+
+
+def build_rows(rows, seed):
+    """(lines, generators, labels) of a seeded `rows`-row build."""
+    from quixi_math_datagen import build_dataset
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.parquet")
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_dataset(n=rows, path=path, seed=seed, output_format="parquet")
+        table = pq.read_table(path)
+    columns = table.to_pydict()
+    fields = ("problem_id", "operation", "problem", "steps", "final_answer",
+              "grade_level", "difficulty")
+    lines = [json.dumps(dict(zip(fields, values)), ensure_ascii=False) + "\n"
+             for values in zip(*(columns[field] for field in fields))]
+    return lines, columns["generator"], columns["generator_label"]
+
+
+def _write_release(path, examples, generators, labels):
+    with pq.ParquetWriter(path, SCHEMA, compression="zstd") as writer:
+        for start in range(0, len(examples), RECORD_BATCH_ROWS):
+            columns = {field.name: [] for field in SCHEMA}
+            for offset, row in enumerate(examples[start:start + RECORD_BATCH_ROWS]):
+                row_id = start + offset
+                columns["row_id"].append(row_id)
+                columns["example_id"].append(f"train-{row_id:09d}")
+                columns["generator"].append(generators[row_id])
+                columns["generator_label"].append(labels[row_id])
+                for name in ("problem_id", "operation", "grade_level", "difficulty",
+                             "problem", "steps", "final_answer"):
+                    columns[name].append(row[name])
+                columns["text"].append(text_for_example(row))
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(columns[field.name], type=field.type) for field in SCHEMA],
+                schema=SCHEMA))
+
+
+def _write_with(writer, rows, generators, labels):
+    with writer:
+        for row, generator, label in zip(rows, generators, labels):
+            writer.write(row, generator, label)
+
+
+def write_layout(layout, path, lines, examples, generators, labels):
+    if layout == "release":
+        _write_release(path, examples, generators, labels)
+    elif layout.startswith("jsonl"):
+        _write_with(JsonlWriter(path), lines, generators, labels)
+    else:
+        _write_with(ParquetDatasetWriter(path, text=layout == "parquet+text"),
+                    examples, generators, labels)
+
+
+def read_back(layout, path):
+    """The problems and rendered texts stored in one output."""
+    if layout.startswith("jsonl"):
+        with open_jsonl(path) as fp:
+            rows = [json.loads(line) for line in fp]
+        return [row["problem"] for row in rows], [text_for_example(row) for row in rows]
+    table = pq.read_table(path)
+    if layout != "release":
+        table = with_text(table)
+    return table.column("problem").to_pylist(), table.column("text").to_pylist()
+
+
+def bench(lines, generators, labels, repeat=3, check=False):
+    """{layout: (bytes on disk, best seconds)}."""
+    suffix = {"jsonl": ".jsonl", "jsonl.gz": ".jsonl.gz"}
+    examples = [json.loads(line) for line in lines]
+    expected = None
+    if check:
+        expected = ([row["problem"] for row in examples],
+                    [text_for_example(row) for row in examples])
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in LAYOUTS:
+            path = os.path.join(tmp, layout.replace("+", "_") + suffix.get(layout, ".parquet"))
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                write_layout(layout, path, lines, examples, generators, labels)
+                best = min(best, time.perf_counter() - start)
+            if check and read_back(layout, path) != expected:
+                raise AssertionError(f"{layout}: rows changed on the way to disk")
+            results[layout] = (os.path.getsize(path), best)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing runs per layout; the best is reported")
+    parser.add_argument("--check", action="store_true",
+                        help="read every output back and compare")
+    args = parser.parse_args(argv)
+
+    lines, generators, labels = build_rows(args.rows, args.seed)
+    jsonl_mb = sum(len(line.encode("utf-8")) for line in lines) / 1e6
+    results = bench(lines, generators, labels, args.repeat, args.check)
+    release_size = results["release"][0]
+    print(f"{len(lines):,} rows, {jsonl_mb:.1f} MB as JSONL")
+    print(f"{'layout':14} {'MB':>8} {'B/row':>7} {'vs release':>10} {'MB/s':>7}")
+    print("-" * 50)
+    for layout, (size, seconds) in results.items():
+        print(f"{layout:14} {size / 1e6:8.2f} {size / len(lines):7.0f} "
+              f"{size / release_size:10.2f} {jsonl_mb / seconds:7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Benchmark rational.Fraction against fractions.Fraction.
+
+Every generator class whose module uses Fraction generates the same seeded
+examples twice, once with each Fraction class patched into the generator
+modules; the outputs are checked to be identical and the best-of-N time per
+example is reported, largest saving first. A short per-operation table
+comes first.
+
+Usage:
+    uv run python tools/bench_rational.py
+    uv run python tools/bench_rational.py --top 15 --samples 300 --repeat 5
+    uv run python tools/bench_rational.py --generators InformationGainGenerator
+"""
+import argparse
+import fractions
+import os
+import sys
+import time
+import timeit
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import rational  # noqa: E402
+from base_generator import example_rng  # noqa: E402
+from tools.probe_generator_capacity import grouped_generators  # noqa: E402
+
+KERNELS = {"fractions": fractions.Fraction, "rational": rational.Fraction}
+
+
+def _generator_modules():
+    return [module for name, module in list(sys.modules.items())
+            if module is not None
+            and (name.startswith("generators.") or name == "helpers")]
+
+
+def uses_fraction(instance) -> bool:
+    module = sys.modules[type(instance).__module__]
+    return getattr(module, "Fraction", None) in KERNELS.values()
+
+
+def _patch_fraction(cls):
+    """Points every generator module's Fraction name at `cls`."""
+    for module in _generator_modules():
+        if getattr(module, "Fraction", None) in KERNELS.values():
+            module.Fraction = cls
+
+
+def _run(instances, name, samples, seed):
+    out = []
+    for i in range(samples):
+        rng = example_rng(seed, name, i)
+        try:
+            out.append(rng.choice(instances).sample(rng))
+        except Exception as exc:
+            out.append(repr(exc))
+    return out
+
+
+def bench_class(instances, name, samples, repeat, seed):
+    """(fractions us/example, rational us/example) for one class; raises
+    AssertionError if the two kernels produce different examples."""
+    original = {module: module.Fraction for module in _generator_modules()
+                if getattr(module, "Fraction", None) in KERNELS.values()}
+    best = dict.fromkeys(KERNELS, float("inf"))
+    outputs = {}
+    try:
+        for _ in range(repeat):
+            for label, cls in KERNELS.items():
+                _patch_fraction(cls)
+                start = time.perf_counter()
+                outputs[label] = _run(instances, name, samples, seed)
+                best[label] = min(best[label], time.perf_counter() - start)
+    finally:
+        for module, cls in original.items():
+            module.Fraction = cls
+    if outputs["fractions"] != outputs["rational"]:
+        raise AssertionError(f"{name}: rational.Fraction changed the output")
+    return best["fractions"] * 1e6 / samples, best["rational"] * 1e6 / samples
+
+
+def bench_ops(number=100_000):
+    """(operation, fractions ns, rational ns) for common operations."""
+    cases = ["F(3, 4)", "a + b", "a + 2", "a * b", "a * 3", "a / b",
+             "a - b", "a < b", "a == b", "hash(a)", "str(a)"]
+    rows = []
+    for case in cases:
+        times = []
+        for cls in KERNELS.values():
+            env = {"F": cls, "a": cls(5, 12), "b": cls(7, 18)}
+            times.append(min(timeit.repeat(case, globals=env, number=number,
+                                           repeat=5)) * 1e9 / number)
+        rows.append((case, *times))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="examples per class per timing run")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing runs per class; the best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generators",
+                        help="comma-separated class names (default: every "
+                             "class whose module uses Fraction)")
+    parser.add_argument("--top", type=int, default=20,
+                        help="rows to show (0 = all)")
+    args = parser.parse_args(argv)
+
+    from quixi_math_datagen import select_generators
+
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    print(f"{'operation':12} {'fractions ns':>13} {'rational ns':>12}")
+    for case, old, new in bench_ops():
+        print(f"{case:12} {old:13.0f} {new:12.0f}")
+    print()
+
+    rows = []
+    for name, instances in grouped_generators(generators):
+        if uses_fraction(instances[0]):
+            old, new = bench_class(instances, name, args.samples, args.repeat,
+                                   args.seed)
+            rows.append((name, old, new))
+    if not rows:
+        print("No selected generator uses Fraction.")
+        return 0
+    rows.sort(key=lambda row: row[1] - row[2], reverse=True)
+
+    print(f"{'generator':36} {'fractions us':>12} {'rational us':>12} {'saved':>7}")
+    print("-" * 70)
+    for name, old, new in rows[:args.top or None]:
+        print(f"{name[:36]:36} {old:12.1f} {new:12.1f} {1 - new / old:7.1%}")
+    print("-" * 70)
+    total_old = sum(row[1] for row in rows)
+    total_new = sum(row[2] for row in rows)
+    print(f"{'mean per example':36} {total_old / len(rows):12.1f} "
+          f"{total_new / len(rows):12.1f} {1 - total_new / total_old:7.1%}")
+    print(f"All {len(rows)} Fraction-using classes produced identical examples.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
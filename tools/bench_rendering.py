@@ -0,0 +1,209 @@
+"""Benchmark the shared renderers in rendering.py.
+
+Compares rendering.fraction_text/dec/exact/vector_text/matrix_text against
+the per-module copies they replaced in two ways:
+
+- per call, for typical values;
+- per example, for every generator class whose module uses a shared
+  renderer: each class generates the same seeded examples with the
+  original copies patched into its module and with the shared ones, the
+  outputs are checked to be identical, and the best-of-N time per example
+  is reported, largest saving first.
+
+Usage:
+    uv run python tools/bench_rendering.py
+    uv run python tools/bench_rendering.py --top 0 --samples 300 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import rendering  # noqa: E402
+from base_generator import example_rng  # noqa: E402
+from rational import Fraction  # noqa: E402
+from tools.probe_generator_capacity import grouped_generators  # noqa: E402
+
+
+def legacy_fraction_text(value):
+    return str(Fraction(value))
+
+
+def legacy_fmt_frac(value):
+    value = Fraction(value)
+    return str(value.numerator) if value.denominator == 1 else str(value)
+
+
+def legacy_dec(value):
+    value = Fraction(value)
+    num, den = value.numerator, value.denominator
+    p10 = 0
+    while den % 2 == 0:
+        den //= 2
+        num *= 5
+        p10 += 1
+    while den % 5 == 0:
+        den //= 5
+        num *= 2
+        p10 += 1
+    assert den == 1, value
+    if p10 == 0:
+        return str(num)
+    s = str(abs(num)).rjust(p10 + 1, "0")
+    out = f"{s[:-p10]}.{s[-p10:]}".rstrip("0").rstrip(".")
+    return ("-" if num < 0 else "") + out
+
+
+def legacy_exact(fr):
+    d = fr.denominator
+    while d % 2 == 0:
+        d //= 2
+    while d % 5 == 0:
+        d //= 5
+    return legacy_dec(fr) if d == 1 else str(fr)
+
+
+def legacy_vector_text(values):
+    return "(" + ",".join(legacy_fraction_text(value) for value in values) + ")"
+
+
+def legacy_matrix_text(matrix):
+    return "[" + ", ".join(
+        "[" + ",".join(legacy_fraction_text(value) for value in row) + "]"
+        for row in matrix
+    ) + "]"
+
+
+# shared renderer -> the copy it replaced (fmt_frac is handled by name)
+LEGACY = {
+    rendering.fraction_text: legacy_fraction_text,
+    rendering.dec: legacy_dec,
+    rendering.exact: legacy_exact,
+    rendering.vector_text: legacy_vector_text,
+    rendering.matrix_text: legacy_matrix_text,
+}
+
+
+def _renderer_bindings(module):
+    """(attribute, shared function) pairs a module imports from rendering."""
+    return [(attr, value) for attr, value in vars(module).items()
+            if callable(value) and value in LEGACY]
+
+
+def _patch(module, bindings, legacy):
+    for attr, shared in bindings:
+        if not legacy:
+            replacement = shared
+        elif attr == "fmt_frac":
+            replacement = legacy_fmt_frac
+        else:
+            replacement = LEGACY[shared]
+        setattr(module, attr, replacement)
+
+
+def _run(instances, name, samples, seed):
+    out = []
+    for i in range(samples):
+        rng = example_rng(seed, name, i)
+        out.append(rng.choice(instances).sample(rng))
+    return out
+
+
+def bench_class(instances, name, samples, repeat, seed):
+    """(legacy us/example, shared us/example) for one class; raises
+    AssertionError if the shared renderers change any example."""
+    module = sys.modules[type(instances[0]).__module__]
+    bindings = _renderer_bindings(module)
+    best = {"legacy": float("inf"), "shared": float("inf")}
+    outputs = {}
+    try:
+        for _ in range(repeat):
+            for label in best:
+                _patch(module, bindings, legacy=label == "legacy")
+                start = time.perf_counter()
+                outputs[label] = _run(instances, name, samples, seed)
+                best[label] = min(best[label], time.perf_counter() - start)
+    finally:
+        _patch(module, bindings, legacy=False)
+    if outputs["legacy"] != outputs["shared"]:
+        raise AssertionError(f"{name}: shared renderers changed the output")
+    return best["legacy"] * 1e6 / samples, best["shared"] * 1e6 / samples
+
+
+def bench_calls(number=100_000):
+    cases = [
+        ("fraction_text(7)", 7),
+        ("fraction_text(5/12)", Fraction(5, 12)),
+        ("dec(1331/1000)", Fraction(1331, 1000)),
+        ("exact(-7/8)", Fraction(-7, 8)),
+        ("vector_text(3)", [Fraction(1, 2), 3, Fraction(-2, 5)]),
+    ]
+    rows = []
+    for label, value in cases:
+        fn = label.split("(")[0]
+        env = {"old": LEGACY[getattr(rendering, fn)],
+               "new": getattr(rendering, fn), "v": value}
+        t_old = min(timeit.repeat("old(v)", globals=env, number=number, repeat=5))
+        t_new = min(timeit.repeat("new(v)", globals=env, number=number, repeat=5))
+        rows.append((label, t_old * 1e9 / number, t_new * 1e9 / number))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="examples per class per timing run")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing runs per class; the best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generators",
+                        help="comma-separated class names (default: every "
+                             "class using a shared renderer)")
+    parser.add_argument("--top", type=int, default=20,
+                        help="rows to show (0 = all)")
+    args = parser.parse_args(argv)
+
+    from quixi_math_datagen import select_generators
+
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    print(f"{'call':22} {'legacy ns':>10} {'shared ns':>10}")
+    for label, old, new in bench_calls():
+        print(f"{label:22} {old:10.0f} {new:10.0f}")
+    print()
+
+    rows = []
+    for name, instances in grouped_generators(generators):
+        module = sys.modules[type(instances[0]).__module__]
+        if _renderer_bindings(module):
+            old, new = bench_class(instances, name, args.samples, args.repeat,
+                                   args.seed)
+            rows.append((name, old, new))
+    if not rows:
+        print("No selected generator uses a shared renderer.")
+        return 0
+    rows.sort(key=lambda row: row[1] - row[2], reverse=True)
+
+    print(f"{'generator':36} {'legacy us':>10} {'shared us':>10} {'saved':>7}")
+    print("-" * 66)
+    for name, old, new in rows[:args.top or None]:
+        print(f"{name[:36]:36} {old:10.1f} {new:10.1f} {1 - new / old:7.1%}")
+    print("-" * 66)
+    total_old = sum(row[1] for row in rows)
+    total_new = sum(row[2] for row in rows)
+    print(f"{'mean per example':36} {total_old / len(rows):10.1f} "
+          f"{total_new / len(rows):10.1f} {1 - total_new / total_old:7.1%}")
+    print(f"All {len(rows)} classes produced identical examples.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Benchmark CLI startup: import time of quixi_math_datagen, before vs after.
+
+Runs ``python -X importtime -c "import quixi_math_datagen"`` against the
+working tree and against a git ref (checked out into a temporary worktree),
+and reports the median cumulative import time, the number of generator
+modules imported, and the wall time of a one-skill ``--sample`` run.
+
+Usage:
+    uv run python tools/bench_startup.py                 # vs HEAD
+    uv run python tools/bench_startup.py --ref baseline-tag --runs 9
+    uv run python tools/bench_startup.py --generators LongDivisionGenerator
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr, module="quixi_math_datagen"):
+    """(cumulative microseconds of `module`, generator modules imported)."""
+    cumulative = None
+    generator_modules = 0
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        if name.startswith("generators."):
+            generator_modules += 1
+        if name == module:
+            cumulative = int(match.group(2))
+    if cumulative is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return cumulative, generator_modules
+
+
+def measure_tree(tree, runs, generators):
+    """Median import time, generator module count, and median sample wall time."""
+    # Warm-up: a fresh worktree has no __pycache__ yet.
+    subprocess.run([sys.executable, "-c", "import quixi_math_datagen"],
+                   cwd=tree, capture_output=True, check=True)
+    import_us = []
+    modules = 0
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import quixi_math_datagen"],
+            cwd=tree, capture_output=True, text=True, check=True,
+        )
+        cumulative, modules = parse_importtime(proc.stderr)
+        import_us.append(cumulative)
+
+    sample_s = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "quixi_math_datagen.py", "--sample",
+             "--seed", "0", "--generators", generators],
+            cwd=tree, capture_output=True, check=True,
+        )
+        sample_s.append(time.perf_counter() - start)
+    return {
+        "import_ms": statistics.median(import_us) / 1000,
+        "generator_modules": modules,
+        "sample_ms": statistics.median(sample_s) * 1000,
+    }
+
+
+def render(rows):
+    lines = [f"{'tree':<24} {'import (ms)':>12} {'gen modules':>12} {'--sample (ms)':>14}",
+             "-" * 65]
+    for label, row in rows:
+        lines.append(f"{label:<24} {row['import_ms']:>12.1f} "
+                     f"{row['generator_modules']:>12} {row['sample_ms']:>14.1f}")
+    if len(rows) == 2:
+        (_, before), (_, after) = rows
+        lines.append(f"{'speedup':<24} {before['import_ms'] / after['import_ms']:>11.1f}x "
+                     f"{'':>12} {before['sample_ms'] / after['sample_ms']:>13.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ref", default="HEAD",
+                        help="git ref to compare against (default: HEAD)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="runs per measurement; the median is reported")
+    parser.add_argument("--generators", default="LongDivisionGenerator",
+                        help="skills passed to the timed --sample run")
+    parser.add_argument("--no-compare", action="store_true",
+                        help="measure only the working tree")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    rows = []
+    if not args.no_compare:
+        with tempfile.TemporaryDirectory(prefix="quixi-bench-") as tmp:
+            worktree = os.path.join(tmp, "tree")
+            subprocess.run(["git", "worktree", "add", "--detach", worktree, args.ref],
+                           cwd=repo_root, capture_output=True, check=True)
+            try:
+                rows.append((args.ref, measure_tree(worktree, args.runs, args.generators)))
+            finally:
+                subprocess.run(["git", "worktree", "remove", "--force", worktree],
+                               cwd=repo_root, capture_output=True)
+    rows.append(("working tree", measure_tree(repo_root, args.runs, args.generators)))
+    print(render(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Benchmark the static tables cached with static_cache.static_table.
+
+For every generator class whose module binds a static table, generates the
+same seeded examples twice: once with each table swapped for its uncached
+original (fn.__wrapped__, so it is rebuilt on every call, as before the
+tables were cached) and once with the cached tables. The outputs are
+checked to be identical and the best-of-N time per example is reported,
+largest saving first, followed by the one-off cost of building each table.
+
+Usage:
+    uv run python tools/bench_static_tables.py
+    uv run python tools/bench_static_tables.py --samples 500 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import static_cache  # noqa: E402
+from base_generator import example_rng  # noqa: E402
+from tools.probe_generator_capacity import grouped_generators  # noqa: E402
+
+
+def _table_bindings(module):
+    """(attribute, table) for each static table bound in `module`."""
+    tables = set(map(id, static_cache.TABLES))
+    return [(attr, value) for attr, value in vars(module).items()
+            if id(value) in tables]
+
+
+def _patch(module, bindings, uncached):
+    for attr, table in bindings:
+        setattr(module, attr, table.__wrapped__ if uncached else table)
+
+
+def _run(instances, name, samples, seed):
+    out = []
+    for i in range(samples):
+        rng = example_rng(seed, name, i)
+        out.append(rng.choice(instances).sample(rng))
+    return out
+
+
+def bench_class(instances, name, samples, repeat, seed):
+    """(uncached us/example, cached us/example) for one class; raises
+    AssertionError if the cached tables change any example."""
+    module = sys.modules[type(instances[0]).__module__]
+    bindings = _table_bindings(module)
+    best = {"uncached": float("inf"), "cached": float("inf")}
+    outputs = {}
+    try:
+        for _ in range(repeat):
+            for label in best:
+                _patch(module, bindings, uncached=label == "uncached")
+                start = time.perf_counter()
+                outputs[label] = _run(instances, name, samples, seed)
+                best[label] = min(best[label], time.perf_counter() - start)
+    finally:
+        _patch(module, bindings, uncached=False)
+    if outputs["uncached"] != outputs["cached"]:
+        raise AssertionError(f"{name}: cached tables changed the output")
+    return best["uncached"] * 1e6 / samples, best["cached"] * 1e6 / samples
+
+
+def build_costs(tables):
+    """(qualified name, entries built, ms to rebuild them all) per table,
+    for the argument tuples cached so far."""
+    rows = []
+    for table in tables:
+        if not table.cache:
+            continue
+        start = time.perf_counter()
+        for args in list(table.cache):
+            table.__wrapped__(*args)
+        ms = (time.perf_counter() - start) * 1e3
+        module = table.__module__.rpartition(".")[2]
+        rows.append((f"{module}.{table.__qualname__}",
+                     len(table.cache), ms))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="examples per class per timing run")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing runs per class; the best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generators",
+                        help="comma-separated class names (default: every "
+                             "class using a static table)")
+    parser.add_argument("--top", type=int, default=20,
+                        help="rows to show (0 = all)")
+    args = parser.parse_args(argv)
+
+    from quixi_math_datagen import select_generators
+
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    rows = []
+    for name, instances in grouped_generators(generators):
+        module = sys.modules[type(instances[0]).__module__]
+        if _table_bindings(module):
+            old, new = bench_class(instances, name, args.samples, args.repeat,
+                                   args.seed)
+            rows.append((name, old, new))
+    if not rows:
+        print("No selected generator uses a static table.")
+        return 0
+    rows.sort(key=lambda row: row[1] - row[2], reverse=True)
+
+    print(f"{'generator':36} {'uncached us':>11} {'cached us':>10} {'speedup':>8}")
+    print("-" * 68)
+    for name, old, new in rows[:args.top or None]:
+        print(f"{name[:36]:36} {old:11.1f} {new:10.1f} {old / new:7.1f}x")
+    print("-" * 68)
+    total_old = sum(row[1] for row in rows)
+    total_new = sum(row[2] for row in rows)
+    print(f"{'mean per example':36} {total_old / len(rows):11.1f} "
+          f"{total_new / len(rows):10.1f} {total_old / total_new:7.1f}x")
+    print(f"All {len(rows)} classes produced identical examples.")
+    print()
+
+    print(f"{'table':60} {'entries':>7} {'build ms':>9}")
+    for label, entries, ms in build_costs(static_cache.TABLES):
+        print(f"{label[:60]:60} {entries:7} {ms:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Micro-benchmark step-string formatting.
+
+Compares the current helpers.step()/step1-3 against the original
+list-and-join step() in two ways:
+
+- per call, for typical 1- and 3-field steps;
+- per example, for every elementary generator class: each class generates
+  the same seeded examples with the original formatter patched into the
+  generator modules and with the current one, the outputs are checked to
+  be identical, and the best-of-N time per example is reported.
+
+Usage:
+    uv run python tools/bench_steps.py
+    uv run python tools/bench_steps.py --samples 500 --repeat 7
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+import helpers  # noqa: E402
+from base_generator import example_rng  # noqa: E402
+from helpers import DELIM  # noqa: E402
+
+STEP_NAMES = ("step", "step1", "step2", "step3")
+
+
+def legacy_step(op, x="", y="", z="", o=""):
+    """helpers.step() as originally written."""
+    parts = [op, str(x), str(y), str(z), str(o)]
+    while parts and parts[-1] == "":  # trim empties
+        parts.pop()
+    return DELIM.join(parts)
+
+
+def _patch_step_functions(replacement):
+    """Points every generator module's step names at `replacement` (or back
+    at helpers' own functions when it is None)."""
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("generators.") or module is None:
+            continue
+        for attr in STEP_NAMES:
+            if getattr(module, attr, None) in _STEP_FUNCTIONS + (legacy_step,):
+                setattr(module, attr, replacement or getattr(helpers, attr))
+
+
+_STEP_FUNCTIONS = tuple(getattr(helpers, attr) for attr in STEP_NAMES)
+
+
+def _run(instances, name, samples, seed):
+    out = []
+    for i in range(samples):
+        rng = example_rng(seed, name, i)
+        out.append(rng.choice(instances).sample(rng))
+    return out
+
+
+def bench_class(instances, name, samples, repeat, seed):
+    """(legacy us/example, current us/example) for one class; raises
+    AssertionError if the two formatters produce different examples."""
+    best = {"legacy": float("inf"), "current": float("inf")}
+    outputs = {}
+    for _ in range(repeat):
+        for label, replacement in (("legacy", legacy_step), ("current", None)):
+            _patch_step_functions(replacement)
+            try:
+                start = time.perf_counter()
+                outputs[label] = _run(instances, name, samples, seed)
+                best[label] = min(best[label], time.perf_counter() - start)
+            finally:
+                _patch_step_functions(None)
+    if outputs["legacy"] != outputs["current"]:
+        raise AssertionError(f"{name}: step formatting changed the output")
+    return (best["legacy"] * 1e6 / samples, best["current"] * 1e6 / samples)
+
+
+def bench_calls(number=200_000):
+    cases = [
+        ("step('Z', '30 R3')", "legacy_step('Z', '30 R3')", "step('Z', '30 R3')"),
+        ("step('D', 12, 4, 3)", "legacy_step('D', 12, 4, 3)", "step('D', 12, 4, 3)"),
+        ("step3('D', 12, 4, 3)", "legacy_step('D', 12, 4, 3)", "step3('D', 12, 4, 3)"),
+    ]
+    env = {"legacy_step": legacy_step, "step": helpers.step, "step3": helpers.step3}
+    rows = []
+    for label, old, new in cases:
+        t_old = min(timeit.repeat(old, globals=env, number=number, repeat=5))
+        t_new = min(timeit.repeat(new, globals=env, number=number, repeat=5))
+        rows.append((label, t_old * 1e9 / number, t_new * 1e9 / number))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="examples per class per timing run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing runs per class; the best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--grade", default="elementary",
+                        help="curriculum grade band to benchmark")
+    args = parser.parse_args(argv)
+
+    from curriculum import CURRICULUM
+    from quixi_math_datagen import GENERATOR_REGISTRY
+
+    print(f"{'call':24} {'legacy ns':>10} {'current ns':>10}")
+    for label, old, new in bench_calls():
+        print(f"{label:24} {old:10.0f} {new:10.0f}")
+    print()
+
+    by_class = {}
+    for entry in GENERATOR_REGISTRY:
+        if CURRICULUM.get(entry.class_name, {}).get("grade_level") == args.grade:
+            by_class.setdefault(entry.class_name, []).append(entry.load())
+
+    print(f"{'generator':36} {'legacy us':>10} {'current us':>10} {'saved':>7}")
+    print("-" * 66)
+    total_old = total_new = 0.0
+    for name, instances in by_class.items():
+        old, new = bench_class(instances, name, args.samples, args.repeat, args.seed)
+        total_old += old
+        total_new += new
+        print(f"{name[:36]:36} {old:10.1f} {new:10.1f} {1 - new / old:7.1%}")
+    print("-" * 66)
+    n = len(by_class)
+    print(f"{'mean per example':36} {total_old / n:10.1f} {total_new / n:10.1f} "
+          f"{1 - total_new / total_old:7.1%}")
+    print(f"All {n} {args.grade} classes produced identical examples.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,42 @@
 The builder streams generated examples directly to sharded Parquet files using
 the size-config layout described in dataset_plan.md. Smaller configs are prefix
 subsets of larger configs within each split.
+
+Each row's split is a function of its dedup key: the key digest modulo
+SPLIT_BUCKETS picks a bucket, and the buckets are divided between the splits
+by --split-fractions, by default in proportion to the splits' row targets so
+that every split fills up after about the same number of attempts. A key
+therefore belongs to exactly one split, so the
+splits share no rows by construction. There is one attempt stream; a build
+routes each attempt to its key's split in a single pass, and each split
+keeps its own dedup index. --splits builds a subset, so separate
+invocations (or machines) can build the splits concurrently into one output
+directory; generation_stats.json and the card are written once every split
+is done. Each such invocation walks the stream up to its own splits'
+targets and discards the other splits' keys, so building the splits
+separately costs more generation in total than one invocation building all
+of them.
+
+With --workers N, producer processes generate and validate attempt batches,
+the parent dedups and numbers rows, and one writer process appends columnar
+record batches to the shards. Every attempt has its own seed-derived RNG
+stream, so the release does not depend on N.
+
+With --checkpoint-every, each split is checkpointed at its shard boundaries
+(cursor, counters, stats, shard numbers and a dedup snapshot), and --resume
+continues an interrupted build into the same release.
+
+With --shard i/N, N processes (on one machine or many) each generate every
+Nth batch of attempts into a shard file named by -o, deduping locally;
+--merge builds the release from the N files, generating whatever they did
+not reach, and its shards equal an unsharded build's.
+
+Usage:
+    uv run python tools/build_hf_release.py -o ~/datasets/QuixiMath-1B --workers 16
+    uv run python tools/build_hf_release.py --preset smoke -o /tmp/qm-smoke
+    uv run python tools/build_hf_release.py --shard 0/2 -o shard-0.jsonl.gz --workers 16
+    uv run python tools/build_hf_release.py --merge shard-0.jsonl.gz shard-1.jsonl.gz \\
+        -o ~/datasets/QuixiMath-1B --workers 16
 """
 
 from __future__ import annotations
@@ -11,17 +47,19 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import multiprocessing
 import os
-import random
+import queue
 import shutil
 import subprocess
 import sys
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -30,11 +68,32 @@ if str(ROOT) not in sys.path:
 
 from quixi_math_datagen import (  # noqa: E402
     _instance_label,
+    _read_shard_header,
+    _shard_batch,
     group_into_skills,
+    parse_shard,
     resolve_pool,
     validate_example,
 )
+from base_generator import example_rng, materialize  # noqa: E402
+from checkpoint import (  # noqa: E402
+    CheckpointTimer,
+    check_resumable,
+    read_checkpoint,
+    remove_checkpoint,
+    restore_dedup,
+    write_checkpoint,
+)
+from dedup import (  # noqa: E402
+    COLLISION_POLICIES,
+    DEDUP_KINDS,
+    key_digest,
+    make_dedup_index,
+    semantic_digest,
+)
 from curriculum import stamp_metadata  # noqa: E402
+from jsonl_writer import JsonlWriter, open_jsonl  # noqa: E402
+from parquet_writer import text_for_example  # noqa: E402
 
 
 DEFAULT_CONFIGS = {
@@ -52,7 +111,27 @@ SMOKE_CONFIGS = {
 }
 
 CONFIG_ORDER = ("preview", "10M_tokens", "100M_tokens", "1B_tokens")
+# Rows per record batch handed to the writers (one Parquet row group each).
+RECORD_BATCH_ROWS = 10_000
+# Attempts per producer task when generating with --workers > 1.
+PRODUCER_BATCH_SIZE = 512
+# Seconds between checks that the Parquet writer process is still alive
+# while waiting on it.
+SINK_POLL_SECONDS = 1.0
 SPLIT_ORDER = ("test", "validation", "train")
+# A key's split is decided by its digest modulo SPLIT_BUCKETS; the buckets
+# are divided between the splits in SPLIT_ORDER by the split fractions
+# (default_split_fractions() unless given).
+SPLIT_BUCKETS = 10_000
+# Explicit split fractions that leave more than this share of the accepted
+# attempts in splits that are already full get a warning.
+SPLIT_WASTE_WARNING = 0.5
+# Checkpoint directory inside the output directory (one subdirectory per
+# split); removed on completion.
+CHECKPOINT_DIR = ".checkpoint"
+# Per-split generation stats, kept so separately built splits can be
+# combined into generation_stats.json.
+SPLIT_STATS_DIR = ".splits"
 
 SCHEMA = pa.schema(
     [
@@ -72,15 +151,6 @@ SCHEMA = pa.schema(
 )
 
 
-def text_for_example(example: Mapping[str, object]) -> str:
-    steps = "\n".join(str(s) for s in example["steps"])
-    return (
-        f"Problem:\n{example['problem']}\n\n"
-        f"Solution steps:\n{steps}\n\n"
-        f"Final answer:\n{example['final_answer']}"
-    )
-
-
 def git_value(args: List[str]) -> Optional[str]:
     try:
         result = subprocess.run(
@@ -112,6 +182,13 @@ def size_category(rows: int) -> str:
 
 
 class SplitWriter:
+    """Streams one config/split to numbered Parquet shards.
+
+    Record batches are appended to the open shard as row groups, so memory
+    is bounded by the batch size rather than by shard_rows. The last shard
+    is closed as soon as target_rows is reached.
+    """
+
     def __init__(
         self,
         output_dir: Path,
@@ -127,38 +204,65 @@ class SplitWriter:
         self.target_rows = target_rows
         self.shard_rows = shard_rows
         self.compression = compression
-        self.rows: List[dict] = []
         self.row_count = 0
         self.text_chars = 0
         self.shard_index = 0
+        self.shard_row_count = 0
         self.total_shards = max(1, math.ceil(target_rows / shard_rows))
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._path: Optional[Path] = None
         (output_dir / config).mkdir(parents=True, exist_ok=True)
 
-    def add(self, row: dict) -> None:
+    def add_batch(self, batch: pa.RecordBatch) -> None:
+        batch = batch.slice(0, max(0, self.target_rows - self.row_count))
+        self.row_count += batch.num_rows
+        self.text_chars += pc.sum(pc.utf8_length(batch.column("text"))).as_py() or 0
+        while batch.num_rows:
+            if self._writer is None:
+                path = (
+                    self.output_dir
+                    / self.config
+                    / f"{self.split}-{self.shard_index:05d}-of-{self.total_shards:05d}.parquet"
+                )
+                self._writer = pq.ParquetWriter(path, SCHEMA, compression=self.compression)
+                self._path = path
+            take = min(batch.num_rows, self.shard_rows - self.shard_row_count)
+            self._writer.write_batch(batch.slice(0, take))
+            self.shard_row_count += take
+            batch = batch.slice(take)
+            if self.shard_row_count >= self.shard_rows:
+                self.flush()
         if self.row_count >= self.target_rows:
-            return
-        self.rows.append(dict(row))
-        self.row_count += 1
-        self.text_chars += len(row["text"])
-        if len(self.rows) >= self.shard_rows:
             self.flush()
 
     def flush(self) -> None:
-        if not self.rows:
+        """Closes the current shard file, if one is open, and fsyncs it: a
+        checkpoint may count it as written."""
+        if self._writer is None:
             return
-        path = (
-            self.output_dir
-            / self.config
-            / f"{self.split}-{self.shard_index:05d}-of-{self.total_shards:05d}.parquet"
-        )
-        table = pa.Table.from_pylist(self.rows, schema=SCHEMA)
-        pq.write_table(table, path, compression=self.compression)
-        self.rows.clear()
+        self._writer.close()
+        with open(self._path, "rb") as fp:
+            os.fsync(fp.fileno())
+        self._writer = None
+        self.shard_row_count = 0
         self.shard_index += 1
 
     def close(self) -> None:
         self.flush()
 
+    def state(self) -> List[int]:
+        """[row_count, text_chars, shard_index]; only valid between shards."""
+        if self._writer is not None:
+            raise RuntimeError(f"{self.config}/{self.split}: shard still open")
+        return [self.row_count, self.text_chars, self.shard_index]
+
+    def restore(self, state: List[int]) -> None:
+        """Continues from state(), removing shards written after it."""
+        self.row_count, self.text_chars, self.shard_index = state
+        for path in (self.output_dir / self.config).glob(f"{self.split}-*.parquet"):
+            if int(path.name.split("-")[1]) >= self.shard_index:
+                path.unlink()
+
     @property
     def rough_tokens(self) -> int:
         return round(self.text_chars / 4)
@@ -180,6 +284,44 @@ class ReleaseStats:
         self.operation: Counter[str] = Counter()
         self.generator_stats: MutableMapping[str, Counter[str]] = defaultdict(Counter)
         self.attempts_by_split: Counter[str] = Counter()
+        self.other_split_by_split: Counter[str] = Counter()
+
+    _COUNTERS = ("rows_by_largest_split", "grade", "difficulty", "grade_difficulty",
+                 "generator", "operation", "attempts_by_split", "other_split_by_split")
+
+    def to_state(self) -> dict:
+        """The row counters, as JSON for checkpoints (writer totals are
+        observed at the end and not included)."""
+        state = {name: dict(getattr(self, name)) for name in self._COUNTERS}
+        state["generator_stats"] = {
+            name: dict(counts) for name, counts in self.generator_stats.items()
+        }
+        return state
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, dict]) -> "ReleaseStats":
+        return cls.from_states([state])
+
+    @classmethod
+    def from_states(cls, states: Iterable[Mapping[str, dict]]) -> "ReleaseStats":
+        """The sum of several to_state() counters (e.g. one per split).
+
+        Errors have no key, so every split counts the errors of the stream
+        prefix it read; they combine as the longest prefix's count, the
+        maximum, rather than a sum.
+        """
+        stats = cls()
+        for state in states:
+            for name in cls._COUNTERS:
+                getattr(stats, name).update(state[name])
+            for name, counts in state["generator_stats"].items():
+                merged = stats.generator_stats[name]
+                for count, value in counts.items():
+                    if count == "errors":
+                        merged[count] = max(merged[count], value)
+                    else:
+                        merged[count] += value
+        return stats
 
     def observe_largest_row(self, split: str, row: Mapping[str, object]) -> None:
         grade = str(row["grade_level"])
@@ -191,9 +333,9 @@ class ReleaseStats:
         self.generator[str(row["generator"])] += 1
         self.operation[str(row["operation"])] += 1
 
-    def observe_writer(self, writer: SplitWriter) -> None:
-        self.rows_by_config_split[writer.config][writer.split] = writer.row_count
-        self.text_chars_by_config_split[writer.config][writer.split] = writer.text_chars
+    def observe_writer(self, config: str, split: str, row_count: int, text_chars: int) -> None:
+        self.rows_by_config_split[config][split] = row_count
+        self.text_chars_by_config_split[config][split] = text_chars
 
     def as_json(self) -> dict:
         return {
@@ -210,6 +352,7 @@ class ReleaseStats:
             },
             "rows_by_largest_split": dict(sorted(self.rows_by_largest_split.items())),
             "attempts_by_split": dict(sorted(self.attempts_by_split.items())),
+            "other_split_by_split": dict(sorted(self.other_split_by_split.items())),
             "rows_by_grade_level": dict(sorted(self.grade.items())),
             "rows_by_difficulty": dict(sorted(self.difficulty.items())),
             "rows_by_grade_level_and_difficulty": dict(
@@ -242,6 +385,72 @@ def max_rows_by_split(configs: Mapping[str, Mapping[str, int]]) -> Dict[str, int
     return result
 
 
+def default_split_fractions(configs: Mapping[str, Mapping[str, int]]) -> Dict[str, float]:
+    """Each split's largest configured row count as a share of their sum
+    (rounded to 6 places), so the splits reach their targets after about
+    the same number of attempts and few attempts are generated for a
+    split that is already full."""
+    max_rows = max_rows_by_split(configs)
+    total = sum(max_rows.values())
+    if not total:
+        raise ValueError("the configs ask for no rows")
+    return {split: round(max_rows[split] / total, 6)
+            for split in SPLIT_ORDER if max_rows[split]}
+
+
+def split_waste(fractions: Mapping[str, float], targets: Mapping[str, int]) -> float:
+    """Estimated share of accepted attempts that land in a full split (or
+    one with no target) when every split is built in one pass."""
+    total = sum(fractions.values())
+    attempts = max(target / (fractions.get(split, 0) / total or 1e-12)
+                   for split, target in targets.items())
+    return max(0.0, 1 - sum(targets.values()) / attempts)
+
+
+def parse_split_fractions(spec: str) -> Dict[str, float]:
+    """Parses "test=0.05,validation=0.05,train=0.9"; raises ValueError."""
+    fractions: Dict[str, float] = {}
+    for part in spec.split(","):
+        split, sep, value = part.strip().partition("=")
+        if not sep or split not in SPLIT_ORDER or split in fractions:
+            raise ValueError(
+                f"Bad split fraction {part.strip()!r}; expected SPLIT=FRACTION "
+                f"once each for {', '.join(SPLIT_ORDER)}"
+            )
+        try:
+            fractions[split] = float(value)
+        except ValueError:
+            raise ValueError(f"Fraction for {split} must be a number, got {value!r}") from None
+    return fractions
+
+
+def split_buckets(fractions: Mapping[str, float]) -> Dict[str, Tuple[int, int]]:
+    """[start, stop) of each split's buckets, in SPLIT_ORDER.
+
+    Fractions are normalized and apportioned over SPLIT_BUCKETS by largest
+    remainder; a split with no fraction gets an empty range.
+    """
+    if any(value < 0 for value in fractions.values()) or not sum(fractions.values()) > 0:
+        raise ValueError(f"split fractions must be >= 0 with a positive sum, got {fractions}")
+    total = sum(fractions.values())
+    shares = {split: fractions.get(split, 0) * SPLIT_BUCKETS / total for split in SPLIT_ORDER}
+    counts = {split: int(share) for split, share in shares.items()}
+    leftover = SPLIT_BUCKETS - sum(counts.values())
+    for split in sorted(SPLIT_ORDER, key=lambda name: counts[name] - shares[name])[:leftover]:
+        counts[split] += 1
+    ranges = {}
+    start = 0
+    for split in SPLIT_ORDER:
+        ranges[split] = (start, start + counts[split])
+        start += counts[split]
+    return ranges
+
+
+def key_bucket(key: object) -> int:
+    """The split bucket of a dedup key (text key or semantic digest)."""
+    return key_digest(key, 64) % SPLIT_BUCKETS
+
+
 def make_row(
     example: Mapping[str, object],
     gen_instance: object,
@@ -265,25 +474,31 @@ def make_row(
     }
 
 
-def generate_release(
-    output_dir: Path,
+def writer_specs(
     configs: Mapping[str, Mapping[str, int]],
-    seed: int,
-    shard_rows: int,
-    compression: str,
-) -> dict:
-    random.seed(seed)
-    gen_pool = resolve_pool(None)
-    skills = group_into_skills(gen_pool)
-    skill_names = list(skills)
-    split_targets = max_rows_by_split(configs)
-    stats = ReleaseStats()
-    seen = set()
+) -> List[Tuple[str, str, int]]:
+    """(config, split, target_rows) for every writer, in CONFIG_ORDER."""
+    return [
+        (config, split, rows)
+        for config in CONFIG_ORDER
+        for split, rows in configs.get(config, {}).items()
+    ]
 
-    writers: Dict[Tuple[str, str], SplitWriter] = {}
-    for config in CONFIG_ORDER:
-        for split, rows in configs.get(config, {}).items():
-            writers[(config, split)] = SplitWriter(
+
+class ReleaseSink:
+    """Owns the SplitWriters and routes each split's rows to every config
+    whose target covers them (see selected_writers)."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        specs: Iterable[Tuple[str, str, int]],
+        shard_rows: int,
+        compression: str,
+        state: Optional[Mapping[str, List[int]]] = None,
+    ) -> None:
+        self.writers: Dict[Tuple[str, str], SplitWriter] = {
+            (config, split): SplitWriter(
                 output_dir=output_dir,
                 config=config,
                 split=split,
@@ -291,69 +506,808 @@ def generate_release(
                 shard_rows=shard_rows,
                 compression=compression,
             )
+            for config, split, rows in specs
+        }
+        for (config, split), writer in self.writers.items():
+            writer.restore((state or {}).get(f"{config}/{split}", [0, 0, 0]))
+
+    def write(self, split: str, start: int, columns: Mapping[str, list]) -> None:
+        """Appends rows start.. of `split`, given column-wise."""
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in SCHEMA],
+            schema=SCHEMA,
+        )
+        for writer in selected_writers(self.writers, split, start):
+            writer.add_batch(batch)
 
-    for split in SPLIT_ORDER:
-        target = split_targets.get(split, 0)
-        if target <= 0:
-            continue
-        print(f"Generating {target:,} unique rows for largest {split} split...")
-        emitted = 0
-        attempts = 0
-        max_attempts = target * 20 + 100_000
-        consecutive_rejects = 0
-        max_consecutive_rejects = max(200_000, target)
-        while emitted < target and attempts < max_attempts:
-            if consecutive_rejects >= max_consecutive_rejects:
-                raise RuntimeError(
-                    f"No accepted {split} rows in {consecutive_rejects:,} attempts; "
-                    "problem space may be exhausted."
-                )
-            attempts += 1
-            skill = random.choice(skill_names)
-            gen_instance = random.choice(skills[skill])
-            label = _instance_label(gen_instance)
+    def sync(self) -> Dict[str, List[int]]:
+        """{"config/split": writer state} once everything written so far is
+        on disk; call only at shard boundaries."""
+        return {
+            f"{config}/{split}": writer.state()
+            for (config, split), writer in self.writers.items()
+        }
+
+    def close(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Closes every writer; returns {(config, split): (rows, text_chars)}."""
+        totals = {}
+        for key, writer in self.writers.items():
+            writer.close()
+            totals[key] = (writer.row_count, writer.text_chars)
+        return totals
+
+
+def _sink_process_main(inbox, outbox, output_dir, specs, shard_rows, compression,
+                       state) -> None:
+    sink = ReleaseSink(output_dir, specs, shard_rows, compression, state)
+    for message in iter(inbox.get, None):
+        if message == "sync":
+            outbox.put(sink.sync())
+        else:
+            sink.write(*message)
+    outbox.put(sink.close())
+
+
+class ProcessReleaseSink:
+    """ReleaseSink running in its own process, so Arrow conversion and
+    Parquet compression overlap with generation.
+
+    Every wait on the writer polls it, so a writer that dies (an exception,
+    a kill) raises RuntimeError here instead of blocking forever.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        specs: Iterable[Tuple[str, str, int]],
+        shard_rows: int,
+        compression: str,
+        state: Optional[Mapping[str, List[int]]] = None,
+    ) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self.inbox = ctx.Queue(maxsize=8)
+        self.outbox = ctx.Queue()
+        self.process = ctx.Process(
+            target=_sink_process_main,
+            args=(self.inbox, self.outbox, output_dir, list(specs), shard_rows, compression,
+                  state),
+            daemon=True,
+        )
+        self.process.start()
+
+    def _check_alive(self) -> None:
+        if not self.process.is_alive():
+            raise RuntimeError(
+                f"Parquet writer process exited with {self.process.exitcode}"
+            )
+
+    def _put(self, message) -> None:
+        while True:
+            self._check_alive()
             try:
-                example = gen_instance.generate()
-                if not example:
-                    raise ValueError("generate() returned an empty example")
-                example = stamp_metadata(example, gen_instance)
-                validate_example(example)
-            except Exception as exc:
-                stats.generator_stats[label]["errors"] += 1
-                consecutive_rejects += 1
-                if stats.generator_stats[label]["errors"] <= 5:
-                    print(f"ERROR: {label} failed validation: {exc}")
-                continue
-
-            key = (example["operation"], example["problem"])
-            if key in seen:
-                stats.generator_stats[label]["duplicates_skipped"] += 1
-                consecutive_rejects += 1
-                continue
-
-            seen.add(key)
-            row = make_row(example, gen_instance, split, emitted)
-            for writer in selected_writers(writers, split, emitted):
-                writer.add(row)
-            stats.observe_largest_row(split, row)
-            stats.generator_stats[label]["emitted"] += 1
-            emitted += 1
-            consecutive_rejects = 0
-            if emitted % 100_000 == 0 or emitted == target:
-                print(
-                    f"... {split}: {emitted:,}/{target:,} rows "
-                    f"after {attempts:,} attempts"
-                )
-        stats.attempts_by_split[split] = attempts
-        if emitted != target:
+                self.inbox.put(message, timeout=SINK_POLL_SECONDS)
+                return
+            except queue.Full:
+                pass
+
+    def _get(self):
+        while True:
+            alive = self.process.is_alive()
+            try:
+                return self.outbox.get(timeout=SINK_POLL_SECONDS)
+            except queue.Empty:
+                # Checked before the wait: a writer flushes its reply
+                # before it exits, so an empty outbox after that is final.
+                if not alive:
+                    self._check_alive()
+
+    def write(self, split: str, start: int, columns: Mapping[str, list]) -> None:
+        self._put((split, start, dict(columns)))
+
+    def sync(self) -> Dict[str, List[int]]:
+        self._put("sync")
+        return self._get()
+
+    def close(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        self._put(None)
+        totals = self._get()
+        self.process.join()
+        if self.process.exitcode:
+            raise RuntimeError(f"Parquet writer process exited with {self.process.exitcode}")
+        return totals
+
+
+_producer_skills: Optional[Mapping[str, list]] = None
+_producer_skill_names: Optional[List[str]] = None
+_producer_buckets: Optional[Mapping[str, Tuple[int, int]]] = None
+_producer_splits: Optional[Iterable[str]] = None
+
+
+def key_split(key: object, buckets: Mapping[str, Tuple[int, int]]) -> str:
+    """The split whose bucket range holds `key`."""
+    bucket = key_bucket(key)
+    for split, (lo, hi) in buckets.items():
+        if lo <= bucket < hi:
+            return split
+    raise ValueError(f"bucket {bucket} is in no split's range")
+
+
+def release_attempt(
+    skills: Mapping[str, list],
+    skill_names: List[str],
+    seed: int,
+    index: int,
+    buckets: Mapping[str, Tuple[int, int]],
+    splits: Optional[Iterable[str]] = None,
+) -> Tuple[str, object, Optional[str], Optional[dict], Optional[str]]:
+    """Attempt `index` of the release's one attempt stream.
+
+    Returns (label, key, split, row, error) with the error message as a
+    string (it may cross a process boundary). `split` is the key's split
+    under `buckets`; the row is only rendered when that split is one of
+    `splits` (default: all), and row_id/example_id are placeholders until
+    the row is accepted.
+    """
+    rng = example_rng(seed, "release", index)
+    skill = rng.choice(skill_names)
+    gen_instance = materialize(rng.choice(skills[skill]))
+    label = _instance_label(gen_instance)
+    try:
+        example = gen_instance.sample(rng)
+        if not example:
+            raise ValueError("generate() returned an empty example")
+        dedup_key = example.pop("dedup_key", None)
+        example = stamp_metadata(example, gen_instance)
+        validate_example(example)
+    except Exception as exc:
+        return label, None, None, None, str(exc)
+    if dedup_key is None:
+        key = (example["operation"], example["problem"])
+    else:
+        key = semantic_digest(example["operation"], dedup_key)
+    split = key_split(key, buckets)
+    if splits is not None and split not in splits:
+        return label, key, split, None, None
+    return label, key, split, make_row(example, gen_instance, split, 0), None
+
+
+def _init_producer(skills: Mapping[str, list], skill_names: List[str],
+                   buckets: Mapping[str, Tuple[int, int]],
+                   splits: Optional[Iterable[str]]) -> None:
+    global _producer_skills, _producer_skill_names, _producer_buckets, _producer_splits
+    _producer_skills = skills
+    _producer_skill_names = skill_names
+    _producer_buckets = buckets
+    _producer_splits = splits
+
+
+def _produce_batch(seed: int, start: int, size: int) -> list:
+    return [
+        release_attempt(_producer_skills, _producer_skill_names, seed, index,
+                        _producer_buckets, _producer_splits)
+        for index in range(start, start + size)
+    ]
+
+
+def release_batches(
+    skills: Mapping[str, list],
+    skill_names: List[str],
+    seed: int,
+    buckets: Mapping[str, Tuple[int, int]],
+    splits: Optional[Iterable[str]] = None,
+    pool=None,
+    workers: int = 1,
+    slot: int = 0,
+    shard: Tuple[int, int] = (0, 1),
+):
+    """Yields (batch, attempts) for attempt batches slot, slot+1, ... of
+    `shard`: batch b is attempts b*PRODUCER_BATCH_SIZE onwards as
+    release_attempt() results, and shard (i, N) runs batches i, i+N, ...
+    A `pool` (its producers initialized with the same buckets and splits)
+    computes them ahead, workers*2 batches at a time."""
+    if pool is None:
+        while True:
+            batch = _shard_batch(slot, shard)
+            first = batch * PRODUCER_BATCH_SIZE
+            yield batch, [release_attempt(skills, skill_names, seed, index, buckets, splits)
+                          for index in range(first, first + PRODUCER_BATCH_SIZE)]
+            slot += 1
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                batch = _shard_batch(slot, shard)
+                pending.append((batch, pool.apply_async(
+                    _produce_batch, (seed, batch * PRODUCER_BATCH_SIZE, PRODUCER_BATCH_SIZE))))
+                slot += 1
+            batch, result = pending.popleft()
+            yield batch, result.get()
+    finally:
+        # Drain in-flight work so the pool is idle when it is closed.
+        for _, result in pending:
+            result.wait()
+
+
+def release_attempts(
+    skills: Mapping[str, list],
+    skill_names: List[str],
+    seed: int,
+    buckets: Mapping[str, Tuple[int, int]],
+    splits: Optional[Iterable[str]] = None,
+    pool=None,
+    workers: int = 1,
+    start: int = 0,
+):
+    """Yields release_attempt() results for indices start, start+1, ... in
+    order (see release_batches)."""
+    skip = start % PRODUCER_BATCH_SIZE
+    batches = release_batches(skills, skill_names, seed, buckets, splits, pool, workers,
+                              slot=start // PRODUCER_BATCH_SIZE)
+    try:
+        for _, attempts in batches:
+            yield from attempts[skip:]
+            skip = 0
+    finally:
+        batches.close()
+
+
+def _split_stats_path(output_dir: Path, split: str) -> Path:
+    return output_dir / SPLIT_STATS_DIR / f"{split}.json"
+
+
+def read_split_stats(output_dir: Path, split: str) -> Optional[dict]:
+    """The stats a finished build of `split` left in output_dir, or None."""
+    path = _split_stats_path(output_dir, split)
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_split_stats(output_dir: Path, split: str, part: Mapping[str, object]) -> None:
+    path = _split_stats_path(output_dir, split)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps(part, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _SplitBuild:
+    """One split's side of a release pass: its dedup index, writers,
+    counters and checkpoint (output_dir/.checkpoint/<split>).
+
+    take() consumes the stream's attempts in order from `attempts` on.
+    Attempts whose key belongs to another split are counted in
+    other_split_by_split and skipped; they do not count towards the
+    exhausted-space stop.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        split: str,
+        target: int,
+        params: Mapping[str, object],
+        buckets: Tuple[int, int],
+        process_sink: bool,
+        dedup_options: Tuple,
+        checkpoint_every: Optional[float],
+        resume: bool,
+    ) -> None:
+        self.output_dir = output_dir
+        self.split = split
+        self.target = target
+        self.params = params
+        self.shard_rows = params["shard_rows"]
+        self.timer = CheckpointTimer(checkpoint_every)
+        self.seen = make_dedup_index(*dedup_options)
+        self.stats = ReleaseStats()
+        self.checkpoint_dir = str(output_dir / CHECKPOINT_DIR / split)
+        self.emitted = self.attempts = self.other = self.consecutive_rejects = 0
+        state = read_checkpoint(self.checkpoint_dir) if resume else None
+        writer_state = None
+        if state is not None:
+            check_resumable(state, params)
+            self.stats = ReleaseStats.from_state(state["stats"])
+            restore_dedup(self.checkpoint_dir, self.seen)
+            writer_state = state["writers"]
+            self.emitted = state["emitted"]
+            self.attempts = state["attempts"]
+            self.other = state["other_split"]
+            self.consecutive_rejects = state["consecutive_rejects"]
+            print(
+                f"Resuming {split} from checkpoint: {self.emitted:,} rows, "
+                f"{self.attempts:,} attempts."
+            )
+        specs = [spec for spec in writer_specs(params["configs"]) if spec[1] == split]
+        sink_class = ProcessReleaseSink if process_sink else ReleaseSink
+        self.sink = sink_class(output_dir, specs, self.shard_rows, params["compression"],
+                               writer_state)
+        self.max_attempts = _split_max_attempts(target, buckets)
+        self.max_consecutive_rejects = max(200_000, target)
+        self.columns: Dict[str, list] = {field.name: [] for field in SCHEMA}
+        self.batch_start = self.emitted
+        share = (buckets[1] - buckets[0]) / SPLIT_BUCKETS
+        print(f"Generating {target:,} unique rows for largest {split} split "
+              f"({share:.1%} of key buckets)...")
+
+    @property
+    def done(self) -> bool:
+        return self.emitted >= self.target
+
+    def take(self, label: str, key: object, split: Optional[str], row: Optional[dict],
+             exc: Optional[str]) -> None:
+        """Consumes the stream's attempt number `self.attempts`."""
+        if self.consecutive_rejects >= self.max_consecutive_rejects:
+            raise RuntimeError(
+                f"No accepted {self.split} rows in {self.consecutive_rejects:,} attempts; "
+                "problem space may be exhausted."
+            )
+        if self.attempts >= self.max_attempts:
             raise RuntimeError(
-                f"Target for {split} not reached: emitted {emitted:,}/{target:,} "
-                f"after {attempts:,} attempts."
+                f"Target for {self.split} not reached: emitted "
+                f"{self.emitted:,}/{self.target:,} after {self.attempts:,} attempts."
             )
+        self.attempts += 1
+        stats = self.stats
+        if exc is not None:
+            stats.generator_stats[label]["errors"] += 1
+            self.consecutive_rejects += 1
+            if stats.generator_stats[label]["errors"] <= 5:
+                print(f"ERROR: {label} failed validation: {exc}")
+            return
+        if split != self.split:
+            self.other += 1
+            return
+        if not self.seen.add(key):
+            stats.generator_stats[label]["duplicates_skipped"] += 1
+            self.consecutive_rejects += 1
+            return
+
+        emitted = self.emitted
+        row["row_id"] = emitted
+        row["example_id"] = f"{self.split}-{emitted:09d}"
+        for name, values in self.columns.items():
+            values.append(row[name])
+        stats.observe_largest_row(self.split, row)
+        stats.generator_stats[label]["emitted"] += 1
+        emitted = self.emitted = emitted + 1
+        self.consecutive_rejects = 0
+        # Record batches never straddle a shard boundary, so every
+        # boundary is a consistent checkpoint position.
+        at_boundary = emitted % self.shard_rows == 0 or emitted == self.target
+        if emitted - self.batch_start >= RECORD_BATCH_ROWS or at_boundary:
+            self.sink.write(self.split, self.batch_start, self.columns)
+            self.columns = {field.name: [] for field in SCHEMA}
+            self.batch_start = emitted
+        if at_boundary and self.timer.due():
+            write_checkpoint(self.checkpoint_dir, {
+                "params": self.params,
+                "split": self.split,
+                "emitted": emitted,
+                "attempts": self.attempts,
+                "other_split": self.other,
+                "consecutive_rejects": self.consecutive_rejects,
+                "stats": stats.to_state(),
+                "writers": self.sink.sync(),
+            }, self.seen)
+            self.timer.reset()
+        if emitted % 100_000 == 0 or emitted == self.target:
+            print(
+                f"... {self.split}: {emitted:,}/{self.target:,} rows "
+                f"after {self.attempts:,} attempts"
+            )
+
+    def close(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Writes the last record batch and closes the writers."""
+        try:
+            if self.emitted > self.batch_start:
+                self.sink.write(self.split, self.batch_start, self.columns)
+                self.columns = {field.name: [] for field in SCHEMA}
+                self.batch_start = self.emitted
+        finally:
+            totals = self.sink.close()
+        return totals
+
+    def abort(self) -> None:
+        """Closes the writers and index after a failure; the checkpoint stays."""
+        try:
+            self.sink.close()
+        finally:
+            self.seen.close()
+
+    def finish(self) -> dict:
+        """Closes a finished split and returns its stats part (also saved
+        under SPLIT_STATS_DIR)."""
+        try:
+            totals = self.close()
+        except BaseException:
+            self.seen.close()
+            raise
+        seen = self.seen
+        self.stats.attempts_by_split[self.split] = self.attempts
+        self.stats.other_split_by_split[self.split] = self.other
+        print(f"Dedup index ({self.split}): {seen.describe()}")
+        part = {
+            "params": self.params,
+            "split": self.split,
+            "stats": self.stats.to_state(),
+            "writers": {f"{config}/{name}": list(total)
+                        for (config, name), total in totals.items()},
+            "dedup_index": {
+                "kind": seen.kind,
+                "keys": len(seen),
+                "memory_bytes": seen.memory_bytes(),
+                "disk_bytes": seen.disk_bytes(),
+                "collisions": seen.collisions,
+            },
+        }
+        seen.close()
+        _write_split_stats(self.output_dir, self.split, part)
+        remove_checkpoint(self.checkpoint_dir)
+        try:
+            os.rmdir(self.output_dir / CHECKPOINT_DIR)
+        except OSError:
+            pass  # other splits' checkpoints remain
+        return part
+
+
+def generate_splits(
+    output_dir: Path,
+    targets: Mapping[str, int],
+    params: Mapping[str, object],
+    skills: Mapping[str, list],
+    buckets: Mapping[str, Tuple[int, int]],
+    workers: int = 1,
+    pool=None,
+    dedup_options: Tuple = ("hash128", None, None, "keep"),
+    checkpoint_every: Optional[float] = None,
+    resume: bool = False,
+    merge: Optional[List[str]] = None,
+) -> Dict[str, dict]:
+    """Generates each split's `targets[split]` rows into its config shards
+    in one pass over the attempt stream; returns {split: stats part}.
+
+    Every attempt is routed to the split its key belongs to, so a release
+    generates each attempt once however many splits it builds. Each split
+    keeps its own dedup index, writers, counters and checkpoint, and takes
+    the stream from its own cursor: a resumed pass starts at the smallest
+    cursor and a split ignores attempts before its own. A split is finished
+    as soon as it reaches its target; the pass ends with the last one.
+    With `merge` the attempts are read from those shard files while they
+    last (see merged_release_attempts).
+    """
+    seed = params["seed"]
+    skill_names = list(skills)
+    builds: List[_SplitBuild] = []
+    parts: Dict[str, dict] = {}
+    try:
+        for split, target in targets.items():
+            builds.append(_SplitBuild(
+                output_dir, split, target, params, buckets[split], pool is not None,
+                dedup_options, checkpoint_every, resume))
+        start = min((build.attempts for build in builds), default=0)
+
+        def live(first):
+            return release_attempts(skills, skill_names, seed, buckets, list(targets), pool,
+                                    workers, start=first)
+        stream = (live(start) if not merge
+                  else merged_release_attempts(merge, params, start, live))
+        try:
+            index = start
+            while builds:
+                attempt = next(stream)
+                for build in builds:
+                    if build.attempts == index:
+                        build.take(*attempt)
+                for build in [build for build in builds if build.done]:
+                    builds.remove(build)
+                    parts[build.split] = build.finish()
+                index += 1
+        finally:
+            stream.close()
+    except BaseException:
+        for build in builds:
+            try:
+                build.abort()
+            except Exception:
+                pass  # keep the original error
+        raise
+    return parts
+
+
+def _release_setup(
+    configs: Mapping[str, Mapping[str, int]],
+    seed: int,
+    shard_rows: int,
+    compression: str,
+    dedup: str,
+    split_fractions: Optional[Mapping[str, float]],
+    dedup_memory_mb: Optional[float],
+    dedup_on_collision: str,
+) -> Tuple[dict, Dict[str, Tuple[int, int]], Dict[str, int], Dict[str, list], list]:
+    """(params, buckets, {split: target} in SPLIT_ORDER, skills, generator
+    pool) for a release; raises ValueError for bad options."""
+    fractions = dict(default_split_fractions(configs) if split_fractions is None
+                     else split_fractions)
+    buckets = split_buckets(fractions)
+    max_rows = max_rows_by_split(configs)
+    split_targets = {split: max_rows[split] for split in SPLIT_ORDER if max_rows[split] > 0}
+    for split in split_targets:
+        if buckets[split][0] == buckets[split][1]:
+            raise ValueError(f"split {split} has rows in the configs but no "
+                             f"share of the key buckets")
+    waste = split_waste(fractions, split_targets)
+    if split_fractions is not None and waste > SPLIT_WASTE_WARNING:
+        print(f"WARN: split fractions {fractions} do not match the split targets "
+              f"{split_targets}: about {waste:.0%} of accepted attempts will land in "
+              f"a split that is already full (omit --split-fractions to use "
+              f"fractions proportional to the targets).")
+    # Validate options early.
+    make_dedup_index(dedup, dedup_memory_mb, on_collision=dedup_on_collision).close()
+
+    gen_pool = resolve_pool(None)
+    skills = group_into_skills(gen_pool)
+    params = {
+        "seed": seed,
+        "configs": {config: dict(rows) for config, rows in configs.items()},
+        "shard_rows": shard_rows,
+        "compression": compression,
+        "dedup": dedup,
+        "dedup_on_collision": dedup_on_collision,
+        "split_fractions": fractions,
+        "skills": {name: len(skills[name]) for name in skills},
+    }
+    return params, buckets, split_targets, skills, gen_pool
+
+
+def _split_max_attempts(target: int, buckets: Tuple[int, int]) -> int:
+    """Attempts a split of `target` rows may take before it gives up."""
+    lo, hi = buckets
+    return math.ceil((target * 20 + 100_000) / ((hi - lo) / SPLIT_BUCKETS))
+
+
+def generate_release_shard(
+    path: str,
+    configs: Mapping[str, Mapping[str, int]],
+    seed: int,
+    shard: Tuple[int, int],
+    shard_rows: int,
+    compression: str,
+    workers: int = 1,
+    dedup: str = "hash128",
+    split_fractions: Optional[Mapping[str, float]] = None,
+    dedup_memory_mb: Optional[float] = None,
+    dedup_spill_dir: Optional[str] = None,
+    dedup_on_collision: str = "keep",
+) -> dict:
+    """Generates slice shard=(i, N) of a release's attempts into a shard file
+    for generate_release(merge=...); returns {split: rows kept}.
+
+    The shard runs attempt batches i, i+N, ... (PRODUCER_BATCH_SIZE
+    attempts each) and writes `path` as JSONL (compressed by its suffix): a
+    header with the release options, then one record per batch holding
+    every attempt as [label, key, split, row, error]. Each split is deduped
+    locally, and a local duplicate keeps only its key: its earlier twin
+    comes first in the merged stream too, so the merge rejects it as well.
+    The shard stops after the batch that gives every split about 1/N of its
+    target (or its share of the attempt budget); the merge generates
+    whatever the shards did not reach.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    index, count = shard
+    params, buckets, split_targets, skills, _ = _release_setup(
+        configs, seed, shard_rows, compression, dedup, split_fractions, dedup_memory_mb,
+        dedup_on_collision)
+    skill_names = list(skills)
+    targets = {split: -(-target // count) for split, target in split_targets.items()}
+    max_attempts = max(_split_max_attempts(target, buckets[split])
+                       for split, target in split_targets.items())
+    max_attempts = -(-max_attempts // count)
+    seen = {split: make_dedup_index(dedup, dedup_memory_mb, dedup_spill_dir,
+                                    dedup_on_collision)
+            for split in split_targets}
+    kept = dict.fromkeys(split_targets, 0)
+    attempts = 0
+    print(f"Building release shard {index}/{count}: about "
+          f"{', '.join(f'{rows:,} {split}' for split, rows in targets.items())} rows...")
+    pool = None
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=_init_producer,
+                                    initargs=(skills, skill_names, buckets,
+                                              list(split_targets)))
+    batches = release_batches(skills, skill_names, seed, buckets, list(split_targets),
+                              pool, workers, shard=shard)
+    try:
+        with JsonlWriter(path, "w") as fp:
+            fp.write(json.dumps({"shard": [index, count], "params": params}) + "\n")
+            for batch, results in batches:
+                record = []
+                for label, key, split, row, exc in results:
+                    if row is not None and not seen[split].add(key):
+                        row = None
+                    elif row is not None:
+                        kept[split] += 1
+                    record.append([label, key, split, row, exc])
+                fp.write(json.dumps({"batch": batch, "attempts": record},
+                                    ensure_ascii=False) + "\n")
+                attempts += len(results)
+                if (all(kept[split] >= target for split, target in targets.items())
+                        or attempts >= max_attempts):
+                    break
+    finally:
+        batches.close()
+        for split_seen in seen.values():
+            split_seen.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+    print(f"Shard {index}/{count}: "
+          f"{', '.join(f'{rows:,} {split}' for split, rows in kept.items())} rows "
+          f"after {attempts:,} attempts -> {path}")
+    return kept
+
+
+def merged_release_attempts(
+    shard_paths: List[str],
+    params: Mapping[str, object],
+    start: int,
+    live,
+):
+    """Yields attempts start, start+1, ... from the shard files while they
+    hold them, then `live(index)`'s attempts from the first batch none
+    does (a shard that stopped early leaves the rest to this process).
+
+    Shard i of N holds batches i, i+N, ... in order, so batch b is the next
+    record of shard b % N.
+    """
+    shards = {}
+    for path in shard_paths:
+        index, count = _read_shard_header(path, params)
+        if count != len(shard_paths) or index in shards:
+            raise ValueError(f"shard files do not form one i/N set: {path} is "
+                             f"shard {index}/{count}, {len(shard_paths)} given")
+        shards[index] = path
+    files = [open_jsonl(shards[index]) for index in range(len(shards))]
+    batch, skip = divmod(start, PRODUCER_BATCH_SIZE)
+    try:
+        for fp in files:
+            fp.readline()
+        while True:
+            fp = files[batch % len(files)]
+            text = fp.readline()
+            record = json.loads(text) if text.strip() else None
+            while record is not None and record["batch"] < batch:
+                text = fp.readline()
+                record = json.loads(text) if text.strip() else None
+            if record is None or record["batch"] != batch:
+                break
+            for label, key, split, row, exc in record["attempts"][skip:]:
+                yield label, tuple(key) if isinstance(key, list) else key, split, row, exc
+            skip = 0
+            batch += 1
+    finally:
+        for fp in files:
+            fp.close()
+    print(f"Shards end at attempt {batch * PRODUCER_BATCH_SIZE:,}; generating the rest.")
+    yield from live(batch * PRODUCER_BATCH_SIZE + skip)
 
-    for writer in writers.values():
-        writer.close()
-        stats.observe_writer(writer)
+
+def generate_release(
+    output_dir: Path,
+    configs: Mapping[str, Mapping[str, int]],
+    seed: int,
+    shard_rows: int,
+    compression: str,
+    workers: int = 1,
+    dedup: str = "hash128",
+    checkpoint_every: Optional[float] = None,
+    resume: bool = False,
+    splits: Optional[Iterable[str]] = None,
+    split_fractions: Optional[Mapping[str, float]] = None,
+    dedup_memory_mb: Optional[float] = None,
+    dedup_spill_dir: Optional[str] = None,
+    dedup_on_collision: str = "keep",
+    merge: Optional[List[str]] = None,
+) -> Optional[dict]:
+    """Generates the splits and streams them to the nested config shards.
+
+    Every split with rows in `configs` is built unless `splits` names a
+    subset; the others may be built by other calls (even concurrently) into
+    the same output_dir with the same options. Returns the release
+    metadata once every split is done, else None.
+
+    A row's split is fixed by its dedup key (see split_buckets), so no key
+    can appear in two splits. Attempt i draws only from
+    example_rng(seed, "release", i), and every split takes its rows from
+    that one stream in attempt order (see generate_splits), so the release
+    is the same for any worker count and for any grouping of splits into
+    calls. With workers > 1 a pool of producer processes generates, stamps
+    and validates attempts, this process dedups and numbers them, and one
+    writer process per split encodes Parquet.
+
+    `dedup` is a dedup.DEDUP_KINDS name; each split gets its own index
+    (dedup_memory_mb, dedup_spill_dir and dedup_on_collision as for
+    make_dedup_index). The
+    default 128-bit digest index keeps dedup memory at 18 bytes per slot.
+
+    With checkpoint_every (seconds; 0 = at every shard boundary) a split's
+    progress is saved to output_dir/.checkpoint/<split> whenever its row
+    count reaches a multiple of shard_rows, where every shard written so far
+    is complete. resume=True skips finished splits and continues the rest
+    from their checkpoints (same options required), deleting shards written
+    after a checkpoint, and produces the same shards as an uninterrupted
+    build.
+
+    merge=[shard files] (--merge) takes the attempts from the files of a
+    generate_release_shard() i/N set built with the same options instead
+    of generating them, and generates live from the first attempt batch no
+    shard reached, so the release equals a build without shards.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    params, buckets, split_targets, skills, gen_pool = _release_setup(
+        configs, seed, shard_rows, compression, dedup, split_fractions, dedup_memory_mb,
+        dedup_on_collision)
+    fractions = params["split_fractions"]
+    skill_names = list(skills)
+    wanted = list(split_targets)
+    selected = wanted if splits is None else [split for split in wanted if split in splits]
+    unknown = sorted(set(splits or ()) - set(wanted))
+    if unknown:
+        raise ValueError(f"no rows configured for split(s) {', '.join(unknown)}")
+    targets = {}
+    for split in selected:
+        done = read_split_stats(output_dir, split) if resume else None
+        if done is not None:
+            check_resumable(done, params)
+            print(f"Split {split} already built; skipping.")
+            continue
+        targets[split] = split_targets[split]
+    pool = None
+    if workers > 1 and targets:
+        pool = multiprocessing.Pool(workers, initializer=_init_producer,
+                                    initargs=(skills, skill_names, buckets, list(targets)))
+    try:
+        generate_splits(output_dir, targets, params, skills, buckets, workers, pool,
+                        (dedup, dedup_memory_mb, dedup_spill_dir, dedup_on_collision),
+                        checkpoint_every, resume,
+                        merge)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    parts = {}
+    for split in wanted:
+        part = read_split_stats(output_dir, split)
+        if part is None:
+            continue
+        if part["params"] != params:
+            raise ValueError(f"split {split} in {output_dir} was built with "
+                             f"different options; rebuild it")
+        parts[split] = part
+    pending = [split for split in wanted if split not in parts]
+    if pending:
+        print(f"Splits still to build: {', '.join(pending)}")
+        return None
+
+    stats = ReleaseStats.from_states(part["stats"] for part in parts.values())
+    for part in parts.values():
+        for name, (row_count, text_chars) in part["writers"].items():
+            config, split = name.split("/")
+            stats.observe_writer(config, split, row_count, text_chars)
+    dedup_by_split = {split: part["dedup_index"] for split, part in parts.items()}
+    dedup_index = {
+        "kind": dedup,
+        "on_collision": dedup_on_collision,
+        "keys": sum(index["keys"] for index in dedup_by_split.values()),
+        # Splits built in one pass hold their indexes at the same time.
+        "memory_bytes": sum(index["memory_bytes"] for index in dedup_by_split.values()),
+        "disk_bytes": sum(index["disk_bytes"] for index in dedup_by_split.values()),
+        "collisions": sum(index["collisions"] for index in dedup_by_split.values()),
+        "by_split": dedup_by_split,
+    }
 
     metadata = {
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
@@ -364,8 +1318,11 @@ def generate_release(
         "configs": configs,
         "shard_rows": shard_rows,
         "compression": compression,
+        "split_fractions": fractions,
+        "split_buckets": {split: list(bounds) for split, bounds in buckets.items()},
         "default_pool_skills": len(skills),
         "default_pool_instances": len(gen_pool),
+        "dedup_index": dedup_index,
         **stats.as_json(),
     }
     return metadata
@@ -538,6 +1495,8 @@ Columns:
     ("Default generator instances", metadata["default_pool_instances"]),
     ("Seed", metadata["seed"]),
     ("Shard rows", metadata["shard_rows"]),
+    ("Dedup index", metadata["dedup_index"]["kind"]),
+    ("Dedup index memory, all splits (bytes)", metadata["dedup_index"]["memory_bytes"]),
 ])}
 
 ### Grade Distribution
@@ -562,9 +1521,13 @@ Source git commit: `{metadata.get("source_git_commit") or "unknown"}`
 
 Source git dirty: `{metadata["source_git_dirty"]}`
 
-Exact duplicate `(operation, problem)` pairs were skipped across the generated
-largest splits before nested configs were materialized. Per-generator duplicate
-and error counts are stored in `generation_stats.json`.
+Each row's split is a fixed function of its dedup key (the `(operation,
+problem)` pair, or a generator's canonical operand key): the key's hash picks
+one of {SPLIT_BUCKETS:,} buckets, divided between the splits as
+{", ".join(f"{split} {share:g}" for split, share in metadata["split_fractions"].items())}.
+No key can occur in two splits, and duplicates were skipped within each
+largest split before nested configs were materialized. Per-generator duplicate
+and error counts, and attempts per split, are stored in `generation_stats.json`.
 
 ## Licensing Information
 
@@ -590,12 +1553,118 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--seed", type=int, default=20260707)
     parser.add_argument("--shard-rows", type=int, default=100_000)
     parser.add_argument("--compression", default="zstd")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Producer processes. With N > 1 a separate process writes Parquet; "
+        "the release is identical for any N.",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_KINDS,
+        default="hash128",
+        help="Dedup index for (operation, problem) keys, one per split; hash "
+        "indexes store a fixed-width digest per key instead of the text.",
+    )
+    parser.add_argument(
+        "--dedup-memory-mb",
+        type=float,
+        default=None,
+        help="Spill hash-index digests to sorted runs on disk past this many MiB.",
+    )
+    parser.add_argument(
+        "--dedup-spill-dir",
+        default=None,
+        help="Directory for dedup spill runs (default: the system temp dir).",
+    )
+    parser.add_argument(
+        "--dedup-on-collision",
+        choices=COLLISION_POLICIES,
+        default="keep",
+        help="What a hash index does with two keys that share a digest but not a "
+        "check tag: keep the row (default), drop it, or stop with an error.",
+    )
+    parser.add_argument(
+        "--splits",
+        default=None,
+        help="Comma-separated splits to build (default: all). Other invocations "
+        "with the same options may build the rest, concurrently, into the same "
+        "output directory; the last one to finish writes the stats and card.",
+    )
+    parser.add_argument(
+        "--split-fractions",
+        default=None,
+        help="Share of key buckets per split, e.g. test=0.05,validation=0.05,"
+        "train=0.9 (default: proportional to each split's largest row count, "
+        "e.g. 88:1:1 for the full preset). Every built split needs a positive share.",
+    )
     parser.add_argument(
         "--overwrite",
         action="store_true",
-        help="Remove output directory first if it already exists.",
+        help="Remove output directory first if it already exists (with --splits, "
+        "only the selected splits' files).",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="Checkpoint at the next shard boundary once this many seconds have "
+        "passed (default: 300; 0 = every shard boundary).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted build in the existing output directory. "
+        "Use the same options; the shards match an uninterrupted build.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--shard",
+        default=None,
+        metavar="i/N",
+        help="Build slice i of an N-way multi-node release into the shard file "
+        "-o names (JSONL, compressed by its suffix); merge the N files with --merge.",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        default=None,
+        metavar="SHARD",
+        help="Build the release from the files of a --shard build, dropping "
+        "cross-shard duplicates and generating any shortfall; use the options "
+        "the shards were built with.",
+    )
+    args = parser.parse_args()
+    if args.resume and args.overwrite:
+        parser.error("--resume and --overwrite are mutually exclusive")
+    if args.shard is not None:
+        if args.merge or args.resume or args.splits is not None:
+            parser.error("--shard cannot be combined with --merge, --resume or --splits")
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if args.splits is not None:
+        args.splits = [split.strip() for split in args.splits.split(",") if split.strip()]
+        unknown = sorted(set(args.splits) - set(SPLIT_ORDER))
+        if unknown or not args.splits:
+            parser.error(f"--splits takes {', '.join(SPLIT_ORDER)}; got {args.splits}")
+    if args.split_fractions is not None:
+        try:
+            args.split_fractions = parse_split_fractions(args.split_fractions)
+        except ValueError as exc:
+            parser.error(str(exc))
+    return args
+
+
+def split_files(output_dir: Path, split: str) -> List[Path]:
+    """Shards, stats part and checkpoint of `split` in output_dir."""
+    paths = sorted(output_dir.glob(f"*/{split}-*.parquet"))
+    paths += [path for path in (_split_stats_path(output_dir, split),)
+              if path.exists()]
+    paths += sorted((output_dir / CHECKPOINT_DIR).glob(f"{split}*"))
+    return paths
 
 
 def main() -> None:
@@ -603,11 +1672,43 @@ def main() -> None:
     output_dir = Path(args.output_dir).expanduser().resolve()
     configs = DEFAULT_CONFIGS if args.preset == "full" else SMOKE_CONFIGS
 
-    if output_dir.exists():
-        if not args.overwrite:
-            raise SystemExit(f"Output directory already exists: {output_dir}")
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True)
+    if args.shard is not None:
+        if output_dir.exists() and not args.overwrite:
+            raise SystemExit(f"Output already exists: {output_dir}")
+        output_dir.parent.mkdir(parents=True, exist_ok=True)
+        generate_release_shard(
+            path=str(output_dir),
+            configs=configs,
+            seed=args.seed,
+            shard=args.shard,
+            shard_rows=args.shard_rows,
+            compression=args.compression,
+            workers=args.workers,
+            dedup=args.dedup,
+            split_fractions=args.split_fractions,
+            dedup_memory_mb=args.dedup_memory_mb,
+            dedup_spill_dir=args.dedup_spill_dir,
+            dedup_on_collision=args.dedup_on_collision,
+        )
+        return
+
+    if output_dir.exists() and not args.resume:
+        if args.splits is None:
+            existing = [output_dir]
+        else:
+            existing = [path for split in args.splits
+                        for path in split_files(output_dir, split)]
+        if existing and not args.overwrite:
+            raise SystemExit(
+                f"Output already exists: {existing[0]} "
+                "(use --resume to continue an interrupted build)"
+            )
+        for path in existing:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     metadata = generate_release(
         output_dir=output_dir,
@@ -615,7 +1716,21 @@ def main() -> None:
         seed=args.seed,
         shard_rows=args.shard_rows,
         compression=args.compression,
+        workers=args.workers,
+        dedup=args.dedup,
+        checkpoint_every=args.checkpoint_every,
+        resume=args.resume,
+        splits=args.splits,
+        split_fractions=args.split_fractions,
+        dedup_memory_mb=args.dedup_memory_mb,
+        dedup_spill_dir=args.dedup_spill_dir,
+        dedup_on_collision=args.dedup_on_collision,
+        merge=args.merge,
     )
+    if metadata is None:
+        print(f"Built {', '.join(args.splits)} in {output_dir}; the card is written "
+              "once the other splits are built.")
+        return
     (output_dir / "generation_stats.json").write_text(
         json.dumps(metadata, indent=2, sort_keys=True) + "\n",
         encoding="utf-8",
@@ -0,0 +1,181 @@
+"""Content-hash cache for the generated-docs tools.
+
+gen_opcode_legend.py and gen_problem_types.py scan and sample every
+generator module. Their per-module results only change when that module,
+or a repo module it imports (helpers.py, base_generator.py, another
+generator, ...), changes, so results are stored under a fingerprint of
+that source closure and reused while it matches. Third-party packages are
+not fingerprinted; pass --no-cache after upgrading one.
+
+The cache is a JSON file per tool under .gen_cache/ (git-ignored), discarded
+when the tool's own source changes; entries not used by a run are dropped
+when it is saved.
+"""
+import ast
+import hashlib
+import json
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".gen_cache")
+
+# Bump to invalidate every cache written by an older tool version.
+CACHE_VERSION = 1
+
+
+def _digest(*parts) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ContentCache:
+    """JSON store of {namespace: {key: [fingerprint, value]}}.
+
+    get() returns the stored value only if its fingerprint matches; put()
+    records a fresh one. Values must be JSON-serializable.
+    """
+
+    def __init__(self, path, salt=""):
+        self.path = path
+        self.salt = salt
+        self.hits = {}     # namespace -> count
+        self.misses = {}
+        self._entries = {}
+        self._used = {}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = None
+        if (isinstance(data, dict) and data.get("version") == CACHE_VERSION
+                and data.get("salt") == salt):
+            self._entries = data.get("entries", {})
+
+    def get(self, namespace, key, fingerprint):
+        entry = self._entries.get(namespace, {}).get(key)
+        if entry is not None and entry[0] == fingerprint:
+            self._used.setdefault(namespace, {})[key] = entry
+            self.hits[namespace] = self.hits.get(namespace, 0) + 1
+            return entry[1]
+        self.misses[namespace] = self.misses.get(namespace, 0) + 1
+        return None
+
+    def put(self, namespace, key, fingerprint, value):
+        self._used.setdefault(namespace, {})[key] = [fingerprint, value]
+
+    def summary(self, namespace) -> str:
+        return (f"{self.hits.get(namespace, 0)} reused, "
+                f"{self.misses.get(namespace, 0)} regenerated")
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": CACHE_VERSION, "salt": self.salt,
+                       "entries": self._used}, fh, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def open_cache(name, cache_dir=None, enabled=True, tool=None):
+    """The ContentCache for tool `name`, or None when caching is disabled.
+
+    `tool` is the tool's source path: editing the tool (or this module)
+    discards its cache, since cached values depend on the tool's logic.
+    """
+    if not enabled:
+        return None
+    salt = ""
+    if tool is not None:
+        with open(tool, "rb") as fh, open(__file__, "rb") as own:
+            salt = _digest(fh.read(), own.read())
+    return ContentCache(os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{name}.json"),
+                        salt)
+
+
+class SourceFingerprints:
+    """Fingerprints of repo modules and their repo-local import closures.
+
+    Import lists are parsed once per file content and kept in `cache`
+    (namespace "imports") when one is given.
+    """
+
+    def __init__(self, cache=None, root=REPO_ROOT):
+        self.cache = cache
+        self.root = root
+        self._file_hashes = {}
+        self._imports = {}
+        self._closures = {}
+
+    def module_path(self, module):
+        """Repo-relative path of a module name, or None if not in the repo."""
+        parts = module.split(".")
+        for rel in (os.path.join(*parts) + ".py",
+                    os.path.join(*parts, "__init__.py")):
+            if os.path.isfile(os.path.join(self.root, rel)):
+                return rel
+        return None
+
+    def file_hash(self, rel):
+        if rel not in self._file_hashes:
+            with open(os.path.join(self.root, rel), "rb") as fh:
+                self._file_hashes[rel] = _digest(fh.read())
+        return self._file_hashes[rel]
+
+    def _parse_imports(self, rel):
+        with open(os.path.join(self.root, rel), encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), filename=rel)
+        found = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                # `from pkg import mod` may name a submodule.
+                names = [node.module] + [f"{node.module}.{alias.name}"
+                                         for alias in node.names]
+            else:
+                continue
+            for name in names:
+                path = self.module_path(name)
+                if path is not None and path != rel:
+                    found.add(path)
+        return sorted(found)
+
+    def imports(self, rel):
+        """Repo-relative paths of the repo modules `rel` imports."""
+        if rel not in self._imports:
+            value = None
+            if self.cache is not None:
+                value = self.cache.get("imports", rel, self.file_hash(rel))
+            if value is None:
+                value = self._parse_imports(rel)
+                if self.cache is not None:
+                    self.cache.put("imports", rel, self.file_hash(rel), value)
+            self._imports[rel] = value
+        return self._imports[rel]
+
+    def closure(self, rel):
+        """`rel` plus every repo module it imports, transitively (sorted)."""
+        if rel not in self._closures:
+            seen = {rel}
+            stack = [rel]
+            while stack:
+                for dep in self.imports(stack.pop()):
+                    if dep not in seen:
+                        seen.add(dep)
+                        stack.append(dep)
+            self._closures[rel] = sorted(seen)
+        return self._closures[rel]
+
+    def fingerprint(self, modules, *extra):
+        """Fingerprint of the source closure of `modules` plus `extra` values."""
+        paths = set()
+        for module in modules:
+            rel = self.module_path(module)
+            if rel is None:
+                raise ValueError(f"module {module!r} not found under {self.root}")
+            paths.update(self.closure(rel))
+        return _digest(*(f"{rel}={self.file_hash(rel)}" for rel in sorted(paths)),
+                       *extra)
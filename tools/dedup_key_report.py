@@ -0,0 +1,157 @@
+"""Report what generator-emitted dedup keys change in a build.
+
+A generator may return a compact `dedup_key` (operands plus variant) with
+each example; builds then dedup on dedup.semantic_digest() of it rather
+than on the (operation, problem) text. For every selected class that emits
+one, this draws as many attempts as the class gets in a --rows build
+(rows / number of skills, skills being drawn uniformly) and counts:
+
+- text-unique: distinct (operation, problem) keys, what text dedup keeps
+- semantic-unique: distinct semantic keys, what key dedup keeps
+- extra: text-unique minus semantic-unique, the paraphrase duplicates that
+  only the semantic key catches
+
+It also times (best of --repeat) what each row costs the build's serial
+dedup step, a hash128 index add: text keys are hashed there, while a
+semantic key arrives as a digest already computed in the worker ("digest
+us" is that worker-side cost). Critic formats embed a whole scratchpad in
+the problem text, so their text keys are the expensive ones.
+
+Usage:
+    uv run python tools/dedup_key_report.py
+    uv run python tools/dedup_key_report.py --rows 100000 --generators ErrorSpottingGenerator
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from base_generator import example_rng  # noqa: E402
+from dedup import HashDedup, semantic_digest  # noqa: E402
+from tools.probe_generator_capacity import grouped_generators  # noqa: E402
+
+
+def emits_dedup_key(instances, seed=0) -> bool:
+    rng = example_rng(seed, "dedup_key_probe")
+    return "dedup_key" in rng.choice(instances).sample(rng)
+
+
+def _best_us(run, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(items)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / max(1, len(items))
+
+
+def _add_all(keys):
+    index = HashDedup(bits=128)
+    for key in keys:
+        index.add(key)
+    return len(index)
+
+
+def _digest_all(keys):
+    return [semantic_digest(operation, key) for operation, key in keys]
+
+
+def report_class(instances, name, attempts, seed=0, repeat=3) -> dict:
+    """Counts and hashing costs for `attempts` draws of one class, each
+    from its own stream."""
+    text_keys = []
+    raw_keys = []
+    errors = 0
+    for i in range(attempts):
+        rng = example_rng(seed, name, i)
+        try:
+            example = rng.choice(instances).sample(rng)
+        except Exception:
+            errors += 1
+            continue
+        text_keys.append((example["operation"], example["problem"]))
+        raw_keys.append((example["operation"], example["dedup_key"]))
+    semantic_keys = _digest_all(raw_keys)
+    text_unique = len(set(text_keys))
+    semantic_unique = len(set(semantic_keys))
+    return {
+        "generator": name,
+        "attempts": attempts,
+        "errors": errors,
+        "text_unique": text_unique,
+        "semantic_unique": semantic_unique,
+        "extra": text_unique - semantic_unique,
+        "text_us": _best_us(_add_all, text_keys, repeat),
+        "semantic_us": _best_us(_add_all, semantic_keys, repeat),
+        "digest_us": _best_us(_digest_all, raw_keys, repeat),
+    }
+
+
+def build_report(generators, rows=1_000_000, seed=0, repeat=3) -> list:
+    """report_class() rows for the key-emitting classes among `generators`,
+    most extra duplicates first."""
+    groups = grouped_generators(generators)
+    per_skill = -(-rows // max(1, len(groups)))
+    report = [report_class(instances, name, per_skill, seed, repeat)
+              for name, instances in groups
+              if emits_dedup_key(instances, seed)]
+    report.sort(key=lambda row: (-row["extra"], row["generator"]))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="build size to model (default: 1,000,000)")
+    parser.add_argument("--generators",
+                        help="comma-separated class names (default: the "
+                             "whole registry, as a default build draws)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing runs per class; the best is reported")
+    args = parser.parse_args(argv)
+
+    from quixi_math_datagen import select_generators
+
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    skills = len(grouped_generators(generators))
+    report = build_report(generators, args.rows, args.seed, args.repeat)
+    if not report:
+        print("No selected generator emits a dedup_key.")
+        return 0
+    per_skill = report[0]["attempts"]
+    print(f"{args.rows:,}-row build over {skills} skills: "
+          f"{per_skill:,} attempts per skill")
+    print(f"{'generator':34} {'text uniq':>9} {'key uniq':>9} {'extra':>7} "
+          f"{'text us':>8} {'key us':>7} {'digest us':>9}")
+    print("-" * 89)
+    for row in report:
+        print(f"{row['generator'][:34]:34} {row['text_unique']:9,} "
+              f"{row['semantic_unique']:9,} {row['extra']:7,} "
+              f"{row['text_us']:8.2f} {row['semantic_us']:7.2f} "
+              f"{row['digest_us']:9.2f}")
+    print("-" * 89)
+    text = sum(row["text_unique"] for row in report)
+    semantic = sum(row["semantic_unique"] for row in report)
+    attempts = sum(row["attempts"] - row["errors"] for row in report)
+    text_us = sum(row["text_us"] for row in report) / len(report)
+    semantic_us = sum(row["semantic_us"] for row in report) / len(report)
+    digest_us = sum(row["digest_us"] for row in report) / len(report)
+    print(f"{'total':34} {text:9,} {semantic:9,} {text - semantic:7,} "
+          f"{text_us:8.2f} {semantic_us:7.2f} {digest_us:9.2f}")
+    print(f"{len(report)} classes emit dedup keys; of their {attempts:,} "
+          f"attempts, {text - semantic:,} more are duplicates "
+          f"({(text - semantic) / args.rows:.3%} of the build).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
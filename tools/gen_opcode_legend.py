@@ -7,17 +7,27 @@ produced by scanning the generator source (every step flows through
 helpers.step(), so an AST scan sees the full vocabulary) and sampling each
 generator for an example step.
 
+Each registry instance is sampled from its own seed, so per-module scan
+results and sampled steps are cached under a hash of the module's source
+closure (tools/content_cache.py) and only changed modules are re-scanned
+and re-sampled.
+
 Usage:
     python tools/gen_opcode_legend.py            # rewrite OPCODES.md
     python tools/gen_opcode_legend.py --check    # exit 1 if OPCODES.md is stale
+    python tools/gen_opcode_legend.py --check --no-cache   # full rescan
 """
 import argparse
 import ast
+import hashlib
 import os
 import random
 import re
 import sys
 
+# helpers.step() and its arity-specialised variants.
+STEP_FUNCTIONS = {"step", "step1", "step2", "step3"}
+
 # Op-codes are ALL-CAPS tokens (letters, digits, underscores).
 OPCODE_RE = re.compile(r"[A-Z][A-Z0-9_]*\Z")
 
@@ -25,6 +35,9 @@ REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
+from base_generator import derive_seed  # noqa: E402
+from tools.content_cache import SourceFingerprints, open_cache  # noqa: E402
+
 GENERATORS_DIR = os.path.join(REPO_ROOT, "generators")
 DEFAULT_OUTPUT = os.path.join(REPO_ROOT, "OPCODES.md")
 
@@ -86,12 +99,53 @@ def _harvest_catalog_codes(tree):
     return found
 
 
-def scan_opcodes(generators_dir=GENERATORS_DIR):
+def scan_file(fname, source):
+    """AST-scan one generator module for step(...) calls.
+
+    Returns (codes, dynamic_sites) where codes maps code -> sorted arities
+    and dynamic_sites lists "file:line" locations whose op-code could not
+    be resolved statically.
+    """
+    tree = ast.parse(source, filename=fname)
+    codes = {}
+    dynamic_sites = []
+    catalog_site = False
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        is_step = (isinstance(func, ast.Name) and func.id in STEP_FUNCTIONS) or (
+            isinstance(func, ast.Attribute) and func.attr in STEP_FUNCTIONS
+        )
+        if not is_step or not node.args:
+            continue
+        found = _opcodes_from_first_arg(node.args[0])
+        if found is None:
+            # A bare Name means the code is pulled from a data
+            # catalog (e.g. `for code, ... in path:`); resolve it
+            # by harvesting the module's catalog rather than warning.
+            if isinstance(node.args[0], ast.Name):
+                catalog_site = True
+            else:
+                dynamic_sites.append(f"{fname}:{node.lineno}")
+            continue
+        arity = len(node.args) - 1
+        for code in found:
+            codes.setdefault(code, set()).add(arity)
+    if catalog_site:
+        for code, arities in _harvest_catalog_codes(tree).items():
+            codes.setdefault(code, set()).update(arities)
+    return ({code: sorted(arities) for code, arities in codes.items()},
+            dynamic_sites)
+
+
+def scan_opcodes(generators_dir=GENERATORS_DIR, cache=None):
     """AST-scan generator modules for step(...) calls.
 
     Returns (opcodes, dynamic_sites) where opcodes maps code -> OpInfo and
     dynamic_sites lists "file:line" locations whose op-code could not be
-    resolved statically.
+    resolved statically. With a ContentCache, a file is only re-parsed
+    when its content changed.
     """
     opcodes = {}
     dynamic_sites = []
@@ -99,56 +153,66 @@ def scan_opcodes(generators_dir=GENERATORS_DIR):
         if not fname.endswith(".py") or fname == "__init__.py":
             continue
         path = os.path.join(generators_dir, fname)
-        with open(path, encoding="utf-8") as fp:
-            tree = ast.parse(fp.read(), filename=path)
-        catalog_site = False
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-            func = node.func
-            is_step = (isinstance(func, ast.Name) and func.id == "step") or (
-                isinstance(func, ast.Attribute) and func.attr == "step"
-            )
-            if not is_step or not node.args:
-                continue
-            codes = _opcodes_from_first_arg(node.args[0])
-            if codes is None:
-                # A bare Name means the code is pulled from a data
-                # catalog (e.g. `for code, ... in path:`); resolve it
-                # by harvesting the module's catalog rather than warning.
-                if isinstance(node.args[0], ast.Name):
-                    catalog_site = True
-                else:
-                    dynamic_sites.append(f"{fname}:{node.lineno}")
-                continue
-            arity = len(node.args) - 1
-            for code in codes:
-                info = opcodes.setdefault(code, OpInfo())
-                info.arities.add(arity)
-                info.files.add(fname)
-        if catalog_site:
-            for code, arities in _harvest_catalog_codes(tree).items():
-                info = opcodes.setdefault(code, OpInfo())
-                info.arities |= arities
-                info.files.add(fname)
+        with open(path, "rb") as fp:
+            source = fp.read()
+        fingerprint = hashlib.blake2b(source, digest_size=16).hexdigest()
+        facts = cache.get("scan", fname, fingerprint) if cache else None
+        if facts is None:
+            facts = scan_file(fname, source)
+            if cache is not None:
+                cache.put("scan", fname, fingerprint, facts)
+        codes, sites = facts
+        for code, arities in codes.items():
+            info = opcodes.setdefault(code, OpInfo())
+            info.arities.update(arities)
+            info.files.add(fname)
+        dynamic_sites.extend(sites)
     return opcodes, dynamic_sites
 
 
-def collect_examples(seed=EXAMPLE_SEED, samples_per_gen=SAMPLES_PER_GENERATOR):
-    """Sample every registered generator and record one example step per code."""
-    from quixi_math_datagen import ALL_GENERATORS
+def _entry_key(entry):
+    return f"{entry.module}:{entry.class_name}:{entry.args!r}:{entry.kwargs!r}"
+
+
+def sample_steps(entry, seed=EXAMPLE_SEED, samples_per_gen=SAMPLES_PER_GENERATOR):
+    """First step seen per op-code over `samples_per_gen` generate() calls
+    of one registry entry, seeded from (seed, entry) alone."""
+    random.seed(derive_seed(seed, _entry_key(entry)))
+    gen = entry.load()
+    first = {}
+    for _ in range(samples_per_gen):
+        try:
+            result = gen.generate()
+        except Exception:
+            continue
+        for s in result.get("steps", []):
+            first.setdefault(s.split("|", 1)[0], s)
+    return first
+
+
+def collect_examples(seed=EXAMPLE_SEED, samples_per_gen=SAMPLES_PER_GENERATOR,
+                     cache=None):
+    """Sample every registered generator and record one example step per code.
+
+    With a ContentCache, an entry is only re-sampled (and its module only
+    imported) when its module's source closure changed.
+    """
+    from quixi_math_datagen import GENERATOR_REGISTRY
 
-    random.seed(seed)
+    sources = SourceFingerprints(cache)
     examples = {}
-    for gen in ALL_GENERATORS:
-        for _ in range(samples_per_gen):
-            try:
-                result = gen.generate()
-            except Exception:
-                continue
-            for s in result.get("steps", []):
-                code = s.split("|", 1)[0]
-                examples.setdefault(code, s)
+    for entry in GENERATOR_REGISTRY:
+        key = _entry_key(entry)
+        first = None
+        if cache is not None:
+            fingerprint = sources.fingerprint([entry.module], seed, samples_per_gen)
+            first = cache.get("examples", key, fingerprint)
+        if first is None:
+            first = sample_steps(entry, seed, samples_per_gen)
+            if cache is not None:
+                cache.put("examples", key, fingerprint, first)
+        for code, s in first.items():
+            examples.setdefault(code, s)
     return examples
 
 
@@ -193,9 +257,9 @@ def render_markdown(opcodes, examples, dynamic_sites):
     return "\n".join(lines)
 
 
-def build_legend():
-    opcodes, dynamic_sites = scan_opcodes()
-    examples = collect_examples()
+def build_legend(cache=None):
+    opcodes, dynamic_sites = scan_opcodes(cache=cache)
+    examples = collect_examples(cache=cache)
     return render_markdown(opcodes, examples, dynamic_sites)
 
 
@@ -205,9 +269,18 @@ def main():
                         help="Output path (default: OPCODES.md at repo root).")
     parser.add_argument("--check", action="store_true",
                         help="Exit 1 if the output file is missing or stale.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-scan and re-sample every module.")
+    parser.add_argument("--cache-dir",
+                        help="Cache directory (default: .gen_cache/ at repo root).")
     args = parser.parse_args()
 
-    content = build_legend()
+    cache = open_cache("opcode_legend", args.cache_dir, not args.no_cache,
+                       __file__)
+    content = build_legend(cache)
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.summary('examples')} generator instances.")
     if args.check:
         if not os.path.exists(args.output):
             print(f"STALE: {args.output} does not exist.")
@@ -7,9 +7,14 @@ list of internal `operation` variants (sampled), and one real worked
 example (problem, scratchpad steps, answer). Like OPCODES.md this file
 is generated, not hand-edited.
 
+Each class is sampled from its own seed, so its entry is cached under a
+hash of its modules' source closure (tools/content_cache.py); only classes
+whose source changed are re-imported and re-sampled.
+
 Usage:
     uv run python tools/gen_problem_types.py            # write the file
     uv run python tools/gen_problem_types.py --check    # verify fresh
+    uv run python tools/gen_problem_types.py --check --no-cache
 """
 import argparse
 import inspect
@@ -22,6 +27,9 @@ repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
 
+from base_generator import materialize  # noqa: E402
+from tools.content_cache import SourceFingerprints, open_cache  # noqa: E402
+
 BANDS = [
     ("elementary", "Elementary (grades 3–5)"),
     ("middle", "Middle School (grades 6–8)"),
@@ -63,43 +71,67 @@ def render_example(example):
     return "\n".join(out)
 
 
-def collect(seed=0):
-    """Group registered instances by class, preserving registration order."""
-    from quixi_math_datagen import ALL_GENERATORS
+def sample_class(instances, seed=0):
+    """Description, sampled operation variants and one worked example for
+    the instances of one class, seeded per class."""
+    instances = [materialize(gen) for gen in instances]
+    variants = set()
+    example = None
+    random.seed(seed)
+    for gen in instances:
+        for _ in range(80 // len(instances) + 1):
+            ex = gen.generate()
+            variants.add(ex["operation"])
+            if example is None:
+                example = ex
+    return {
+        "description": description_for(type(instances[0])),
+        "variants": sorted(variants),
+        "example": example,
+    }
+
+
+def collect(seed=0, cache=None):
+    """Group registered instances by class, preserving registration order.
+
+    With a ContentCache, a class is only imported and re-sampled when the
+    source closure of its modules changed.
+    """
+    from quixi_math_datagen import GENERATOR_REGISTRY
     from curriculum import CURRICULUM
 
     order = []
     by_class = {}
-    for gen in ALL_GENERATORS:
-        name = type(gen).__name__
+    for entry in GENERATOR_REGISTRY:
+        name = entry.class_name
         if name not in by_class:
             by_class[name] = []
             order.append(name)
-        by_class[name].append(gen)
+        by_class[name].append(entry)
 
+    sources = SourceFingerprints(cache)
     entries = []
     for name in order:
         instances = by_class[name]
-        cls = type(instances[0])
         meta = CURRICULUM.get(name, {})
-        # Sample variant operation strings across all instances.
-        variants = set()
-        example = None
-        random.seed(seed)
-        for gen in instances:
-            for _ in range(80 // len(instances) + 1):
-                ex = gen.generate()
-                variants.add(ex["operation"])
-                if example is None:
-                    example = ex
+        sampled = None
+        if cache is not None:
+            fingerprint = sources.fingerprint(
+                {entry.module for entry in instances}, seed,
+                *(repr((entry.args, entry.kwargs)) for entry in instances))
+            sampled = cache.get("classes", name, fingerprint)
+        if sampled is None:
+            sampled = sample_class(instances, seed)
+            if cache is not None:
+                cache.put("classes", name, fingerprint, sampled)
         entries.append({
             "class": name,
             "title": title_for(name),
-            "description": description_for(cls),
+            "description": sampled["description"],
             "grade": meta.get("grade_level", "?"),
             "difficulty": meta.get("difficulty", "?"),
-            "variants": sorted(variants),
-            "example": example,
+            "variants": sampled["variants"],
+            "example": sampled["example"],
             "n_instances": len(instances),
         })
     return entries
@@ -168,9 +200,18 @@ def main():
                     default=os.path.join(repo_root, "PROBLEM_TYPES.md"))
     ap.add_argument("--check", action="store_true",
                     help="exit 1 if the file on disk is stale")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="re-import and re-sample every class")
+    ap.add_argument("--cache-dir",
+                    help="cache directory (default: .gen_cache/ at repo root)")
     args = ap.parse_args()
 
-    content = render(collect())
+    cache = open_cache("problem_types", args.cache_dir, not args.no_cache,
+                       __file__)
+    content = render(collect(cache=cache))
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.summary('classes')} classes.")
     if args.check:
         try:
             with open(args.output, encoding="utf-8") as fh:
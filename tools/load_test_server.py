@@ -0,0 +1,122 @@
+"""Load-test the example server (quixi_math_datagen.py --serve).
+
+Sends --requests GET /examples requests from --concurrency client threads
+and reports requests/s, rows/s and latency percentiles (p50/p90/p99/max).
+Each request asks for --batch rows; --seeded gives every request its own
+seed (computed by a worker on request) instead of drawing from the
+server's prefetched buffers, and --skill/--grade-level/--difficulty pass a
+filter through. Without --url a server is started in this process on a
+free port (--workers worker processes) and warmed up before timing.
+
+Usage:
+    uv run python tools/load_test_server.py --workers 4
+    uv run python tools/load_test_server.py --url http://127.0.0.1:8765 \\
+        --requests 5000 --concurrency 32 --batch 16 --seeded
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def percentile(sorted_values, q):
+    """The q-th percentile (0-100) of sorted values, nearest rank."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def fetch(url):
+    """(seconds, rows) of one request."""
+    start = time.perf_counter()
+    with urllib.request.urlopen(url) as response:
+        body = response.read()
+    return time.perf_counter() - start, body.count(b"\n")
+
+
+def run_load(base_url, requests=1000, concurrency=8, batch=64, seeded=False,
+             filters=None):
+    """Runs the load and returns {"requests", "rows", "seconds",
+    "requests_per_s", "rows_per_s", "p50_ms", "p90_ms", "p99_ms", "max_ms"}."""
+    query = {"n": batch, **{key: value for key, value in (filters or {}).items()
+                            if value}}
+
+    def url(i):
+        params = dict(query, seed=i) if seeded else query
+        return f"{base_url.rstrip('/')}/examples?{urlencode(params)}"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(lambda i: fetch(url(i)), range(requests)))
+    seconds = time.perf_counter() - start
+    latencies = sorted(latency for latency, _ in results)
+    rows = sum(count for _, count in results)
+    return {
+        "requests": requests,
+        "rows": rows,
+        "seconds": seconds,
+        "requests_per_s": requests / seconds,
+        "rows_per_s": rows / seconds,
+        **{f"p{q}_ms": percentile(latencies, q) * 1000 for q in (50, 90, 99)},
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None,
+                        help="a running server (default: start one in-process)")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="worker processes of the in-process server")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=64, help="rows per request")
+    parser.add_argument("--seeded", action="store_true",
+                        help="give every request its own seed")
+    parser.add_argument("--skill", default=None)
+    parser.add_argument("--grade-level", default=None)
+    parser.add_argument("--difficulty", default=None)
+    args = parser.parse_args(argv)
+    filters = {"skill": args.skill, "grade_level": args.grade_level,
+               "difficulty": args.difficulty}
+
+    service = server = None
+    base_url = args.url
+    if base_url is None:
+        from example_server import ExampleService, make_server
+
+        service = ExampleService(workers=args.workers)
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        # Warm-up: loads the workers' generators and fills the buffer.
+        run_load(base_url, requests=args.workers * 4, concurrency=args.workers,
+                 batch=args.batch, seeded=True, filters=filters)
+        run_load(base_url, requests=1, batch=args.batch, filters=filters)
+    try:
+        result = run_load(base_url, args.requests, args.concurrency, args.batch,
+                          args.seeded, filters)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            service.close()
+    print(f"{result['requests']:,} requests x {args.batch} rows, "
+          f"{args.concurrency} clients, {'seeded' if args.seeded else 'buffered'}")
+    print(f"{result['requests_per_s']:,.0f} requests/s, {result['rows_per_s']:,.0f} rows/s")
+    print(f"latency ms: p50 {result['p50_ms']:.1f}  p90 {result['p90_ms']:.1f}  "
+          f"p99 {result['p99_ms']:.1f}  max {result['max_ms']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
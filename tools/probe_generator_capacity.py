@@ -12,13 +12,14 @@ Usage:
 import argparse
 import json
 import os
-import random
 import sys
 
 repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
 
+from base_generator import example_rng  # noqa: E402
+
 
 def grouped_generators(generators):
     order = []
@@ -33,26 +34,23 @@ def grouped_generators(generators):
 
 
 def probe_generators(generators, samples=2000, threshold=1000, seed=0):
-    rng = random.Random(seed)
+    # Sample i of class `name` draws from its own stream, so a class probes
+    # the same way whether or not other classes are selected.
     rows = []
     for name, instances in grouped_generators(generators):
         problems = set()
         op_problem = set()
         errors = 0
-        for _ in range(samples):
+        for i in range(samples):
+            rng = example_rng(seed, name, i)
             gen = rng.choice(instances)
-            state = random.getstate()
-            random.setstate(rng.getstate())
             try:
-                ex = gen.generate()
+                ex = gen.sample(rng)
             except Exception:
                 errors += 1
             else:
-                rng.setstate(random.getstate())
                 problems.add(ex["problem"])
                 op_problem.add((ex["operation"], ex["problem"]))
-            finally:
-                random.setstate(state)
         distinct_problem_texts = len(problems)
         distinct_operation_problem = len(op_problem)
         duplicate_rate = (
@@ -103,16 +101,12 @@ def main(argv=None):
                         help="write machine-readable rows to this path")
     args = parser.parse_args(argv)
 
-    from quixi_math_datagen import ALL_GENERATORS
+    from quixi_math_datagen import select_generators
 
-    generators = ALL_GENERATORS
-    if args.generators:
-        wanted = {part.strip() for part in args.generators.split(",")
-                  if part.strip()}
-        generators = [g for g in ALL_GENERATORS if type(g).__name__ in wanted]
-        missing = sorted(wanted - {type(g).__name__ for g in generators})
-        if missing:
-            parser.error(f"unknown generator(s): {', '.join(missing)}")
+    try:
+        generators = select_generators(args.generators)
+    except ValueError as exc:
+        parser.error(str(exc))
 
     rows = probe_generators(generators, args.samples, args.threshold, args.seed)
     print(render_table(rows, args.threshold))
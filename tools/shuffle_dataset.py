@@ -0,0 +1,267 @@
+"""Shuffle a dataset out of core: build_dataset JSONL or a release directory.
+
+Every row gets a 64-bit sort key from a seeded bijective mix of its index, and
+the output is the rows in key order. The sort runs in bounded memory: rows are
+scattered into temp buckets by key range (so each bucket holds about
+--memory-mb of rows), then each bucket is loaded, sorted by key and appended to
+the output. Since bucket boundaries are key ranges, the order depends only on
+the seed, not on the memory budget.
+
+A JSONL file is shuffled line by line (lines are moved verbatim). A release
+directory (tools/build_hf_release.py layout: <config>/<split>-NNNNN-of-NNNNN
+.parquet) is shuffled split by split: the rows of the largest config are cut
+at every smaller config's size and each segment is shuffled on its own, so
+every config keeps the same rows and is still a prefix of the larger ones.
+row_id and example_id are rewritten to the new positions, shards keep their
+size and names, and README.md / generation_stats.json are copied over (with
+the shuffle seed recorded).
+
+Usage:
+    uv run python tools/shuffle_dataset.py train.jsonl train.shuffled.jsonl --seed 1
+    uv run python tools/shuffle_dataset.py ~/datasets/QuixiMath-1B /data/qm-shuffled --memory-mb 2048
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from base_generator import derive_seed  # noqa: E402
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+# Rows read per Parquet batch in the scatter pass.
+READ_BATCH_ROWS = 10_000
+
+
+def sort_key(base, index) -> int:
+    """SplitMix64 of row `index` in the stream `base`: distinct indices get
+    distinct keys, uniformly spread over 64 bits."""
+    z = (base + (index + 1) * _GOLDEN) & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+
+def bucket_count(n_bytes, memory_bytes) -> int:
+    return max(1, math.ceil(n_bytes / memory_bytes))
+
+
+def _bucket_of(key, buckets):
+    # Key ranges, so concatenating the sorted buckets sorts everything.
+    return (key * buckets) >> 64
+
+
+# --- JSONL ---------------------------------------------------------------
+
+
+def shuffle_jsonl(src, dst, seed, memory_mb=512, tmp_dir=None) -> int:
+    """Writes the lines of `src` to `dst` in seeded random order; returns
+    the number of lines."""
+    base = derive_seed(seed, "shuffle", "jsonl")
+    buckets = bucket_count(os.path.getsize(src), memory_mb * 1024 * 1024)
+    work = tempfile.mkdtemp(prefix="quixi-shuffle-", dir=tmp_dir)
+    try:
+        files = [open(os.path.join(work, f"{b:05d}"), "wb") for b in range(buckets)]
+        rows = 0
+        with open(src, "rb") as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                key = sort_key(base, rows)
+                files[_bucket_of(key, buckets)].write(b"%016x" % key + line)
+                rows += 1
+        for fp in files:
+            fp.close()
+        tmp = f"{dst}.tmp"
+        with open(tmp, "wb") as out:
+            for b in range(buckets):
+                path = os.path.join(work, f"{b:05d}")
+                with open(path, "rb") as fp:
+                    lines = fp.readlines()
+                os.remove(path)
+                lines.sort()  # fixed-width hex keys sort numerically
+                out.writelines(line[16:] for line in lines)
+        os.replace(tmp, dst)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return rows
+
+
+# --- release directories -----------------------------------------------------
+
+
+def _split_layout(release_dir, split):
+    """{config: (rows, [shard paths])} for the configs holding `split`."""
+    import pyarrow.parquet as pq
+
+    layout = {}
+    for config_dir in sorted(p for p in Path(release_dir).iterdir() if p.is_dir()):
+        shards = sorted(config_dir.glob(f"{split}-*.parquet"))
+        if shards:
+            rows = sum(pq.ParquetFile(path).metadata.num_rows for path in shards)
+            layout[config_dir.name] = (rows, shards)
+    return layout
+
+
+def _uncompressed_bytes(paths):
+    import pyarrow.parquet as pq
+
+    total = 0
+    for path in paths:
+        meta = pq.ParquetFile(path).metadata
+        total += sum(meta.row_group(i).total_byte_size for i in range(meta.num_row_groups))
+    return total
+
+
+def shuffle_split(release_dir, out_dir, split, seed, shard_rows, compression,
+                  memory_mb=512, tmp_dir=None) -> dict:
+    """Shuffles one split of a release into out_dir; returns {config: rows}.
+
+    Segments between consecutive config sizes are shuffled separately (see
+    the module docstring), each from its own key stream.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    from tools.build_hf_release import SCHEMA, SplitWriter
+
+    layout = _split_layout(release_dir, split)
+    largest = max(layout, key=lambda config: layout[config][0])
+    total, shards = layout[largest]
+    cuts = sorted({rows for rows, _ in layout.values()} | {0})
+    writers = [SplitWriter(Path(out_dir), config, split, rows, shard_rows, compression)
+               for config, (rows, _) in sorted(layout.items(), key=lambda kv: kv[1][0])]
+    bytes_per_row = _uncompressed_bytes(shards) / max(1, total)
+    memory_bytes = memory_mb * 1024 * 1024
+    keyed = SCHEMA.append(pa.field("_key", pa.uint64()))
+    work = tempfile.mkdtemp(prefix="quixi-shuffle-", dir=tmp_dir)
+    try:
+        batches = (batch for path in shards
+                   for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_BATCH_ROWS))
+        pending = None
+        position = 0
+        for lo, hi in zip(cuts, cuts[1:]):
+            base = derive_seed(seed, "shuffle", split, lo, hi)
+            buckets = bucket_count((hi - lo) * bytes_per_row, memory_bytes)
+            paths = [os.path.join(work, f"{lo}-{b:05d}.arrow") for b in range(buckets)]
+            sinks = [pa.ipc.new_stream(path, keyed) for path in paths]
+            # Scatter rows lo..hi-1 by key range.
+            while position < hi:
+                if pending is None:
+                    pending = pa.Table.from_batches([next(batches)]).combine_chunks()
+                take = min(pending.num_rows, hi - position)
+                chunk, pending = pending.slice(0, take), pending.slice(take)
+                if not pending.num_rows:
+                    pending = None
+                keys = [sort_key(base, position - lo + i) for i in range(take)]
+                chunk = chunk.append_column("_key", pa.array(keys, pa.uint64()))
+                groups = [[] for _ in range(buckets)]
+                for i, key in enumerate(keys):
+                    groups[_bucket_of(key, buckets)].append(i)
+                for sink, rows in zip(sinks, groups):
+                    if rows:
+                        sink.write_table(chunk.take(rows))
+                position += take
+            for sink in sinks:
+                sink.close()
+            # Gather: sort each bucket by key and renumber.
+            row_id = lo
+            for path in paths:
+                with pa.memory_map(path) as source:
+                    table = pa.ipc.open_stream(source).read_all()
+                table = table.take(pc.sort_indices(table, [("_key", "ascending")]))
+                n = table.num_rows
+                ids = list(range(row_id, row_id + n))
+                table = table.drop_columns(["_key"])
+                table = table.set_column(table.schema.get_field_index("row_id"), "row_id",
+                                         pa.array(ids, pa.int64()))
+                table = table.set_column(table.schema.get_field_index("example_id"),
+                                         "example_id",
+                                         pa.array([f"{split}-{i:09d}" for i in ids]))
+                for batch in table.to_batches(max_chunksize=READ_BATCH_ROWS):
+                    for writer in writers:
+                        if row_id < writer.target_rows:
+                            writer.add_batch(batch)
+                    row_id += batch.num_rows
+                del table
+                os.remove(path)
+    finally:
+        for writer in writers:
+            writer.close()
+        shutil.rmtree(work, ignore_errors=True)
+    return {writer.config: writer.row_count for writer in writers}
+
+
+def shuffle_release(release_dir, out_dir, seed, memory_mb=512, tmp_dir=None) -> dict:
+    """Shuffles every split of a release directory into out_dir; returns
+    {split: {config: rows}}."""
+    from tools.build_hf_release import SPLIT_ORDER
+
+    release_dir, out_dir = Path(release_dir), Path(out_dir)
+    stats_path = release_dir / "generation_stats.json"
+    metadata = json.loads(stats_path.read_text(encoding="utf-8")) if stats_path.is_file() else {}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    result = {}
+    for split in SPLIT_ORDER:
+        layout = _split_layout(release_dir, split)
+        if not layout:
+            continue
+        _, shards = layout[max(layout, key=lambda config: layout[config][0])]
+        import pyarrow.parquet as pq
+
+        shard_rows = metadata.get("shard_rows") or pq.ParquetFile(shards[0]).metadata.num_rows
+        compression = metadata.get("compression", "zstd")
+        result[split] = shuffle_split(release_dir, out_dir, split, seed, shard_rows,
+                                      compression, memory_mb, tmp_dir)
+    if metadata:
+        metadata["shuffle_seed"] = seed
+        (out_dir / "generation_stats.json").write_text(
+            json.dumps(metadata, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if (release_dir / "README.md").is_file():
+        shutil.copyfile(release_dir / "README.md", out_dir / "README.md")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="a .jsonl file or a release directory")
+    parser.add_argument("output", help="output file (JSONL) or directory (release)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory-mb", type=float, default=512,
+                        help="rows held in memory at once, roughly (default: 512)")
+    parser.add_argument("--tmp-dir", default=None,
+                        help="directory for the temp buckets (default: system temp)")
+    args = parser.parse_args(argv)
+    if args.memory_mb <= 0:
+        parser.error("--memory-mb must be positive")
+    if os.path.abspath(args.input) == os.path.abspath(args.output):
+        parser.error("output must differ from input")
+
+    if os.path.isdir(args.input):
+        if os.path.exists(args.output) and os.listdir(args.output):
+            parser.error(f"output directory {args.output} is not empty")
+        result = shuffle_release(args.input, args.output, args.seed, args.memory_mb,
+                                 args.tmp_dir)
+        for split, configs in result.items():
+            sizes = ", ".join(f"{config} {rows:,}" for config, rows in configs.items())
+            print(f"{split}: {sizes}")
+    else:
+        rows = shuffle_jsonl(args.input, args.output, args.seed, args.memory_mb,
+                             args.tmp_dir)
+        print(f"Shuffled {rows:,} lines into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())